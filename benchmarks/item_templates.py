@@ -0,0 +1,77 @@
+# benchmarks/item_templates.py
+"""
+Measures what shared item template records save. Builds the same world of
+items twice, once with every item holding a full copy of its template's
+properties (the old layout) and once bound to interned template records, and
+reports memory per item and the time to serialize every item reference.
+
+Usage: python benchmarks/item_templates.py [--items 50000] [--templates item_healing_potion_small ...]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from engine.items.item_factory import ItemFactory
+from engine.utils.utils import _serialize_item_reference
+from engine.world.definition_loader import _load_item_templates
+from engine.world.world import World
+
+DEFAULT_TEMPLATES = ["item_healing_potion_small", "item_starter_dagger", "item_iron_sword", "item_leather_armor", "item_gold_coin"]
+
+
+def build(world: World, template_ids, count: int, shared: bool, seed: int = 1):
+    rng = random.Random(seed)
+    items = []
+    tracemalloc.start()
+    start = time.perf_counter()
+    for i in range(count):
+        template_id = rng.choice(template_ids)
+        if shared:
+            item = ItemFactory.create_item_from_template(template_id, world)
+        else:
+            item = ItemFactory._build_item(template_id, world.item_templates[template_id], world, {})
+        if item and i % 10 == 0: item.update_property("durability", rng.randint(1, 5))
+        items.append(item)
+    elapsed = time.perf_counter() - start
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return items, memory, elapsed
+
+
+def run(count: int, template_ids) -> None:
+    world = World()
+    world.game = None
+    _load_item_templates(world)
+    template_ids = [tid for tid in template_ids if tid in world.item_templates]
+    if not template_ids:
+        print("None of the requested templates exist.")
+        return
+
+    print(f"{count} items from {len(template_ids)} templates")
+    print(f"{'layout':>10} {'build (ms)':>11} {'bytes/item':>11} {'serialize (ms)':>15} {'override keys':>14}")
+    for shared in (False, True):
+        items, memory, build_time = build(world, template_ids, count, shared)
+        start = time.perf_counter()
+        refs = [_serialize_item_reference(item, 1, world) for item in items]
+        serialize_time = time.perf_counter() - start
+        override_keys = sum(len(ref.get("properties_override", {})) for ref in refs if ref)
+        label = "shared" if shared else "copied"
+        print(f"{label:>10} {build_time * 1000:>11.1f} {memory / count:>11.0f} {serialize_time * 1000:>15.1f} {override_keys:>14}")
+        del items, refs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark shared item template records.")
+    parser.add_argument("--items", type=int, default=50000)
+    parser.add_argument("--templates", nargs="+", default=DEFAULT_TEMPLATES)
+    args = parser.parse_args()
+    run(args.items, args.templates)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# benchmarks/loot_generation.py
+"""
+Measures loot generation throughput. Times affix rolls alone, first with the
+per-roll filter over the whole affix pool the generator used to run and then
+with the precomputed AffixTable lookup, and then times full generate_loot
+calls on a handful of weapon and armor templates.
+
+Usage: python benchmarks/loot_generation.py [--rolls 200000] [--items 20000]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from engine.items.affix_data import PREFIXES, SUFFIXES
+from engine.items.loot_generator import LootGenerator
+from engine.utils.logger import Logger, LogLevel
+from engine.world.definition_loader import _load_item_templates
+from engine.world.world import World
+
+ITEM_TYPES = ("Weapon", "Armor", "Jewelry")
+
+
+def filtered_pick(pool, item_type, level):
+    valid = [(name, data) for name, data in pool.items()
+             if ("All" in data["allowed_types"] or item_type in data["allowed_types"]) and level >= data.get("level_min", 1)]
+    return random.choice(valid) if valid else ("", {})
+
+
+def time_rolls(pick, rolls: int) -> float:
+    start = time.perf_counter()
+    for i in range(rolls):
+        pick(PREFIXES if i & 1 else SUFFIXES, ITEM_TYPES[i % 3], 1 + i % 12)
+    return time.perf_counter() - start
+
+
+def run(rolls: int, items: int) -> None:
+    Logger.set_level(LogLevel.WARNING)
+    random.seed(0)
+    print(f"{'affix roll':>12} {'total (ms)':>11} {'rolls/s':>11}")
+    for label, pick in (("filtered", filtered_pick), ("table", LootGenerator._pick_affix)):
+        elapsed = time_rolls(pick, rolls)
+        print(f"{label:>12} {elapsed * 1000:>11.1f} {rolls / elapsed:>11.0f}")
+
+    world = World()
+    world.game = None
+    _load_item_templates(world)
+    bases = [t for t, data in world.item_templates.items() if data.get("type") in ("Weapon", "Armor")][:10]
+    if not bases:
+        print("No weapon or armor templates found.")
+        return
+    start = time.perf_counter()
+    for i in range(items):
+        LootGenerator.generate_loot(bases[i % len(bases)], world, level=1 + i % 12, rarity_roll=random.random())
+    elapsed = time.perf_counter() - start
+    print(f"\ngenerate_loot: {items} items in {elapsed * 1000:.1f} ms ({items / elapsed:.0f} items/s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark affix rolls and loot generation.")
+    parser.add_argument("--rolls", type=int, default=200000)
+    parser.add_argument("--items", type=int, default=20000)
+    args = parser.parse_args()
+    run(args.rolls, args.items)
+
+
+if __name__ == "__main__":
+    main()
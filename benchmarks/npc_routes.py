@@ -0,0 +1,148 @@
+# benchmarks/npc_routes.py
+"""
+Counts pathfinding calls made by patrolling and scheduled NPCs. Builds a grid
+town, gives guards patrol loops and townsfolk schedules, then simulates game
+hours of movement ticks twice: with the pathfind-every-step movement the AI
+used before, and with route cursors over precomputed legs. Reports
+find_path calls per simulated hour for the first day and the days after.
+
+Usage: python benchmarks/npc_routes.py [--guards 50] [--townsfolk 200] [--size 12] [--step 5] [--days 2]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from engine.core.time_manager import TimeManager
+from engine.npcs.ai import movement
+from engine.npcs.npc import NPC
+from engine.utils.logger import Logger, LogLevel
+from engine.world.region import Region
+from engine.world.room import Room
+from engine.world.world import World
+
+
+def build_town(world: World, size: int) -> None:
+    region = Region("Bench Town", "A grid of streets.", obj_id="bench_town")
+    for y in range(size):
+        for x in range(size):
+            room = Room(f"Street {x}-{y}", "", obj_id=f"r_{x}_{y}")
+            if y > 0: room.exits["north"] = f"r_{x}_{y - 1}"
+            if y < size - 1: room.exits["south"] = f"r_{x}_{y + 1}"
+            if x > 0: room.exits["west"] = f"r_{x - 1}_{y}"
+            if x < size - 1: room.exits["east"] = f"r_{x + 1}_{y}"
+            region.add_room(room.obj_id, room)
+    world.add_region("bench_town", region)
+
+
+def spawn(world: World, guards: int, townsfolk: int, size: int, seed: int) -> None:
+    rng = random.Random(seed)
+    def somewhere(): return f"r_{rng.randrange(size)}_{rng.randrange(size)}"
+    for i in range(guards):
+        npc = NPC(obj_id=f"bench_guard_{i}", name=f"Guard {i}")
+        npc.behavior_type = "patrol"
+        npc.patrol_points = [somewhere() for _ in range(4)]
+        npc.home_region_id = npc.current_region_id = "bench_town"
+        npc.current_room_id = npc.patrol_points[-1]
+        world.add_npc(npc)
+    for i in range(townsfolk):
+        npc = NPC(obj_id=f"bench_villager_{i}", name=f"Villager {i}")
+        npc.behavior_type = "scheduled"
+        home, work, tavern = somewhere(), somewhere(), somewhere()
+        npc.schedule = {hour: {"region_id": "bench_town", "room_id": room, "activity": activity}
+                        for hour, room, activity in (("7", home, "waking up"), ("9", work, "working"),
+                                                     ("18", tavern, "socializing"), ("22", home, "sleeping"))}
+        npc.home_region_id = npc.current_region_id = "bench_town"
+        npc.current_room_id = home
+        world.add_npc(npc)
+
+
+def legacy_patrol(npc: NPC, world: World, player) -> None:
+    """Patrol movement as it was: a fresh path to the next point on every step."""
+    target_room_id = npc.patrol_points[npc.patrol_index]
+    if npc.current_room_id == target_room_id:
+        npc.patrol_index = (npc.patrol_index + 1) % len(npc.patrol_points)
+        return None
+    path = world.find_path(npc.current_region_id, npc.current_room_id, npc.home_region_id, target_room_id)
+    if path: movement.execute_move(npc, world, player, path[0])
+
+
+def legacy_schedule(npc: NPC, world: World, player) -> None:
+    """Schedule movement as it was: a path per destination, walked without checking it."""
+    hour = world.game.time_manager.hour
+    hours = sorted((int(h) for h in npc.schedule), reverse=True)
+    entry = next((npc.schedule[str(h)] for h in hours if hour >= h), npc.schedule[str(hours[0])])
+    destination = (entry["region_id"], entry["room_id"], entry["activity"])
+    if npc.schedule_destination != destination:
+        npc.schedule_destination = destination
+        npc.current_path = []
+    if (npc.current_region_id, npc.current_room_id) == destination[:2]: return None
+    if not npc.current_path:
+        path = world.find_path(npc.current_region_id, npc.current_room_id, destination[0], destination[1])
+        if not path: return None
+        npc.current_path = path
+    movement.execute_move(npc, world, player, npc.current_path.pop(0))
+
+
+def simulate(world: World, patrol, schedule, days: int, step: int):
+    """Ticks every NPC every `step` game minutes; returns find_path calls for each simulated day."""
+    calls = [0]
+    original = world.find_path
+    def counting(*args):
+        calls[0] += 1
+        return original(*args)
+    world.find_path = counting
+    time_manager = world.game.time_manager
+    npcs = list(world.npcs.values())
+    per_day = []
+    try:
+        for _ in range(days):
+            calls[0] = 0
+            for minute in range(0, 24 * 60, step):
+                time_manager.hour, time_manager.minute = divmod(minute, 60)
+                for npc in npcs:
+                    if npc.behavior_type == "patrol": patrol(npc, world, None)
+                    else: schedule(npc, world, None)
+            per_day.append(calls[0])
+    finally:
+        del world.find_path
+    return per_day
+
+
+def run(guards: int, townsfolk: int, size: int, step: int, days: int) -> None:
+    Logger.set_level(LogLevel.WARNING)
+    results = {}
+    for label, patrol, schedule in (("pathfind per step", legacy_patrol, legacy_schedule),
+                                    ("route cursors", movement.perform_patrol, movement.perform_schedule)):
+        world = World()
+        world.game = SimpleNamespace(time_manager=TimeManager())
+        world.regions = {}  # Only the bench town, not the game's own regions.
+        build_town(world, size)
+        spawn(world, guards, townsfolk, size, seed=1)
+        start = time.perf_counter()
+        results[label] = (simulate(world, patrol, schedule, days, step), time.perf_counter() - start)
+
+    print(f"{guards} guards, {townsfolk} townsfolk, {size * size} rooms, a tick every {step} game minutes")
+    print(f"{'':>18} {'day 1 calls/h':>14} {'later calls/h':>14} {'total (s)':>10}")
+    for label, (per_day, elapsed) in results.items():
+        later = sum(per_day[1:]) / (24 * (len(per_day) - 1)) if len(per_day) > 1 else float("nan")
+        print(f"{label:>18} {per_day[0] / 24:>14.1f} {later:>14.1f} {elapsed:>10.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Count NPC pathfinding calls per simulated hour.")
+    parser.add_argument("--guards", type=int, default=50)
+    parser.add_argument("--townsfolk", type=int, default=200)
+    parser.add_argument("--size", type=int, default=12, help="Town is a size x size grid of rooms.")
+    parser.add_argument("--step", type=int, default=5, help="Game minutes between movement ticks.")
+    parser.add_argument("--days", type=int, default=2)
+    args = parser.parse_args()
+    run(args.guards, args.townsfolk, args.size, args.step, args.days)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+# benchmarks/npc_schedules.py
+"""
+Measures scheduled NPC upkeep for a large town. Builds a grid of rooms named
+like a town's homes, workshops and taverns, spawns scheduled townsfolk,
+times initialize_npc_schedules and the town-space keyword pass against the
+previous per-room/per-keyword scan, then simulates a day of schedule ticks
+with the sorted-hours lookup perform_schedule used before and with the
+compiled timelines. For the day, every schedule entry is pinned to the NPC's
+own room so the numbers are schedule bookkeeping alone, not walking and
+pathfinding.
+
+Usage: python benchmarks/npc_schedules.py [--npcs 2000] [--size 16] [--step 5]
+"""
+import argparse
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from engine.core.time_manager import TimeManager
+from engine.npcs.ai import movement, schedules
+from engine.npcs.npc import NPC
+from engine.utils.logger import Logger, LogLevel
+from engine.world.region import Region
+from engine.world.room import Room
+from engine.world.world import World
+
+ROOM_NAMES = ["Cottage", "Small House", "Quiet Lane", "Forge", "Market Stall", "Old Mill",
+              "Tavern", "Town Square", "Garden Path", "Meeting Hall", "General Store", "Back Alley"]
+
+
+def build_town(world: World, size: int) -> None:
+    region = Region("Bench Town", "A very large town.", obj_id="bench_town")
+    for y in range(size):
+        for x in range(size):
+            room = Room(ROOM_NAMES[(x * 7 + y * 3) % len(ROOM_NAMES)], "", obj_id=f"r_{x}_{y}")
+            if y > 0: room.exits["north"] = f"r_{x}_{y - 1}"
+            if y < size - 1: room.exits["south"] = f"r_{x}_{y + 1}"
+            if x > 0: room.exits["west"] = f"r_{x - 1}_{y}"
+            if x < size - 1: room.exits["east"] = f"r_{x + 1}_{y}"
+            region.add_room(room.obj_id, room)
+    world.add_region("bench_town", region)
+
+
+def spawn_townsfolk(world: World, count: int, size: int) -> None:
+    for i in range(count):
+        npc = NPC(obj_id=f"bench_villager_{i}", name=f"Villager {i}")
+        npc.template_id = "bench_villager"
+        npc.home_region_id = npc.current_region_id = "bench_town"
+        npc.home_room_id = npc.current_room_id = f"r_{i % size}_{(i // size) % size}"
+        world.add_npc(npc)
+
+
+def legacy_designate(available_rooms):
+    """The town-space pass as it was: every keyword of every space type against every room."""
+    town_spaces = {space_type: [] for space_type in schedules.SPACE_KEYWORDS}
+    for room_info in available_rooms:
+        room_name = room_info["room_name"].lower()
+        for space_type, key_list in schedules.SPACE_KEYWORDS.items():
+            if any(key in room_name for key in key_list):
+                if room_info not in town_spaces[space_type]:
+                    town_spaces[space_type].append(room_info)
+    return town_spaces
+
+
+def legacy_entry(npc: NPC, hour: int):
+    """The active entry as perform_schedule used to find it, sorting the hours on every call."""
+    current_hour_str = str(hour)
+    if current_hour_str in npc.schedule: return npc.schedule[current_hour_str]
+    sorted_hours = sorted([int(h) for h in npc.schedule.keys()], reverse=True)
+    for h in sorted_hours:
+        if hour >= h: return npc.schedule[str(h)]
+    return npc.schedule[str(sorted_hours[0])] if sorted_hours else None
+
+
+def legacy_perform_schedule(npc: NPC, world: World, player) -> None:
+    target_entry = legacy_entry(npc, world.game.time_manager.hour)
+    if not target_entry: return None
+    new_destination = (target_entry.get("region_id"), target_entry.get("room_id"), target_entry.get("activity", "idle"))
+    if npc.schedule_destination != new_destination:
+        npc.schedule_destination = new_destination
+        npc.current_path = []
+        npc.ai_state["current_activity"] = new_destination[2]
+        npc.mark_changed()
+    if npc.current_region_id == new_destination[0] and npc.current_room_id == new_destination[1]:
+        npc.current_path = []
+        return None
+    if not npc.current_path:
+        path = world.find_path(npc.current_region_id, npc.current_room_id, new_destination[0], new_destination[1])
+        if not path:
+            npc.schedule_destination = None
+            return None
+        npc.current_path = path
+    movement.execute_move(npc, world, player, npc.current_path.pop(0))
+
+
+def pin_schedules(world: World) -> None:
+    """Points every NPC's schedule entries at the room it stands in, keeping the hours and activities."""
+    for npc in world.npcs.values():
+        here = {"region_id": npc.current_region_id, "room_id": npc.current_room_id}
+        npc.schedule = {hour: {**entry, **here} for hour, entry in npc.schedule.items()}
+
+
+def simulate_day(world: World, perform, step: int) -> float:
+    """Runs one schedule tick per NPC every `step` game minutes over a day; returns seconds taken."""
+    time_manager = world.game.time_manager
+    npcs = list(world.npcs.values())
+    start = time.perf_counter()
+    for minute in range(0, 24 * 60, step):
+        time_manager.hour, time_manager.minute = divmod(minute, 60)
+        for npc in npcs: perform(npc, world, None)
+    return time.perf_counter() - start
+
+
+def run(count: int, size: int, step: int) -> None:
+    Logger.set_level(LogLevel.WARNING)
+    world = World()
+    world.game = SimpleNamespace(time_manager=TimeManager())
+    world.regions = {}  # Only the bench town, not the game's own regions.
+    build_town(world, size)
+    spawn_townsfolk(world, count, size)
+    available_rooms = schedules._collect_available_rooms(world)
+
+    start = time.perf_counter()
+    legacy_designate(available_rooms)
+    legacy_ms = (time.perf_counter() - start) * 1000
+    start = time.perf_counter()
+    schedules._index_rooms_by_space(available_rooms)
+    index_ms = (time.perf_counter() - start) * 1000
+    start = time.perf_counter()
+    schedules.initialize_npc_schedules(world)
+    init_ms = (time.perf_counter() - start) * 1000
+
+    ticks = 24 * 60 // step
+    print(f"{count} townsfolk, {len(available_rooms)} rooms, {ticks} ticks per day")
+    print(f"town spaces: scan {legacy_ms:.1f} ms, keyword index {index_ms:.1f} ms; initialize_npc_schedules {init_ms:.1f} ms")
+
+    pin_schedules(world)
+    calls = count * ticks
+    legacy_s = simulate_day(world, legacy_perform_schedule, step)
+    compiled_s = simulate_day(world, movement.perform_schedule, step)
+    print(f"day of ticks: legacy {legacy_s * 1000:.1f} ms ({legacy_s / calls * 1e6:.2f} us/tick), "
+          f"compiled {compiled_s * 1000:.1f} ms ({compiled_s / calls * 1e6:.2f} us/tick)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark scheduled NPC upkeep.")
+    parser.add_argument("--npcs", type=int, default=2000)
+    parser.add_argument("--size", type=int, default=16, help="Town is a size x size grid of rooms.")
+    parser.add_argument("--step", type=int, default=5, help="Game minutes between schedule ticks.")
+    args = parser.parse_args()
+    run(args.npcs, args.size, args.step)
+
+
+if __name__ == "__main__":
+    main()
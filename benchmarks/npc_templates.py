@@ -0,0 +1,73 @@
+# benchmarks/npc_templates.py
+"""
+Measures the memory NPCs take with shared template records. Spawns the same
+crowd twice: once as built (dialog, loot table, schedule and properties are
+views onto one NPCTemplate), and once with each of those copied into the NPC
+as before, then reports bytes per NPC and the time to serialize them all.
+
+Usage: python benchmarks/npc_templates.py [--count 10000] [--template goblin]
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from engine.npcs.npc_factory import NPCFactory
+from engine.utils.logger import Logger, LogLevel
+from engine.world.definition_loader import _load_item_templates, _load_npc_templates
+from engine.world.world import World
+
+TEMPLATE_FIELDS = ("dialog", "loot_table", "schedule", "properties")
+
+
+def spawn(world: World, template_id: str, count: int, shared: bool):
+    tracemalloc.start()
+    start = time.perf_counter()
+    npcs = []
+    for i in range(count):
+        npc = NPCFactory.create_npc_from_template(template_id, world, f"{template_id}_{i:06d}",
+                                                  current_region_id="bench", current_room_id=f"room_{i % 100}")
+        if npc and not shared:
+            for field in TEMPLATE_FIELDS: setattr(npc, field, dict(getattr(npc, field)))
+            npc.patrol_points = list(npc.patrol_points)
+        npcs.append(npc)
+    elapsed = time.perf_counter() - start
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return npcs, memory, elapsed
+
+
+def run(count: int, template_id: str) -> None:
+    Logger.set_level(LogLevel.WARNING)
+    world = World()
+    world.game = None
+    _load_item_templates(world)
+    _load_npc_templates(world)
+    if template_id not in world.npc_templates:
+        print(f"NPC template '{template_id}' not found.")
+        return
+
+    print(f"{count} x {template_id}")
+    print(f"{'layout':>10} {'spawn (ms)':>11} {'bytes/npc':>10} {'to_dict (ms)':>13}")
+    for shared in (False, True):
+        npcs, memory, spawn_time = spawn(world, template_id, count, shared)
+        start = time.perf_counter()
+        for npc in npcs: npc.to_dict()
+        serialize_time = time.perf_counter() - start
+        print(f"{'shared' if shared else 'copied':>10} {spawn_time * 1000:>11.1f} {memory / count:>10.0f} {serialize_time * 1000:>13.1f}")
+        del npcs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark shared NPC template records.")
+    parser.add_argument("--count", type=int, default=10000)
+    parser.add_argument("--template", default="goblin")
+    args = parser.parse_args()
+    run(args.count, args.template)
+
+
+if __name__ == "__main__":
+    main()
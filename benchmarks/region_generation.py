@@ -0,0 +1,69 @@
+# benchmarks/region_generation.py
+"""
+Times RegionGenerator.generate_region across region sizes and checks that a
+fixed seed always produces byte-identical output.
+
+Usage: python benchmarks/region_generation.py [--sizes 20 200 2000 20000] [--seeds 1 2 3] [--theme caves]
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from engine.world.region_generator import RegionGenerator
+
+
+def _fingerprint(result) -> str:
+    region, entry_room_id = result
+    payload = json.dumps({"entry": entry_room_id, "region": region.to_dict()}, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()
+
+
+def run(sizes, seeds, theme: str) -> bool:
+    generator = RegionGenerator(None)
+    if theme not in generator.themes:
+        print(f"Theme '{theme}' not found.")
+        return False
+
+    all_identical = True
+    print(f"{'rooms':>8} {'seed':>6} {'time (ms)':>10} {'peak (KiB)':>11} {'built':>7}  identical")
+    for size in sizes:
+        for seed in seeds:
+            start = time.perf_counter()
+            result = generator.generate_region(theme, size, seed)
+            elapsed = time.perf_counter() - start
+            if not result:
+                print(f"{size:>8} {seed:>6}  generation failed")
+                all_identical = False
+                continue
+
+            # Second, traced run: measures peak memory and doubles as the determinism check.
+            tracemalloc.start()
+            repeat = generator.generate_region(theme, size, seed)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            identical = _fingerprint(result) == _fingerprint(repeat)
+            all_identical = all_identical and identical
+            print(f"{size:>8} {seed:>6} {elapsed * 1000:>10.1f} {peak / 1024:>11.0f} {len(result[0].rooms):>7}  {'yes' if identical else 'NO'}")
+    return all_identical
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark procedural region generation.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[20, 200, 2000, 20000])
+    parser.add_argument("--seeds", type=int, nargs="+", default=[1, 2, 3])
+    parser.add_argument("--theme", default="caves")
+    args = parser.parse_args()
+
+    identical = run(args.sizes, args.seeds, args.theme)
+    assert identical, "Generation with a fixed seed was not byte-identical across runs."
+
+
+if __name__ == "__main__":
+    main()
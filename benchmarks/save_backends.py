@@ -0,0 +1,136 @@
+# benchmarks/save_backends.py
+"""
+Compares the JSON save format with the SQLite store on synthetic save
+documents at several world sizes. For SQLite it times a first full save, an
+autosave after a small change that writes only the changed rows (as the game
+does once a store has been saved to), a full load, the core document a game
+load starts from, and a single-region read.
+
+Usage: python benchmarks/save_backends.py [--scales 1 10 100] [--changed 0.01]
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from engine.world.region_generator import RegionGenerator
+from engine.world.sqlite_store import SQLiteWorldStore
+
+# Size of the 1x world.
+BASE_REGIONS = 5
+BASE_ROOMS_PER_REGION = 20
+BASE_NPCS = 100
+BASE_QUESTS = 10
+
+
+def build_document(scale: int, seed: int = 1) -> dict:
+    rng = random.Random(seed)
+    generator = RegionGenerator(None)
+    regions, room_items, npc_states = [], {}, {}
+    for i in range(BASE_REGIONS * scale):
+        region, _ = generator.generate_region("caves", BASE_ROOMS_PER_REGION, seed=seed * 100000 + i)
+        regions.append(region.to_dict())
+        for room_id in region.rooms:
+            if rng.random() < 0.5:
+                room_items[f"{region.obj_id}:{room_id}"] = [
+                    {"item_id": "item_healing_potion_small", "properties_override": {"uses": rng.randint(1, 3)}}
+                    for _ in range(rng.randint(1, 3))
+                ]
+    region_ids = [r["id"] for r in regions]
+    for i in range(BASE_NPCS * scale):
+        npc_id = f"goblin_{i:07d}"
+        npc_states[npc_id] = {
+            "template_id": "goblin", "obj_id": npc_id, "name": "Goblin", "health": rng.randint(1, 30),
+            "max_health": 30, "current_region_id": rng.choice(region_ids), "current_room_id": "room_0",
+            "faction": "hostile", "ai_state": {}, "properties": {"level": rng.randint(1, 10)},
+        }
+    quests = {f"quest_{i}": {"instance_id": f"quest_{i}", "state": "active", "stages": [{"objective": {"type": "kill"}}]}
+              for i in range(BASE_QUESTS * scale)}
+    return {
+        "save_format_version": 4, "save_name": f"bench_{scale}x", "timestamp": "2026-01-01T00:00:00Z",
+        "player": {"name": "Bench", "level": 10, "quest_log": quests, "completed_quest_log": {}, "archived_quest_log": {}},
+        "npc_states": npc_states, "room_items_state": room_items, "dynamic_regions": regions,
+        "generated_regions": [], "quest_board": list(quests.values())[:5],
+        "time_state": {}, "weather_state": {}, "respawn_queue": [],
+    }
+
+
+def mutate(doc: dict, fraction: float, rng: random.Random):
+    """
+    Changes a fraction of the NPCs and room item stacks, as a play session would
+    between autosaves. Returns the changed NPC ids and room keys.
+    """
+    npc_ids = rng.sample(list(doc["npc_states"]), max(1, int(len(doc["npc_states"]) * fraction)))
+    for npc_id in npc_ids:
+        doc["npc_states"][npc_id]["health"] -= 1
+    room_keys = rng.sample(list(doc["room_items_state"]), max(1, int(len(doc["room_items_state"]) * fraction)))
+    for key in room_keys:
+        doc["room_items_state"][key].append({"item_id": "item_iron_sword", "properties_override": {}})
+    return npc_ids, room_keys
+
+
+def write_changes(store: SQLiteWorldStore, doc: dict, npc_ids, room_keys):
+    """Writes the core document and the changed rows only."""
+    core = {key: value for key, value in doc.items()
+            if key not in ("npc_states", "room_items_state", "dynamic_regions", "generated_regions")}
+    return store.write_changes(core, {npc_id: doc["npc_states"][npc_id] for npc_id in npc_ids},
+                               {tuple(key.split(":", 1)): doc["room_items_state"][key] for key in room_keys}, {}, {})
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, (time.perf_counter() - start) * 1000
+
+
+def run(scales, changed: float):
+    print(f"{'scale':>6} {'rows':>8} {'json KiB':>9} {'json save':>10} {'json load':>10} "
+          f"{'db save':>9} {'db autosave':>12} {'db load':>9} {'db core':>8} {'db region':>10}   (ms)")
+    for scale in scales:
+        doc = build_document(scale)
+        with tempfile.TemporaryDirectory() as tmp:
+            json_path, db_path = os.path.join(tmp, "save.json"), os.path.join(tmp, "save.db")
+
+            def json_save():
+                with open(json_path, "w") as f: json.dump(doc, f, indent=2, default=str)
+
+            def json_load():
+                with open(json_path) as f: return json.load(f)
+
+            _, json_save_ms = _timed(json_save)
+            _, json_load_ms = _timed(json_load)
+
+            store = SQLiteWorldStore(db_path)
+            stats, db_save_ms = _timed(lambda: store.write_document(doc))
+            npc_ids, room_keys = mutate(doc, changed, random.Random(scale))
+            _, db_autosave_ms = _timed(lambda: write_changes(store, doc, npc_ids, room_keys))
+            store.close()
+
+            reader = SQLiteWorldStore(db_path)
+            loaded, db_load_ms = _timed(reader.read_document)
+            _, db_core_ms = _timed(reader.read_core)
+            region_id = doc["dynamic_regions"][0]["id"]
+            _, db_region_ms = _timed(lambda: reader.read_region(region_id))
+            reader.close()
+            assert loaded["npc_states"] == doc["npc_states"] and loaded["room_items_state"] == doc["room_items_state"], \
+                "SQLite round trip lost data"
+
+            print(f"{scale:>5}x {stats['written']:>8} {os.path.getsize(json_path) / 1024:>9.0f} {json_save_ms:>10.1f} "
+                  f"{json_load_ms:>10.1f} {db_save_ms:>9.1f} {db_autosave_ms:>12.1f} {db_load_ms:>9.1f} {db_core_ms:>8.2f} {db_region_ms:>10.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark JSON and SQLite save backends.")
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--changed", type=float, default=0.01, help="Fraction of rows changed between autosaves.")
+    args = parser.parse_args()
+    run(args.scales, args.changed)
+
+
+if __name__ == "__main__":
+    main()
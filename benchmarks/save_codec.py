@@ -0,0 +1,70 @@
+# benchmarks/save_codec.py
+"""
+Compares the indented JSON save format with the binary save codec on
+synthetic save documents: file size, full parse time, and time until the
+player and the current region's data are available with streaming load.
+
+Usage: python benchmarks/save_codec.py [--scales 1 10 100]
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from benchmarks.save_backends import build_document
+from engine.world.save_codec import BinarySaveReader, read_binary_save, write_binary_save
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, (time.perf_counter() - start) * 1000
+
+
+def run(scales):
+    print(f"{'scale':>6} {'json KiB':>9} {'bin KiB':>8} {'ratio':>6} {'json write':>11} {'bin write':>10} "
+          f"{'json parse':>11} {'bin parse':>10} {'bin first':>10}   (ms)")
+    for scale in scales:
+        doc = build_document(scale)
+        with tempfile.TemporaryDirectory() as tmp:
+            json_path, bin_path = os.path.join(tmp, "save.json"), os.path.join(tmp, "save.sav")
+
+            def json_write():
+                with open(json_path, "w") as f: json.dump(doc, f, indent=2, default=str)
+
+            def bin_write():
+                with open(bin_path, "wb") as f: write_binary_save(doc, f)
+
+            def json_parse():
+                with open(json_path) as f: return json.load(f)
+
+            def bin_first():
+                # What a streaming load needs before it can place the player.
+                with BinarySaveReader.open(bin_path) as reader:
+                    return reader["player"], reader.get("dynamic_regions")
+
+            _, json_write_ms = _timed(json_write)
+            _, bin_write_ms = _timed(bin_write)
+            json_doc, json_parse_ms = _timed(json_parse)
+            bin_doc, bin_parse_ms = _timed(lambda: read_binary_save(bin_path))
+            _, bin_first_ms = _timed(bin_first)
+            assert bin_doc == json_doc, "Binary round trip differs from JSON"
+
+            json_size, bin_size = os.path.getsize(json_path), os.path.getsize(bin_path)
+            print(f"{scale:>5}x {json_size / 1024:>9.0f} {bin_size / 1024:>8.0f} {json_size / bin_size:>5.1f}x "
+                  f"{json_write_ms:>11.1f} {bin_write_ms:>10.1f} {json_parse_ms:>11.1f} {bin_parse_ms:>10.1f} {bin_first_ms:>10.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the binary save codec against JSON saves.")
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100])
+    args = parser.parse_args()
+    run(args.scales)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# benchmarks/vendor_catalog.py
+"""
+Measures vendor listing and item lookup with the per-vendor catalog. Builds a
+vendor selling a large number of template wares, then times rendering the
+ware list and finding wares by name with a cold catalog (rebuilt on every
+call, as prices and lookups were computed before) and with a warm one.
+
+Usage: python benchmarks/vendor_catalog.py [--wares 1000] [--repeat 200]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from engine.npcs.npc import NPC
+from engine.npcs.vendor_catalog import VendorCatalog
+from engine.player import Player
+from engine.utils.logger import Logger, LogLevel
+from engine.world.world import World
+
+
+def build_vendor(world: World, count: int) -> NPC:
+    refs = []
+    for i in range(count):
+        item_id = f"bench_ware_{i:04d}"
+        world.item_templates[item_id] = {"type": "Item", "name": f"Ware Number {i:04d}", "value": 5 + i % 50}
+        refs.append({"item_id": item_id, "price_multiplier": 1.5 + (i % 4) * 0.5})
+    vendor = NPC(obj_id="bench_vendor", name="Bench Vendor")
+    vendor.properties["is_vendor"] = True
+    vendor.properties["sells_items"] = refs
+    return vendor
+
+
+def time_calls(call, repeat: int, vendor: NPC, cold: bool) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        if cold: vendor.catalog = None
+        call()
+    return (time.perf_counter() - start) / repeat
+
+
+def run(count: int, repeat: int) -> None:
+    Logger.set_level(LogLevel.WARNING)
+    # Imported here so loading the command modules happens after logging is quietened.
+    from engine.commands.mercantile import _display_vendor_inventory
+    world = World()
+    world.game = None
+    vendor = build_vendor(world, count)
+    player = Player("Bench")
+    queries = [f"ware number {i:04d}" for i in range(0, count, max(1, count // 20))] + ["number 0007", "missing ware"]
+
+    def list_wares(): _display_vendor_inventory(player, vendor, world)
+    def find_wares():
+        catalog = VendorCatalog.for_vendor(vendor, world)
+        for query in queries: catalog.find_ware(query)
+
+    print(f"{count} wares, {len(queries)} lookups per find")
+    print(f"{'operation':>10} {'cold (ms)':>10} {'warm (ms)':>10}")
+    for label, call in (("list", list_wares), ("find", find_wares)):
+        cold = time_calls(call, repeat, vendor, True)
+        warm = time_calls(call, repeat, vendor, False)
+        print(f"{label:>10} {cold * 1000:>10.3f} {warm * 1000:>10.3f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the vendor price cache and stock index.")
+    parser.add_argument("--wares", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+    run(args.wares, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,7 +6,8 @@ import time
 from typing import Dict, Optional, TYPE_CHECKING, Any
 from engine.config import DATA_DIR
 from engine.utils.logger import Logger
-from .campaign_models import CampaignDefinition, CampaignNode
+from .campaign_models import CampaignDefinition, CampaignNode, CampaignTransition
+from .transition_table import TransitionTable, EVENT_QUEST_COMPLETED, EVENT_FLAG_SET
 
 if TYPE_CHECKING:
     from engine.world.world import World
@@ -16,6 +17,8 @@ class CampaignManager:
     def __init__(self, world: 'World'):
         self.world = world
         self.definitions: Dict[str, CampaignDefinition] = {}
+        # Compiled transitions per campaign, rebuilt if its definition is replaced.
+        self._tables: Dict[str, TransitionTable] = {}
         self._load_definitions()
 
     def _load_definitions(self):
@@ -31,9 +34,18 @@ class CampaignManager:
                         data = json.load(f)
                         defn = CampaignDefinition.from_dict(data)
                         self.definitions[defn.campaign_id] = defn
+                        self._tables[defn.campaign_id] = TransitionTable(defn)
                 except Exception as e:
                     Logger.error("CampaignManager", f"Failed to load {fname}: {e}")
 
+    def get_transition_table(self, campaign_id: str) -> Optional[TransitionTable]:
+        definition = self.definitions.get(campaign_id)
+        if not definition: return None
+        table = self._tables.get(campaign_id)
+        if table is None or table.definition is not definition:
+            table = self._tables[campaign_id] = TransitionTable(definition)
+        return table
+
     def start_campaign(self, campaign_id: str, player: 'Player') -> bool:
         if campaign_id not in self.definitions: return False
         
@@ -76,42 +88,51 @@ class CampaignManager:
             player_state["history"].append({"node_id": node_id, "resolution": resolution})
         
         # Find Next Node
-        next_node_id = None
-        transition_text = ""
-        
-        for transition in current_node.transitions:
-            # 1. Check Trigger
-            matches = False
-            if transition.trigger == resolution:
-                matches = True
-            elif transition.trigger == "SUCCESS" and "SUCCESS" in resolution:
-                matches = True
-            elif transition.trigger == "FAILURE" and "FAILURE" in resolution:
-                matches = True
-                
-            if matches:
-                # 2. Check RNG (Twists)
-                if transition.chance < 1.0 and random.random() > transition.chance:
-                    continue 
-                    
-                next_node_id = transition.target_node_id
-                transition_text = transition.narrative_text
-                break
-        
-        if next_node_id:
-            # Advance
-            if player_state:
-                player_state["current_node"] = next_node_id
-                
-            next_node = definition.nodes.get(next_node_id)
-            if next_node:
-                self._trigger_node(campaign_id, next_node, player)
-                if transition_text:
-                    return f"{transition_text}"
-                return ""
+        table = self.get_transition_table(campaign_id)
+        transition = table.select(node_id, EVENT_QUEST_COMPLETED, resolution, player, player_state or {}, random.random) if table else None
+        if transition:
+            text = self._advance(campaign_id, definition, transition, player)
+            if text is not None: return text
         
         return "The campaign path ends here."
 
+    def handle_event(self, event_type: str, key: str, player: 'Player', campaign_id: Optional[str] = None) -> str:
+        """
+        Fires an item_acquired, location_entered or flag_set event against the current node of
+        each active campaign (or just `campaign_id`). Returns the narrative of any transitions taken.
+        """
+        if not player.active_campaigns: return ""
+        messages = []
+        campaign_ids = [campaign_id] if campaign_id else list(player.active_campaigns)
+        for c_id in campaign_ids:
+            player_state = player.active_campaigns.get(c_id)
+            table = self.get_transition_table(c_id)
+            if not player_state or not table: continue
+            node_id = player_state["current_node"]
+            transition = table.select(node_id, event_type, key, player, player_state, random.random)
+            if not transition: continue
+            player_state["history"].append({"node_id": node_id, "event": event_type, "trigger": key})
+            text = self._advance(c_id, table.definition, transition, player)
+            if text: messages.append(text)
+        return "\n".join(messages)
+
+    def set_flag(self, campaign_id: str, flag: str, player: 'Player', value: Any = True) -> str:
+        """Sets a campaign variable and fires flag_set for it."""
+        player_state = player.active_campaigns.get(campaign_id)
+        if not player_state: return ""
+        player_state["variables"][flag] = value
+        return self.handle_event(EVENT_FLAG_SET, flag, player, campaign_id) if value else ""
+
+    def _advance(self, campaign_id: str, definition: CampaignDefinition, transition: CampaignTransition, player: 'Player') -> Optional[str]:
+        """Moves a campaign along a transition; None if its target node does not exist."""
+        next_node = definition.nodes.get(transition.target_node_id)
+        player_state = player.active_campaigns.get(campaign_id)
+        if player_state:
+            player_state["current_node"] = transition.target_node_id
+        if not next_node: return None
+        self._trigger_node(campaign_id, next_node, player)
+        return transition.narrative_text or ""
+
     def _trigger_node(self, campaign_id: str, node: CampaignNode, player: 'Player'):
         if node.node_type == "QUEST" and node.quest_template_id:
             # Context allows the quest to report back upon completion
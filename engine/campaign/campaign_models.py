@@ -9,6 +9,9 @@ class CampaignTransition:
     narrative_text: str = ""
     conditions: Dict[str, Any] = field(default_factory=dict) # e.g. {"reputation_min": 50}
     chance: float = 1.0 # 1.0 = 100% chance (for RNG twists)
+    # What fires it: "quest_completed" (trigger is a resolution), "item_acquired" (an item ID),
+    # "location_entered" ("region:room") or "flag_set" (a campaign variable name).
+    event: str = "quest_completed"
 
 @dataclass
 class CampaignNode:
@@ -39,7 +42,8 @@ class CampaignDefinition:
                     target_node_id=t.get("target_node_id"),
                     narrative_text=t.get("narrative_text", ""),
                     conditions=t.get("conditions", {}),
-                    chance=t.get("chance", 1.0)
+                    chance=t.get("chance", 1.0),
+                    event=t.get("event", "quest_completed")
                 ))
             
             nodes_dict[nid] = CampaignNode(
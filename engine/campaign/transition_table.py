@@ -0,0 +1,99 @@
+# engine/campaign/transition_table.py
+"""
+Compiled campaign transitions.
+
+A TransitionTable is built once per CampaignDefinition. For every node it
+files the outgoing transitions under the event that can fire them and that
+event's key (a quest resolution, item ID, "region:room" location or flag
+name), with their conditions parsed into a single predicate. Handling an
+event is then a couple of dict lookups on the player's current node, however
+large the campaign graph is.
+"""
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, TYPE_CHECKING
+
+from engine.utils.logger import Logger
+from .campaign_models import CampaignDefinition, CampaignTransition
+
+if TYPE_CHECKING:
+    from engine.player.core import Player
+
+EVENT_QUEST_COMPLETED = "quest_completed"
+EVENT_ITEM_ACQUIRED = "item_acquired"
+EVENT_LOCATION_ENTERED = "location_entered"
+EVENT_FLAG_SET = "flag_set"
+EVENT_TYPES = (EVENT_QUEST_COMPLETED, EVENT_ITEM_ACQUIRED, EVENT_LOCATION_ENTERED, EVENT_FLAG_SET)
+
+# (player, campaign state) -> whether the transition may fire.
+Condition = Callable[['Player', Dict[str, Any]], bool]
+
+
+class CompiledTransition(NamedTuple):
+    order: int  # Position in the node's transition list; earlier transitions win.
+    transition: CampaignTransition
+    condition: Optional[Condition]
+
+
+def _compile_condition(key: str, value: Any) -> Optional[Condition]:
+    if key == "level_min":
+        return lambda player, state: player.level >= value
+    if key == "reputation_min" and isinstance(value, dict):
+        minimums = tuple(value.items())
+        return lambda player, state: all(player.get_reputation(faction) >= amount for faction, amount in minimums)
+    if key == "has_item":
+        return lambda player, state: player.inventory.count_item(value) > 0
+    if key == "flag":
+        return lambda player, state: bool(state.get("variables", {}).get(value))
+    if key == "not_flag":
+        return lambda player, state: not state.get("variables", {}).get(value)
+    return None
+
+
+def compile_conditions(conditions: Dict[str, Any], where: str) -> Optional[Condition]:
+    """One predicate for a transition's conditions, or None when it has none."""
+    checks: List[Condition] = []
+    for key, value in conditions.items():
+        check = _compile_condition(key, value)
+        if check: checks.append(check)
+        else: Logger.warning("CampaignManager", f"Ignoring unsupported condition '{key}' on {where}.")
+    if not checks: return None
+    if len(checks) == 1: return checks[0]
+    return lambda player, state: all(check(player, state) for check in checks)
+
+
+class TransitionTable:
+    def __init__(self, definition: CampaignDefinition):
+        self.definition = definition
+        # node_id -> event type -> event key -> transitions in declaration order
+        self.nodes: Dict[str, Dict[str, Dict[str, List[CompiledTransition]]]] = {}
+        for node_id, node in definition.nodes.items():
+            by_event: Dict[str, Dict[str, List[CompiledTransition]]] = {}
+            for order, transition in enumerate(node.transitions):
+                if transition.event not in EVENT_TYPES:
+                    Logger.warning("CampaignManager", f"Unknown event '{transition.event}' on {definition.campaign_id}:{node_id}.")
+                    continue
+                condition = compile_conditions(transition.conditions, f"{definition.campaign_id}:{node_id}")
+                compiled = CompiledTransition(order, transition, condition)
+                by_event.setdefault(transition.event, {}).setdefault(transition.trigger, []).append(compiled)
+            if by_event: self.nodes[node_id] = by_event
+
+    def candidates(self, node_id: str, event_type: str, key: str) -> List[CompiledTransition]:
+        """Transitions out of a node that this event could fire, in declaration order."""
+        by_key = self.nodes.get(node_id, {}).get(event_type)
+        if not by_key: return []
+        found = by_key.get(key, [])
+        if event_type == EVENT_QUEST_COMPLETED:
+            # Generic SUCCESS/FAILURE transitions also catch specific resolutions like VIOLENT_SUCCESS.
+            for generic in ("SUCCESS", "FAILURE"):
+                if generic != key and generic in key and generic in by_key:
+                    found = sorted(found + by_key[generic])
+        return found
+
+    def select(self, node_id: str, event_type: str, key: str, player: 'Player',
+               state: Dict[str, Any], roll: Callable[[], float]) -> Optional[CampaignTransition]:
+        """The transition this event fires from a node, if any: the first whose conditions and chance pass."""
+        for compiled in self.candidates(node_id, event_type, key):
+            if compiled.condition and not compiled.condition(player, state): continue
+            transition = compiled.transition
+            if transition.chance < 1.0 and roll() > transition.chance: continue
+            return transition
+        return None
@@ -23,8 +23,10 @@ def recipes_handler(args, context):
 
     # List Recipes
     available_count = 0
+    craftable = manager.craftable_recipes(player)
+    counts = manager.inventory_counts(player)
     for r_id, recipe in manager.recipes.items():
-        can_do, _ = manager.can_craft(player, recipe)
+        can_do = r_id in craftable
         
         # Filter: Only show if we can craft it OR if the user typed "recipes all"
         # We also show it if we have the station but missing ingredients, to help player learn.
@@ -41,7 +43,7 @@ def recipes_handler(args, context):
                 template = ItemFactory.get_template(ing['item_id'], world)
                 i_name = template.get("name", ing['item_id']) if template else ing['item_id']
                 
-                has = player.inventory.count_item(ing['item_id'])
+                has = counts.get(ing['item_id'], 0)
                 req = ing['quantity']
                 color = FORMAT_SUCCESS if has >= req else FORMAT_ERROR
                 ing_list.append(f"{color}{has}/{req} {i_name}{FORMAT_RESET}")
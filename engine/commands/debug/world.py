@@ -1,6 +1,5 @@
 from engine.commands.command_system import command
 from engine.config import FORMAT_ERROR, FORMAT_SUCCESS, FORMAT_RESET, FORMAT_HIGHLIGHT
-from engine.world.region_generator import RegionGenerator
 from engine.config.config_world import DYNAMIC_REGION_DEFAULT_NUM_ROOMS
 from engine.npcs.npc import NPC
 
@@ -33,7 +32,7 @@ def settime_handler(args, context):
     for npc in context["world"].npcs.values():
         if npc.behavior_type == "scheduled":
             npc.schedule_destination = None
-            npc.current_path = []
+            npc.route = None
             
     return f"{FORMAT_SUCCESS}Time set to {hour:02d}:{minute:02d}.{FORMAT_RESET}"
 
@@ -130,8 +129,7 @@ def genregion_handler(args, context):
     theme = args[0].lower()
     rooms = int(args[1]) if len(args) > 1 else DYNAMIC_REGION_DEFAULT_NUM_ROOMS
     
-    gen = RegionGenerator(world)
-    res = gen.generate_region(theme, rooms)
+    res = world.region_pool.acquire(theme, rooms, world.region_generator)
     if not res: return "Generation failed."
     
     reg, eid = res
@@ -147,6 +145,14 @@ def genregion_handler(args, context):
     
     return f"{FORMAT_SUCCESS}Generated {reg.name}. Portal created.{FORMAT_RESET}"
 
+@command("regionpool", [], "debug", "Show region pre-generation stats.")
+def regionpool_handler(args, context):
+    m = context["world"].region_pool.get_metrics()
+    return (f"{FORMAT_SUCCESS}Region Pool:{FORMAT_RESET}\n"
+            f"Hits: {m['pool_hits']}  Misses: {m['pool_misses']}  Failures: {m['worker_failures']}\n"
+            f"Generation: avg {m['generation_avg_ms']:.1f}ms, max {1000 * m['generation_time_max']:.1f}ms\n"
+            f"Hand-off: avg {m['handoff_avg_ms']:.1f}ms, max {1000 * m['handoff_time_max']:.1f}ms")
+
 @command("close portal", [], "debug", "Close portal and destroy region.")
 def close_portal_handler(args, context):
     world = context["world"]
@@ -159,9 +165,8 @@ def close_portal_handler(args, context):
     if not rid.startswith("dynamic_"): return "Not a dynamic region."
     
     # Cleanup
-    ids = [n.obj_id for n in world.npcs.values() if n.current_region_id == rid]
-    for i in ids: del world.npcs[i]
-    if rid in world.regions: del world.regions[rid]
+    for npc in world.npcs.npcs_in_region(rid): world.npcs.pop(npc.obj_id, None)
+    world.remove_region(rid)
     del room.exits["portal"]
     
     return f"{FORMAT_SUCCESS}Region destroyed.{FORMAT_RESET}"
\ No newline at end of file
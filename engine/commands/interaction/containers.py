@@ -81,6 +81,6 @@ def put_handler(args, context):
         if container.add_item(rem_item):
             return f"{FORMAT_SUCCESS}You put the {rem_item.name} in the {container.name}.{FORMAT_RESET}"
         else:
-            player.inventory.add_item(rem_item)
+            player.inventory.add_item(rem_item, notify=False)
             return f"{FORMAT_ERROR}Failed to add item.{FORMAT_RESET}"
     return f"{FORMAT_ERROR}Failed to remove item from inventory.{FORMAT_RESET}"
@@ -87,6 +87,8 @@ def _handle_item_acquisition(args: List[str], context: Dict[str, Any], command_v
              if src_key not in taken_log: taken_log[src_key] = []
              taken_log[src_key].append(item.name)
 
+    # Campaign narrative raised by the acquisitions shows with the pickup rather than on the next tick.
+    hints.extend(player.take_event_messages())
     if not taken_log: return f"{FORMAT_ERROR}Couldn't take anything.{err_msg}{FORMAT_RESET}"
 
     msgs = []
@@ -12,61 +12,22 @@ from engine.items.item_factory import ItemFactory
 from engine.items.item import Item
 from engine.player import Player
 from engine.npcs.npc import NPC
-
-def _get_price_multiplier(vendor: NPC) -> float:
-    base = DEFAULT_VENDOR_SELL_MULTIPLIER
-    if "economy_impact" in vendor.properties:
-        discount = vendor.properties["economy_impact"].get("discount", 0.0)
-        return max(0.1, base - discount)
-    return base
+from engine.npcs.vendor_catalog import VendorCatalog
 
 def _display_vendor_inventory(player: Player, vendor: NPC, world) -> str:
-    vendor_items_refs = vendor.properties.get("sells_items", [])
-    
+    catalog = VendorCatalog.for_vendor(vendor, world)
     display_lines = [f"{FORMAT_TITLE}{vendor.name}'s Wares:{FORMAT_RESET}\n"]
-    
-    current_multiplier = _get_price_multiplier(vendor)
-    if current_multiplier < DEFAULT_VENDOR_SELL_MULTIPLIER:
+
+    if catalog.multiplier < DEFAULT_VENDOR_SELL_MULTIPLIER:
         display_lines.append(f"{FORMAT_HIGHLIGHT}(Special Discount Active!){FORMAT_RESET}\n")
 
-    if vendor_items_refs:
-        for item_ref in vendor_items_refs:
-            item_id = item_ref.get("item_id")
-            if not item_id: continue
-            
-            template = world.item_templates.get(item_id)
-            if not template: continue
-                
-            item_name = template.get("name", "Unknown Item")
-            base_value = template.get("value", 0)
-            
-            # Combine item-specific multiplier with vendor global multiplier (discount)
-            # Item specific multiplier is usually 1.0 or higher.
-            # Vendor global multiplier starts at 2.0 (DEFAULT_SELL) and lowers with discount.
-            # Effective Price = Base * ItemMult * (VendorMult / DefaultVendorMult) ??
-            # Or simpler: The stored price_multiplier in item_ref IS the sell price factor relative to base value.
-            # Default is 2.0. If item has 5.0, it's expensive.
-            # If we apply a discount (e.g. 0.2 off), we should reduce the final factor.
-            
-            item_mult = item_ref.get("price_multiplier", DEFAULT_VENDOR_SELL_MULTIPLIER)
-            
-            # Calculate discount ratio
-            discount_ratio = current_multiplier / DEFAULT_VENDOR_SELL_MULTIPLIER
-            final_mult = item_mult * discount_ratio
-            
-            buy_price = max(VENDOR_MIN_BUY_PRICE, int(base_value * final_mult))
-            
-            display_lines.append(f"- {item_name:<{VENDOR_LIST_ITEM_NAME_WIDTH}} | Price: {buy_price:>{VENDOR_LIST_PRICE_WIDTH}} gold")
+    for ware in catalog.wares:
+        display_lines.append(f"- {ware.name:<{VENDOR_LIST_ITEM_NAME_WIDTH}} | Price: {ware.price:>{VENDOR_LIST_PRICE_WIDTH}} gold")
 
-    for slot in vendor.inventory.slots:
-        if slot.item:
-            item_name = slot.item.name
-            
-            # Dynamic stock usually uses default multiplier
-            buy_price = max(VENDOR_MIN_BUY_PRICE, int(slot.item.value * current_multiplier))
-            
-            qty_str = f" (x{slot.quantity})" if slot.quantity > 1 else ""
-            display_lines.append(f"- {item_name}{qty_str:<{VENDOR_LIST_ITEM_NAME_WIDTH - len(qty_str)}} | Price: {buy_price:>{VENDOR_LIST_PRICE_WIDTH}} gold")
+    # Dynamic stock is priced at the vendor's default multiplier.
+    for entry in catalog.stock:
+        qty_str = f" (x{entry.quantity})" if entry.quantity > 1 else ""
+        display_lines.append(f"- {entry.item.name}{qty_str:<{VENDOR_LIST_ITEM_NAME_WIDTH - len(qty_str)}} | Price: {entry.price:>{VENDOR_LIST_PRICE_WIDTH}} gold")
 
     if len(display_lines) == 1:
         return f"{vendor.name} has nothing to sell right now."
@@ -139,19 +100,16 @@ def buy_handler(args, context):
     except ValueError: return f"{FORMAT_ERROR}Invalid quantity specified.{FORMAT_RESET}"
     if not item_name: return f"{FORMAT_ERROR}You must specify an item name.{FORMAT_RESET}"
 
-    # Calculate current effective multiplier (including discounts)
-    current_multiplier = _get_price_multiplier(vendor)
-    discount_ratio = current_multiplier / DEFAULT_VENDOR_SELL_MULTIPLIER
+    catalog = VendorCatalog.for_vendor(vendor, world)
+    stock_entry = catalog.find_stock(item_name)
 
-    found_inv_item = vendor.inventory.find_item_by_name(item_name)
-    
-    if found_inv_item:
-        available_qty = vendor.inventory.count_item(found_inv_item.obj_id)
+    if stock_entry:
+        found_inv_item = stock_entry.item
+        available_qty = catalog.stock_count(found_inv_item.obj_id)
         if quantity > available_qty:
             return f"{FORMAT_ERROR}{vendor.name} only has {available_qty} {found_inv_item.name}(s).{FORMAT_RESET}"
-            
-        base_value = found_inv_item.value
-        buy_price_per_item = max(VENDOR_MIN_BUY_PRICE, int(base_value * current_multiplier))
+
+        buy_price_per_item = stock_entry.price
         total_cost = buy_price_per_item * quantity
         
         if player.gold < total_cost: return f"{FORMAT_ERROR}You don't have enough gold (Need {total_cost}, have {player.gold}).{FORMAT_RESET}"
@@ -173,28 +131,13 @@ def buy_handler(args, context):
 
         return f"{FORMAT_SUCCESS}You buy {quantity} {found_inv_item.name}{'' if quantity == 1 else 's'} for {total_cost} gold.{FORMAT_RESET}"
 
-    found_item_ref = None; found_template = None
-    for item_ref in vendor.properties.get("sells_items", []):
-        item_id = item_ref.get("item_id")
-        if not item_id: continue
-        template = world.item_templates.get(item_id)
-        if template:
-            name_in_template = template.get("name", "").lower()
-            if item_name == item_id.lower() or item_name == name_in_template:
-                found_item_ref = item_ref; found_template = template; break
-            elif item_name in name_in_template:
-                 found_item_ref = item_ref; found_template = template
-                 
-    if not found_item_ref or not found_template:
+    ware = catalog.find_ware(item_name)
+    if not ware:
         return f"{FORMAT_ERROR}{vendor.name} doesn't sell '{item_name}'. Type 'list' to see wares.{FORMAT_RESET}"
 
-    item_id = found_template["obj_id"] = found_item_ref["item_id"]
-    base_value = found_template.get("value", 0)
-    
-    item_specific_mult = found_item_ref.get("price_multiplier", DEFAULT_VENDOR_SELL_MULTIPLIER)
-    final_mult = item_specific_mult * discount_ratio
-    
-    buy_price_per_item = max(VENDOR_MIN_BUY_PRICE, int(base_value * final_mult))
+    found_template = ware.template
+    item_id = found_template["obj_id"] = ware.item_id
+    buy_price_per_item = ware.price
     total_cost = buy_price_per_item * quantity
     
     if player.gold < total_cost: return f"{FORMAT_ERROR}You don't have enough gold (Need {total_cost}, have {player.gold}).{FORMAT_RESET}"
@@ -4,7 +4,7 @@ Contains all core system and meta-game commands.
 """
 import os
 from engine.commands.command_system import command
-from engine.config import SAVE_GAME_DIR, FORMAT_ERROR, FORMAT_HIGHLIGHT, FORMAT_RESET, FORMAT_SUCCESS
+from engine.config import SAVE_GAME_DIR, BINARY_SAVE_EXTENSION, SQLITE_SAVE_EXTENSION, FORMAT_ERROR, FORMAT_HIGHLIGHT, FORMAT_RESET, FORMAT_SUCCESS
 from engine.config.config_display import FORMAT_TITLE
 
 @command("help", ["h", "?"], "system", "Show help.\nUsage: help [command]")
@@ -34,8 +34,7 @@ def save_handler(args, context):
     player = world.player
     if not player: return f"{FORMAT_ERROR}You must start or load a game first.{FORMAT_RESET}"
     game = context["game"]
-    fname = (args[0] if args else game.current_save_file)
-    if not fname.endswith(".json"): fname += ".json"
+    fname = world.save_manager.with_save_extension(args[0] if args else game.current_save_file)
     if world.save_game(fname):
         game.current_save_file = fname
         return f"{FORMAT_SUCCESS}World state saved to {fname}{FORMAT_RESET}"
@@ -46,15 +45,14 @@ def save_handler(args, context):
 def load_handler(args, context):
     world = context["world"]
     game = context["game"]
-    fname = (args[0] if args else game.current_save_file)
-    if not fname.endswith(".json"): fname += ".json"
+    fname = world.save_manager.with_save_extension(args[0] if args else game.current_save_file)
     save_path = os.path.join(SAVE_GAME_DIR, fname)
     if not os.path.exists(save_path):
          return f"{FORMAT_ERROR}Save file '{fname}' not found in '{SAVE_GAME_DIR}'.{FORMAT_RESET}"
     
     print(f"Attempting to load game state from {fname}...")
     
-    load_success, loaded_time_data, loaded_weather_data = world.load_save_game(fname)
+    load_success, loaded_time_data, loaded_weather_data = world.load_save_game(fname, phased=True)
     
     if load_success:
          game.current_save_file = fname
@@ -76,6 +74,31 @@ def load_handler(args, context):
     else:
          return f"{FORMAT_ERROR}Error loading world state from {fname}. Game state might be unstable.{FORMAT_RESET}"
 
+def _convert_save(context, source: str, target: str, verb: str) -> str:
+    if not os.path.exists(os.path.join(SAVE_GAME_DIR, source)):
+        return f"{FORMAT_ERROR}Save file '{source}' not found in '{SAVE_GAME_DIR}'.{FORMAT_RESET}"
+    try:
+        context["world"].save_manager.convert_save(os.path.join(SAVE_GAME_DIR, source), os.path.join(SAVE_GAME_DIR, target))
+    except Exception as e:
+        return f"{FORMAT_ERROR}{verb} failed: {e}{FORMAT_RESET}"
+    return f"{FORMAT_SUCCESS}{verb}ed {source} as {target}{FORMAT_RESET}"
+
+@command("exportsave", [], "system", "Export an SQLite or binary save to a JSON save.\nUsage: exportsave <name.db|name.sav> [name.json]")
+def export_save_handler(args, context):
+    if not args or not args[0].endswith((SQLITE_SAVE_EXTENSION, BINARY_SAVE_EXTENSION)):
+        return f"{FORMAT_ERROR}Usage: exportsave <name{SQLITE_SAVE_EXTENSION}|name{BINARY_SAVE_EXTENSION}> [name.json]{FORMAT_RESET}"
+    target = args[1] if len(args) > 1 else os.path.splitext(args[0])[0] + ".json"
+    return _convert_save(context, args[0], target, "Export")
+
+@command("importsave", [], "system", "Import a JSON save into an SQLite or binary save.\nUsage: importsave <name.json> [name.db|name.sav]")
+def import_save_handler(args, context):
+    if not args or not args[0].endswith(".json"):
+        return f"{FORMAT_ERROR}Usage: importsave <name.json> [name{SQLITE_SAVE_EXTENSION}|name{BINARY_SAVE_EXTENSION}]{FORMAT_RESET}"
+    target = args[1] if len(args) > 1 else os.path.splitext(args[0])[0] + SQLITE_SAVE_EXTENSION
+    if not target.endswith((SQLITE_SAVE_EXTENSION, BINARY_SAVE_EXTENSION)):
+        return f"{FORMAT_ERROR}Import target must end in {SQLITE_SAVE_EXTENSION} or {BINARY_SAVE_EXTENSION}.{FORMAT_RESET}"
+    return _convert_save(context, args[0], target, "Import")
+
 @command("minimap", ["map"], "system", "Toggle the visual minimap panel.\nUsage: minimap [on|off]")
 def toggle_minimap_handler(args, context):
     game = context.get("game")
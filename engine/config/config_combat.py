@@ -26,6 +26,13 @@ LEVEL_DIFF_COMBAT_MODIFIERS = {
     "gray":   (1.25, 1.40, 0.20),
 }
 
+# --- Combat Lookup Table Bounds ---
+# Viewer levels above the cap fall back to computing the category directly.
+# Level deltas are clamped to +/- the max delta, which must stay wider than
+# the largest category threshold reachable at the level cap.
+COMBAT_TABLE_MAX_LEVEL = 100
+COMBAT_TABLE_MAX_LEVEL_DELTA = 64
+
 # --- Experience Point Calculation ---
 XP_GAIN_HEALTH_DIVISOR = 5
 XP_GAIN_LEVEL_MULTIPLIER = 5
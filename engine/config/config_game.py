@@ -17,6 +17,28 @@ REGION_DIR = os.path.join(DATA_DIR, "regions")
 ITEM_TEMPLATE_DIR = os.path.join(DATA_DIR, "items")
 NPC_TEMPLATE_DIR = os.path.join(DATA_DIR, "npcs")
 DEFAULT_SAVE_FILE = "default_save.json"
+# Backend for saves named without an extension: "json" (one document), "binary" (compact sectioned
+# file, streamed on load) or "sqlite" (row store, incremental writes).
+# Every format loads regardless of this setting; the file extension (or binary magic) decides.
+SAVE_BACKEND = "json"
+SQLITE_SAVE_EXTENSION = ".db"
+BINARY_SAVE_EXTENSION = ".sav"
+SAVE_FILE_EXTENSIONS = (".json", BINARY_SAVE_EXTENSION, SQLITE_SAVE_EXTENSION)
+# Overwrite older-format saves with the migrated document after they load.
+SAVE_REWRITE_AFTER_MIGRATION = False
+# Check the chosen save against its header checksum before loading it from the menu.
+SAVE_VERIFY_ON_LOAD = True
+# Autosave every N seconds of play (0 disables). "fork" saves a copy-on-write snapshot from a
+# child process so the game never waits on serialization; "incremental" spreads the save over
+# frames, SAVE_FRAME_BUDGET_MS at a time; "inline" saves on the main thread in one go.
+# Platforms without os.fork save incrementally instead.
+AUTOSAVE_INTERVAL_SECONDS = 300.0
+AUTOSAVE_MODE = "fork"
+AUTOSAVE_FILE = "autosave"
+SAVE_FRAME_BUDGET_MS = 2.0
+# Loading restores the player and their region at once; the rest of the world is
+# rebuilt in the background, this many milliseconds per frame.
+LOAD_HYDRATION_BUDGET_MS = 2.0
 CAMPAIGN_DIR = os.path.join(DATA_DIR, "campaigns")
 
 # --- System Settings ---
@@ -7,6 +7,21 @@ Configuration for the game world, including simulation, spawning, and factions.
 WORLD_UPDATE_INTERVAL = 0.5
 DYNAMIC_REGION_DEFAULT_NUM_ROOMS = 20
 
+# --- Region Streaming ---
+# Static regions load from data files the first time they are entered or
+# pathed through, and are unloaded to a compressed blob once the player has
+# been away from them for REGION_EVICT_IDLE_SECONDS.
+REGION_LAZY_LOADING = True
+REGION_EVICT_IDLE_SECONDS = 600.0
+REGION_EVICTION_CHECK_INTERVAL = 30.0
+
+# --- Region Pre-generation ---
+# Procedural regions are generated ahead of time in worker processes and
+# handed over ready-made; an empty pool falls back to generating in place.
+REGION_PREGEN_ENABLED = True
+REGION_PREGEN_POOL_SIZE = 2       # Ready regions kept per (theme, room count)
+REGION_PREGEN_MAX_WORKERS = 1
+
 # --- Monster Spawner Settings ---
 SPAWN_INTERVAL_SECONDS = 5.0
 SPAWN_CHANCE_PER_TICK = 1.0
@@ -18,6 +33,8 @@ SPAWN_NO_SPAWN_ROOM_KEYWORDS = [
     "general_store", "blacksmith", "farmhouse_yard", "shepherds_hut"
 ]
 SPAWN_DEBUG = False
+# Regions other than the player's that get one spawn attempt per spawner tick.
+SPAWN_BACKGROUND_REGIONS_PER_TICK = 2
 
 # --- Faction Settings ---
 FACTIONS = ["player", "friendly", "neutral", "hostile", "player_minion"]
@@ -0,0 +1,134 @@
+# engine/core/autosave_manager.py
+"""
+Periodic autosaves.
+
+In "fork" mode each autosave runs in a forked child process. The child sees a
+copy-on-write snapshot of the world as it stood at the fork, writes it with
+SaveManager and exits, while the parent goes straight on ticking. The parent
+reaps the child without blocking on later ticks and reports the result in the
+message log. Where os.fork is unavailable, and in "incremental" mode, the
+save is spread over frames by an IncrementalSave instead.
+"""
+import os
+import time
+from typing import TYPE_CHECKING, Optional
+
+from engine.config import (
+    AUTOSAVE_FILE, AUTOSAVE_INTERVAL_SECONDS, AUTOSAVE_MODE, FORMAT_ERROR, FORMAT_GRAY, FORMAT_RESET
+)
+from engine.world.incremental_save import IncrementalSave
+from engine.utils.logger import Logger
+
+if TYPE_CHECKING:
+    from engine.core.game_manager import GameManager
+
+
+class AutosaveManager:
+    def __init__(self, game: 'GameManager'):
+        self.game = game
+        self.timer = 0.0
+        self.child_pid: Optional[int] = None
+        self.child_filename = ""
+        self.child_started_at = 0.0
+        self.incremental: Optional[IncrementalSave] = None
+
+    @staticmethod
+    def fork_available() -> bool:
+        return AUTOSAVE_MODE == "fork" and hasattr(os, "fork")
+
+    @property
+    def is_saving(self) -> bool:
+        return self.child_pid is not None or self.incremental is not None
+
+    @property
+    def progress(self) -> Optional[float]:
+        """Completion of an incremental save in progress, for the HUD."""
+        return self.incremental.progress if self.incremental else None
+
+    def update(self, dt: float):
+        """Called once per tick, after the world has updated."""
+        self.poll()
+        if self.incremental and self.incremental.step():
+            self._finish_incremental()
+        if AUTOSAVE_INTERVAL_SECONDS <= 0: return
+        self.timer += dt
+        if self.timer >= AUTOSAVE_INTERVAL_SECONDS and not self.is_saving:
+            self.timer = 0.0
+            self.save()
+
+    def save(self, filename: str = AUTOSAVE_FILE) -> bool:
+        """Starts an autosave. Returns False if there is nothing to save or one is still running."""
+        world = self.game.world
+        if self.is_saving or not world.player: return False
+        if AUTOSAVE_MODE == "inline":
+            self._save_in_process(filename)
+            return True
+        if not self.fork_available():
+            self.incremental = IncrementalSave(world.save_manager, filename)
+            return True
+
+        # A SQLite connection must not be used on both sides of a fork; both reopen their stores.
+        world.save_manager.close_stores()
+        try:
+            pid = os.fork()
+        except OSError as e:
+            Logger.warning("Autosave", f"Fork failed ({e}); saving incrementally.")
+            self.incremental = IncrementalSave(world.save_manager, filename)
+            return True
+
+        if pid == 0:
+            exit_code = 1
+            try:
+                exit_code = 0 if world.save_game(filename) else 1
+            finally:
+                # Skip interpreter and pygame teardown; they belong to the parent.
+                os._exit(exit_code)
+
+        self.child_pid, self.child_filename, self.child_started_at = pid, filename, time.time()
+        world.save_manager.forked_save_started(filename)
+        Logger.debug("Autosave", f"Autosave to {filename} running in process {pid}.")
+        return True
+
+    def poll(self) -> Optional[bool]:
+        """Reaps a finished autosave child without blocking. Returns its result once, otherwise None."""
+        if self.child_pid is None: return None
+        pid, status = os.waitpid(self.child_pid, os.WNOHANG)
+        if pid == 0: return None
+        return self._finish(status)
+
+    def wait(self) -> Optional[bool]:
+        """Blocks until a running autosave finishes, e.g. before quitting."""
+        if self.incremental:
+            self.incremental.run_to_completion()
+            return self._finish_incremental()
+        if self.child_pid is None: return None
+        _, status = os.waitpid(self.child_pid, 0)
+        return self._finish(status)
+
+    def _finish_incremental(self) -> bool:
+        save = self.incremental
+        if not save: return False
+        self.incremental = None
+        self._report(save.success, save.filename, None)
+        return save.success
+
+    def _finish(self, status: int) -> bool:
+        success = os.waitstatus_to_exitcode(status) == 0
+        elapsed = time.time() - self.child_started_at
+        self.child_pid = None
+        self.game.world.save_manager.forked_save_finished(success)
+        self._report(success, self.child_filename, elapsed)
+        return success
+
+    def _save_in_process(self, filename: str):
+        start = time.time()
+        success = self.game.world.save_game(filename)
+        self._report(success, filename, time.time() - start)
+
+    def _report(self, success: bool, filename: str, elapsed: Optional[float]):
+        if success:
+            Logger.info("Autosave", f"Autosaved to {filename}" + (f" in {elapsed:.2f}s." if elapsed is not None else "."))
+            self.game.renderer.add_message(f"{FORMAT_GRAY}Game autosaved.{FORMAT_RESET}")
+        else:
+            Logger.error("Autosave", f"Autosave to {filename} failed.")
+            self.game.renderer.add_message(f"{FORMAT_ERROR}Autosave failed.{FORMAT_RESET}")
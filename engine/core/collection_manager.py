@@ -1,7 +1,7 @@
 # engine/core/collection_manager.py
 import json
 import os
-from typing import Dict, Any, List, Set, TYPE_CHECKING
+from typing import Dict, Any, FrozenSet, List, Optional, Set, Tuple, TYPE_CHECKING
 from engine.config import DATA_DIR, FORMAT_SUCCESS, FORMAT_HIGHLIGHT, FORMAT_RESET, FORMAT_TITLE, FORMAT_ERROR
 from engine.config.config_display import FORMAT_GRAY
 
@@ -10,10 +10,71 @@ if TYPE_CHECKING:
     from engine.items.item import Item
     from engine.npcs.npc import NPC
 
+class CollectionRegistry(dict):
+    """
+    Collection definitions by ID. Behaves like a plain dict but keeps an
+    item_id -> collection IDs membership index and each collection's set of
+    required items up to date as definitions are stored or removed.
+    """
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__()
+        self.members: Dict[str, Set[str]] = {}
+        self.required: Dict[str, FrozenSet[str]] = {}
+        # Bumped on every change, so counters built against older definitions recount.
+        self.version = 0
+        self.update(*args, **kwargs)
+
+    def __setitem__(self, col_id: str, col_def: Dict[str, Any]) -> None:
+        if col_id in self: self._unindex(col_id)
+        super().__setitem__(col_id, col_def)
+        required = frozenset(col_def.get("items", []))
+        self.required[col_id] = required
+        for item_id in required: self.members.setdefault(item_id, set()).add(col_id)
+        self.version += 1
+
+    def __delitem__(self, col_id: str) -> None:
+        super().__delitem__(col_id)
+        self._unindex(col_id)
+
+    def pop(self, col_id: str, *default: Any) -> Any:
+        if col_id not in self: return super().pop(col_id, *default)
+        col_def = super().pop(col_id)
+        self._unindex(col_id)
+        return col_def
+
+    def setdefault(self, col_id: str, default: Any = None) -> Any:
+        if col_id not in self: self[col_id] = default
+        return self[col_id]
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for col_id, col_def in dict(*args, **kwargs).items():
+            self[col_id] = col_def
+
+    def _unindex(self, col_id: str) -> None:
+        for item_id in self.required.pop(col_id, ()):
+            cols = self.members.get(item_id)
+            if cols is not None:
+                cols.discard(col_id)
+                if not cols: del self.members[item_id]
+        self.version += 1
+
+
+class _Counter:
+    """Found items of one collection, valid while the progress list and definitions it counted are unchanged."""
+    __slots__ = ("progress", "length", "version", "found")
+
+    def __init__(self, progress: List[str], version: int, required: FrozenSet[str]):
+        self.progress = progress
+        self.length = len(progress)
+        self.version = version
+        self.found = set(required.intersection(progress))
+
+
 class CollectionManager:
     def __init__(self, world):
         self.world = world
-        self.collections: Dict[str, Any] = {}
+        self.collections: CollectionRegistry = CollectionRegistry()
+        self._counters: Dict[str, _Counter] = {}
         self._load_collections()
 
     def _load_collections(self):
@@ -21,10 +82,48 @@ class CollectionManager:
         if os.path.exists(path):
             try:
                 with open(path, 'r') as f:
-                    self.collections = json.load(f)
+                    self.collections = CollectionRegistry(json.load(f))
             except Exception as e:
                 print(f"Error loading collections: {e}")
-                self.collections = {}
+                self.collections = CollectionRegistry()
+
+    def _counter(self, player: 'Player', col_id: str) -> _Counter:
+        """
+        The found-item counter for a collection. Counts are kept up to date by record_found;
+        a progress list replaced or edited elsewhere (e.g. by loading a save) is counted afresh.
+        """
+        progress = player.collections_progress.setdefault(col_id, [])
+        counter = self._counters.get(col_id)
+        if (counter is None or counter.progress is not progress or counter.length != len(progress)
+                or counter.version != self.collections.version):
+            counter = self._counters[col_id] = _Counter(progress, self.collections.version, self.collections.required.get(col_id, frozenset()))
+        return counter
+
+    def get_progress(self, player: 'Player', col_id: str) -> Tuple[int, int]:
+        """(items turned in, items required) for a collection the player has started."""
+        if col_id not in player.collections_progress: return 0, len(self.collections.required.get(col_id, ()))
+        return len(self._counter(player, col_id).found), len(self.collections.required.get(col_id, ()))
+
+    def get_collection_for_item(self, item: 'Item') -> Optional[str]:
+        """The collection an item counts toward: the one its collection_id names, else one listing its ID."""
+        col_id = item.get_property("collection_id")
+        if col_id and col_id in self.collections: return col_id
+        col_ids = self.collections.members.get(item.obj_id)
+        return min(col_ids) if col_ids else None
+
+    def record_found(self, player: 'Player', col_id: str, item_id: str, messages: List[str]) -> bool:
+        """
+        Marks an item as turned in for a collection, bumping its counter. Returns False if it
+        already was. Completion fires once, when the counter first reaches the collection's total.
+        """
+        counter = self._counter(player, col_id)
+        if item_id in counter.progress: return False
+        counter.progress.append(item_id)
+        counter.length += 1
+        if item_id in self.collections.required.get(col_id, ()):
+            counter.found.add(item_id)
+            self._check_completion(player, col_id, messages)
+        return True
 
     def handle_collection_discovery(self, player: 'Player', item: 'Item') -> str:
         """
@@ -32,8 +131,8 @@ class CollectionManager:
         1. Adds the collection to the player's list (if new).
         2. Returns a hint string.
         """
-        col_id = item.get_property("collection_id")
-        if not col_id or col_id not in self.collections:
+        col_id = self.get_collection_for_item(item)
+        if not col_id:
             return ""
         
         # --- NEW: Unlock the collection in the UI immediately ---
@@ -58,9 +157,9 @@ class CollectionManager:
             if not slot.item: continue
             
             item = slot.item
-            col_id = item.get_property("collection_id")
+            col_id = self.get_collection_for_item(item)
             
-            if col_id and col_id in self.collections:
+            if col_id:
                 # Initialize progress list if needed
                 if col_id not in player.collections_progress:
                     player.collections_progress[col_id] = []
@@ -82,13 +181,10 @@ class CollectionManager:
             removed_item, count, _ = player.inventory.remove_item(obj_id, qty)
             
             if removed_item:
-                # Update Progress
-                player.collections_progress[col_id].append(obj_id)
                 col_name = self.collections[col_id].get("name", col_id)
                 messages.append(f"Donated {name} to {col_name}.")
-                
-                # Check Completion
-                self._check_completion(player, col_id, messages)
+                # Update Progress (checks completion)
+                self.record_found(player, col_id, obj_id, messages)
 
         return f"{FORMAT_SUCCESS}{' '.join(messages)}{FORMAT_RESET}"
 
@@ -96,10 +192,9 @@ class CollectionManager:
         if player.collections_completed.get(col_id, False): return
 
         col_def = self.collections[col_id]
-        required_items = col_def.get("items", [])
-        found_items = player.collections_progress[col_id]
+        found, total = self.get_progress(player, col_id)
         
-        if set(found_items) >= set(required_items):
+        if found >= total:
             player.collections_completed[col_id] = True
             rewards_msg = self._grant_rewards(player, col_def)
             messages.append(f"\n{FORMAT_TITLE}COLLECTION COMPLETE: {col_def.get('name')}{FORMAT_RESET}\n{rewards_msg}")
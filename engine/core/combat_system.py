@@ -7,13 +7,14 @@ import random
 from typing import Tuple, Optional, Union, TYPE_CHECKING, Dict, Any
 
 from engine.config import (
-    HIT_CHANCE_AGILITY_FACTOR, LEVEL_DIFF_COMBAT_MODIFIERS, 
+    HIT_CHANCE_AGILITY_FACTOR,
     MAX_HIT_CHANCE, MIN_HIT_CHANCE, MINIMUM_DAMAGE_TAKEN,
     PLAYER_ATTACK_DAMAGE_VARIATION_RANGE, NPC_ATTACK_DAMAGE_VARIATION_RANGE,
     PLAYER_BASE_HIT_CHANCE, NPC_BASE_HIT_CHANCE,
     FORMAT_ERROR, FORMAT_RESET
 )
-from engine.utils.text_formatter import get_level_diff_category, format_target_name
+from engine.core.combat_tables import get_level_diff_entry
+from engine.utils.text_formatter import format_target_name
 from engine.utils.utils import format_name_for_display
 
 if TYPE_CHECKING:
@@ -42,9 +43,7 @@ class CombatSystem:
         
         attacker_level = getattr(attacker, 'level', 1)
         defender_level = getattr(defender, 'level', 1)
-        category = get_level_diff_category(attacker_level, defender_level)
-        
-        level_hit_mod, _, _ = LEVEL_DIFF_COMBAT_MODIFIERS.get(category, (1.0, 1.0, 1.0))
+        _, level_hit_mod, _, _ = get_level_diff_entry(attacker_level, defender_level)
         
         final_chance = (base_chance + agi_mod) * level_hit_mod
         return max(MIN_HIT_CHANCE, min(final_chance, MAX_HIT_CHANCE))
@@ -61,9 +60,7 @@ class CombatSystem:
         
         attacker_level = getattr(attacker, 'level', 1)
         defender_level = getattr(defender, 'level', 1)
-        category = get_level_diff_category(attacker_level, defender_level)
-        
-        _, damage_mod, _ = LEVEL_DIFF_COMBAT_MODIFIERS.get(category, (1.0, 1.0, 1.0))
+        _, _, damage_mod, _ = get_level_diff_entry(attacker_level, defender_level)
         
         return max(MINIMUM_DAMAGE_TAKEN, int(base_damage * damage_mod))
 
@@ -0,0 +1,125 @@
+# engine/core/combat_tables.py
+"""
+Precomputed lookup tables for the combat hot path.
+
+Level-difference modifiers and elemental resistance data are derived from
+static configuration, so they are built once here and read by index during
+attacks instead of being recomputed with string comparisons every swing.
+Call rebuild_combat_tables() after the combat config or data files change.
+"""
+from typing import Dict, List, Optional, Tuple
+
+from engine.config import config_combat
+from engine.utils.text_formatter import get_level_diff_category
+
+# (category, hit_mod, damage_mod, xp_mod)
+LevelDiffEntry = Tuple[str, float, float, float]
+
+# Resistance tiers, used as the column index of the flavor matrix.
+RESIST_TIER_NONE = 0
+RESIST_TIER_WEAKNESS = 1
+RESIST_TIER_RESISTANCE = 2
+RESIST_TIER_STRONG = 3
+_TIER_KEYS = (None, "weakness", "resistance", "strong_resistance")
+
+_RESIST_MIN = -100
+_RESIST_MAX = 100
+
+_level_rows: List[List[LevelDiffEntry]] = []
+_max_delta: int = 0
+
+_element_ids: Dict[str, int] = {}
+_default_element_id: int = 0
+_resist_multipliers: List[float] = []
+_resist_tiers: List[int] = []
+_flavor_matrix: List[List[Optional[str]]] = []
+
+
+def _build_level_entry(viewer_level: int, target_level: int) -> LevelDiffEntry:
+    category = get_level_diff_category(viewer_level, target_level)
+    hit_mod, dmg_mod, xp_mod = config_combat.LEVEL_DIFF_COMBAT_MODIFIERS.get(category, (1.0, 1.0, 1.0))
+    return (category, hit_mod, dmg_mod, xp_mod)
+
+
+def _resist_tier(resistance: int) -> int:
+    if resistance < 0: return RESIST_TIER_WEAKNESS
+    if resistance >= 50: return RESIST_TIER_STRONG
+    if resistance > 0: return RESIST_TIER_RESISTANCE
+    return RESIST_TIER_NONE
+
+
+def rebuild_combat_tables() -> None:
+    """(Re)builds every combat lookup table from the current configuration."""
+    global _level_rows, _max_delta, _element_ids, _default_element_id
+    global _resist_multipliers, _resist_tiers, _flavor_matrix
+
+    # 1. Level-difference rows: one per viewer level, indexed by (delta + max_delta).
+    max_level = config_combat.COMBAT_TABLE_MAX_LEVEL
+    max_delta = config_combat.COMBAT_TABLE_MAX_LEVEL_DELTA
+    level_rows: List[List[LevelDiffEntry]] = [[]]  # Index 0 unused; levels start at 1.
+    for viewer_level in range(1, max_level + 1):
+        level_rows.append([
+            _build_level_entry(viewer_level, viewer_level + delta)
+            for delta in range(-max_delta, max_delta + 1)
+        ])
+
+    # 2. Intern damage types to small integer IDs.
+    element_ids: Dict[str, int] = {}
+    for dmg_type in list(config_combat.VALID_DAMAGE_TYPES) + [config_combat.SPELL_DEFAULT_DAMAGE_TYPE] + list(config_combat.DAMAGE_TYPE_FLAVOR_TEXT.keys()):
+        if dmg_type not in element_ids:
+            element_ids[dmg_type] = len(element_ids)
+    default_element_id = element_ids.setdefault("default", len(element_ids))
+
+    # 3. Resistance rows, indexed by (clamped resistance - _RESIST_MIN).
+    resist_multipliers = [1.0 - (r / 100.0) for r in range(_RESIST_MIN, _RESIST_MAX + 1)]
+    resist_tiers = [_resist_tier(r) for r in range(_RESIST_MIN, _RESIST_MAX + 1)]
+
+    # 4. Element x resistance-tier flavor matrix.
+    default_flavor = config_combat.DAMAGE_TYPE_FLAVOR_TEXT.get("default", {})
+    flavor_matrix: List[List[Optional[str]]] = []
+    for dmg_type in element_ids:
+        flavor = config_combat.DAMAGE_TYPE_FLAVOR_TEXT.get(dmg_type, default_flavor)
+        flavor_matrix.append([flavor.get(key) if key else None for key in _TIER_KEYS])
+
+    _level_rows, _max_delta = level_rows, max_delta
+    _element_ids, _default_element_id = element_ids, default_element_id
+    _resist_multipliers, _resist_tiers, _flavor_matrix = resist_multipliers, resist_tiers, flavor_matrix
+
+
+def get_level_diff_entry(viewer_level: int, target_level: int) -> LevelDiffEntry:
+    """Returns (category, hit_mod, damage_mod, xp_mod) for a level matchup."""
+    if 1 <= viewer_level < len(_level_rows):
+        delta = target_level - viewer_level
+        if delta > _max_delta: delta = _max_delta
+        elif delta < -_max_delta: delta = -_max_delta
+        return _level_rows[viewer_level][delta + _max_delta]
+    return _build_level_entry(viewer_level, target_level)
+
+
+def get_element_id(damage_type: str) -> int:
+    """Returns the interned integer ID for a damage type."""
+    return _element_ids.get(damage_type, _default_element_id)
+
+
+def _resist_index(resistance: int) -> int:
+    if resistance > _RESIST_MAX: resistance = _RESIST_MAX
+    elif resistance < _RESIST_MIN: resistance = _RESIST_MIN
+    return int(resistance) - _RESIST_MIN
+
+
+def get_resistance_multiplier(resistance: int) -> float:
+    """Damage multiplier for a resistance percentage (clamped to -100..100)."""
+    if not isinstance(resistance, int):
+        # Fractional resistances from scaled effects can't be table-indexed.
+        return 1.0 - (max(_RESIST_MIN, min(_RESIST_MAX, resistance)) / 100.0)
+    return _resist_multipliers[_resist_index(resistance)]
+
+
+def get_resistance_flavor(damage_type: str, resistance: int) -> Optional[str]:
+    """Returns the raw flavor template for hitting a given resistance, if any."""
+    tier = _resist_tiers[_resist_index(resistance)] if isinstance(resistance, int) else _resist_tier(resistance)
+    if tier == RESIST_TIER_NONE: return None
+    return _flavor_matrix[get_element_id(damage_type)][tier]
+
+
+rebuild_combat_tables()
@@ -67,10 +67,6 @@ class ConversationHistory:
     def from_dict(cls, data: Dict[str, Any]) -> 'ConversationHistory':
         history = cls()
         history.vocabulary = set(data.get("vocabulary", ["job", "rumors"]))
-        
-        # Legacy support: if loading old save with global_known_topics, merge into vocabulary
-        if "global_known_topics" in data:
-            history.vocabulary.update(data["global_known_topics"])
 
         raw_npc_history = data.get("npc_history", {})
         for npc_id, npc_data in raw_npc_history.items():
@@ -0,0 +1,124 @@
+# engine/core/factions.py
+"""
+Interned faction IDs and the integer faction relationship matrix.
+
+Factions are mapped to small integers when the config loads so that relation
+checks in the AI loop are list reads instead of nested string-dict walks.
+Player reputation is mirrored into a per-faction offset vector that is only
+touched when reputation actually changes.
+"""
+from typing import Any, Dict, List, Tuple
+
+from engine.config import FACTIONS, FACTION_RELATIONSHIP_MATRIX
+
+_faction_ids: Dict[str, int] = {}
+_relation_matrix: List[List[int]] = []
+
+
+def rebuild_faction_tables() -> None:
+    """(Re)builds the faction ID table and relationship matrix from config."""
+    _faction_ids.clear()
+    _relation_matrix.clear()
+    for faction in FACTIONS:
+        get_faction_id(faction)
+    for viewer, relations in FACTION_RELATIONSHIP_MATRIX.items():
+        viewer_id = get_faction_id(viewer)
+        for target, value in relations.items():
+            _relation_matrix[viewer_id][get_faction_id(target)] = value
+
+
+def get_faction_id(faction: str) -> int:
+    """Returns the interned ID for a faction, registering unknown factions as neutral to everyone."""
+    faction_id = _faction_ids.get(faction)
+    if faction_id is None:
+        faction_id = len(_faction_ids)
+        _faction_ids[faction] = faction_id
+        # Grow in place so existing row references stay valid.
+        for row in _relation_matrix:
+            row.append(0)
+        _relation_matrix.append([0] * (faction_id + 1))
+    return faction_id
+
+
+def get_base_relation(viewer_id: int, target_id: int) -> int:
+    """Matrix relation of one faction toward another, by interned ID."""
+    return _relation_matrix[viewer_id][target_id]
+
+
+class ReputationMap(dict):
+    """
+    Player reputation keyed by faction name. Every write is mirrored into
+    `offsets`, a list indexed by faction ID, so relation checks can add the
+    player's standing without a string lookup.
+    """
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.offsets: List[int] = []
+        for faction, value in self.items():
+            self._sync(faction, value)
+
+    def _sync(self, faction: str, value: int) -> None:
+        faction_id = get_faction_id(faction)
+        if faction_id >= len(self.offsets):
+            self.offsets.extend([0] * (faction_id + 1 - len(self.offsets)))
+        self.offsets[faction_id] = value
+
+    def offset(self, faction_id: int) -> int:
+        return self.offsets[faction_id] if faction_id < len(self.offsets) else 0
+
+    def __setitem__(self, faction: str, value: int) -> None:
+        super().__setitem__(faction, value)
+        self._sync(faction, value)
+
+    def __delitem__(self, faction: str) -> None:
+        super().__delitem__(faction)
+        self._sync(faction, 0)
+
+    def pop(self, faction: str, *default: Any) -> Any:
+        had_key = faction in self
+        value = super().pop(faction, *default)
+        if had_key: self._sync(faction, 0)
+        return value
+
+    def popitem(self) -> Tuple[str, int]:
+        faction, value = super().popitem()
+        self._sync(faction, 0)
+        return faction, value
+
+    def setdefault(self, faction: str, default: int = 0) -> int:
+        if faction not in self: self[faction] = default
+        return self[faction]
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for faction, value in dict(*args, **kwargs).items():
+            self[faction] = value
+
+    def clear(self) -> None:
+        super().clear()
+        self.offsets = []
+
+
+class FactionMemberMixin:
+    """
+    Keeps an interned `faction_id` in sync with the `faction` string.
+    `is_player_like` marks entities whose reputation modifies how others see them.
+    """
+    is_player_like: bool = False
+    faction_id: int = 0
+    _faction: str = "neutral"
+
+    @property
+    def faction(self) -> str:
+        return self._faction
+
+    @faction.setter
+    def faction(self, value: str) -> None:
+        self._faction = value
+        self.faction_id = get_faction_id(value)
+        self._on_faction_changed()
+
+    def _on_faction_changed(self) -> None:
+        pass
+
+
+rebuild_faction_tables()
@@ -10,8 +10,9 @@ from engine.ai.ai_manager import AIManager
 from engine.commands.command_system import CommandProcessor
 from engine.config import (
     FORMAT_ERROR, FORMAT_HIGHLIGHT, FORMAT_RESET, FORMAT_TITLE, SCREEN_HEIGHT, SCREEN_WIDTH, TARGET_FPS,
-    DEBUG_IGNORE_PLAYER_COMBAT, DEFAULT_SAVE_FILE, SAVE_GAME_DIR, DATA_DIR
+    DEBUG_IGNORE_PLAYER_COMBAT, DEFAULT_SAVE_FILE, SAVE_GAME_DIR, SAVE_VERIFY_ON_LOAD, DATA_DIR
 )
+from engine.core.autosave_manager import AutosaveManager
 from engine.core.collection_manager import CollectionManager
 from engine.core.knowledge_manager import KnowledgeManager
 from engine.core.time_manager import TimeManager
@@ -19,6 +20,8 @@ from engine.core.weather_manager import WeatherManager
 from engine.core.input_handler import InputHandler
 from engine.ui.renderer import Renderer
 from engine.world.world import World
+from engine.world.save_manager import SaveManager
+from engine.world.region_pool import shutdown_executor
 from engine.utils.utils import format_name_for_display
 from engine.ui.ui_manager import UIManager
 from engine.ui.ui_element import UIPanel
@@ -47,6 +50,7 @@ class GameManager:
         self.renderer = Renderer(self.screen, self)
         self.input_handler = InputHandler(self, self.command_processor)
         self.ai_manager = AIManager(self)
+        self.autosave_manager = AutosaveManager(self)
 
         self.current_save_file = save_file
         self.game_state = "title_screen"
@@ -67,6 +71,9 @@ class GameManager:
         self.title_options = ["New Game", "Load Game", "Quit"]
         self.selected_title_option = 0
         self.available_saves: List[str] = []
+        # Save filename -> slot header (None for saves without one), for the load menu.
+        self.save_slot_headers: Dict[str, Optional[Dict[str, Any]]] = {}
+        self.load_error_message: Optional[str] = None
         self.selected_load_option = 0
 
         # --- Character Creation State ---
@@ -152,6 +159,9 @@ class GameManager:
 
             self.renderer.draw()
         
+        self.autosave_manager.wait()
+        shutdown_executor()
+        self.world.save_manager.close_stores()
         pygame.quit()
         sys.exit()
 
@@ -184,6 +194,9 @@ class GameManager:
         if self.world.player and not self.world.player.is_alive:
             self.game_state = "game_over"
 
+        # Autosaves start at the end of a tick, so they capture a whole tick's changes.
+        self.autosave_manager.update(dt)
+
     def process_command(self, text: str) -> Optional[str]:
         self.renderer.add_message(f"> {text}")
         context = {"game": self, "world": self.world, "command_processor": self.command_processor}
@@ -246,7 +259,15 @@ class GameManager:
     def load_selected_game(self):
         if self.selected_load_option < 0 or self.selected_load_option >= len(self.available_saves): return
         save_to_load = self.available_saves[self.selected_load_option]
-        load_success, loaded_time_data, loaded_weather_data = self.world.load_save_game(save_to_load)
+        # Only the chosen slot is checked; the menu itself never reads past the headers.
+        if SAVE_VERIFY_ON_LOAD:
+            ok, reason = self.world.save_manager.verify_save(save_to_load)
+            if not ok:
+                Logger.error("GameManager", f"Refusing to load '{save_to_load}': {reason}.")
+                self.load_error_message = f"Cannot load {save_to_load}: {reason}."
+                return
+        self.load_error_message = None
+        load_success, loaded_time_data, loaded_weather_data = self.world.load_save_game(save_to_load, phased=True)
         if load_success and self.world.player and loaded_weather_data:
             self.time_manager.apply_loaded_time_state(loaded_time_data)
             self.weather_manager.apply_loaded_weather_state(loaded_weather_data)
@@ -272,6 +293,8 @@ class GameManager:
         self.input_handler.input_text = ""
 
     def quit_to_title(self):
+        self.autosave_manager.wait()
+        self.autosave_manager.timer = 0.0
         self.renderer.text_buffer = []
         self.renderer.scroll_offset = 0
         self.input_handler.input_text = ""
@@ -293,9 +316,11 @@ class GameManager:
 
     def _update_available_saves(self):
         self.available_saves = []
-        if not os.path.isdir(SAVE_GAME_DIR): return
+        self.save_slot_headers = {}
+        self.load_error_message = None
         try:
-            self.available_saves = sorted([fname for fname in os.listdir(SAVE_GAME_DIR) if fname.lower().endswith(".json")])
+            self.save_slot_headers = dict(SaveManager.list_save_slots(SAVE_GAME_DIR))
+            self.available_saves = list(self.save_slot_headers)
         except Exception as e:
             Logger.error("GameManager", f"Error scanning save directory '{SAVE_GAME_DIR}': {e}")
             
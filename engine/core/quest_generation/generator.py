@@ -200,7 +200,7 @@ class QuestGenerator:
                 theme = region_conf.get("theme", "caves")
                 rooms_count = region_conf.get("rooms", 5)
                 gen = RegionGenerator(self.world)
-                result = gen.generate_region(theme, rooms_count)
+                result = self.world.region_pool.acquire(theme, rooms_count, gen)
                 if result:
                     new_region, entry_room_id = result
                     new_region_id = new_region.obj_id
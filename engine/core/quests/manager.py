@@ -145,6 +145,8 @@ class QuestManager:
             self.world.instance_manager.cleanup_quest_region(quest_id)
         
         player.completed_quest_log[quest_id] = quest_data
+        if self.world.instance_manager:
+            self.world.instance_manager.request_cleanup_check()
         
         if "campaign_context" not in quest_data:
              self.replenish_board(quest_id)
@@ -212,7 +214,7 @@ class QuestManager:
         objective = stage_data.get("objective", {})
         if objective.get("is_procedural_item"):
             item_data = objective.get("procedural_item_data")
-            target_region_id = random.choice(list(self.world.regions.keys()))
+            target_region_id = random.choice(self.world.regions.known_ids())
             region = self.world.get_region(target_region_id)
             if region:
                 room_id = random.choice(list(region.rooms.keys()))
@@ -1,10 +1,11 @@
 # engine/crafting/crafting_manager.py
 import json
 import os
-from typing import Dict, List, Tuple, Optional, TYPE_CHECKING
+from typing import Any, Dict, List, Set, Tuple, Optional, TYPE_CHECKING
 
 from engine.config import DATA_DIR, FORMAT_ERROR, FORMAT_RESET, FORMAT_SUCCESS
 from engine.crafting.recipe import Recipe
+from engine.crafting.recipe_book import RecipeBook
 from engine.items.item import Item
 from engine.items.item_factory import ItemFactory
 from engine.core.skill_system import SkillSystem
@@ -16,7 +17,13 @@ if TYPE_CHECKING:
 class CraftingManager:
     def __init__(self, world: 'World'):
         self.world = world
-        self.recipes: Dict[str, Recipe] = {}
+        self.recipes: RecipeBook = RecipeBook()
+        # Cached result of craftable_recipes and the state it was computed from.
+        self._craftable: Set[str] = set()
+        self._craftable_key: Optional[tuple] = None
+        # Template ID -> (material template ID, quantity), rebuilt when the template table changes.
+        self.salvage_yields: Dict[str, Tuple[str, int]] = {}
+        self._salvage_source: Optional[tuple] = None
         self._load_recipes()
 
     def _load_recipes(self):
@@ -55,20 +62,30 @@ class CraftingManager:
         
         return stations
 
-    def can_craft(self, player: 'Player', recipe: Recipe) -> Tuple[bool, str]:
-        """Checks if player has ingredients, station, AND SKILL."""
+    @staticmethod
+    def inventory_counts(player: 'Player') -> Dict[str, int]:
+        """Quantity of each item ID the player carries, from one pass over the inventory."""
+        counts: Dict[str, int] = {}
+        for slot in player.inventory.slots:
+            if slot.item: counts[slot.item.obj_id] = counts.get(slot.item.obj_id, 0) + slot.quantity
+        return counts
+
+    def can_craft(self, player: 'Player', recipe: Recipe, stations: Optional[List[str]] = None,
+                  counts: Optional[Dict[str, int]] = None) -> Tuple[bool, str]:
+        """Checks if player has ingredients, station, AND SKILL. Callers checking many recipes pass stations and counts in."""
         
         # 1. Check Station
         if recipe.station_required:
-            nearby = self.get_nearby_stations()
+            nearby = stations if stations is not None else self.get_nearby_stations()
             if recipe.station_required not in nearby:
                 return False, f"You need a {recipe.station_display} to craft this."
 
         # 2. Check Ingredients
+        if counts is None: counts = self.inventory_counts(player)
         for ing in recipe.ingredients:
             req_id = ing["item_id"]
             req_qty = ing["quantity"]
-            has_qty = player.inventory.count_item(req_id)
+            has_qty = counts.get(req_id, 0)
             if has_qty < req_qty:
                 template = ItemFactory.get_template(req_id, self.world)
                 name = template.get("name", req_id) if template else req_id
@@ -76,6 +93,35 @@ class CraftingManager:
 
         return True, "Ready to craft."
 
+    def craftable_recipes(self, player: 'Player') -> Set[str]:
+        """
+        IDs of the recipes the player can craft right here. Cached until the recipe set,
+        the player's inventory or the current room's contents change.
+        """
+        world = self.world
+        room = world.get_current_room() if world.current_region_id and world.current_room_id else None
+        key = (self.recipes.version, player.inventory, player.inventory.revision,
+               world.current_region_id, world.current_room_id, room, room.save_version if room else 0)
+        if key == self._craftable_key: return self._craftable
+
+        # Only handcrafted recipes and those made at a station here can be ready...
+        made_here: Dict[str, Recipe] = {}
+        for station in (None, "", *set(self.get_nearby_stations())):
+            made_here.update(self.recipes.by_station.get(station, {}))
+        # ...and only if they use something the player carries (or nothing at all).
+        counts = self.inventory_counts(player)
+        candidates: Dict[str, Recipe] = dict(self.recipes.no_ingredients)
+        for item_id in counts:
+            candidates.update(self.recipes.by_ingredient.get(item_id, {}))
+
+        craftable = set()
+        for recipe_id, recipe in candidates.items():
+            if recipe_id not in made_here: continue
+            if all(counts.get(ing["item_id"], 0) >= ing["quantity"] for ing in recipe.ingredients):
+                craftable.add(recipe_id)
+        self._craftable, self._craftable_key = craftable, key
+        return craftable
+
     def craft(self, player: 'Player', recipe_id: str) -> str:
         """Executes the crafting process: consume ingredients, create result."""
         recipe = self.recipes.get(recipe_id)
@@ -125,38 +171,47 @@ class CraftingManager:
         
         return f"{FORMAT_SUCCESS}Successfully crafted {recipe.result_quantity} x {result_item.name}.{FORMAT_RESET} {roll_msg}{xp_msg}"
 
+    @staticmethod
+    def _salvage_rule(name: str, weight: float) -> Tuple[str, int]:
+        """Material and quantity an item breaks down into, judged by its name and weight."""
+        name_lower = name.lower()
+        if "sword" in name_lower or "plate" in name_lower or "helm" in name_lower:
+            return "item_iron_ingot", max(1, int(weight // 2))
+        if "leather" in name_lower or "boots" in name_lower:
+            return "item_leather_scraps", max(1, int(weight // 1))
+        return "item_scrap", 1 # Generic junk
+
+    def _build_salvage_table(self) -> None:
+        templates = self.world.item_templates
+        self.salvage_yields = {
+            template_id: self._salvage_rule(template.get("name", ""), template.get("weight", 1.0))
+            for template_id, template in templates.items()
+        }
+        self._salvage_source = (templates, len(templates))
+
+    def get_salvage_yield(self, item: Item) -> Tuple[str, int]:
+        templates = self.world.item_templates
+        if self._salvage_source != (templates, len(templates)): self._build_salvage_table()
+        known = self.salvage_yields.get(item.obj_id)
+        if known and item.name == templates.get(item.obj_id, {}).get("name"): return known
+        # Renamed instances (e.g. affixed loot) and template-less items are judged as they are.
+        return self._salvage_rule(item.name, item.weight)
+
     def salvage(self, player: 'Player', item: Item) -> str:
         """Breaks down an item into basic materials."""
         
         # 1. Determine Output
-        # Simple logic: Based on name/type
-        output_template_id = None
-        output_qty = 1
-        
-        name_lower = item.name.lower()
-        if "sword" in name_lower or "plate" in name_lower or "helm" in name_lower:
-            output_template_id = "item_iron_ingot"
-            output_qty = max(1, int(item.weight // 2))
-        elif "leather" in name_lower or "boots" in name_lower:
-            output_template_id = "item_leather_scraps" # Assuming this exists or generic scrap
-            output_qty = max(1, int(item.weight // 1))
-        else:
-             # Default fallback
-             output_template_id = "item_scrap" # Generic junk
-
-        # 2. Check if template exists
-        # In a real scenario we'd check self.world.item_templates
-        # For now, let's assume factories handle None return
-        
+        output_template_id, output_qty = self.get_salvage_yield(item)
+
         mat = ItemFactory.create_item_from_template(output_template_id, self.world)
         if not mat:
              return f"{FORMAT_ERROR}You cannot salvage the {item.name}.{FORMAT_RESET}"
              
-        # 3. Remove Item
+        # 2. Remove Item
         # If stackable, we only salvage 1 unless we add qty logic. Assuming 1.
         player.inventory.remove_item(item.obj_id, 1)
         
-        # 4. Add Materials
+        # 3. Add Materials
         player.inventory.add_item(mat, output_qty)
         
         return f"{FORMAT_SUCCESS}You salvage the {item.name} and recover {output_qty} {mat.name}.{FORMAT_RESET}"
@@ -0,0 +1,89 @@
+# engine/crafting/recipe_book.py
+"""
+The crafting manager's recipe table. Behaves like the plain recipe_id ->
+Recipe dict it replaces, but keeps two indexes up to date as recipes are
+added and removed: ingredient item ID -> recipes that use it, and station
+type (None for handcrafting) -> recipes made there. `version` is bumped on
+every change so callers can cache results derived from the recipe set.
+Recipes are indexed as they are stored; re-store one after changing its
+station or ingredients.
+"""
+from typing import Any, Dict, Optional, Tuple
+
+from engine.crafting.recipe import Recipe
+
+
+class RecipeBook(dict):
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__()
+        self.by_ingredient: Dict[str, Dict[str, Recipe]] = {}
+        self.by_station: Dict[Optional[str], Dict[str, Recipe]] = {}
+        # Recipes with no ingredients are craftable from an empty inventory.
+        self.no_ingredients: Dict[str, Recipe] = {}
+        # recipe_id -> (ingredient IDs, station) it was indexed under, so removal is exact.
+        self._indexed_as: Dict[str, Tuple[Tuple[str, ...], Optional[str]]] = {}
+        self.version = 0
+        self.update(*args, **kwargs)
+
+    # --- Dict Interface ---
+    def __setitem__(self, recipe_id: str, recipe: Recipe) -> None:
+        old = self.get(recipe_id)
+        if old is not None: self._unindex(recipe_id, old)
+        super().__setitem__(recipe_id, recipe)
+        self._index(recipe_id, recipe)
+
+    def __delitem__(self, recipe_id: str) -> None:
+        recipe = self[recipe_id]
+        super().__delitem__(recipe_id)
+        self._unindex(recipe_id, recipe)
+
+    def pop(self, recipe_id: str, *default: Any) -> Any:
+        if recipe_id not in self: return super().pop(recipe_id, *default)
+        recipe = super().pop(recipe_id)
+        self._unindex(recipe_id, recipe)
+        return recipe
+
+    def popitem(self) -> Tuple[str, Recipe]:
+        recipe_id, recipe = super().popitem()
+        self._unindex(recipe_id, recipe)
+        return recipe_id, recipe
+
+    def setdefault(self, recipe_id: str, default: Any = None) -> Any:
+        if recipe_id not in self: self[recipe_id] = default
+        return self[recipe_id]
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for recipe_id, recipe in dict(*args, **kwargs).items():
+            self[recipe_id] = recipe
+
+    def clear(self) -> None:
+        super().clear()
+        self.by_ingredient.clear()
+        self.by_station.clear()
+        self.no_ingredients.clear()
+        self._indexed_as.clear()
+        self.version += 1
+
+    # --- Indexes ---
+    def _index(self, recipe_id: str, recipe: Recipe) -> None:
+        ingredient_ids = tuple(ing["item_id"] for ing in recipe.ingredients)
+        for item_id in ingredient_ids:
+            self.by_ingredient.setdefault(item_id, {})[recipe_id] = recipe
+        if not ingredient_ids: self.no_ingredients[recipe_id] = recipe
+        self.by_station.setdefault(recipe.station_required, {})[recipe_id] = recipe
+        self._indexed_as[recipe_id] = (ingredient_ids, recipe.station_required)
+        self.version += 1
+
+    def _unindex(self, recipe_id: str, recipe: Recipe) -> None:
+        ingredient_ids, station = self._indexed_as.pop(recipe_id, ((), recipe.station_required))
+        for item_id in ingredient_ids:
+            users = self.by_ingredient.get(item_id)
+            if users is not None:
+                users.pop(recipe_id, None)
+                if not users: del self.by_ingredient[item_id]
+        self.no_ingredients.pop(recipe_id, None)
+        made_here = self.by_station.get(station)
+        if made_here is not None:
+            made_here.pop(recipe_id, None)
+            if not made_here: del self.by_station[station]
+        self.version += 1
@@ -5,6 +5,7 @@ import uuid
 import time
 from engine.config import EFFECT_DEFAULT_TICK_INTERVAL, FORMAT_ERROR, FORMAT_HIGHLIGHT, FORMAT_RESET, FORMAT_SUCCESS, NPC_DOT_FLAVOR_MESSAGES, MINIMUM_DAMAGE_TAKEN
 from engine.config.config_display import SCREEN_HEIGHT, SCREEN_WIDTH
+from engine.core.combat_tables import get_resistance_multiplier
 
 class GameObject:
     def __init__(self, obj_id: Optional[str] = None, name: str = "Unknown",
@@ -118,9 +119,7 @@ class GameObject:
         damage_after_flat_reduction = max(0, amount - base_reduction)
         if damage_after_flat_reduction == 0: return 0
 
-        resistance_percent = self.get_resistance(damage_type)
-        resistance_percent = max(-100, min(100, resistance_percent))
-        resistance_multiplier = 1.0 - (resistance_percent / 100.0)
+        resistance_multiplier = get_resistance_multiplier(self.get_resistance(damage_type))
         final_damage = int(damage_after_flat_reduction * resistance_multiplier)
         actual_damage_taken = max(MINIMUM_DAMAGE_TAKEN, final_damage) if final_damage > 0 else 0
 
@@ -1,5 +1,5 @@
 # engine/items/inventory/core.py
-from typing import List, Optional, Tuple
+from typing import Callable, List, Optional, Tuple
 from engine.items.item import Item
 from .slot import InventorySlot
 from .display import InventoryDisplayMixin
@@ -10,11 +10,15 @@ class Inventory(InventoryDisplayMixin, InventoryPersistenceMixin):
     Manages a collection of items in inventory slots.
     Mixins handle display strings and serialization.
     """
+    # Called as (item, quantity) after every add made with notify=True; the player uses it for acquisition events.
+    on_item_added: Optional[Callable[[Item, int], None]] = None
 
     def __init__(self, max_slots: int = 20, max_weight: float = 100.0):
         self.slots: List[InventorySlot] = [InventorySlot() for _ in range(max_slots)]
         self.max_slots = max_slots
         self.max_weight = max_weight
+        # Bumped on every add/remove/sort, for callers that cache serialized inventories.
+        self.revision = 0
 
     def can_add_item(self, item: Item, quantity: int = 1) -> Tuple[bool, str]:
          """Check weight and slot constraints before adding."""
@@ -48,30 +52,33 @@ class Inventory(InventoryDisplayMixin, InventoryPersistenceMixin):
 
          return True, ""
 
-    def add_item(self, item: Item, quantity: int = 1) -> Tuple[bool, str]:
+    def add_item(self, item: Item, quantity: int = 1, notify: bool = True) -> Tuple[bool, str]:
+        """Adds items; notify=False marks a move within the owner's hands (e.g. unequipping), not an acquisition."""
         can_add, message = self.can_add_item(item, quantity)
         if not can_add:
              return False, message
+        self.revision += 1
+        remaining = quantity
 
         # Add to existing stacks
         if item.stackable:
             for slot in self.slots:
                 if slot.item and slot.item.obj_id == item.obj_id:
-                    added = slot.add(item, quantity)
-                    quantity -= added
-                    if quantity <= 0:
-                        return True, f"Added {item.name} to inventory."
+                    added = slot.add(item, remaining)
+                    remaining -= added
+                    if remaining <= 0: break
 
         # Add to empty slots
-        while quantity > 0:
+        while remaining > 0:
             empty_slot = next((slot for slot in self.slots if not slot.item), None)
             if not empty_slot:
-                 return False, f"Not enough space for the remaining {quantity} {item.name}."
+                 return False, f"Not enough space for the remaining {remaining} {item.name}."
 
-            to_add_this_slot = 1 if not item.stackable else quantity
+            to_add_this_slot = 1 if not item.stackable else remaining
             empty_slot.add(item, to_add_this_slot)
-            quantity -= to_add_this_slot
+            remaining -= to_add_this_slot
 
+        if notify and self.on_item_added is not None: self.on_item_added(item, quantity)
         return True, f"Added {item.name} to inventory."
 
     def remove_item(self, obj_id: str, quantity: int = 1) -> Tuple[Optional[Item], int, str]:
@@ -93,6 +100,7 @@ class Inventory(InventoryDisplayMixin, InventoryPersistenceMixin):
                  return None, 0, "You don't have that item."
 
         quantity_to_remove = min(total_available, quantity)
+        self.revision += 1
         actual_removed_count = 0
         last_removed_instance: Optional[Item] = None
 
@@ -159,6 +167,7 @@ class Inventory(InventoryDisplayMixin, InventoryPersistenceMixin):
 
         for slot in self.slots:
             if slot.item is item_instance:
+                self.revision += 1
                 removed_type, removed_count = slot.remove(1) 
                 return removed_type is not None and removed_count == 1
         return False
\ No newline at end of file
@@ -74,7 +74,8 @@ class InventoryDisplayMixin:
     def sort_items(self) -> None:
         """Sorts the inventory, grouping items by type and then alphabetically."""
         inventory = cast('Inventory', self)
-        
+        inventory.revision += 1
+
         item_slots = [slot for slot in inventory.slots if slot.item]
         empty_slots = [slot for slot in inventory.slots if not slot.item]
 
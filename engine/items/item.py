@@ -1,10 +1,14 @@
 # engine/items/item.py
 from typing import Dict, Any, List, Optional
 from engine.game_object import GameObject
+from engine.items.item_template import TEMPLATE_ATTRS, ItemTemplate, PropertyOverlay, same_as_template
 
 class Item(GameObject):
     """Base class for all items in the game."""
 
+    # Shared record of the template this item was built from, if any (see bind_template).
+    template: Optional[ItemTemplate] = None
+
     def __init__(self, obj_id: Optional[str] = None, name: str = "Unknown Item",
                  description: str = "No description", weight: float = 1.0,
                  value: int = 0, stackable: bool = False,
@@ -31,6 +35,27 @@ class Item(GameObject):
              if key not in skip_keys:
                   self.update_property(key, kwarg_value)
 
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for attributes the instance does not hold itself.
+        template = self.__dict__.get("template")
+        if template is not None and name in TEMPLATE_ATTRS:
+            return getattr(template, name)
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def bind_template(self, template: ItemTemplate) -> None:
+        """Drops everything this item shares with its template, keeping only its own values."""
+        base = template.properties
+        overrides = {key: value for key, value in self.properties.items()
+                     if key not in base or not same_as_template(value, base[key])}
+        overlay = PropertyOverlay(base, overrides)
+        for key in base:
+            if key not in self.properties: del overlay[key]
+        self.properties = overlay
+        for attr in TEMPLATE_ATTRS:
+            if attr in self.__dict__ and same_as_template(self.__dict__[attr], getattr(template, attr)):
+                del self.__dict__[attr]
+        self.template = template
+
     def examine(self) -> str:
         base_desc = f"{self.name}\n\n{self.description}\n\nWeight: {self.weight}, Value: {self.value}"
         equip_slots = self.get_property("equip_slot")
@@ -53,6 +78,7 @@ class Item(GameObject):
 
     def to_dict(self) -> Dict[str, Any]:
         data = super().to_dict()
+        data["properties"] = dict(self.properties.items())
         # Ensure core properties are present at top level for compatibility/readability
         data["weight"] = self.weight
         data["value"] = self.value
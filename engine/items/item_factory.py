@@ -9,6 +9,7 @@ from typing import TYPE_CHECKING, Any, Dict, Optional, Type
 from engine.items.gem import Gem
 from engine.items.interactive import Interactive
 from engine.items.item import Item
+from engine.items.item_template import ItemTemplate
 from engine.items.weapon import Weapon
 from engine.items.armor import Armor
 from engine.items.consumable import Consumable
@@ -155,6 +156,17 @@ class ItemFactory:
                 
             template = new_template
 
+        # Procedural templates differ per item, so only fixed ones share a record.
+        record = None
+        if template is world.item_templates.get(item_id):
+            record = ItemTemplate.intern(item_id, template, lambda: ItemFactory._build_item(item_id, template, world, {}))
+
+        item = ItemFactory._build_item(item_id, template, world, overrides)
+        if item and record and type(item) is record.item_type: item.bind_template(record)
+        return item
+
+    @staticmethod
+    def _build_item(item_id: str, template: Dict[str, Any], world: 'World', overrides: Dict[str, Any]) -> Optional['Item']:
         item_type_name = template.get("type", "Item")
         item_class = ITEM_CLASS_MAP.get(item_type_name)
 
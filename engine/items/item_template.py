@@ -0,0 +1,166 @@
+# engine/items/item_template.py
+"""
+Shared item template records.
+
+Every item built from a template used to carry a full copy of the template's
+properties. Items now point at one interned, read-only ItemTemplate per
+template id and keep only what differs in a PropertyOverlay: reads fall
+through to the template, writes land in the overlay. The overlay is exactly
+what a save needs to record for the item.
+"""
+import copy
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Mapping, Optional
+from collections.abc import MutableMapping
+
+if TYPE_CHECKING:
+    from engine.items.item import Item
+
+# Instance attributes an item reads from its template until it is given its own value.
+TEMPLATE_ATTRS = ("name", "description", "weight", "value", "stackable")
+
+# Values that can be shared between items safely when equal. Mutable values are only
+# shared when the item already holds the template's own object.
+_IMMUTABLE = (str, int, float, bool, type(None), tuple, frozenset)
+
+_MISSING = object()
+
+
+def same_as_template(value: Any, template_value: Any) -> bool:
+    if value is template_value: return True
+    return type(value) is type(template_value) and isinstance(value, _IMMUTABLE) and value == template_value
+
+
+class ItemTemplate:
+    """Read-only record of what a freshly built item of one template looks like."""
+    __slots__ = ("template_id", "source", "item_type", "name", "description", "weight", "value", "stackable", "properties")
+
+    _interned: Dict[str, 'ItemTemplate'] = {}
+
+    def __init__(self, template_id: str, source: Dict[str, Any], baseline: 'Item'):
+        self.template_id = template_id
+        # The raw template dict the record was built from; a reload replaces it.
+        self.source = source
+        self.item_type = type(baseline)
+        self.name = baseline.name
+        self.description = baseline.description
+        self.weight = baseline.weight
+        self.value = baseline.value
+        self.stackable = baseline.stackable
+        self.properties: Mapping[str, Any] = MappingProxyType(dict(baseline.properties))
+
+    @classmethod
+    def intern(cls, template_id: str, source: Dict[str, Any], build: Callable[[], Optional['Item']]) -> Optional['ItemTemplate']:
+        """The shared record for a template, built from a pristine item the first time it is needed."""
+        record = cls._interned.get(template_id)
+        if record is not None and record.source is source: return record
+        baseline = build()
+        if baseline is None: return None
+        record = cls(template_id, source, baseline)
+        cls._interned[template_id] = record
+        return record
+
+    def __copy__(self): return self
+    def __deepcopy__(self, memo): return self
+
+    def __reduce__(self):
+        fields = (self.item_type, self.name, self.description, self.weight, self.value, self.stackable)
+        return (_rebuild_template, (self.template_id, fields, dict(self.properties)))
+
+    def __repr__(self) -> str:
+        return f"ItemTemplate({self.template_id!r})"
+
+
+def _rebuild_template(template_id: str, fields: tuple, properties: Dict[str, Any]) -> ItemTemplate:
+    """Unpickles to the interned record when it still matches, otherwise to a detached copy."""
+    record = ItemTemplate._interned.get(template_id)
+    if record is not None and (record.item_type, record.name, record.description, record.weight,
+                               record.value, record.stackable) == fields and record.properties == properties:
+        return record
+    record = ItemTemplate.__new__(ItemTemplate)
+    record.template_id, record.source = template_id, None
+    record.item_type, record.name, record.description, record.weight, record.value, record.stackable = fields
+    record.properties = MappingProxyType(properties)
+    return record
+
+
+class PropertyOverlay(MutableMapping):
+    """
+    An item's properties: its own values on top of its template's. Only the item's
+    own entries are stored; a removed template key is kept as a marker. Not a dict
+    subclass, so nothing can read the bare overrides by going around the view;
+    take dict(overlay) where a real dict is needed.
+    """
+    __slots__ = ("base", "_own")
+    _DELETED = object()
+
+    def __init__(self, base: Mapping[str, Any], overrides: Optional[Dict[str, Any]] = None):
+        self.base = base
+        self._own: Dict[str, Any] = dict(overrides) if overrides else {}
+
+    def overrides(self) -> Dict[str, Any]:
+        """The item's own entries, without removals."""
+        return {k: v for k, v in self._own.items() if v is not PropertyOverlay._DELETED}
+
+    # --- Reads ---
+    def __getitem__(self, key: str) -> Any:
+        value = self._own.get(key, _MISSING)
+        if value is _MISSING: return self.base[key]
+        if value is PropertyOverlay._DELETED: raise KeyError(key)
+        return value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        value = self._own.get(key, _MISSING)
+        if value is _MISSING: return self.base.get(key, default)
+        return default if value is PropertyOverlay._DELETED else value
+
+    def __contains__(self, key: Any) -> bool:
+        value = self._own.get(key, _MISSING)
+        if value is _MISSING: return key in self.base
+        return value is not PropertyOverlay._DELETED
+
+    def __iter__(self) -> Iterator[str]:
+        own = self._own
+        for key in self.base:
+            if key not in own: yield key
+        for key, value in own.items():
+            if value is not PropertyOverlay._DELETED: yield key
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
+
+    def copy(self) -> Dict[str, Any]:
+        return dict(self.items())
+
+    # --- Writes ---
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._own[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if key not in self: raise KeyError(key)
+        if key in self.base: self._own[key] = PropertyOverlay._DELETED
+        else: del self._own[key]
+
+    def clear(self) -> None:
+        self._own = dict.fromkeys(self.base, PropertyOverlay._DELETED)
+
+    # --- Copying ---
+    def __copy__(self) -> 'PropertyOverlay':
+        return PropertyOverlay(self.base, self._own)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> 'PropertyOverlay':
+        overrides = {k: (v if v is PropertyOverlay._DELETED else copy.deepcopy(v, memo)) for k, v in self._own.items()}
+        return PropertyOverlay(self.base, overrides)
+
+    def __reduce__(self):
+        removed = [k for k, v in self._own.items() if v is PropertyOverlay._DELETED]
+        return (_rebuild_overlay, (dict(self.base), self.overrides(), removed))
+
+
+def _rebuild_overlay(base: Dict[str, Any], overrides: Dict[str, Any], removed: Optional[List[str]] = None) -> PropertyOverlay:
+    overlay = PropertyOverlay(MappingProxyType(base), overrides)
+    for key in removed or (): del overlay[key]
+    return overlay
@@ -1,11 +1,48 @@
 # engine/items/loot_generator.py
 import random
-from typing import Optional, Dict, Any
+from bisect import bisect_right
+from typing import Optional, Dict, Any, List, Tuple
 
 from engine.items.item import Item
 from engine.items.item_factory import ItemFactory
 from engine.items.affix_data import PREFIXES, SUFFIXES
 
+
+class AffixTable:
+    """
+    An affix pool pre-sorted for rolling. For every item type and level band (the
+    levels between two consecutive level_min values) it keeps the eligible
+    affixes in pool order with a running total of their weights, so a roll is
+    one random draw and a bisect. Affixes weigh 1 unless they set "weight".
+    """
+    def __init__(self, pool: Dict[str, Any]):
+        self.thresholds = sorted({data.get("level_min", 1) for data in pool.values()})
+        item_types = {t for data in pool.values() for t in data["allowed_types"] if t != "All"}
+        # (item type or None for types no affix names, band) -> (names, data, cumulative weights)
+        self.tables: Dict[Tuple[Optional[str], int], Tuple[List[str], List[Dict[str, Any]], List[float]]] = {}
+        for item_type in list(item_types) + [None]:
+            for band in range(1, len(self.thresholds) + 1):
+                names, datas, cumulative, total = [], [], [], 0.0
+                for name, data in pool.items():
+                    allowed = data["allowed_types"]
+                    if ("All" in allowed or item_type in allowed) and data.get("level_min", 1) <= self.thresholds[band - 1]:
+                        total += data.get("weight", 1)
+                        names.append(name); datas.append(data); cumulative.append(total)
+                if names: self.tables[(item_type, band)] = (names, datas, cumulative)
+
+    def pick(self, item_type: str, level: int) -> Tuple[str, Dict[str, Any]]:
+        band = bisect_right(self.thresholds, level)
+        table = self.tables.get((item_type, band)) or self.tables.get((None, band))
+        if not table: return "", {}
+        names, datas, cumulative = table
+        index = bisect_right(cumulative, random.random() * cumulative[-1])
+        return names[index], datas[index]
+
+
+PREFIX_TABLE = AffixTable(PREFIXES)
+SUFFIX_TABLE = AffixTable(SUFFIXES)
+
+
 class LootGenerator:
     @staticmethod
     def generate_loot(base_template_id: str, world, level: int = 1, rarity_roll: float = 0.5) -> Optional[Item]:
@@ -78,14 +115,8 @@ class LootGenerator:
 
     @staticmethod
     def _pick_affix(pool: Dict[str, Any], item_type: str, level: int) -> tuple[str, Dict]:
-        valid = []
-        for name, data in pool.items():
-            if "All" in data["allowed_types"] or item_type in data["allowed_types"]:
-                if level >= data.get("level_min", 1):
-                    valid.append((name, data))
-        
-        if not valid: return "", {}
-        return random.choice(valid)
+        table = PREFIX_TABLE if pool is PREFIXES else SUFFIX_TABLE if pool is SUFFIXES else AffixTable(pool)
+        return table.pick(item_type, level)
 
     @staticmethod
     def _apply_prefix(item: Item, data: Dict):
@@ -7,11 +7,12 @@ import uuid
 from engine.items.container import Container
 from engine.items.item import Item
 from engine.world.room import Room # NEW
-from engine.utils.text_formatter import get_level_diff_category, format_target_name
+from engine.utils.text_formatter import format_target_name
+from engine.core.combat_tables import get_level_diff_entry, get_resistance_flavor
 from engine.magic.spell import Spell
 from engine.config import (
-    DAMAGE_TYPE_FLAVOR_TEXT, EFFECT_DEFAULT_TICK_INTERVAL, FORMAT_HIGHLIGHT, FORMAT_RESET,
-    LEVEL_DIFF_COMBAT_MODIFIERS, MINIMUM_SPELL_EFFECT_VALUE, SPELL_DAMAGE_VARIATION_FACTOR,
+    EFFECT_DEFAULT_TICK_INTERVAL, FORMAT_HIGHLIGHT, FORMAT_RESET,
+    MINIMUM_SPELL_EFFECT_VALUE, SPELL_DAMAGE_VARIATION_FACTOR,
     SPELL_DEFAULT_DAMAGE_TYPE
 )
 from engine.utils.utils import format_name_for_display, get_article
@@ -80,8 +81,7 @@ def apply_spell_effect(caster: CasterType, target: SpellTargetType, spell: Spell
         
         caster_level = getattr(caster, 'level', 1)
         target_level = getattr(target, 'level', 1)
-        category = get_level_diff_category(caster_level, target_level)
-        _, damage_heal_mod, _ = LEVEL_DIFF_COMBAT_MODIFIERS.get(category, (1.0, 1.0, 1.0))
+        _, _, damage_heal_mod, _ = get_level_diff_entry(caster_level, target_level)
         
         final_val = stat_based_value
         if eff_type in ["damage", "heal", "life_tap"]:
@@ -95,10 +95,8 @@ def apply_spell_effect(caster: CasterType, target: SpellTargetType, spell: Spell
                 flavor = ""
                 if eff_dmg_type != "physical" and hasattr(target, 'get_resistance'):
                     res = getattr(target, 'get_resistance')(eff_dmg_type)
-                    f_key = "weakness" if res < 0 else ("strong_resistance" if res >= 50 else ("resistance" if res > 0 else None))
-                    if f_key:
-                        raw_flavor = DAMAGE_TYPE_FLAVOR_TEXT.get(eff_dmg_type, DAMAGE_TYPE_FLAVOR_TEXT["default"]).get(f_key)
-                        if raw_flavor: flavor = f"{FORMAT_HIGHLIGHT}{raw_flavor.format(target_name=target_name_raw)}{FORMAT_RESET}\n"
+                    raw_flavor = get_resistance_flavor(eff_dmg_type, res)
+                    if raw_flavor: flavor = f"{FORMAT_HIGHLIGHT}{raw_flavor.format(target_name=target_name_raw)}{FORMAT_RESET}\n"
 
                 formatted_target = format_name_for_display(viewer, target, start_of_sentence=False) if viewer else target_name_raw
                 msg = spell.hit_message.replace("points!", f"{eff_dmg_type} points!")
@@ -204,6 +202,7 @@ def apply_spell_effect(caster: CasterType, target: SpellTargetType, spell: Spell
                        npc = NPCFactory.create_npc_from_template(tid, caster.world, instance_id, **overrides)
                        if npc:
                             caster.world.add_npc(npc)
+                            npc.owner_handle = caster.world.entities.handle_of(caster)
                             if spell.spell_id not in caster.active_summons: caster.active_summons[spell.spell_id] = []
                             caster.active_summons[spell.spell_id].append(npc.obj_id)
                             total_value += 1
@@ -2,6 +2,8 @@
 import random
 from typing import TYPE_CHECKING, Optional
 from engine.utils.utils import format_npc_departure_message, format_npc_arrival_message
+from .routes import next_direction, plan_patrol_loop
+from .schedule_timeline import get_timeline, in_window
 
 if TYPE_CHECKING:
     from engine.npcs.npc import NPC
@@ -87,11 +89,12 @@ def perform_patrol(npc: 'NPC', world: 'World', player: 'Player') -> Optional[str
         npc.patrol_index = (npc.patrol_index + 1) % len(npc.patrol_points)
         return None # Arrived at patrol point, wait for next cooldown
 
-    # Find path to the *next* patrol point
+    # Walk the precomputed leg to the *next* patrol point
     if not npc.current_region_id or not npc.current_room_id or not npc.home_region_id: return None
-    path = world.find_path(npc.current_region_id, npc.current_room_id, npc.home_region_id, target_room_id)
-    if path: 
-        return execute_move(npc, world, player, path[0])
+    plan_patrol_loop(npc, world)
+    direction = next_direction(npc, world, (npc.home_region_id, target_room_id))
+    if direction: 
+        return execute_move(npc, world, player, direction)
     else:
         # Cannot find path to patrol point, just wander
         return perform_wander(npc, world, player)
@@ -99,10 +102,9 @@ def perform_patrol(npc: 'NPC', world: 'World', player: 'Player') -> Optional[str
 def perform_follow(npc: 'NPC', world: 'World', player: 'Player', path_override=None) -> Optional[str]:
     path = path_override
     if not path:
-        target_id = npc.follow_target
-        if not target_id: return None # No one to follow
+        if npc.follow_target is None: return None # No one to follow
 
-        target = world.player if world.player and world.player.obj_id == target_id else world.get_npc(target_id)
+        target = world.entities.resolve(npc.follow_target)
         if not target or not target.is_alive: 
             npc.follow_target = None # Target is gone
             return None
@@ -124,51 +126,33 @@ def perform_follow(npc: 'NPC', world: 'World', player: 'Player', path_override=N
 def perform_schedule(npc: 'NPC', world: 'World', player: 'Player') -> Optional[str]:
     game = world.game
     if not game: return None
-    
-    # Find the correct schedule entry for the current hour
-    current_hour_str = str(game.time_manager.hour)
-    target_entry = None
-    if current_hour_str in npc.schedule:
-        target_entry = npc.schedule[current_hour_str]
-    else:
-        # Find the most recent schedule entry before the current hour
-        sorted_hours = sorted([int(h) for h in npc.schedule.keys()], reverse=True)
-        for hour in sorted_hours:
-            if game.time_manager.hour >= hour:
-                target_entry = npc.schedule[str(hour)]
-                break
-        if not target_entry and sorted_hours: # Handle wrap-around
-            target_entry = npc.schedule[str(sorted_hours[0])]
-            
-    if not target_entry: return None 
-
-    dest_region = target_entry.get("region_id")
-    dest_room = target_entry.get("room_id")
-    activity = target_entry.get("activity", "idle")
-
-    new_destination = (dest_region, dest_room, activity)
-    
-    # Update AI state if destination is new
-    if npc.schedule_destination != new_destination:
-        npc.schedule_destination = new_destination
-        npc.current_path = [] # Clear old path
-        npc.ai_state["current_activity"] = activity
+
+    minute_of_day = game.time_manager.hour * 60 + game.time_manager.minute
+    timeline = get_timeline(npc)
+    window = npc.schedule_window
+
+    # Only look the entry up again once the clock leaves the active one's window.
+    if window is None or npc.schedule_destination is None or not in_window(window, minute_of_day):
+        window = npc.schedule_window = timeline.window_at(minute_of_day)
+        if not window or not window[2]: return None
+        target_entry = window[2]
+        new_destination = (target_entry.get("region_id"), target_entry.get("room_id"), target_entry.get("activity", "idle"))
+
+        # Update AI state if destination is new
+        if npc.schedule_destination != new_destination:
+            npc.schedule_destination = new_destination
+            npc.ai_state["current_activity"] = new_destination[2]
+            npc.mark_changed()
+
+    dest_region, dest_room, _ = npc.schedule_destination
 
     # If at destination, do nothing
-    if npc.current_region_id == dest_region and npc.current_room_id == dest_room:
-        npc.current_path = [] # Clear path on arrival
-        return None
+    if npc.current_room_id == dest_room and npc.current_region_id == dest_region: return None
+    if not npc.current_region_id or not npc.current_room_id: return None
 
-    # Find path if we don't have one
-    if not npc.current_path:
-        if not npc.current_region_id or not npc.current_room_id: return None
-        path = world.find_path(npc.current_region_id, npc.current_room_id, dest_region, dest_room)
-        if path:
-            npc.current_path = path
-        else:
-            npc.schedule_destination = None 
-            return None
-    
-    # Move along the path
-    direction = npc.current_path.pop(0)
+    # Move along the route
+    direction = next_direction(npc, world, (dest_region, dest_room))
+    if not direction:
+        npc.schedule_destination = None 
+        return None
     return execute_move(npc, world, player, direction)
\ No newline at end of file
@@ -0,0 +1,128 @@
+# engine/npcs/ai/routes.py
+"""
+Precomputed NPC routes.
+
+Patrol loops and schedule destinations are fixed, so the walk between two of
+their rooms only needs pathfinding once. A planned leg records each step's
+direction and the room it should lead to; an NPC keeps its legs and a cursor
+on the one it is walking, and advances the cursor one step per move. A step
+is re-planned only when it no longer leads where it did (an exit removed or
+redirected, an instance torn down) or the NPC was moved off its route.
+"""
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+if TYPE_CHECKING:
+    from engine.npcs.npc import NPC
+    from engine.world.world import World
+
+Location = Tuple[str, str]
+# (direction, region_id, room_id) the exit should lead to.
+Step = Tuple[str, str, str]
+Leg = Tuple[Step, ...]
+
+# Legs kept per NPC before the cache is dropped; patrols and schedules use a handful.
+MAX_CACHED_LEGS = 64
+
+
+class RouteCursor:
+    __slots__ = ("origin", "goal", "steps", "position")
+
+    def __init__(self, origin: Location, goal: Location, steps: Leg):
+        self.origin = origin
+        self.goal = goal
+        self.steps = steps
+        self.position = 0
+
+    def location(self) -> Location:
+        """Where the NPC should be standing if it has followed the route so far."""
+        if self.position == 0: return self.origin
+        _, region_id, room_id = self.steps[self.position - 1]
+        return region_id, room_id
+
+
+def _resolve_exit(world: 'World', region_id: str, room_id: str, direction: str) -> Optional[Location]:
+    region = world.get_region(region_id)
+    room = region.get_room(room_id) if region else None
+    destination = room.exits.get(direction) if room else None
+    if not destination: return None
+    return tuple(destination.split(":")) if ":" in destination else (region_id, destination)  # type: ignore[return-value]
+
+
+def plan_leg(world: 'World', origin: Location, goal: Location) -> Optional[Leg]:
+    """Pathfinds from origin to goal and records the room each step should reach."""
+    directions = world.find_path(origin[0], origin[1], goal[0], goal[1])
+    if directions is None: return None
+    steps = []
+    here = origin
+    for direction in directions:
+        there = _resolve_exit(world, here[0], here[1], direction)
+        if there is None: return None
+        steps.append((direction, there[0], there[1]))
+        here = there
+    return tuple(steps)
+
+
+def get_leg(npc: 'NPC', world: 'World', origin: Location, goal: Location) -> Optional[Leg]:
+    """The NPC's leg between two rooms, planning it the first time it is needed."""
+    legs = npc.route_legs
+    if legs is None: legs = npc.route_legs = {}
+    leg = legs.get((origin, goal))
+    if leg is None:
+        leg = plan_leg(world, origin, goal)
+        if leg is None: return None
+        if len(legs) >= MAX_CACHED_LEGS: legs.clear()
+        legs[(origin, goal)] = leg
+    return leg
+
+
+def _step_is_open(world: 'World', location: Location, step: Step) -> bool:
+    if _resolve_exit(world, location[0], location[1], step[0]) != (step[1], step[2]): return False
+    region = world.get_region(step[1])
+    return bool(region and region.get_room(step[2]))
+
+
+def next_direction(npc: 'NPC', world: 'World', goal: Location) -> Optional[str]:
+    """
+    The direction of the NPC's next step towards goal, advancing its route cursor.
+    Returns None if the NPC is already there or the goal cannot be reached.
+    """
+    if not npc.current_region_id or not npc.current_room_id: return None
+    here = (npc.current_region_id, npc.current_room_id)
+    if here == goal: return None
+
+    cursor = npc.route
+    if cursor is None or cursor.goal != goal or cursor.location() != here or cursor.position >= len(cursor.steps):
+        leg = get_leg(npc, world, here, goal)
+        if not leg:
+            npc.route = None
+            return None
+        cursor = npc.route = RouteCursor(here, goal, leg)
+
+    step = cursor.steps[cursor.position]
+    if not _step_is_open(world, here, step):
+        # The world changed under the leg: forget it and re-plan from here.
+        if npc.route_legs:
+            npc.route_legs.pop((cursor.origin, goal), None)
+            npc.route_legs.pop((here, goal), None)
+        leg = get_leg(npc, world, here, goal)
+        if not leg:
+            npc.route = None
+            return None
+        cursor = npc.route = RouteCursor(here, goal, leg)
+        step = leg[0]
+
+    cursor.position += 1
+    return step[0]
+
+
+def plan_patrol_loop(npc: 'NPC', world: 'World') -> None:
+    """Plans every leg of the NPC's patrol loop once, the first time it patrols it."""
+    region_id = npc.home_region_id
+    key = (region_id, tuple(npc.patrol_points))
+    if not region_id or npc.patrol_loop == key: return
+    npc.patrol_loop = key
+    points = npc.patrol_points
+    if len(points) < 2: return
+    for index, room_id in enumerate(points):
+        previous = points[index - 1]
+        if previous != room_id: get_leg(npc, world, (region_id, previous), (region_id, room_id))
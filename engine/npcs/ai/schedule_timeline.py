@@ -0,0 +1,54 @@
+# engine/npcs/ai/schedule_timeline.py
+"""
+Compiled NPC schedules.
+
+A schedule maps hour strings to entries. A ScheduleTimeline sorts it once
+into parallel arrays of start minute-of-day and entry, so the active entry is
+a bisect away, and reports how long that entry stays active. perform_schedule
+keeps the active window on the NPC and does no lookup at all until the clock
+leaves it. Timelines are rebuilt when an NPC's schedule is reassigned; assign
+a new schedule rather than editing one in place.
+"""
+import bisect
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Tuple
+
+if TYPE_CHECKING:
+    from engine.npcs.npc import NPC
+
+MINUTES_PER_DAY = 24 * 60
+
+# (start minute-of-day, minutes active, entry)
+ScheduleWindow = Tuple[int, int, Dict[str, Any]]
+
+
+class ScheduleTimeline:
+    __slots__ = ("source", "starts", "entries")
+
+    def __init__(self, schedule: Mapping[str, Dict[str, Any]]):
+        self.source = schedule
+        hours = sorted(schedule, key=int)
+        self.starts: List[int] = [int(hour) * 60 for hour in hours]
+        self.entries: List[Dict[str, Any]] = [schedule[hour] for hour in hours]
+
+    def window_at(self, minute_of_day: int) -> Optional[ScheduleWindow]:
+        """The entry active at a minute of the day, with its start and duration. Wraps past midnight."""
+        starts = self.starts
+        if not starts: return None
+        index = bisect.bisect_right(starts, minute_of_day) - 1
+        if index < 0: index = len(starts) - 1
+        start = starts[index]
+        end = starts[index + 1] if index + 1 < len(starts) else starts[0] + MINUTES_PER_DAY
+        return start, end - start, self.entries[index]
+
+
+def in_window(window: ScheduleWindow, minute_of_day: int) -> bool:
+    return (minute_of_day - window[0]) % MINUTES_PER_DAY < window[1]
+
+
+def get_timeline(npc: 'NPC') -> ScheduleTimeline:
+    """The NPC's compiled schedule, rebuilt if the schedule has been reassigned."""
+    timeline = npc.schedule_timeline
+    if timeline is None or timeline.source is not npc.schedule:
+        timeline = npc.schedule_timeline = ScheduleTimeline(npc.schedule)
+        npc.schedule_window = None
+    return timeline
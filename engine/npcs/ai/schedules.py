@@ -27,6 +27,7 @@ def initialize_npc_schedules(world: 'World'):
         if not hasattr(npc, "ai_state"): npc.ai_state = {}
         if "original_behavior_type" not in npc.ai_state:
             npc.ai_state["original_behavior_type"] = getattr(npc, "behavior_type", "wanderer")
+            npc.mark_changed()
 
         schedule_created = False
         if "merchant" in npc.template_id or "shopkeeper" in npc.template_id:
@@ -47,46 +48,63 @@ def initialize_npc_schedules(world: 'World'):
             npc.last_moved = 0 
 
 def _collect_available_rooms(world: 'World'):
+    # The catalog covers unloaded regions too, so schedules can point at rooms not yet in memory.
     available_rooms = []
-    for region_id, region in world.regions.items():
-        for room_id, room in region.rooms.items():
-            available_rooms.append({
-                "region_id": region_id, "room_id": room_id,
-                "room_name": room.name, "properties": getattr(room, "properties", {})
-            })
+    for region_id, room_id, room_name, properties in world.regions.room_catalog():
+        available_rooms.append({
+            "region_id": region_id, "room_id": room_id,
+            "room_name": room_name, "properties": properties
+        })
     return available_rooms
 
-def _designate_town_spaces(world: 'World', available_rooms):
-    town_spaces = {"homes": [], "shops": [], "taverns": [], "markets": [], "town_square": [], "gardens": [], "work_areas": [], "social_areas": []}
-    keywords = {
-        "homes": ["home", "house", "cottage"], "shops": ["shop", "store"],
-        "taverns": ["tavern", "inn", "pub"], "markets": ["market", "bazaar"],
-        "town_square": ["square", "plaza", "center"], "gardens": ["garden", "park"],
-        "work_areas": ["workshop", "forge", "mill"], "social_areas": ["hall", "meeting"]
-    }
+# Room-name keywords that mark a room as a kind of town space.
+SPACE_KEYWORDS = {
+    "homes": ("home", "house", "cottage"), "shops": ("shop", "store"),
+    "taverns": ("tavern", "inn", "pub"), "markets": ("market", "bazaar"),
+    "town_square": ("square", "plaza", "center"), "gardens": ("garden", "park"),
+    "work_areas": ("workshop", "forge", "mill"), "social_areas": ("hall", "meeting")
+}
+
+def _index_rooms_by_space(available_rooms):
+    """Space type -> rooms whose name carries one of its keywords. Each distinct room name is matched once."""
+    index = {space_type: [] for space_type in SPACE_KEYWORDS}
+    spaces_by_name = {}
     for room_info in available_rooms:
         room_name = room_info["room_name"].lower()
-        for space_type, key_list in keywords.items():
-            if any(key in room_name for key in key_list):
-                if room_info not in town_spaces[space_type]:
-                    town_spaces[space_type].append(room_info)
+        space_types = spaces_by_name.get(room_name)
+        if space_types is None:
+            space_types = spaces_by_name[room_name] = tuple(
+                space_type for space_type, key_list in SPACE_KEYWORDS.items() if any(key in room_name for key in key_list)
+            )
+        for space_type in space_types:
+            index[space_type].append(room_info)
+    return index
+
+def _designate_town_spaces(world: 'World', available_rooms):
+    town_spaces = _index_rooms_by_space(available_rooms)
     
     for space_type in town_spaces:
         if not town_spaces[space_type]:
             suitable_fallbacks = town_spaces["town_square"] or available_rooms
             if suitable_fallbacks:
                 town_spaces[space_type] = random.sample(suitable_fallbacks, min(1, len(suitable_fallbacks)))
+
+    # Combined pools the schedule builders draw from, built once rather than per NPC.
+    town_spaces["work_places"] = town_spaces["work_areas"] + town_spaces["markets"]
+    town_spaces["social_spots"] = town_spaces["taverns"] + town_spaces["town_square"]
     return town_spaces
 
 def _get_random_location(locations, exclude_loc=None):
     if not locations: return None
+    choice = random.choice(locations)
+    if exclude_loc is None or choice != exclude_loc: return choice
     valid_locations = [loc for loc in locations if loc != exclude_loc]
-    return random.choice(valid_locations) if valid_locations else random.choice(locations)
+    return random.choice(valid_locations) if valid_locations else choice
 
 def _create_villager_schedule(npc, town_spaces):
     home = _get_random_location(town_spaces["homes"]) or {"region_id": npc.home_region_id, "room_id": npc.home_room_id}
-    work_place = _get_random_location(town_spaces["work_areas"] + town_spaces["markets"], exclude_loc=home) or home
-    social_spot = _get_random_location(town_spaces["taverns"] + town_spaces["town_square"], exclude_loc=home) or home
+    work_place = _get_random_location(town_spaces["work_places"], exclude_loc=home) or home
+    social_spot = _get_random_location(town_spaces["social_spots"], exclude_loc=home) or home
     
     npc.schedule = {
         "7": {"activity": "waking up", **home},
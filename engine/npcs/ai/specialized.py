@@ -54,7 +54,7 @@ def perform_minion_logic(npc: 'NPC', world: 'World', current_time: float, player
     if not npc.current_region_id or not npc.current_room_id:
         return None
 
-    owner = player if player and player.obj_id == npc.properties.get("owner_id") else None
+    owner = npc.resolve_owner(world)
 
     if not owner:
         return npc.despawn(world, silent=True)
@@ -68,7 +68,7 @@ def perform_minion_logic(npc: 'NPC', world: 'World', current_time: float, player
     my_loc = (npc.current_region_id, npc.current_room_id)
 
     if my_loc != owner_loc:
-        npc.follow_target = owner.obj_id 
+        npc.follow_target = world.entities.handle_of(owner)
         return perform_follow(npc, world, player, path_override=None)
 
     if my_loc == owner_loc:
@@ -4,10 +4,11 @@ import random
 import time
 from engine.config import (
     HIT_CHANCE_AGILITY_FACTOR, LEVEL_DIFF_COMBAT_MODIFIERS, MAX_HIT_CHANCE, MIN_HIT_CHANCE, MINIMUM_DAMAGE_TAKEN, FORMAT_RESET,
-    FORMAT_SUCCESS, NPC_ATTACK_DAMAGE_VARIATION_RANGE, NPC_BASE_HIT_CHANCE, NPC_LOW_MANA_RETREAT_THRESHOLD, FACTION_RELATIONSHIP_MATRIX
+    FORMAT_SUCCESS, NPC_ATTACK_DAMAGE_VARIATION_RANGE, NPC_BASE_HIT_CHANCE, NPC_LOW_MANA_RETREAT_THRESHOLD
 )
 from engine.config.config_display import FORMAT_ERROR
 from engine.core.combat_system import CombatSystem
+from engine.core.factions import get_base_relation, get_faction_id
 from engine.magic.effects import apply_spell_effect
 from engine.magic.spell_registry import get_spell
 from engine.utils.text_formatter import format_target_name, get_level_diff_category
@@ -23,23 +24,21 @@ def get_relation_to(viewer: Union['NPC', 'Player'], target: Union['NPC', 'Player
     Calculates relationship. 
     If Viewer is NPC and Target is Player: Base Matrix + Player Rep.
     """
-    if not hasattr(viewer, 'faction') or not hasattr(target, 'faction'): return 0
-    
-    viewer_faction = viewer.faction
-    target_faction = target.faction
-    
+    viewer_id = getattr(viewer, 'faction_id', None)
+    target_id = getattr(target, 'faction_id', None)
+    if viewer_id is None or target_id is None:
+        if not hasattr(viewer, 'faction') or not hasattr(target, 'faction'): return 0
+        viewer_id, target_id = get_faction_id(viewer.faction), get_faction_id(target.faction)
+
     # 1. Base Matrix Value
-    relation_map = FACTION_RELATIONSHIP_MATRIX.get(viewer_faction)
-    base_val = relation_map.get(target_faction, 0) if relation_map else 0
-    
+    relation = get_base_relation(viewer_id, target_id)
+
     # 2. Player Reputation Modifier
     # Only applies if the viewer is an NPC judging the Player
-    modifier = 0
-    from engine.player import Player
-    if isinstance(target, Player):
-        modifier = target.reputation.get(viewer_faction, 0)
-        
-    return base_val + modifier
+    if getattr(target, 'is_player_like', False):
+        relation += target.reputation.offset(viewer_id)
+
+    return relation
 
 def is_hostile_to(npc: 'NPC', other) -> bool:
     return get_relation_to(npc, other) < 0
@@ -118,6 +117,7 @@ def cast_spell(npc: 'NPC', spell, target, current_time: float) -> Dict[str, Any]
     if npc.mana < spell.mana_cost: return {"message": f"{npc.name} lacks mana."}
     npc.mana -= spell.mana_cost
     npc.spell_cooldowns[spell.spell_id] = current_time + spell.cooldown
+    npc.mark_changed()
     viewer = npc.world.player if npc.world and hasattr(npc.world, 'player') else None
     _, effect_message = apply_spell_effect(npc, target, spell, viewer)
     
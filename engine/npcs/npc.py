@@ -10,21 +10,47 @@ from engine.config import (
 )
 from engine.config.config_player import PLAYER_BASE_HEALTH_REGEN_RATE
 from engine.game_object import GameObject
+from engine.core.factions import FactionMemberMixin
 from engine.items.inventory import Inventory
 from engine.items.item import Item
 from engine.items.item_factory import ItemFactory
 from engine.magic.spell_registry import SPELL_REGISTRY
 from engine.utils.utils import format_loot_drop_message, format_name_for_display, calculate_xp_gain
+from engine.world.entity_registry import EntityHandle, HandleSet
 
 from . import ai as npc_ai 
 from . import combat as npc_combat
 
 if TYPE_CHECKING:
+    from engine.npcs.ai.routes import Leg, Location, RouteCursor
+    from engine.npcs.ai.schedule_timeline import ScheduleTimeline, ScheduleWindow
+    from engine.npcs.npc_template import NPCTemplate
+    from engine.npcs.vendor_catalog import VendorCatalog
     from engine.world.world import World
     from engine.player import Player
     from engine.core.game_manager import GameManager
 
-class NPC(GameObject):
+class NPC(FactionMemberMixin, GameObject):
+    # Shared record of the template this NPC was spawned from (see NPCFactory).
+    template: Optional['NPCTemplate'] = None
+    # Set by the world's NPCRegistry while this NPC is registered in it.
+    _npc_registry = None
+    handle: Optional['EntityHandle'] = None
+    # Price cache and stock index, built the first time a player trades with this NPC.
+    catalog: Optional['VendorCatalog'] = None
+    # Compiled schedule and the window of its active entry (see ai/schedule_timeline.py).
+    schedule_timeline: Optional['ScheduleTimeline'] = None
+    schedule_window: Optional['ScheduleWindow'] = None
+    # Planned patrol/schedule legs and the cursor on the one being walked (see ai/routes.py).
+    route: Optional['RouteCursor'] = None
+    route_legs: Optional[Dict[Tuple['Location', 'Location'], 'Leg']] = None
+    patrol_loop: Optional[Tuple[str, Tuple[str, ...]]] = None
+    _current_region_id: Optional[str] = None
+    _is_alive: bool = True
+    # Bumped by mark_changed when stats, ai_state or spell_cooldowns change in place. Plain
+    # attribute writes are picked up by save_fingerprint instead, so they stay cheap.
+    save_version: int = 0
+
     def __init__(self, obj_id: Optional[str] = None, name: str = "Unknown NPC",
                  description: str = "No description", health: int = 100,
                  friendly: bool = True, level: int = 1):
@@ -63,7 +89,7 @@ class NPC(GameObject):
         self.spell_cast_chance: float = 0.0
         self.patrol_points = []
         self.patrol_index = 0
-        self.follow_target: Optional[str] = None
+        self.follow_target: Optional['EntityHandle'] = None
         self.schedule = {}
         self.last_moved: float = 0
         self.dialog = {}
@@ -76,12 +102,13 @@ class NPC(GameObject):
         self.combat_target = None
         self.last_combat_action: float = 0
         self.last_attack_time: float = 0
-        self.combat_targets = set()
+        self.combat_targets = HandleSet(self)
         self.combat_messages = []
         self.usable_spells: List[str] = []
         self.spell_cooldowns: Dict[str, float] = {}
         self.world: Optional['World'] = None
         self.owner_id: Optional[str] = None
+        self.owner_handle: Optional['EntityHandle'] = None
         self.creation_time: float = 0.0
         self.summon_duration: float = 0.0
         self.current_path: List[str] = []
@@ -89,6 +116,60 @@ class NPC(GameObject):
         self.retreat_destination: Optional[Tuple[str, str]] = None
         self.original_behavior: Optional[str] = None
 
+    def mark_changed(self) -> None:
+        """Records an in-place change to saved state (ai_state, stats, spell_cooldowns)."""
+        self.save_version += 1
+
+    def save_fingerprint(self) -> Tuple[Any, ...]:
+        """Cheap stamp of everything to_dict writes; changes whenever the saved state does."""
+        return (self.save_version, self.inventory.revision, id(self.inventory), self.template_id, self.obj_id,
+                self.name, self._current_region_id, self.current_room_id, self.health, self.max_health,
+                self.mana, self.max_mana, self.level, self._is_alive, self.faction,
+                id(self.stats), id(self.ai_state), id(self.spell_cooldowns))
+
+    # --- Indexed State ---
+    # Region, liveness and faction feed the registry's per-region indexes.
+    @property
+    def current_region_id(self) -> Optional[str]:
+        return self._current_region_id
+
+    @current_region_id.setter
+    def current_region_id(self, value: Optional[str]) -> None:
+        self._current_region_id = value
+        if self._npc_registry is not None: self._npc_registry.reindex(self)
+
+    @property
+    def is_alive(self) -> bool:
+        return self._is_alive
+
+    @is_alive.setter
+    def is_alive(self, value: bool) -> None:
+        self._is_alive = value
+        if self._npc_registry is not None: self._npc_registry.reindex(self)
+
+    # --- Entity References ---
+    # Held as entity handles, so a target that has been removed from the world reads as None.
+    @property
+    def combat_target(self) -> Optional[Any]:
+        target = self.__dict__.get("_combat_target")
+        if isinstance(target, EntityHandle): return self.world.entities.resolve(target) if self.world else None
+        return target
+
+    @combat_target.setter
+    def combat_target(self, target: Optional[Any]) -> None:
+        world = self.__dict__.get("world")
+        # Only a registered entity gets a handle; a released one must not be brought back.
+        self._combat_target = world.entities.live_handle(target) if world is not None and target is not None else target
+
+    def resolve_owner(self, world: 'World') -> Optional[Any]:
+        """The entity that owns this minion, or None if it is gone."""
+        owner = world.entities.resolve(self.owner_handle)
+        if owner is None and world.player and world.player.obj_id == self.properties.get("owner_id"): owner = world.player
+        return owner
+
+    def _on_faction_changed(self) -> None:
+        if self._npc_registry is not None: self._npc_registry.reindex(self)
+
     def get_description(self) -> str:
         health_percent = self.health / self.max_health * 100 if self.max_health > 0 else 0
         health_desc = ""
@@ -192,6 +273,7 @@ class NPC(GameObject):
         for stat, value in self.stats.items():
             if isinstance(value, (int, float)):
                 self.stats[stat] += NPC_LEVEL_UP_STAT_INCREASE
+        self.mark_changed()
         old_max_health = self.max_health
         final_con = self.stats.get('constitution', 8)
         self.max_health += NPC_LEVEL_HEALTH_BASE_INCREASE + int(final_con * NPC_LEVEL_CON_HEALTH_MULTIPLIER)
@@ -13,6 +13,7 @@ from engine.config import (
 from engine.config.config_npc import NPC_MANA_LEVEL_UP_INT_DIVISOR, NPC_MANA_LEVEL_UP_MULTIPLIER
 from engine.items.item_factory import ItemFactory
 from .npc import NPC
+from .npc_template import NPCTemplate
 from engine.items.inventory import Inventory
 from engine.utils.logger import Logger, LogLevel # NEW IMPORT
 
@@ -72,6 +73,8 @@ class NPCFactory:
             }
             npc = NPC(**init_args)
             npc.template_id = template_id
+            record = NPCTemplate.intern(template_id, template)
+            npc.template = record
 
             base_stats = npc.stats.copy()
             template_stats = template.get("stats", {})
@@ -121,19 +124,19 @@ class NPCFactory:
             npc.home_region_id = creation_args.get("home_region_id", npc.current_region_id)
             npc.home_room_id = creation_args.get("home_room_id", npc.current_room_id)
 
-            npc.dialog = creation_args.get("dialog", {}).copy()
+            # Template-owned mappings are shared views onto the record; an override replaces one outright.
+            npc.dialog = dict(overrides["dialog"]) if "dialog" in overrides else record.overlay("dialog")
             npc.default_dialog = creation_args.get("default_dialog", npc.default_dialog)
 
-            npc.loot_table = creation_args.get("loot_table", {}).copy()
+            npc.loot_table = dict(overrides["loot_table"]) if "loot_table" in overrides else record.overlay("loot_table")
             npc.usable_spells = []
-            npc.schedule = creation_args.get("schedule", {}).copy()
+            npc.schedule = dict(overrides["schedule"]) if "schedule" in overrides else record.overlay("schedule")
 
             template_props = template.get("properties", {})
             
-            if "required_spells" in template_props:
-                for spell_id in template_props["required_spells"]:
-                    if spell_id not in npc.usable_spells:
-                        npc.usable_spells.append(spell_id)
+            for spell_id in record.required_spells:
+                if spell_id not in npc.usable_spells:
+                    npc.usable_spells.append(spell_id)
             
             if "random_spells" in template_props:
                 spell_config = template_props["random_spells"]
@@ -148,15 +151,13 @@ class NPCFactory:
                     npc.usable_spells.extend(spells_learned)
 
             npc.patrol_index = creation_args.get("patrol_index", 0)
-            npc.patrol_points = creation_args.get("patrol_points", [])[:]
+            npc.patrol_points = list(overrides["patrol_points"]) if "patrol_points" in overrides else record.patrol_points
 
             npc.is_alive = overrides.get("is_alive", npc.is_alive) if npc.health > 0 else False
             npc.ai_state = overrides.get("ai_state", {}).copy()
             npc.spell_cooldowns = overrides.get("spell_cooldowns", {}).copy()
 
-            npc.properties = template.get("properties", {}).copy()
-            prop_overrides = overrides.get("properties_override", {})
-            npc.properties.update(prop_overrides)
+            npc.properties = record.overlay("properties", overrides.get("properties_override"))
 
             npc.aggression = npc.properties.get("aggression", NPC_DEFAULT_AGGRESSION)
             npc.flee_threshold = npc.properties.get("flee_threshold", NPC_DEFAULT_FLEE_THRESHOLD)
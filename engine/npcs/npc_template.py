@@ -0,0 +1,58 @@
+# engine/npcs/npc_template.py
+"""
+Shared NPC template records.
+
+NPCFactory used to copy a template's dialog, loot table, schedule and
+properties into every NPC it built. Each template id now has one interned,
+read-only NPCTemplate, and an NPC holds PropertyOverlay views onto it: reads
+fall through to the record, and only what an NPC changes for itself is
+stored on the NPC. Everything else on an NPC is runtime state.
+"""
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from engine.items.item_template import PropertyOverlay
+
+
+def _frozen(value: Any) -> Mapping[str, Any]:
+    return MappingProxyType(dict(value)) if isinstance(value, dict) else MappingProxyType({})
+
+
+class NPCTemplate:
+    """Read-only record of the template-owned data every NPC of one template shares."""
+    __slots__ = ("template_id", "source", "description", "default_dialog", "dialog", "loot_table",
+                 "schedule", "properties", "patrol_points", "required_spells")
+
+    _interned: Dict[str, 'NPCTemplate'] = {}
+
+    def __init__(self, template_id: str, source: Dict[str, Any]):
+        self.template_id = template_id
+        # The raw template dict the record was built from; a reload replaces it.
+        self.source = source
+        self.description: str = source.get("description", "No description")
+        self.default_dialog: Optional[str] = source.get("default_dialog")
+        self.dialog = _frozen(source.get("dialog"))
+        self.loot_table = _frozen(source.get("loot_table"))
+        self.schedule = _frozen(source.get("schedule"))
+        self.properties = _frozen(source.get("properties"))
+        self.patrol_points: Tuple[str, ...] = tuple(source.get("patrol_points", ()))
+        self.required_spells: Tuple[str, ...] = tuple(self.properties.get("required_spells", ()))
+
+    @classmethod
+    def intern(cls, template_id: str, source: Dict[str, Any]) -> 'NPCTemplate':
+        """The shared record for a template, rebuilt only if the template itself was replaced."""
+        record = cls._interned.get(template_id)
+        if record is None or record.source is not source:
+            record = cls(template_id, source)
+            cls._interned[template_id] = record
+        return record
+
+    def overlay(self, field: str, own: Optional[Dict[str, Any]] = None) -> PropertyOverlay:
+        """A per-NPC view of one of the record's mappings, starting with `own` entries."""
+        return PropertyOverlay(getattr(self, field), dict(own) if own else None)
+
+    def __copy__(self): return self
+    def __deepcopy__(self, memo): return self
+
+    def __repr__(self) -> str:
+        return f"NPCTemplate({self.template_id!r})"
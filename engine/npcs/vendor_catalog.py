@@ -0,0 +1,129 @@
+# engine/npcs/vendor_catalog.py
+"""
+Per-vendor price cache and stock index.
+
+A vendor's listed wares (its "sells_items" template references) and its
+dynamic stock (items players have sold to it) are priced and indexed by item
+ID and lowercased name once, rather than on every list and buy. Listed wares
+are rebuilt when the sells_items list, the item template table or the
+vendor's price multiplier (its economy_impact discount) changes; dynamic
+stock is rebuilt when the vendor's inventory revision moves on.
+"""
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from engine.config import DEFAULT_VENDOR_SELL_MULTIPLIER, VENDOR_MIN_BUY_PRICE
+from engine.items.item import Item
+
+
+def get_price_multiplier(vendor) -> float:
+    """The vendor's current sell multiplier, lowered by any active economy_impact discount."""
+    base = DEFAULT_VENDOR_SELL_MULTIPLIER
+    if "economy_impact" in vendor.properties:
+        discount = vendor.properties["economy_impact"].get("discount", 0.0)
+        return max(0.1, base - discount)
+    return base
+
+
+class Ware(NamedTuple):
+    item_id: str
+    template: Dict[str, Any]
+    item_ref: Dict[str, Any]
+    name: str
+    price: int
+
+
+class StockEntry(NamedTuple):
+    item: Item
+    quantity: int
+    price: int
+
+
+class VendorCatalog:
+    def __init__(self):
+        self.multiplier = DEFAULT_VENDOR_SELL_MULTIPLIER
+        self.wares: List[Ware] = []
+        self.stock: List[StockEntry] = []
+        self._wares_by_key: Dict[str, Ware] = {}
+        self._stock_by_key: Dict[str, StockEntry] = {}
+        self._stock_counts: Dict[str, int] = {}
+        # What each half was built from. Tuple comparison checks identity before equality,
+        # so an unchanged source costs a few pointer compares.
+        self._wares_source: Optional[tuple] = None
+        self._stock_source: Optional[tuple] = None
+
+    @staticmethod
+    def for_vendor(vendor, world) -> 'VendorCatalog':
+        """The vendor's catalog, created on first use and brought up to date."""
+        catalog = vendor.catalog
+        if catalog is None:
+            catalog = vendor.catalog = VendorCatalog()
+        catalog.refresh(vendor, world)
+        return catalog
+
+    def refresh(self, vendor, world) -> None:
+        multiplier = get_price_multiplier(vendor)
+        refs = vendor.properties.get("sells_items", [])
+        templates = world.item_templates
+        source = (refs, len(refs), templates, len(templates), multiplier)
+        if source != self._wares_source:
+            self._build_wares(refs, templates, multiplier)
+            self._wares_source = source
+
+        inventory = vendor.inventory
+        source = (inventory, inventory.revision, multiplier)
+        if source != self._stock_source:
+            self._build_stock(inventory, multiplier)
+            self._stock_source = source
+        self.multiplier = multiplier
+
+    def _build_wares(self, refs: List[Dict[str, Any]], templates: Dict[str, Any], multiplier: float) -> None:
+        # A ware's price_multiplier is its sell factor at full price; a discount scales it down.
+        discount_ratio = multiplier / DEFAULT_VENDOR_SELL_MULTIPLIER
+        self.wares = []
+        self._wares_by_key = {}
+        for item_ref in refs:
+            item_id = item_ref.get("item_id")
+            if not item_id: continue
+            template = templates.get(item_id)
+            if not template: continue
+            item_mult = item_ref.get("price_multiplier", DEFAULT_VENDOR_SELL_MULTIPLIER)
+            price = max(VENDOR_MIN_BUY_PRICE, int(template.get("value", 0) * item_mult * discount_ratio))
+            ware = Ware(item_id, template, item_ref, template.get("name", "Unknown Item"), price)
+            self.wares.append(ware)
+            # The first ware with a given ID or name wins, as the old linear scan did.
+            self._wares_by_key.setdefault(item_id.lower(), ware)
+            if ware.name: self._wares_by_key.setdefault(template.get("name", "").lower(), ware)
+
+    def _build_stock(self, inventory, multiplier: float) -> None:
+        self.stock = []
+        self._stock_by_key = {}
+        self._stock_counts = {}
+        for slot in inventory.slots:
+            if not slot.item: continue
+            item = slot.item
+            entry = StockEntry(item, slot.quantity, max(VENDOR_MIN_BUY_PRICE, int(item.value * multiplier)))
+            self.stock.append(entry)
+            self._stock_by_key.setdefault(item.obj_id, entry)
+            self._stock_by_key.setdefault(item.name.lower(), entry)
+            self._stock_counts[item.obj_id] = self._stock_counts.get(item.obj_id, 0) + slot.quantity
+
+    def find_ware(self, name: str) -> Optional[Ware]:
+        """A listed ware by exact ID or name, else the last ware whose name contains `name`."""
+        name = name.lower()
+        ware = self._wares_by_key.get(name)
+        if ware: return ware
+        for candidate in reversed(self.wares):
+            if name in candidate.name.lower(): return candidate
+        return None
+
+    def find_stock(self, name: str) -> Optional[StockEntry]:
+        """A stocked item by exact ID or name, else the first one whose name contains `name`."""
+        name = name.lower()
+        entry = self._stock_by_key.get(name)
+        if entry: return entry
+        for candidate in self.stock:
+            if name in candidate.item.name.lower(): return candidate
+        return None
+
+    def stock_count(self, obj_id: str) -> int:
+        return self._stock_counts.get(obj_id, 0)
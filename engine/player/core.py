@@ -12,12 +12,15 @@ from engine.config import (
     PLAYER_DEFAULT_RESPAWN_ROOM, PLAYER_DEFAULT_STATS, PLAYER_MANA_REGEN_WISDOM_DIVISOR,
     PLAYER_MAX_COMBAT_MESSAGES, PLAYER_REGEN_TICK_INTERVAL, PLAYER_HEALTH_REGEN_STRENGTH_DIVISOR
 )
+from engine.campaign.transition_table import EVENT_ITEM_ACQUIRED
 from engine.game_object import GameObject
 from engine.items.inventory import Inventory
 from engine.items.item import Item
 from engine.items.item_factory import ItemFactory
 from engine.items.set_manager import SetManager
 from engine.core.conversation_history import ConversationHistory
+from engine.core.factions import FactionMemberMixin, ReputationMap
+from engine.world.entity_registry import HandleSet
 
 # Import Mixins
 from engine.player.display import PlayerDisplayMixin
@@ -37,8 +40,11 @@ class Player(
     PlayerProgressionMixin,
     PlayerDisplayMixin, 
     PlayerPersistenceMixin, 
+    FactionMemberMixin,
     GameObject
 ):
+    is_player_like = True
+
     def __init__(self, name: str, obj_id: str = "player"):
         super().__init__(obj_id=obj_id, name=name, description="The main character.")
         self.inventory = Inventory(max_slots=DEFAULT_INVENTORY_MAX_SLOTS, max_weight=DEFAULT_INVENTORY_MAX_WEIGHT)
@@ -74,8 +80,10 @@ class Player(
         self.combat_target: Optional[Any] = None
         self.attack_cooldown = PLAYER_BASE_ATTACK_COOLDOWN
         self.last_attack_time = 0.0 # Float
-        self.combat_targets: Set[Any] = set()
+        self.combat_targets = HandleSet(self)
         self.combat_messages: List[str] = []
+        # Narrative raised outside a command (e.g. campaign transitions on acquiring an item); shown on the next update.
+        self.event_messages: List[str] = []
         self.max_combat_messages = PLAYER_MAX_COMBAT_MESSAGES
         self.respawn_region_id: Optional[str] = PLAYER_DEFAULT_RESPAWN_REGION
         self.respawn_room_id: Optional[str] = PLAYER_DEFAULT_RESPAWN_ROOM
@@ -98,9 +106,18 @@ class Player(
         self.collections_progress: Dict[str, List[str]] = {} 
         self.collections_completed: Dict[str, bool] = {} 
 
-        self.reputation: Dict[str, int] = {} 
+        self.reputation = ReputationMap()
         self.set_manager = SetManager()
 
+    @property
+    def reputation(self) -> ReputationMap:
+        return self._reputation
+
+    @reputation.setter
+    def reputation(self, value: Dict[str, int]) -> None:
+        # Wrap plain dicts (e.g. from a save) so the faction offset vector stays in sync.
+        self._reputation = value if isinstance(value, ReputationMap) else ReputationMap(value or {})
+
     def get_effective_stat(self, stat_name: str) -> int:
         """Calculates stat including base, buffs, equipment, AND set bonuses."""
         val = super().get_effective_stat(stat_name)
@@ -171,9 +188,30 @@ class Player(
              
         effect_msgs = self.process_active_effects(current_time, time_delta_effects)
         messages.extend(effect_msgs)
-        
+
+        messages.extend(self.take_event_messages())
         return messages
 
+    def take_event_messages(self) -> List[str]:
+        messages, self.event_messages = self.event_messages, []
+        return messages
+
+    @property
+    def inventory(self) -> Inventory:
+        return self._inventory
+
+    @inventory.setter
+    def inventory(self, value: Inventory) -> None:
+        # Every way into the player's inventory (pickup, buying, crafting, loot, rewards) passes through add_item.
+        self._inventory = value
+        value.on_item_added = self._on_item_acquired
+
+    def _on_item_acquired(self, item: Item, quantity: int) -> None:
+        world = self.world
+        if not self.active_campaigns or not world or not world.campaign_manager: return
+        campaign_update = world.campaign_manager.handle_event(EVENT_ITEM_ACQUIRED, item.obj_id, self)
+        if campaign_update: self.event_messages.append(campaign_update)
+
     def update_quest(self, quest_id: str, progress: Any) -> None: self.quest_log[quest_id] = progress
     def get_quest_progress(self, quest_id: str) -> Optional[Any]: return self.quest_log.get(quest_id)
     
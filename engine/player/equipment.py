@@ -106,7 +106,7 @@ class PlayerEquipmentMixin:
             if effect_name: p.remove_effect(effect_name)
 
         # Move to Inventory
-        success, add_message = p.inventory.add_item(item_to_unequip, 1)
+        success, add_message = p.inventory.add_item(item_to_unequip, 1, notify=False)
         if not success: 
             # Re-apply effects if fail
             if effect_data: p.apply_effect(effect_data, time.time())
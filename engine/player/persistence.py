@@ -62,7 +62,7 @@ class PlayerPersistenceMixin:
             "collections_progress": p.collections_progress,
             "collections_completed": p.collections_completed,
             "follow_target": p.follow_target,
-            "reputation": p.reputation,
+            "reputation": dict(p.reputation),
             "active_campaigns": p.active_campaigns,
             "completed_campaigns": p.completed_campaigns
         })
@@ -98,14 +98,8 @@ class PlayerPersistenceMixin:
         player.stats = PLAYER_DEFAULT_STATS.copy()
         player.stats.update(data.get("stats", {}))
         
-        # Skills (Handle legacy integer format if present)
-        raw_skills = data.get("skills", {})
-        player.skills = {}
-        for k, v in raw_skills.items():
-            if isinstance(v, int):
-                player.skills[k] = {"level": v, "xp": 0}
-            else:
-                player.skills[k] = v
+        # Skills (legacy integer levels are upgraded by the save migrations)
+        player.skills = data.get("skills", {})
 
         # Quests & Campaign
         player.quest_log = data.get("quest_log", {})
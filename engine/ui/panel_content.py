@@ -387,8 +387,7 @@ def render_collections_content(surface: pygame.Surface, context: dict, hotspots:
         col_def = manager.collections[col_id]
         name = col_def.get("name", col_id)
         
-        found = player.collections_progress.get(col_id, [])
-        total = col_def.get("items", [])
+        found, total = manager.get_progress(player, col_id)
         is_done = player.collections_completed.get(col_id, False)
         
         # Clickable Header
@@ -401,12 +400,12 @@ def render_collections_content(surface: pygame.Surface, context: dict, hotspots:
         # Progress Bar
         bar_w = surface.get_width() - (padding * 2)
         bar_h = 6
-        pct = len(found) / len(total) if total else 0
+        pct = found / total if total else 0
         
         pygame.draw.rect(surface, (60, 60, 60), (padding, y, bar_w, bar_h))
         pygame.draw.rect(surface, (100, 200, 100), (padding, y, int(bar_w * pct), bar_h))
         
-        count_surf = get_font(12).render(f"{len(found)}/{len(total)}", True, (200, 200, 200))
+        count_surf = get_font(12).render(f"{found}/{total}", True, (200, 200, 200))
         surface.blit(count_surf, (padding + bar_w - count_surf.get_width(), y - 14))
         
         y += 12
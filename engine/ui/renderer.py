@@ -216,6 +216,11 @@ class Renderer:
         if renderer_func:
             renderer_func(self) # Pass 'self' as the renderer instance to external functions
 
+        save_progress = self.game.autosave_manager.progress
+        if save_progress is not None and self.game.game_state == "playing":
+            save_surface = self.font.render(f"Saving... {int(save_progress * 100)}%", True, (180, 180, 180))
+            self.screen.blit(save_surface, (self.layout["screen_width"] - save_surface.get_width() - 10, 25))
+
         if self.game.debug_mode:
              debug_text = "DEBUG" + (" (Levels ON)" if DEBUG_SHOW_LEVEL else "")
              debug_surface = self.font.render(debug_text, True, DEBUG_COLOR)
@@ -3,6 +3,7 @@ import pygame
 from typing import TYPE_CHECKING
 from engine.config import *
 from engine.magic.spell_registry import get_spell
+from engine.world.save_header import describe_save_header
 
 if TYPE_CHECKING:
     from engine.ui.renderer import Renderer
@@ -24,12 +25,18 @@ def draw_load_screen(renderer: 'Renderer'):
         display_index = i
         if display_index >= len(renderer.game.available_saves): break
         save_name = renderer.game.available_saves[display_index]
+        header = renderer.game.save_slot_headers.get(save_name)
+        summary = describe_save_header(header) if header else ""
+        if summary: save_name = f"{save_name}  ({summary})"
         is_selected = (display_index == renderer.game.selected_load_option)
         font = renderer.selected_font if is_selected else renderer.font
         color = (255, 255, 100) if is_selected else TEXT_COLOR
         prefix = "> " if is_selected else "  "
         renderer._draw_centered_text(f"{prefix}{save_name}", font, color, y_offset=option_start_y + i * option_spacing)
     
+    if renderer.game.load_error_message:
+        renderer._draw_centered_text(renderer.game.load_error_message, renderer.font, (255, 100, 100), y_offset=option_start_y - option_spacing)
+
     back_selected = (renderer.game.selected_load_option == len(renderer.game.available_saves))
     back_font = renderer.selected_font if back_selected else renderer.font
     back_color = (255, 255, 100) if back_selected else TEXT_COLOR
@@ -4,15 +4,17 @@ import re
 from engine.config import (
     DEBUG_SHOW_LEVEL, FORMAT_BLUE, FORMAT_CATEGORY, FORMAT_ERROR, 
     FORMAT_FRIENDLY_NPC, FORMAT_RESET, FORMAT_SUCCESS, FORMAT_YELLOW, 
-    LEVEL_DIFF_COMBAT_MODIFIERS, MIN_XP_GAIN, 
+    MIN_XP_GAIN, 
     PLAYER_STATUS_HEALTH_CRITICAL_THRESHOLD, PLAYER_STATUS_HEALTH_LOW_THRESHOLD, 
     XP_GAIN_HEALTH_DIVISOR, XP_GAIN_LEVEL_MULTIPLIER
 )
 from engine.config.config_display import FORMAT_CYAN
 from engine.items.item import Item
+from engine.items.item_template import PropertyOverlay
 from typing import Dict, Any, List, Optional, Union, TYPE_CHECKING, Tuple
 
 from engine.utils.text_formatter import LEVEL_DIFF_COLORS, get_level_diff_category
+from engine.core.combat_tables import get_level_diff_entry
 
 DEPARTURE_VERBS = [
     "leaves", "heads", "departs", "goes", "wanders",
@@ -34,6 +36,12 @@ if(TYPE_CHECKING):
     from engine.player import Player
     from engine.npcs.npc import NPC
 
+# Item properties that always come from the template and are never saved per item.
+_TEMPLATE_ONLY_PROPS = frozenset({
+    "weight", "value", "stackable", "name", "description", "equip_slot", "type", "max_durability", "max_uses",
+    "effect_type", "effect_value", "damage", "defense", "target_id", "treasure_type",
+})
+
 def _serialize_item_reference(item: 'Item', quantity: int, world: 'World') -> Optional[Dict[str, Any]]:
     """
     Creates a dictionary representing an item reference for saving.
@@ -47,11 +55,25 @@ def _serialize_item_reference(item: 'Item', quantity: int, world: 'World') -> Op
     from engine.items.item_factory import ItemFactory
 
     template_id = item.obj_id
-    template = ItemFactory.get_template(template_id, world)
-
     override_props: Dict[str, Any] = {}
     known_dynamic_props = {"durability", "uses", "is_open", "locked", "contains"}
 
+    record = item.template
+    if record is not None and isinstance(item.properties, PropertyOverlay):
+        # Items sharing a template record already hold only what differs from it.
+        for attr in ("name", "description"):
+            if attr in item.__dict__ and item.__dict__[attr] != getattr(record, attr):
+                override_props[attr] = item.__dict__[attr]
+        for key, current_value in item.properties.overrides().items():
+            if key == "contains":
+                contained_refs = [ref for ref in (_serialize_item_reference(contained, 1, world) for contained in current_value or []) if ref]
+                if contained_refs: override_props[key] = contained_refs
+            elif key in known_dynamic_props or key not in _TEMPLATE_ONLY_PROPS:
+                override_props[key] = current_value
+        return _item_reference(item, template_id, quantity, override_props, world)
+
+    template = ItemFactory.get_template(template_id, world)
+
     # --- Check for Core Attribute Overrides ---
     # These are stored on the instance, not always in properties, so we check explicitly.
     if template:
@@ -82,7 +104,7 @@ def _serialize_item_reference(item: 'Item', quantity: int, world: 'World') -> Op
                 else:
                     override_props[key] = current_value
             elif key not in template_props or template_props.get(key) != current_value:
-                 if key not in ["weight", "value", "stackable", "name", "description", "equip_slot", "type", "max_durability", "max_uses", "effect_type", "effect_value", "damage", "defense", "target_id", "treasure_type"]:
+                 if key not in _TEMPLATE_ONLY_PROPS:
                     override_props[key] = current_value
     else:
         print(f"Warning: Item template '{template_id}' not found during serialization of '{item.name}'. Saving only known dynamic state.")
@@ -100,6 +122,9 @@ def _serialize_item_reference(item: 'Item', quantity: int, world: 'World') -> Op
                 else:
                     override_props[key] = item.properties[key]
 
+    return _item_reference(item, template_id, quantity, override_props, world)
+
+def _item_reference(item: 'Item', template_id: str, quantity: int, override_props: Dict[str, Any], world: 'World') -> Dict[str, Any]:
     if world and world.game and world.game.debug_mode and override_props:
          print(f"[Save DBG] Overrides for {item.name} ({template_id}): {override_props}")
 
@@ -313,8 +338,7 @@ def format_npc_arrival_message(npc: 'NPC', direction_exited_from: str, viewer: O
 def calculate_xp_gain(killer_level: int, target_level: int, target_max_health: int) -> int:
     """Calculates the experience points gained for defeating a target."""
     base_xp_gained = max(1, target_max_health // XP_GAIN_HEALTH_DIVISOR) + target_level * XP_GAIN_LEVEL_MULTIPLIER
-    category = get_level_diff_category(killer_level, target_level)
-    _, _, xp_mod = LEVEL_DIFF_COMBAT_MODIFIERS.get(category, (1.0, 1.0, 1.0))
+    _, _, _, xp_mod = get_level_diff_entry(killer_level, target_level)
     final_xp_gained = int(base_xp_gained * xp_mod)
     final_xp_gained = max(MIN_XP_GAIN, final_xp_gained)
     return final_xp_gained
@@ -4,16 +4,19 @@ Handles loading all game definitions from JSON files and initializing a new worl
 """
 import json
 import os
+import time
 import uuid
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-from engine.config import FORMAT_ERROR, FORMAT_RESET, ITEM_TEMPLATE_DIR, NPC_TEMPLATE_DIR, REGION_DIR
+from engine.config import FORMAT_ERROR, FORMAT_RESET, ITEM_TEMPLATE_DIR, NPC_TEMPLATE_DIR, REGION_DIR, REGION_LAZY_LOADING
+from engine.core.combat_tables import rebuild_combat_tables
 from engine.items.item_factory import ItemFactory
 from engine.magic.spell_registry import load_spells_from_json
 from engine.npcs.npc_factory import NPCFactory
 from engine.npcs.ai import initialize_npc_schedules
 from engine.player import Player
 from engine.world.region import Region
+from engine.world.region_delta import restore_generated_region
 from engine.utils.logger import Logger
 
 if TYPE_CHECKING:
@@ -23,6 +26,7 @@ if TYPE_CHECKING:
 def load_all_definitions(world: 'World'):
     """Populates the world's template dictionaries by loading from disk."""
     Logger.info("Loader", "Loading definitions...")
+    rebuild_combat_tables()
     load_spells_from_json()
     _load_item_templates(world)
     _load_npc_templates(world)
@@ -74,6 +78,8 @@ def _load_npc_templates(world: 'World'):
     Logger.info("Loader", f"[NPC Templates] Loaded {len(world.npc_templates)} NPC templates.")
 
 def _load_regions(world: 'World'):
+    """Builds the region manifest. Regions themselves load on first use unless lazy loading is off."""
+    for region_id in list(world.regions): world.remove_region(region_id)
     world.regions = {}
     if not os.path.isdir(REGION_DIR):
         Logger.warning("Loader", f"Region directory not found: {REGION_DIR}")
@@ -84,15 +90,107 @@ def _load_regions(world: 'World'):
             try:
                 with open(path, 'r') as f:
                     region_data = json.load(f)
-                    region_id = filename[:-5]
-                    region_data['obj_id'] = region_id
-                    region = Region.from_dict(region_data)
-                    world.add_region(region_id, region)
+                region_id = filename[:-5]
+                rooms = region_data.get("rooms", {})
+                entry_exits = {}
+                for room_id, room_data in rooms.items():
+                    exits = {d: dest for d, dest in room_data.get("exits", {}).items() if isinstance(dest, str) and ":" in dest}
+                    if exits: entry_exits[room_id] = exits
+                world.regions.register_manifest(region_id, {
+                    "name": region_data.get("name", region_id), "path": path,
+                    "rooms": {room_id: room_data.get("name", "Unknown Room") for room_id, room_data in rooms.items()},
+                    "exits": entry_exits,
+                    "safe_zone": bool(region_data.get("properties", {}).get("safe_zone", False)),
+                    "npcs": {room_id: room_data["initial_npcs"] for room_id, room_data in rooms.items() if room_data.get("initial_npcs")},
+                })
+                # Seed the reverse link index so links out of unloaded regions are known too.
+                for room_id, exits in entry_exits.items():
+                    for direction, dest in exits.items(): world.exit_links.relink((region_id, room_id), direction, None, dest)
             except Exception as e:
                 Logger.error("Loader", f"Error loading region from {path}: {e}")
+    if not REGION_LAZY_LOADING:
+        for region_id in world.regions.known_ids(): world.get_region(region_id)
+
+def load_region(world: 'World', region_id: str) -> Optional[Region]:
+    """
+    Materializes an unloaded region from its eviction blob or its data file.
+    A region's initial items and NPCs are spawned the first time it loads in a game.
+    """
+    state = world.regions.take_blob(region_id)
+    if state:
+        if "generated" in state:
+            region = restore_generated_region(state["generated"], world.region_generator)
+            if not region:
+                Logger.error("Loader", f"Could not regenerate region {region_id} from its recipe.")
+                return None
+        else:
+            region = Region.from_dict(state["region"])
+        world.add_region(region_id, region)
+        _add_room_items(world, region, state.get("items", {}))
+    else:
+        entry = world.regions.manifest_entry(region_id)
+        if not entry: return None
+        try:
+            with open(entry["path"], 'r') as f:
+                region_data = json.load(f)
+        except Exception as e:
+            Logger.error("Loader", f"Error loading region from {entry['path']}: {e}")
+            return None
+        region_data['obj_id'] = region_id
+        region = Region.from_dict(region_data)
+        world.add_region(region_id, region)
+        # Static NPCs were spawned from the manifest when the game started.
+        if region_id not in world.regions.populated: populate_region(world, region, spawn_npcs=False)
+
+    world.hydrator.read_stored_items(region_id)
+    _add_room_items(world, region, world.pending_room_items.pop(region_id, {}))
+    world.regions.touch(region_id, time.time())
+    Logger.debug("Loader", f"Loaded region '{region_id}' ({len(region.rooms)} rooms).")
+    return region
+
+def populate_region(world: 'World', region: Region, spawn_npcs: bool = True):
+    """Places a region's initial room items and, unless told otherwise, spawns its initial NPCs."""
+    world.regions.populated.add(region.obj_id)
+    for room_id, room in region.rooms.items():
+        for item_ref in getattr(room, 'initial_item_refs', []):
+            if item_ref and "item_id" in item_ref:
+                item = ItemFactory.create_item_from_template(item_ref["item_id"], world, **item_ref.get("properties_override", {}))
+                if item:
+                    room.add_item(item)
+        if spawn_npcs: _spawn_initial_npcs(world, region.obj_id, room_id, getattr(room, 'initial_npc_refs', []))
+
+def _spawn_initial_npcs(world: 'World', region_id: str, room_id: str, npc_refs: List[Dict[str, Any]]) -> int:
+    spawned = 0
+    for npc_ref in npc_refs:
+        instance_id = npc_ref.get("instance_id", f"{npc_ref.get('template_id')}_{uuid.uuid4().hex[:8]}")
+        if npc_ref.get("template_id") and instance_id not in world.npcs:
+            overrides = {"current_region_id": region_id, "current_room_id": room_id, "home_region_id": region_id, "home_room_id": room_id}
+            npc = NPCFactory.create_npc_from_template(npc_ref.get("template_id"), world, instance_id, **overrides)
+            if npc:
+                world.add_npc(npc)
+                spawned += 1
+    return spawned
+
+def _add_room_items(world: 'World', region: Region, items_by_room: Dict[str, List[Dict[str, Any]]]):
+    for room_id, item_refs in items_by_room.items():
+        room = region.get_room(room_id)
+        if not room: continue
+        for item_ref in item_refs:
+            if item_ref and "item_id" in item_ref:
+                item = ItemFactory.create_item_from_template(item_ref["item_id"], world, **item_ref.get("properties_override", {}))
+                if item: room.add_item(item)
+
+def unload_static_regions(world: 'World'):
+    """Drops every loaded or evicted static region so each reloads fresh from its file."""
+    for region_id in [rid for rid in world.regions.keys() if world.regions.manifest_entry(rid)]:
+        world.remove_region(region_id)
+    world.regions.clear_blobs()
+    world.pending_room_items = {}
 
 def initialize_new_world(world: 'World', start_region="town", start_room="town_square"):
     Logger.info("Loader", "Initializing new world state...")
+    world.hydrator.reset()
+    world.save_manager.reset_session()
     world.player = Player("Adventurer")
     world.player.world = world
     starter_dagger = ItemFactory.create_item_from_template("item_starter_dagger", world)
@@ -108,25 +206,22 @@ def initialize_new_world(world: 'World', start_region="town", start_room="town_s
 
     world.npcs = {}
     world.respawn_manager.respawn_queue = []
-    
+    unload_static_regions(world)
+    world.regions.populated = set()
+
+    # Regions still resident (generated ones) are repopulated here. Static regions place their
+    # items when first loaded, but their NPCs are spawned now, dormant, from the manifest.
     npcs_created_count = 0
-    for region_id, region in world.regions.items():
-        for room_id, room in region.rooms.items():
+    for region in list(world.regions.values()):
+        for room in region.rooms.values():
             room.items = [] # Clear items from previous sessions
-            
-            for item_ref in getattr(room, 'initial_item_refs', []):
-                if item_ref and "item_id" in item_ref:
-                    item = ItemFactory.create_item_from_template(item_ref["item_id"], world, **item_ref.get("properties_override", {}))
-                    if item:
-                        room.add_item(item)
-            for npc_ref in getattr(room, 'initial_npc_refs', []):
-                instance_id = npc_ref.get("instance_id", f"{npc_ref.get('template_id')}_{uuid.uuid4().hex[:8]}")
-                if npc_ref.get("template_id") and instance_id not in world.npcs:
-                    overrides = {"current_region_id": region_id, "current_room_id": room_id, "home_region_id": region_id, "home_room_id": room_id}
-                    npc = NPCFactory.create_npc_from_template(npc_ref.get("template_id"), world, instance_id, **overrides)
-                    if npc:
-                        world.add_npc(npc)
-                        npcs_created_count += 1
+        populate_region(world, region)
+    for region_id, entry in world.regions.manifest_entries():
+        for room_id, npc_refs in entry.get("npcs", {}).items():
+            npcs_created_count += _spawn_initial_npcs(world, region_id, room_id, npc_refs)
+    if not REGION_LAZY_LOADING:
+        for region_id in world.regions.known_ids(): world.get_region(region_id)
+    world.get_region(start_region)
 
     if npcs_created_count == 0:
         Logger.warning("Loader", "No initial NPCs were spawned. The world may feel empty.")
@@ -0,0 +1,133 @@
+# engine/world/entity_registry.py
+"""
+Generational entity handles.
+
+Live references between entities (who an NPC follows, whom it is fighting,
+which player owns a minion) hold an EntityHandle rather than the object or
+its obj_id string. A handle is an (index, generation) pair into the world's
+EntityRegistry: resolving one is a list lookup, and once the entity is
+released its slot's generation moves on, so every handle still pointing at
+it resolves to None instead of keeping a dead entity alive. Freed slots are
+reused from a free list. obj_id strings remain the identity used in saves.
+"""
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional
+
+
+class EntityHandle(NamedTuple):
+    index: int
+    generation: int
+
+
+class EntityRegistry:
+    def __init__(self):
+        self._entities: List[Any] = []
+        self._generations: List[int] = []
+        self._free: List[int] = []
+
+    def register(self, entity: Any) -> EntityHandle:
+        """Gives an entity a slot and stores its handle on it as `entity.handle`."""
+        if self._free:
+            index = self._free.pop()
+            self._entities[index] = entity
+        else:
+            index = len(self._entities)
+            self._entities.append(entity)
+            self._generations.append(0)
+        handle = EntityHandle(index, self._generations[index])
+        entity.handle = handle
+        return handle
+
+    def release(self, handle: Optional[EntityHandle]) -> Optional[Any]:
+        """Frees a handle's slot; it and every copy of it resolve to None from now on."""
+        entity = self.resolve(handle)
+        if entity is None or handle is None: return None
+        self._entities[handle.index] = None
+        self._generations[handle.index] += 1
+        self._free.append(handle.index)
+        if getattr(entity, "handle", None) == handle: entity.handle = None
+        return entity
+
+    def resolve(self, handle: Optional[EntityHandle]) -> Optional[Any]:
+        if handle is None: return None
+        index, generation = handle
+        if index >= len(self._entities) or self._generations[index] != generation: return None
+        return self._entities[index]
+
+    def live_handle(self, entity: Any) -> Optional[EntityHandle]:
+        """The entity's handle if it is registered here right now, else None. Never registers."""
+        handle = getattr(entity, "handle", None)
+        return handle if handle is not None and self.resolve(handle) is entity else None
+
+    def handle_of(self, entity: Any) -> EntityHandle:
+        """The entity's current handle, registering it first if this registry does not know it."""
+        handle = getattr(entity, "handle", None)
+        if handle is not None and self.resolve(handle) is entity: return handle
+        return self.register(entity)
+
+    def __len__(self) -> int:
+        return len(self._entities) - len(self._free)
+
+    def __contains__(self, handle: Any) -> bool:
+        return isinstance(handle, tuple) and self.resolve(handle) is not None
+
+
+class HandleSet:
+    """
+    A set of entities (e.g. combat targets) held by handle through the owner's
+    world, so a member that is released drops out rather than being kept alive.
+    Entities the registry does not know (an owner or target not in a world)
+    are held directly, as there is nothing to release them.
+    """
+    __slots__ = ("_owner", "_handles", "_loose")
+
+    def __init__(self, owner: Any):
+        self._owner = owner
+        self._handles: Dict[EntityHandle, None] = {}  # Insertion-ordered set.
+        self._loose: Dict[int, Any] = {}
+
+    def _registry(self) -> Optional[EntityRegistry]:
+        world = getattr(self._owner, "world", None)
+        return getattr(world, "entities", None)
+
+    def _live_handle(self, entity: Any) -> Optional[EntityHandle]:
+        registry = self._registry()
+        return registry.live_handle(entity) if registry is not None else None
+
+    def add(self, entity: Any) -> None:
+        handle = self._live_handle(entity)
+        if handle is not None: self._handles[handle] = None
+        else: self._loose[id(entity)] = entity
+
+    def discard(self, entity: Any) -> None:
+        handle = self._live_handle(entity)
+        if handle is not None: self._handles.pop(handle, None)
+        self._loose.pop(id(entity), None)
+
+    def remove(self, entity: Any) -> None:
+        if entity not in self: raise KeyError(entity)
+        self.discard(entity)
+
+    def clear(self) -> None:
+        self._handles.clear()
+        self._loose.clear()
+
+    def __contains__(self, entity: Any) -> bool:
+        if id(entity) in self._loose: return True
+        handle = self._live_handle(entity)
+        return handle is not None and handle in self._handles
+
+    def __iter__(self) -> Iterator[Any]:
+        registry = self._registry()
+        members = []
+        for handle in list(self._handles):
+            entity = registry.resolve(handle) if registry is not None else None
+            if entity is None: del self._handles[handle]  # Released since it was added.
+            else: members.append(entity)
+        members.extend(self._loose.values())
+        return iter(members)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
@@ -0,0 +1,137 @@
+# engine/world/exit_index.py
+"""
+Reverse index of cross-region exits.
+
+Rooms store their exits in an ExitMap, which reports every change to the
+world's ExitLinkIndex. The index keeps, for each region, the set of
+(source region, room, direction) links that lead into it, so tearing a
+region down only touches the exits that actually point at it.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    from engine.world.region import Region
+    from engine.world.room import Room
+
+# (source region id, source room id, direction)
+ExitLink = Tuple[str, str, str]
+
+
+def _target_region(source_region_id: str, destination: Any) -> Optional[str]:
+    """Region an exit leads into, or None for exits that stay inside the source region."""
+    if not isinstance(destination, str) or ":" not in destination: return None
+    target = destination.split(":", 1)[0]
+    return target if target and target != source_region_id else None
+
+
+class ExitMap(dict):
+    """A room's direction -> destination table that reports writes to its owning room."""
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._owner: Optional['Room'] = None
+
+    def __reduce__(self):
+        # Copies and pickles carry the exits only, never the owning room.
+        return (ExitMap, (dict(self),))
+
+    def _changed(self, direction: str, old: Any, new: Any) -> None:
+        if self._owner is not None and old != new: self._owner._on_exit_changed(direction, old, new)
+
+    def __setitem__(self, direction: str, destination: str) -> None:
+        old = self.get(direction)
+        super().__setitem__(direction, destination)
+        self._changed(direction, old, destination)
+
+    def __delitem__(self, direction: str) -> None:
+        old = self[direction]
+        super().__delitem__(direction)
+        self._changed(direction, old, None)
+
+    def pop(self, direction: str, *default: Any) -> Any:
+        if direction not in self: return super().pop(direction, *default)
+        old = super().pop(direction)
+        self._changed(direction, old, None)
+        return old
+
+    def popitem(self) -> Tuple[str, str]:
+        direction, old = super().popitem()
+        self._changed(direction, old, None)
+        return direction, old
+
+    def setdefault(self, direction: str, default: Any = None) -> Any:
+        if direction not in self: self[direction] = default
+        return self[direction]
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for direction, destination in dict(*args, **kwargs).items():
+            self[direction] = destination
+
+    def clear(self) -> None:
+        for direction in list(self.keys()): del self[direction]
+
+
+class ExitLinkIndex:
+    """Target region -> set of exits leading into it, for every region registered with the world."""
+    def __init__(self):
+        self._incoming: Dict[str, Set[ExitLink]] = {}
+
+    # --- Registration ---
+    def attach_region(self, region: 'Region') -> None:
+        region._link_index = self
+        for room_id, room in region.rooms.items():
+            if room: self.attach_room(region.obj_id, room_id, room)
+
+    def detach_region(self, region: 'Region') -> None:
+        if getattr(region, '_link_index', None) is not self: return
+        for room in region.rooms.values():
+            if room: self.detach_room(room)
+        region._link_index = None
+
+    def release_region(self, region: 'Region') -> None:
+        """Stops tracking a region's room objects but keeps its links, for regions unloaded to a blob."""
+        if getattr(region, '_link_index', None) is not self: return
+        for room in region.rooms.values():
+            if room and room._link_index is self: room._link_index = None
+        region._link_index = None
+
+    def attach_room(self, region_id: str, room_id: str, room: 'Room') -> None:
+        if room._link_index is not None: room._link_index.detach_room(room)
+        room._link_index = self
+        room._link_source = (region_id, room_id)
+        for direction, destination in room.exits.items():
+            self._add(region_id, room_id, direction, destination)
+
+    def detach_room(self, room: 'Room') -> None:
+        if room._link_index is not self: return
+        region_id, room_id = room._link_source
+        for direction, destination in room.exits.items():
+            self._discard(region_id, room_id, direction, destination)
+        room._link_index = None
+
+    def clear(self) -> None:
+        self._incoming.clear()
+
+    # --- Maintenance ---
+    def relink(self, source: Tuple[str, str], direction: str, old: Any, new: Any) -> None:
+        """Called by rooms whenever one of their exits is added, changed or removed."""
+        region_id, room_id = source
+        if old is not None: self._discard(region_id, room_id, direction, old)
+        if new is not None: self._add(region_id, room_id, direction, new)
+
+    def _add(self, region_id: str, room_id: str, direction: str, destination: Any) -> None:
+        target = _target_region(region_id, destination)
+        if target is None: return
+        self._incoming.setdefault(target, set()).add((region_id, room_id, direction))
+
+    def _discard(self, region_id: str, room_id: str, direction: str, destination: Any) -> None:
+        target = _target_region(region_id, destination)
+        if target is None: return
+        links = self._incoming.get(target)
+        if not links: return
+        links.discard((region_id, room_id, direction))
+        if not links: del self._incoming[target]
+
+    # --- Queries ---
+    def links_to(self, region_id: str) -> List[ExitLink]:
+        """All exits in other regions that lead into the given region."""
+        return sorted(self._incoming.get(region_id, ()))
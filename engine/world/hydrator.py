@@ -0,0 +1,160 @@
+# engine/world/hydrator.py
+"""
+Background world hydration after a phased load.
+
+SaveManager.load restores the player and their region first and hands the
+saved NPCs and room items to the hydrator, which rebuilds them a few at a time
+each frame (within LOAD_HYDRATION_BUDGET_MS). A region the player moves into
+is materialized in full at once. Room items for regions that are not loaded
+stay in world.pending_room_items and are placed when their region loads.
+After a SQLite load, each region's NPCs and room items are read from the
+store only when that region is materialized (see store_session.py).
+Once nothing is left, NPC schedules and the quest board are set up as a
+normal load would, and the phase timings are logged.
+"""
+import time
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional
+
+from engine.config import LOAD_HYDRATION_BUDGET_MS
+from engine.npcs.ai import initialize_npc_schedules
+from engine.npcs.npc_factory import NPCFactory
+from engine.world.definition_loader import _add_room_items
+from engine.utils.logger import Logger
+
+if TYPE_CHECKING:
+    from engine.world.store_session import StoreSession
+    from engine.world.world import World
+
+
+class WorldHydrator:
+    def __init__(self, world: 'World'):
+        self.world = world
+        # region id (None for NPCs without one) -> instance id -> saved NPC state
+        self.pending_npcs: Dict[Optional[str], Dict[str, Dict[str, Any]]] = {}
+        self.active = False
+        # The SQLite save the game was loaded from; kept after hydration for regions loaded later.
+        self.source: Optional['StoreSession'] = None
+        # Phase name -> seconds. "hydrate" is the sum of frame slices; "hydrate_frames" counts them.
+        self.timings: Dict[str, float] = {}
+        self._started_at = 0.0
+
+    def reset(self):
+        self.pending_npcs = {}
+        self.active = False
+        self.source = None
+
+    def start(self, npc_states: Dict[str, Dict[str, Any]], room_items: Dict[str, List[Dict[str, Any]]],
+              source: Optional['StoreSession'] = None):
+        """Queues a save's NPCs and room items, and regions still to be read from `source`; nothing is built yet."""
+        self.reset()
+        self.source = source
+        for instance_id, state in npc_states.items():
+            if state.get("template_id"):
+                self.pending_npcs.setdefault(state.get("current_region_id"), {})[instance_id] = state
+        pending_items = self.world.pending_room_items
+        for location_key, item_refs in room_items.items():
+            region_id, _, room_id = location_key.partition(":")
+            if not room_id:
+                Logger.warning("Hydrator", f"Could not parse room location key '{location_key}' from save file.")
+                continue
+            pending_items.setdefault(region_id, {}).setdefault(room_id, []).extend(item_refs)
+        self.active = True
+        self._started_at = time.perf_counter()
+        self.timings.update({"hydrate": 0.0, "hydrate_frames": 0})
+
+    def pending_npc_states(self) -> Iterator[tuple]:
+        """(instance id, saved state) for every NPC not rebuilt yet, so saves keep them."""
+        for states in self.pending_npcs.values():
+            yield from states.items()
+
+    # --- Materialization ---
+    def materialize_region(self, region_id: Optional[str]):
+        """Builds everything still pending for one region right away."""
+        if not self.active: return
+        self._read_npcs(region_id)
+        for instance_id, state in list(self.pending_npcs.pop(region_id, {}).items()):
+            self._spawn_npc(instance_id, state)
+        if region_id and self.world.regions.is_loaded(region_id):
+            self._place_items(region_id)
+
+    def _spawn_npc(self, instance_id: str, state: Dict[str, Any]):
+        overrides = state.copy()
+        template_id = overrides.pop("template_id")
+        npc = NPCFactory.create_npc_from_template(template_id, self.world, instance_id, **overrides)
+        if not npc: return
+        self.world.add_npc(npc)
+        if self.source: self.source.adopt_npc(instance_id, state, npc)
+
+    def _read_npcs(self, region_id: Optional[str]):
+        if not self.source: return
+        for instance_id, state in self.source.read_npcs(region_id).items():
+            if state.get("template_id"): self.pending_npcs.setdefault(region_id, {})[instance_id] = state
+
+    def read_stored_items(self, region_id: str):
+        """Queues a region's room items from the SQLite save the game was loaded from, the first time it loads."""
+        if not self.source: return
+        pending = self.world.pending_room_items
+        for room_id, item_refs in self.source.read_room_items(region_id).items():
+            pending.setdefault(region_id, {}).setdefault(room_id, []).extend(item_refs)
+
+    def _place_items(self, region_id: str, room_id: Optional[str] = None):
+        if not room_id: self.read_stored_items(region_id)
+        rooms = self.world.pending_room_items.get(region_id)
+        region = self.world.regions.get(region_id)
+        if not rooms or not region: return
+        batch = {room_id: rooms.pop(room_id)} if room_id else dict(rooms)
+        if not room_id or not rooms: self.world.pending_room_items.pop(region_id, None)
+        _add_room_items(self.world, region, batch)
+
+    def _units(self) -> Iterator[None]:
+        # Whatever the player can see comes first, then loaded regions, then dormant NPCs.
+        self.materialize_region(self.world.current_region_id)
+        regions = set(self.pending_npcs) | (self.source.unread_npcs if self.source else set())
+        loaded_first = sorted(regions, key=lambda rid: not self.world.regions.is_loaded(rid))
+        for region_id in loaded_first:
+            self._read_npcs(region_id)
+            states = self.pending_npcs.get(region_id, {})
+            while states:
+                self._spawn_npc(*states.popitem())
+                yield
+            self.pending_npcs.pop(region_id, None)
+            if region_id and self.world.regions.is_loaded(region_id):
+                self.read_stored_items(region_id)
+                for room_id in list(self.world.pending_room_items.get(region_id, {})):
+                    self._place_items(region_id, room_id)
+                    yield
+        item_regions = set(self.world.pending_room_items) | (self.source.unread_items if self.source else set())
+        for region_id in [rid for rid in item_regions if self.world.regions.is_loaded(rid)]:
+            self._place_items(region_id)
+            yield
+
+    # --- Frame Driver ---
+    def step(self, budget_ms: float = LOAD_HYDRATION_BUDGET_MS) -> bool:
+        """Hydrates until the frame budget is spent. Returns True once everything is built."""
+        if not self.active: return True
+        start = time.perf_counter()
+        deadline = start + budget_ms / 1000.0
+        finished = True
+        for _ in self._units():
+            if time.perf_counter() >= deadline:
+                finished = False
+                break
+        self.timings["hydrate"] += time.perf_counter() - start
+        self.timings["hydrate_frames"] += 1
+        if finished: self._complete()
+        return finished
+
+    def finish(self):
+        """Hydrates everything that is left in one go."""
+        while not self.step(float("inf")): pass
+
+    def _complete(self):
+        self.active = False
+        start = time.perf_counter()
+        initialize_npc_schedules(self.world)
+        self.world.quest_manager.ensure_initial_quests()
+        self.timings["finalize"] = time.perf_counter() - start
+        self.timings["hydrate_wall"] = time.perf_counter() - self._started_at
+        Logger.info("Hydrator", "World hydrated: " + ", ".join(
+            f"{phase} {value * 1000:.1f}ms" if phase != "hydrate_frames" else f"{int(value)} frames"
+            for phase, value in self.timings.items()))
@@ -0,0 +1,182 @@
+# engine/world/incremental_save.py
+"""
+Frame-budgeted saving.
+
+IncrementalSave builds a save document a little at a time: each step() call
+serializes NPCs and room item stacks until the frame budget is spent, then
+returns so the game can carry on. Every serialized object is recorded with
+its version stamp. Once the walk is complete, a final pass (run within one
+frame) serializes again whatever changed, appeared or vanished since, so the
+document matches the world as it stood in that frame. A .db store that was
+saved to before only needs what changed since, which SaveManager writes
+within a single frame instead.
+
+Snapshots are copied as they are taken, so the finished document shares
+nothing with the live world. JSON output is then encoded and written in
+budgeted chunks as well. Binary and SQLite targets are written in one go from
+the finished document.
+"""
+import hashlib
+import json
+import os
+import tempfile
+import time
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
+
+from engine.config import BINARY_SAVE_EXTENSION, DEFAULT_SAVE_FILE, SAVE_FRAME_BUDGET_MS, SAVE_GAME_DIR, SQLITE_SAVE_EXTENSION
+from engine.world.save_header import build_save_header, write_json_save_from_body
+from engine.utils.logger import Logger
+
+if TYPE_CHECKING:
+    from engine.npcs.npc import NPC
+    from engine.world.room import Room
+    from engine.world.save_manager import SaveManager
+
+# Share of the progress bar taken by serialization; the rest is encoding and writing.
+_SERIALIZE_SHARE = 0.8
+# Encoder chunks are tiny; check the clock only every this many.
+_ENCODE_BATCH = 512
+
+
+def _detach(value: Any) -> Any:
+    """Deep copy through JSON, so later changes to live objects cannot leak into the save."""
+    return json.loads(json.dumps(value, default=str))
+
+
+def _npc_stamp(npc: 'NPC') -> Tuple[Any, ...]:
+    return npc.save_fingerprint()
+
+
+class IncrementalSave:
+    def __init__(self, save_manager: 'SaveManager', filename: str = DEFAULT_SAVE_FILE, budget_ms: float = SAVE_FRAME_BUDGET_MS):
+        self.save_manager = save_manager
+        self.world = save_manager.world
+        self.filename = filename
+        self.budget = budget_ms / 1000.0
+        self.phase = "serializing"
+        self.progress = 0.0
+        self.done = False
+        self.success = False
+        self.frames = 0
+        self.reserialized = 0
+        self._player = self.world.player
+        # instance id -> (npc, stamp, state or None for NPCs that are not saved)
+        self._npcs: Dict[str, Tuple['NPC', Tuple[Any, ...], Optional[Dict[str, Any]]]] = {}
+        # (region id, room id) -> (room, stamp, item references)
+        self._rooms: Dict[Tuple[str, str], Tuple['Room', int, List[Dict[str, Any]]]] = {}
+        self._steps = self._run()
+
+    def step(self) -> bool:
+        """Advances the save by one frame's budget. Returns True once it has finished."""
+        if self.done: return True
+        self.frames += 1
+        deadline = time.perf_counter() + self.budget
+        try:
+            if self.world.player is not self._player: raise RuntimeError("the world was replaced mid-save")
+            for _ in self._steps:
+                if time.perf_counter() >= deadline: return False
+            self._finish(True)
+        except Exception as e:
+            Logger.error("IncrementalSave", f"Save to {self.filename} failed: {e}")
+            self._finish(False)
+        return True
+
+    def run_to_completion(self) -> bool:
+        """Finishes the save without a frame budget (e.g. before quitting)."""
+        while not self.step(): pass
+        return self.success
+
+    def _finish(self, success: bool):
+        self.done, self.success, self.progress = True, success, 1.0 if success else self.progress
+
+    # --- Serialization ---
+    def _snapshot_npc(self, instance_id: str, npc: 'NPC'):
+        state = self.save_manager.serialize_npc(npc)
+        self._npcs[instance_id] = (npc, _npc_stamp(npc), _detach(state) if state else None)
+
+    def _snapshot_room(self, key: Tuple[str, str], room: 'Room'):
+        self._rooms[key] = (room, room.save_version, _detach(self.save_manager.serialize_room_items(room)))
+
+    def _run(self) -> Iterator[None]:
+        if self.save_manager.saves_changes_only(self.filename):
+            self.phase = "writing"
+            if not self.save_manager.save(self.filename): raise RuntimeError("the store could not be updated")
+            return
+
+        npcs = list(self.world.npcs.items())
+        rooms = [((region_id, room_id), room) for region_id, region in list(self.world.regions.items()) if region
+                 for room_id, room in region.rooms.items() if room]
+        total = max(1, len(npcs) + len(rooms))
+        for done, (instance_id, npc) in enumerate(npcs, 1):
+            self._snapshot_npc(instance_id, npc)
+            self.progress = _SERIALIZE_SHARE * done / total
+            yield
+        for done, (key, room) in enumerate(rooms, len(npcs) + 1):
+            self._snapshot_room(key, room)
+            self.progress = _SERIALIZE_SHARE * done / total
+            yield
+
+        # No yields from here until the document is complete: it all happens in one frame.
+        save_data = self._final_pass()
+        header = build_save_header(save_data, self.world)
+        self.phase = "writing"
+        Logger.debug("IncrementalSave", f"Serialized {len(npcs) + len(rooms)} objects over {self.frames} frames; "
+                                        f"{self.reserialized} changed and were serialized again.")
+        yield from self._write(save_data, header)
+
+    def _final_pass(self) -> Dict[str, Any]:
+        npc_states: Dict[str, Any] = {}
+        for instance_id, npc in self.world.npcs.items():
+            entry = self._npcs.get(instance_id)
+            if not entry or entry[0] is not npc or entry[1] != _npc_stamp(npc):
+                self._snapshot_npc(instance_id, npc)
+                self.reserialized += 1
+                entry = self._npcs[instance_id]
+            if entry[2] is not None: npc_states[instance_id] = entry[2]
+
+        # Items can change in place (containers) without touching their room's stamp, but only
+        # where the player is, so the player's room is always taken fresh.
+        current_room = (self.world.current_region_id, self.world.current_room_id)
+        room_items: Dict[str, Any] = {}
+        for region_id, region in self.world.regions.items():
+            if not region: continue
+            for room_id, room in region.rooms.items():
+                if not room: continue
+                key = (region_id, room_id)
+                entry = self._rooms.get(key)
+                if not entry or entry[0] is not room or entry[1] != room.save_version or key == current_room:
+                    self._snapshot_room(key, room)
+                    if key != current_room: self.reserialized += 1
+                    entry = self._rooms[key]
+                if entry[2]: room_items[f"{region_id}:{room_id}"] = entry[2]
+
+        save_data = self.save_manager.build_document(self.filename, npc_states, room_items)
+        for key, value in save_data.items():
+            if key not in ("npc_states", "room_items_state"): save_data[key] = _detach(value)
+        save_data["room_items_state"] = dict(save_data["room_items_state"])
+        return save_data
+
+    # --- Writing ---
+    def _write(self, save_data: Dict[str, Any], header: Dict[str, Any]) -> Iterator[None]:
+        save_path = self.save_manager._resolve_save_path(self.filename, SAVE_GAME_DIR)
+        if not save_path: raise ValueError(f"invalid save name '{self.filename}'")
+        if save_path.endswith((SQLITE_SAVE_EXTENSION, BINARY_SAVE_EXTENSION)):
+            self.save_manager.write_document(save_path, save_data, header)
+            self.save_manager.track_store_save(save_path)
+            return
+
+        # Encode into a scratch file while hashing, then lay the header in front of it.
+        digest = hashlib.sha256()
+        fd, body_path = tempfile.mkstemp(prefix=".save-", suffix=".part", dir=os.path.dirname(save_path))
+        try:
+            with os.fdopen(fd, 'w+b') as body:
+                encoder = json.JSONEncoder(indent=2, default=str)
+                for count, chunk in enumerate(encoder.iterencode(save_data), 1):
+                    data = chunk.encode("utf-8")
+                    digest.update(data)
+                    body.write(data)
+                    if count % _ENCODE_BATCH == 0: yield
+                with open(save_path, 'wb') as out:
+                    write_json_save_from_body(out, body, header, digest.hexdigest())
+        finally:
+            if os.path.exists(body_path): os.remove(body_path)
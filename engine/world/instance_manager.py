@@ -13,6 +13,24 @@ if TYPE_CHECKING:
 class InstanceManager:
     def __init__(self, world: 'World'):
         self.world = world
+        # Teardown checks run only after the player changes region or a quest completes.
+        self._cleanup_pending = True
+        self._last_player_region_id: Optional[str] = None
+
+    def update(self):
+        """Runs the completed-instance check once per player region change or quest completion."""
+        player = self.world.player
+        if not player: return
+        if player.current_region_id != self._last_player_region_id:
+            self._last_player_region_id = player.current_region_id
+            self._cleanup_pending = True
+        if self._cleanup_pending:
+            self._cleanup_pending = False
+            self.check_and_cleanup_completed_instances()
+
+    def request_cleanup_check(self):
+        """Schedules a completed-instance check on the next update."""
+        self._cleanup_pending = True
 
     # ... (Keep instantiate_quest_region) ...
     def instantiate_quest_region(self, quest_data: Dict[str, Any]) -> Tuple[bool, str, Optional[str]]:
@@ -48,7 +66,7 @@ class InstanceManager:
                 new_room = Room.from_dict(room_data)
                 new_region.add_room(room_id, new_room)
 
-            self.world.regions[unique_region_id] = new_region
+            self.world.add_region(unique_region_id, new_region)
 
             target_template_id = objective.get("target_template_id")
             target_count_range = layout_config.get("target_count", [2, 4])
@@ -122,10 +140,6 @@ class InstanceManager:
         # 2. Cleanup Procedurally Generated Saga Regions
         if "generated_region_ids" in quest_data:
             for region_id in quest_data["generated_region_ids"]:
-                # Also need to find and remove the entrance link in the parent region
-                # Since we don't store the exact link pos easily, we scan exits or rely on it being okay (dangling exits are bad though).
-                # Actually, QuestGenerator linked them.
-                # To clean up properly, we should ideally search for exits pointing TO this region.
                 self._remove_links_to_region(region_id)
                 self._remove_region_and_npcs(region_id)
 
@@ -135,21 +149,15 @@ class InstanceManager:
         self.world.player.archived_quest_log[quest_id] = quest_data
 
     def _remove_region_and_npcs(self, region_id: str):
-        npcs_to_remove = [npc.obj_id for npc in self.world.npcs.values() if npc.current_region_id == region_id]
-        for npc_id in npcs_to_remove: del self.world.npcs[npc_id]
-        if region_id in self.world.regions: del self.world.regions[region_id]
+        for npc in self.world.npcs.npcs_in_region(region_id): self.world.npcs.pop(npc.obj_id, None)
+        self.world.remove_region(region_id)
         
     def _remove_links_to_region(self, target_region_id: str):
-        """Scans all regions to remove exits pointing to the target region."""
-        for region in self.world.regions.values():
-            if region.obj_id == target_region_id: continue
-            for room in region.rooms.values():
-                exits_to_remove = []
-                for dir, dest in room.exits.items():
-                    if dest.startswith(f"{target_region_id}:"):
-                        exits_to_remove.append(dir)
-                for dir in exits_to_remove:
-                    del room.exits[dir]
+        """Removes exits in other regions that point to the target region."""
+        for source_region_id, room_id, direction in self.world.exit_links.links_to(target_region_id):
+            region = self.world.get_region(source_region_id)
+            room = region.get_room(room_id) if region else None
+            if room and direction in room.exits: del room.exits[direction]
 
     def check_and_cleanup_completed_instances(self):
         if not self.world.player or not hasattr(self.world.player, 'completed_quest_log'): return
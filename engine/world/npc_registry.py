@@ -0,0 +1,117 @@
+# engine/world/npc_registry.py
+"""
+The world's NPC table. Behaves like the plain obj_id -> NPC dict it replaces,
+but keeps per-region indexes (membership and hostile counts) up to date as
+NPCs are added, removed, move between regions, change faction or die.
+Registered NPCs also hold a handle in the world's EntityRegistry, released
+when they leave the table.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from engine.npcs.npc import NPC
+    from engine.world.entity_registry import EntityRegistry
+
+
+class NPCRegistry(dict):
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__()
+        self._hostile_counts: Dict[str, int] = {}
+        self._hostile_region: Dict[int, str] = {}  # id(npc) -> region it is counted in
+        self._region_members: Dict[str, Dict[int, 'NPC']] = {}  # region -> {id(npc): npc}
+        self._member_region: Dict[int, str] = {}  # id(npc) -> region it is listed under
+        self.entities: Optional['EntityRegistry'] = None
+        self.update(*args, **kwargs)
+
+    # --- Dict Interface ---
+    def __setitem__(self, key: str, npc: 'NPC') -> None:
+        old = self.get(key)
+        if old is not None and old is not npc: self._detach(old)
+        super().__setitem__(key, npc)
+        self._attach(npc)
+
+    def __delitem__(self, key: str) -> None:
+        npc = self[key]
+        super().__delitem__(key)
+        self._detach(npc)
+
+    def pop(self, key: str, *default: Any) -> Any:
+        if key not in self: return super().pop(key, *default)
+        npc = super().pop(key)
+        self._detach(npc)
+        return npc
+
+    def popitem(self) -> Tuple[str, 'NPC']:
+        key, npc = super().popitem()
+        self._detach(npc)
+        return key, npc
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        if key not in self: self[key] = default
+        return self[key]
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for key, npc in dict(*args, **kwargs).items():
+            self[key] = npc
+
+    def bind_entities(self, entities: 'EntityRegistry') -> None:
+        """Hands out entity handles to every NPC in the table, now and as they are added."""
+        self.entities = entities
+        for npc in self.values(): entities.handle_of(npc)
+
+    def clear(self) -> None:
+        for npc in list(self.values()): self._detach(npc)
+        super().clear()
+
+    # --- Index Maintenance ---
+    def _attach(self, npc: 'NPC') -> None:
+        if npc is None: return
+        npc._npc_registry = self
+        if self.entities is not None: self.entities.handle_of(npc)
+        self.reindex(npc)
+
+    def _detach(self, npc: 'NPC') -> None:
+        if npc is None: return
+        if getattr(npc, '_npc_registry', None) is self: npc._npc_registry = None
+        if self.entities is not None: self.entities.release(npc.handle)
+        self._set_hostile_region(npc, None)
+        self._set_member_region(npc, None)
+
+    def reindex(self, npc: 'NPC') -> None:
+        """Called by NPCs whenever their region, faction or liveness changes."""
+        counted = npc.is_alive and npc.faction == "hostile"
+        self._set_hostile_region(npc, npc.current_region_id if counted else None)
+        self._set_member_region(npc, npc.current_region_id)
+
+    def _set_member_region(self, npc: 'NPC', region_id: Optional[str]) -> None:
+        key = id(npc)
+        old_region = self._member_region.get(key)
+        if old_region == region_id: return
+        if old_region is not None:
+            members = self._region_members[old_region]
+            del members[key]
+            if not members: del self._region_members[old_region]
+            del self._member_region[key]
+        if region_id is not None:
+            self._region_members.setdefault(region_id, {})[key] = npc
+            self._member_region[key] = region_id
+
+    def _set_hostile_region(self, npc: 'NPC', region_id: Optional[str]) -> None:
+        key = id(npc)
+        old_region = self._hostile_region.get(key)
+        if old_region == region_id: return
+        if old_region is not None:
+            self._hostile_counts[old_region] -= 1
+            del self._hostile_region[key]
+        if region_id is not None:
+            self._hostile_counts[region_id] = self._hostile_counts.get(region_id, 0) + 1
+            self._hostile_region[key] = region_id
+
+    # --- Queries ---
+    def count_hostiles_in_region(self, region_id: str) -> int:
+        """Number of living hostile NPCs currently in a region."""
+        return self._hostile_counts.get(region_id, 0)
+
+    def npcs_in_region(self, region_id: str) -> List['NPC']:
+        """Every registered NPC (alive or not) currently located in a region."""
+        return list(self._region_members.get(region_id, {}).values())
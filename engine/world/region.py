@@ -4,6 +4,13 @@ from engine.world.room import Room
 from engine.game_object import GameObject
 
 class Region(GameObject):
+    # Set by the world's ExitLinkIndex while the region is loaded.
+    _link_index = None
+    # to_dict() of a generated region as its recipe produces it; the base its save delta is taken against.
+    generation_baseline: Optional[Dict[str, Any]] = None
+    # Bumped when add_room adds or replaces a room; see Spawner.
+    rooms_version: int = 0
+
     def __init__(self, name: str, description: str, obj_id: Optional[str] = None):
         region_obj_id = obj_id if obj_id else f"region_{name.lower().replace(' ', '_')}"
         super().__init__(obj_id=region_obj_id, name=name, description=description)
@@ -12,7 +19,11 @@ class Region(GameObject):
         self.properties.setdefault("indoors", False)
 
     def add_room(self, room_id: str, room: Room):
+        old = self.rooms.get(room_id)
+        if self._link_index is not None and old is not None and old is not room: self._link_index.detach_room(old)
         self.rooms[room_id] = room
+        self.rooms_version += 1
+        if self._link_index is not None: self._link_index.attach_room(self.obj_id, room_id, room)
 
     def get_room(self, room_id: str) -> Optional[Room]:
         return self.rooms.get(room_id)
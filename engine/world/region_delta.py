@@ -0,0 +1,66 @@
+# engine/world/region_delta.py
+"""
+Seed-plus-diff persistence for procedurally generated regions.
+
+A generated region is saved as its generation recipe and a delta against a
+fresh regeneration of that recipe, so only player-caused changes (new or
+removed exits, unlocked doors, visited flags, edited properties) are written.
+Items and NPCs are already saved per room and per NPC by SaveManager.
+
+The regenerated baseline is cached on the region when it is generated or
+restored, so saving never runs the generator again.
+"""
+import copy
+from typing import Any, Dict, Optional
+
+from engine.world.region import Region
+from engine.world.region_generator import RegionGenerator
+
+_SET, _DEL, _SUB = "set", "del", "sub"
+
+
+def dict_delta(base: Dict[str, Any], current: Dict[str, Any]) -> Dict[str, Any]:
+    """Recursive delta turning `base` into `current`. Empty when they are equal."""
+    delta: Dict[str, Any] = {}
+    for key, value in current.items():
+        if key not in base:
+            delta.setdefault(_SET, {})[key] = value
+        elif base[key] != value:
+            if isinstance(value, dict) and isinstance(base[key], dict):
+                delta.setdefault(_SUB, {})[key] = dict_delta(base[key], value)
+            else:
+                delta.setdefault(_SET, {})[key] = value
+    removed = [key for key in base if key not in current]
+    if removed: delta[_DEL] = removed
+    return delta
+
+
+def apply_dict_delta(base: Dict[str, Any], delta: Dict[str, Any]) -> Dict[str, Any]:
+    """Applies a dict_delta to `base` in place and returns it."""
+    for key in delta.get(_DEL, ()): base.pop(key, None)
+    for key, value in delta.get(_SET, {}).items(): base[key] = value
+    for key, sub_delta in delta.get(_SUB, {}).items():
+        if isinstance(base.get(key), dict): apply_dict_delta(base[key], sub_delta)
+    return base
+
+
+def snapshot_generated_region(region: Region, generator: RegionGenerator) -> Optional[Dict[str, Any]]:
+    """Returns {"id", "recipe", "delta"} for a generated region, or None if it must be saved in full."""
+    recipe = region.properties.get("generation")
+    if not recipe: return None
+    baseline = region.generation_baseline
+    if baseline is None:
+        regenerated = generator.regenerate(recipe)
+        if not regenerated or regenerated[0].obj_id != region.obj_id: return None
+        baseline = region.generation_baseline = regenerated[0].generation_baseline
+    return {"id": region.obj_id, "recipe": recipe, "delta": dict_delta(baseline, region.to_dict())}
+
+
+def restore_generated_region(entry: Dict[str, Any], generator: RegionGenerator) -> Optional[Region]:
+    """Regenerates a region from its recipe and replays the saved delta."""
+    baseline = generator.regenerate(entry["recipe"])
+    if not baseline: return None
+    region_data = apply_dict_delta(copy.deepcopy(baseline[0].generation_baseline), entry.get("delta", {}))
+    region = Region.from_dict(region_data)
+    region.generation_baseline = baseline[0].generation_baseline
+    return region
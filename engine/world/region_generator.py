@@ -1,8 +1,8 @@
 # engine/world/region_generator.py
+import copy
 import json
 import os
 import random
-import uuid
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from engine.config import DATA_DIR
@@ -13,6 +13,22 @@ from engine.utils.logger import Logger
 if TYPE_CHECKING:
     from engine.world.world import World
 
+# Bump whenever a change would make the same recipe produce a different region.
+REGION_GENERATOR_VERSION = 1
+
+_DIRECTION_VECTORS = {
+    "north": (0, -1, 0), "south": (0, 1, 0), "east": (1, 0, 0), "west": (-1, 0, 0),
+    "northeast": (1, -1, 0), "northwest": (-1, -1, 0), "southeast": (1, 1, 0), "southwest": (-1, 1, 0),
+    "up": (0, 0, 1), "down": (0, 0, -1)
+}
+_OPPOSITE_DIRECTION = {
+    "north": "south", "south": "north", "east": "west", "west": "east",
+    "northeast": "southwest", "southwest": "northeast", "northwest": "southeast", "southeast": "northwest",
+    "up": "down", "down": "up"
+}
+# (direction, dx, dy, dz), flattened once for the growth loops.
+_DIRECTION_OFFSETS = tuple((d, dx, dy, dz) for d, (dx, dy, dz) in _DIRECTION_VECTORS.items())
+
 class RegionGenerator:
     def __init__(self, world: "World"):
         self.world = world
@@ -33,89 +49,108 @@ class RegionGenerator:
         except json.JSONDecodeError:
             Logger.error("RegionGenerator", f"Could not decode JSON from '{theme_path}'.")
 
-    def _format_with_placeholders(self, text: str) -> str:
+    def _format_with_placeholders(self, text: str, rng: Any = random) -> str:
         for key, words in self.placeholders.items():
             if f"{{{key.capitalize()}}}" in text:
-                text = text.replace(f"{{{key.capitalize()}}}", random.choice(words).capitalize())
+                text = text.replace(f"{{{key.capitalize()}}}", rng.choice(words).capitalize())
             if f"{{{key.lower()}}}" in text:
-                text = text.replace(f"{{{key.lower()}}}", random.choice(words).lower())
+                text = text.replace(f"{{{key.lower()}}}", rng.choice(words).lower())
         return text
 
-    def generate_region(self, theme_name: str, num_rooms: int) -> Optional[Tuple[Region, str]]:
+    def generate_region(self, theme_name: str, num_rooms: int, seed: Optional[int] = None) -> Optional[Tuple[Region, str]]:
+        """
+        Grows a connected 3D room layout for a theme. The result, including the
+        region ID, is a pure function of (generator version, theme, room count,
+        seed); the recipe is stored on the region so it can be rebuilt on load.
+        """
         theme = self.themes.get(theme_name)
         if not theme:
             Logger.error("RegionGenerator", f"Theme '{theme_name}' not found.")
             return None
 
-        # ... (Rest of logic unchanged) ...
-        direction_vectors = {
-            "north": (0, -1, 0), "south": (0, 1, 0), "east": (1, 0, 0), "west": (-1, 0, 0),
-            "northeast": (1, -1, 0), "northwest": (-1, -1, 0), "southeast": (1, 1, 0), "southwest": (-1, 1, 0),
-            "up": (0, 0, 1), "down": (0, 0, -1)
-        }
-        opposite_direction = {
-            "north": "south", "south": "north", "east": "west", "west": "east",
-            "northeast": "southwest", "southwest": "northeast", "northwest": "southeast", "southeast": "northwest",
-            "up": "down", "down": "up"
-        }
-        planar_directions = ["north", "south", "east", "west", "northeast", "northwest", "southeast", "southwest"]
-        vertical_directions = ["up", "down"]
+        if seed is None: seed = random.getrandbits(64)
+        rng = random.Random(seed)
+        room_names = theme.get("room_names", ["A Room"])
+        room_descriptions = theme.get("room_descriptions", ["An empty space."])
 
         coords_to_id: Dict[Tuple[int, int, int], str] = {}
         id_to_coords: Dict[str, Tuple[int, int, int]] = {}
+        room_ids: List[str] = []
         rooms_data: Dict[str, Any] = {}
-        
-        region_id = f"dynamic_{theme_name}_{uuid.uuid4().hex[:6]}"
-        region_name = self._format_with_placeholders(random.choice(theme.get("name_templates", ["A Mysterious Place"])))
+
+        region_id = f"dynamic_{theme_name}_{rng.getrandbits(24):06x}"
+        region_name = self._format_with_placeholders(rng.choice(theme.get("name_templates", ["A Mysterious Place"])), rng)
         new_region = Region(name=region_name, description=theme.get("description", ""), obj_id=region_id)
         new_region.spawner_config = theme.get("spawner", {})
+        new_region.properties["generation"] = {
+            "version": REGION_GENERATOR_VERSION, "theme": theme_name, "num_rooms": num_rooms, "seed": seed
+        }
 
         entry_room_id = f"room_entry"
         coords_to_id[(0, 0, 0)] = entry_room_id
         id_to_coords[entry_room_id] = (0, 0, 0)
+        room_ids.append(entry_room_id)
         rooms_data[entry_room_id] = { "name": "Entrance", "exits": {} }
-        frontier = [entry_room_id]
+
+        # Rooms that may still have a free neighbouring cell. Swap-remove keeps
+        # random picks and removals O(1); frontier_pos maps room -> list index.
+        frontier: List[str] = [entry_room_id]
+        frontier_pos: Dict[str, int] = {entry_room_id: 0}
 
         for i in range(1, num_rooms):
             new_room_id = f"room_{i}"
             connection_made = False
-            random.shuffle(frontier)
-            for current_room_id in frontier:
+            while frontier:
+                current_room_id = frontier[rng.randrange(len(frontier))]
                 cx, cy, cz = id_to_coords[current_room_id]
-                
-                direction_pool = planar_directions + vertical_directions if random.random() < 0.2 else vertical_directions + planar_directions
-                random.shuffle(direction_pool)
-                
-                for direction in direction_pool:
-                    dx, dy, dz = direction_vectors[direction]
-                    next_coords = (cx + dx, cy + dy, cz + dz)
-                    if next_coords not in coords_to_id:
-                        coords_to_id[next_coords] = new_room_id
-                        id_to_coords[new_room_id] = next_coords
-                        rooms_data[new_room_id] = { "name": random.choice(theme.get("room_names", ["A Room"])), "exits": {} }
-                        rooms_data[current_room_id]["exits"][direction] = new_room_id
-                        rooms_data[new_room_id]["exits"][opposite_direction[direction]] = current_room_id
-                        frontier.append(new_room_id)
-                        connection_made = True
-                        break
-                if connection_made: break
+                free = [(d, (cx + dx, cy + dy, cz + dz)) for d, dx, dy, dz in _DIRECTION_OFFSETS if (cx + dx, cy + dy, cz + dz) not in coords_to_id]
+                if not free:
+                    _frontier_remove(frontier, frontier_pos, current_room_id)
+                    continue
+                direction, next_coords = free[rng.randrange(len(free))]
+                coords_to_id[next_coords] = new_room_id
+                id_to_coords[new_room_id] = next_coords
+                room_ids.append(new_room_id)
+                rooms_data[new_room_id] = { "name": rng.choice(room_names), "exits": {} }
+                rooms_data[current_room_id]["exits"][direction] = new_room_id
+                rooms_data[new_room_id]["exits"][_OPPOSITE_DIRECTION[direction]] = current_room_id
+                frontier_pos[new_room_id] = len(frontier)
+                frontier.append(new_room_id)
+                if len(free) == 1: _frontier_remove(frontier, frontier_pos, current_room_id)
+                connection_made = True
+                break
             if not connection_made: break
 
-        num_extra_connections = random.randint(num_rooms // 2, num_rooms)
+        num_extra_connections = rng.randint(num_rooms // 2, num_rooms)
         for _ in range(num_extra_connections):
-            room_id = random.choice(list(id_to_coords.keys()))
+            room_id = room_ids[rng.randrange(len(room_ids))]
             cx, cy, cz = id_to_coords[room_id]
-            possible_connections = [d for d, (dx, dy, dz) in direction_vectors.items() if (cx + dx, cy + dy, cz + dz) in coords_to_id and d not in rooms_data[room_id]["exits"]]
+            exits = rooms_data[room_id]["exits"]
+            possible_connections = [(d, coords_to_id[(cx + dx, cy + dy, cz + dz)]) for d, dx, dy, dz in _DIRECTION_OFFSETS if d not in exits and (cx + dx, cy + dy, cz + dz) in coords_to_id]
             if possible_connections:
-                chosen_direction = random.choice(possible_connections)
-                nx, ny, nz = (cx + direction_vectors[chosen_direction][0], cy + direction_vectors[chosen_direction][1], cz + direction_vectors[chosen_direction][2])
-                neighbor_id = coords_to_id[(nx, ny, nz)]
-                rooms_data[room_id]["exits"][chosen_direction] = neighbor_id
-                rooms_data[neighbor_id]["exits"][opposite_direction[chosen_direction]] = room_id
+                chosen_direction, neighbor_id = possible_connections[rng.randrange(len(possible_connections))]
+                exits[chosen_direction] = neighbor_id
+                rooms_data[neighbor_id]["exits"][_OPPOSITE_DIRECTION[chosen_direction]] = room_id
         
         for room_id, data in rooms_data.items():
-            desc = self._format_with_placeholders(random.choice(theme.get("room_descriptions", ["An empty space."])))
+            desc = self._format_with_placeholders(rng.choice(room_descriptions), rng)
             room = Room(name=data["name"], description=desc, exits=data["exits"], obj_id=room_id)
             new_region.add_room(room_id, room)
 
-        return new_region, entry_room_id
\ No newline at end of file
+        new_region.generation_baseline = copy.deepcopy(new_region.to_dict())
+        return new_region, entry_room_id
+
+    def regenerate(self, recipe: Dict[str, Any]) -> Optional[Tuple[Region, str]]:
+        """Rebuilds a region from the generation recipe stored on it."""
+        if recipe.get("version") != REGION_GENERATOR_VERSION:
+            Logger.warning("RegionGenerator", f"Region recipe is from generator v{recipe.get('version')} (current v{REGION_GENERATOR_VERSION}); layout may differ.")
+        return self.generate_region(recipe["theme"], recipe["num_rooms"], recipe["seed"])
+
+
+def _frontier_remove(frontier: List[str], frontier_pos: Dict[str, int], room_id: str) -> None:
+    """O(1) removal: move the last frontier entry into the vacated slot."""
+    index = frontier_pos.pop(room_id)
+    last = frontier.pop()
+    if last != room_id:
+        frontier[index] = last
+        frontier_pos[last] = index
@@ -0,0 +1,128 @@
+# engine/world/region_pool.py
+"""
+Background pre-generation of procedural regions.
+
+Regions are generated in a worker process and kept as serialized dicts,
+a few per (theme, room count), so a quest or portal can take one without
+stalling the main loop. Taking a region schedules its replacement; when
+nothing is ready the caller's generator runs synchronously instead.
+"""
+import copy
+import multiprocessing
+import random
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any, Deque, Dict, Optional, Tuple
+
+from engine.config import REGION_PREGEN_ENABLED, REGION_PREGEN_MAX_WORKERS, REGION_PREGEN_POOL_SIZE
+from engine.utils.logger import Logger
+from engine.world.region import Region
+from engine.world.region_generator import RegionGenerator
+
+if TYPE_CHECKING:
+    from engine.world.world import World
+
+PoolKey = Tuple[str, int]
+
+_executor: Optional[ProcessPoolExecutor] = None
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    """Shared worker pool, started on first use. 'spawn' keeps workers clear of pygame state."""
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=REGION_PREGEN_MAX_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+    return _executor
+
+
+def shutdown_executor() -> None:
+    """Stops the worker pool, abandoning queued generation jobs."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+def _generate_region_data(theme_name: str, num_rooms: int, seed: int) -> Optional[Tuple[Dict[str, Any], str, float]]:
+    """Worker entry point. Returns (serialized region, entry room id, generation seconds)."""
+    start = time.perf_counter()
+    result = RegionGenerator(None).generate_region(theme_name, num_rooms, seed)
+    if not result: return None
+    region, entry_room_id = result
+    return region.to_dict(), entry_room_id, time.perf_counter() - start
+
+
+class RegionPregenPool:
+    def __init__(self, world: 'World'):
+        self.world = world
+        self.enabled = REGION_PREGEN_ENABLED
+        self._pending: Dict[PoolKey, Deque[Future]] = {}
+        self.metrics: Dict[str, Any] = {
+            "pool_hits": 0, "pool_misses": 0, "worker_failures": 0,
+            "generation_count": 0, "generation_time_total": 0.0, "generation_time_max": 0.0,
+            "handoff_count": 0, "handoff_time_total": 0.0, "handoff_time_max": 0.0,
+        }
+
+    def prime(self, theme_name: str, num_rooms: int) -> None:
+        """Queues background generation until the pool for this key is full."""
+        if not self.enabled: return
+        queue = self._pending.setdefault((theme_name, num_rooms), deque())
+        try:
+            while len(queue) < REGION_PREGEN_POOL_SIZE:
+                queue.append(_get_executor().submit(_generate_region_data, theme_name, num_rooms, random.getrandbits(64)))
+        except Exception as e:
+            Logger.warning("RegionPool", f"Background generation unavailable, generating in place from now on: {e}")
+            self.enabled = False
+
+    def acquire(self, theme_name: str, num_rooms: int, generator: Optional[RegionGenerator] = None) -> Optional[Tuple[Region, str]]:
+        """Returns (region, entry room id), from the pool when one is ready, otherwise generated now."""
+        start = time.perf_counter()
+        result = self._take_ready((theme_name, num_rooms))
+        if result:
+            self.metrics["pool_hits"] += 1
+        else:
+            self.metrics["pool_misses"] += 1
+            gen_start = time.perf_counter()
+            result = (generator or self.world.region_generator).generate_region(theme_name, num_rooms)
+            if result: self._record("generation", time.perf_counter() - gen_start)
+        self._record("handoff", time.perf_counter() - start)
+
+        if result: self.prime(theme_name, num_rooms)
+        return result
+
+    def ready_count(self, theme_name: str, num_rooms: int) -> int:
+        return sum(1 for f in self._pending.get((theme_name, num_rooms), ()) if f.done())
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Counters plus average generation and hand-off times in milliseconds."""
+        m = dict(self.metrics)
+        m["generation_avg_ms"] = 1000.0 * m["generation_time_total"] / m["generation_count"] if m["generation_count"] else 0.0
+        m["handoff_avg_ms"] = 1000.0 * m["handoff_time_total"] / m["handoff_count"] if m["handoff_count"] else 0.0
+        return m
+
+    def _take_ready(self, key: PoolKey) -> Optional[Tuple[Region, str]]:
+        queue = self._pending.get(key)
+        if not queue: return None
+        for future in list(queue):
+            if not future.done(): continue
+            queue.remove(future)
+            try:
+                payload = future.result()
+            except Exception as e:
+                self.metrics["worker_failures"] += 1
+                Logger.warning("RegionPool", f"Background generation for {key} failed: {e}")
+                continue
+            if not payload: continue
+            region_data, entry_room_id, gen_seconds = payload
+            self._record("generation", gen_seconds)
+            # The worker's copy is exactly what the recipe produces: keep it as the save baseline.
+            region = Region.from_dict(copy.deepcopy(region_data))
+            region.generation_baseline = region_data
+            return region, entry_room_id
+        return None
+
+    def _record(self, kind: str, seconds: float) -> None:
+        self.metrics[f"{kind}_count"] += 1
+        self.metrics[f"{kind}_time_total"] += seconds
+        if seconds > self.metrics[f"{kind}_time_max"]: self.metrics[f"{kind}_time_max"] = seconds
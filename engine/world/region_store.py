@@ -0,0 +1,172 @@
+# engine/world/region_store.py
+"""
+The world's region table with lazy loading and cold-region eviction.
+
+Behaves like the plain region_id -> Region dict it replaces, except that
+iteration only covers regions currently in memory. Looking a region up by id
+(get, [], in) brings it in on demand: static regions from the lightweight
+manifest built at boot, evicted regions from the compact blob they were
+unloaded into, and regions from a save that have not been needed since the
+load from the state they were deferred with.
+"""
+import json
+import zlib
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    from engine.world.region import Region
+
+
+class RegionStore(dict):
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        # region_id -> {"name", "path", "rooms": {room_id: room name},
+        #               "exits": {room_id: {dir: dest}}, "npcs": {room_id: [initial npc refs]}}
+        self._manifest: Dict[str, Dict[str, Any]] = {}
+        self._blobs: Dict[str, bytes] = {}
+        # Saved region states not rebuilt since the game was loaded, kept as plain dicts.
+        self._deferred: Dict[str, Dict[str, Any]] = {}
+        self._last_visit: "OrderedDict[str, float]" = OrderedDict()  # Oldest first.
+        self._loading: Set[str] = set()
+        # Regions whose initial room items have been placed this game.
+        self.populated: Set[str] = set()
+        # Set by the world: builds, registers and returns an unloaded region.
+        self.loader: Optional[Callable[[str], Optional['Region']]] = None
+
+    # --- Dict Interface ---
+    def __missing__(self, region_id: str) -> 'Region':
+        region = self._load(region_id)
+        if region is None: raise KeyError(region_id)
+        return region
+
+    def get(self, region_id: Any, default: Any = None) -> Any:
+        if dict.__contains__(self, region_id): return dict.__getitem__(self, region_id)
+        region = self._load(region_id)
+        return region if region is not None else default
+
+    def __contains__(self, region_id: Any) -> bool:
+        return (dict.__contains__(self, region_id) or region_id in self._manifest
+                or region_id in self._blobs or region_id in self._deferred)
+
+    def pop(self, region_id: str, *default: Any) -> Any:
+        self._last_visit.pop(region_id, None)
+        self._blobs.pop(region_id, None)
+        self._deferred.pop(region_id, None)
+        return super().pop(region_id, *default)
+
+    def __delitem__(self, region_id: str) -> None:
+        self._last_visit.pop(region_id, None)
+        self._blobs.pop(region_id, None)
+        self._deferred.pop(region_id, None)
+        super().__delitem__(region_id)
+
+    # --- Manifest & Loading ---
+    def register_manifest(self, region_id: str, entry: Dict[str, Any]) -> None:
+        self._manifest[region_id] = entry
+
+    def manifest_entry(self, region_id: str) -> Optional[Dict[str, Any]]:
+        return self._manifest.get(region_id)
+
+    def manifest_entries(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        return iter(self._manifest.items())
+
+    def is_loaded(self, region_id: Optional[str]) -> bool:
+        return dict.__contains__(self, region_id)
+
+    def known_ids(self) -> List[str]:
+        """Every region id the world knows about, loaded or not."""
+        ids = list(self.keys())
+        ids.extend(rid for rid in self._manifest if not dict.__contains__(self, rid))
+        ids.extend(rid for rid in self._blobs if not dict.__contains__(self, rid) and rid not in self._manifest)
+        ids.extend(rid for rid in self._deferred if not dict.__contains__(self, rid) and rid not in self._manifest)
+        return ids
+
+    def safe_zone_rooms(self) -> Iterator[Tuple[str, List[str]]]:
+        """(region_id, room ids) for every known safe-zone region, without loading regions."""
+        for region_id, region in self.items():
+            if region.get_property("safe_zone", False): yield region_id, list(region.rooms.keys())
+        for region_id, entry in self._manifest.items():
+            if dict.__contains__(self, region_id) or not entry.get("safe_zone"): continue
+            yield region_id, list(entry.get("rooms", {}))
+        # Generated regions are never safe zones; saved dynamic regions keep their full definition.
+        for region_id, state in self._deferred.items():
+            if dict.__contains__(self, region_id) or region_id in self._manifest: continue
+            region_data = state.get("region") or {}
+            if region_data.get("properties", {}).get("safe_zone"): yield region_id, list(region_data.get("rooms", {}))
+
+    def room_catalog(self) -> Iterator[Tuple[str, str, str, Dict[str, Any]]]:
+        """(region_id, room_id, room name, properties) for every known room, without loading regions."""
+        for region_id, region in self.items():
+            for room_id, room in region.rooms.items():
+                yield region_id, room_id, room.name, getattr(room, "properties", {})
+        for region_id, entry in self._manifest.items():
+            if dict.__contains__(self, region_id): continue
+            for room_id, room_name in entry.get("rooms", {}).items():
+                yield region_id, room_id, room_name, {}
+
+    def _load(self, region_id: Any) -> Optional['Region']:
+        if region_id is None or region_id in self._loading or self.loader is None: return None
+        if region_id not in self._manifest and region_id not in self._blobs and region_id not in self._deferred: return None
+        self._loading.add(region_id)
+        try:
+            return self.loader(region_id)
+        finally:
+            self._loading.discard(region_id)
+
+    # --- Eviction ---
+    def touch(self, region_id: Optional[str], now: float) -> None:
+        """Marks a region as visited by the player at `now`."""
+        if region_id is None: return
+        self._last_visit[region_id] = now
+        self._last_visit.move_to_end(region_id)
+
+    def last_visit(self, region_id: str) -> Optional[float]:
+        return self._last_visit.get(region_id)
+
+    def cold_region_ids(self, now: float, max_idle: float) -> List[str]:
+        """Loaded regions, least recently visited first, that the player left over `max_idle` seconds ago."""
+        cold = []
+        for region_id, visited in self._last_visit.items():
+            if now - visited < max_idle: break
+            if dict.__contains__(self, region_id): cold.append(region_id)
+        return cold
+
+    def store_blob(self, region_id: str, state: Dict[str, Any]) -> None:
+        """Unloads a region, keeping its state as a compressed JSON blob."""
+        self._blobs[region_id] = zlib.compress(json.dumps(state, separators=(",", ":"), default=str).encode("utf-8"))
+        self._last_visit.pop(region_id, None)
+        super().pop(region_id, None)
+
+    def defer(self, region_id: str, state: Dict[str, Any]) -> None:
+        """Keeps a saved region's state to be rebuilt the first time the region is needed."""
+        self._deferred[region_id] = state
+
+    def take_blob(self, region_id: str) -> Optional[Dict[str, Any]]:
+        if region_id in self._deferred: return self._deferred.pop(region_id)
+        blob = self._blobs.pop(region_id, None)
+        return json.loads(zlib.decompress(blob).decode("utf-8")) if blob else None
+
+    def peek_blob(self, region_id: str) -> Optional[Dict[str, Any]]:
+        """State of one evicted or deferred region, leaving it unloaded."""
+        if region_id in self._deferred: return self._deferred[region_id]
+        blob = self._blobs.get(region_id)
+        return json.loads(zlib.decompress(blob).decode("utf-8")) if blob else None
+
+    def peek_blobs(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """State of every evicted or deferred region, for saving."""
+        for region_id, blob in self._blobs.items():
+            yield region_id, json.loads(zlib.decompress(blob).decode("utf-8"))
+        yield from self._deferred.items()
+
+    def unloaded_states(self) -> Iterator[Tuple[str, Any]]:
+        """
+        (region id, blob or deferred state) for every evicted or deferred region, without
+        decompressing anything. A region evicted again is stored under a new blob object.
+        """
+        yield from self._blobs.items()
+        yield from self._deferred.items()
+
+    def clear_blobs(self) -> None:
+        self._blobs.clear()
+        self._deferred.clear()
@@ -6,8 +6,18 @@ from engine.config import FORMAT_CATEGORY, FORMAT_RESET, FORMAT_HIGHLIGHT
 from engine.game_object import GameObject
 from engine.items.item import Item
 from engine.config.config_combat import HAZARD_TYPE_MAP, HAZARD_FLAVOR_TEXT
+from engine.world.exit_index import ExitMap
 
 class Room(GameObject):
+    # Set by the world's ExitLinkIndex while the room's region is loaded.
+    _link_index = None
+    _link_source = None
+    # Bumped when the room's item list changes; see IncrementalSave.
+    save_version: int = 0
+    # Bumped on the class when any room's spawn-relevant state (name, no_monster_spawn) changes; see Spawner.
+    spawn_epoch: int = 0
+    _exits: Optional[ExitMap] = None
+
     def __init__(self, name: str, description: str, exits: Optional[Dict[str, str]] = None, obj_id: Optional[str] = None):
         room_obj_id = obj_id if obj_id else f"room_{name.lower().replace(' ', '_')}_{uuid.uuid4().hex[:4]}"
         
@@ -29,6 +39,40 @@ class Room(GameObject):
         self.update_property("time_descriptions", self.time_descriptions)
         self.update_property("env_properties", self.env_properties)
 
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @name.setter
+    def name(self, value: str) -> None:
+        self._name = value
+        Room.spawn_epoch += 1
+
+    def update_property(self, key: str, value: Any) -> None:
+        super().update_property(key, value)
+        if key == "no_monster_spawn": Room.spawn_epoch += 1
+
+    @property
+    def exits(self) -> ExitMap:
+        return self._exits
+
+    @exits.setter
+    def exits(self, value: Dict[str, str]) -> None:
+        # Wrap plain dicts so exit changes reach the world's reverse link index.
+        old = self._exits
+        new = value if isinstance(value, ExitMap) and value._owner is None else ExitMap(value or {})
+        new._owner = self
+        self._exits = new
+        if old is None: return
+        old._owner = None
+        if self._link_index is not None:
+            for direction, destination in old.items(): self._link_index.relink(self._link_source, direction, destination, None)
+            for direction, destination in new.items(): self._link_index.relink(self._link_source, direction, None, destination)
+        if self.properties.get("exits") is old: self.properties["exits"] = new
+
+    def _on_exit_changed(self, direction: str, old: Optional[str], new: Optional[str]) -> None:
+        if self._link_index is not None: self._link_index.relink(self._link_source, direction, old, new)
+
     def update(self, dt: float) -> List[str]:
         """Called every tick to handle temporary environmental effects."""
         messages = []
@@ -149,10 +193,14 @@ class Room(GameObject):
         return desc
     
     def get_exit(self, direction: str) -> Optional[str]: return self.exits.get(direction.lower())
-    def add_item(self, item: Item) -> None: self.items.append(item)
+    def add_item(self, item: Item) -> None:
+        self.items.append(item)
+        self.save_version += 1
     def remove_item(self, obj_id: str) -> Optional[Item]:
         for i, item in enumerate(self.items):
-            if item.obj_id == obj_id: return self.items.pop(i)
+            if item.obj_id == obj_id:
+                self.save_version += 1
+                return self.items.pop(i)
         return None
     def get_item(self, obj_id: str) -> Optional[Item]:
         for item in self.items:
@@ -161,7 +209,7 @@ class Room(GameObject):
 
     def to_dict(self) -> Dict[str, Any]:
         data = super().to_dict()
-        data["exits"] = self.exits
+        data["exits"] = dict(self.exits)
         data["initial_items"] = self.initial_item_refs
         data["initial_npcs"] = self.initial_npc_refs
         data["visited"] = self.visited
@@ -0,0 +1,215 @@
+# engine/world/save_codec.py
+"""
+Compact binary encoding for save documents.
+
+A binary save is a magic tag followed by length-prefixed sections, each a
+zlib-compressed compact JSON payload. Dict keys that repeat across the save
+("item_id", "properties_override", ...) are written once in a leading key
+table and referenced by index everywhere else. Sections are decoded only
+when a key stored in them is first read, so a loader that asks for the
+player first never parses NPCs or room items before it needs them.
+
+A save may open with a small "slot" section holding its display header (see
+save_header.py) ahead of everything else, so the load menu can read it without
+touching the rest of the file.
+"""
+import hashlib
+import io
+import json
+import struct
+import zlib
+from collections import Counter
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+SAVE_MAGIC = b"RSAV"
+CODEC_VERSION = 2
+
+# Section name -> top-level save document keys it holds, in file order.
+# Keys not listed here go into the header section.
+SECTION_KEYS: Dict[str, Tuple[str, ...]] = {
+    "header": (),
+    "player": ("player",),
+    "regions": ("generated_regions", "dynamic_regions"),
+    "npcs": ("npc_states",),
+    "items": ("room_items_state",),
+}
+_KEY_SECTION = "keys"
+_SLOT_SECTION = "slot"
+# Marks an encoded key as a key table reference; no real save key starts with it.
+_KEY_REF = "\x01"
+
+
+def is_binary_save(path: str) -> bool:
+    with open(path, 'rb') as f: return f.read(len(SAVE_MAGIC)) == SAVE_MAGIC
+
+
+# --- Encoding ---
+def _count_keys(value: Any, counts: Counter) -> None:
+    if isinstance(value, dict):
+        counts.update(value.keys())
+        for child in value.values(): _count_keys(child, counts)
+    elif isinstance(value, list):
+        for child in value: _count_keys(child, counts)
+
+
+def _replace_keys(value: Any, refs: Dict[str, str]) -> Any:
+    if isinstance(value, dict):
+        return {refs.get(key, key): _replace_keys(child, refs) for key, child in value.items()}
+    if isinstance(value, list):
+        return [_replace_keys(child, refs) for child in value]
+    return value
+
+
+def _write_section(out: BinaryIO, name: str, payload: Any) -> None:
+    data = zlib.compress(json.dumps(payload, separators=(",", ":"), default=str).encode("utf-8"), 6)
+    encoded_name = name.encode("ascii")
+    out.write(struct.pack(">B", len(encoded_name)) + encoded_name + struct.pack(">I", len(data)))
+    out.write(data)
+
+
+def write_binary_save(doc: Dict[str, Any], out: BinaryIO, slot_header: Optional[Dict[str, Any]] = None) -> None:
+    """
+    Writes a save document as a binary save. A slot header is written first, with
+    its checksum set to the SHA-256 of every byte that follows it.
+    """
+    sections: Dict[str, Dict[str, Any]] = {name: {} for name in SECTION_KEYS}
+    owner = {key: name for name, keys in SECTION_KEYS.items() for key in keys}
+    for key, value in doc.items(): sections[owner.get(key, "header")][key] = value
+
+    counts: Counter = Counter()
+    _count_keys(doc, counts)
+    # Only keys that appear more than once (and are strings, as JSON keys) are worth a table slot.
+    table: List[str] = [key for key, count in counts.most_common() if count > 1 and isinstance(key, str)]
+    refs = {key: f"{_KEY_REF}{index:x}" for index, key in enumerate(table)}
+
+    body = io.BytesIO()
+    _write_section(body, _KEY_SECTION, table)
+    for name, payload in sections.items():
+        _write_section(body, name, _replace_keys(payload, refs))
+
+    out.write(SAVE_MAGIC + struct.pack(">B", CODEC_VERSION))
+    if slot_header is not None:
+        _write_section(out, _SLOT_SECTION, dict(slot_header, checksum=hashlib.sha256(body.getbuffer()).hexdigest()))
+    out.write(body.getbuffer())
+
+
+# --- Decoding ---
+def _read_preamble(stream: BinaryIO) -> None:
+    if stream.read(len(SAVE_MAGIC)) != SAVE_MAGIC: raise ValueError("Not a binary save file.")
+    version = struct.unpack(">B", stream.read(1))[0]
+    if version > CODEC_VERSION: raise ValueError(f"Binary save codec version {version} is newer than supported ({CODEC_VERSION}).")
+
+
+def _read_section(stream: BinaryIO) -> Optional[Tuple[str, bytes]]:
+    prefix = stream.read(1)
+    if not prefix: return None
+    name = stream.read(prefix[0]).decode("ascii")
+    (length,) = struct.unpack(">I", stream.read(4))
+    data = stream.read(length)
+    if len(data) != length: raise ValueError(f"Binary save section '{name}' is truncated.")
+    return name, data
+
+
+def _read_sections(stream: BinaryIO) -> Iterator[Tuple[str, bytes]]:
+    _read_preamble(stream)
+    while True:
+        entry = _read_section(stream)
+        if entry is None: return
+        yield entry
+
+
+class BinarySaveReader:
+    """
+    Read-only mapping over a binary save. Sections are read from the stream in
+    order and only decompressed and parsed the first time one of their keys is
+    requested. Close it (or use it as a context manager) when done.
+    """
+    def __init__(self, stream: BinaryIO):
+        self._stream = stream
+        self._sections = _read_sections(stream)
+        self._raw: Dict[str, bytes] = {}
+        self._decoded: Dict[str, Any] = {}
+        self.slot_header: Optional[Dict[str, Any]] = None
+        name, data = next(self._sections, (None, b""))
+        if name == _SLOT_SECTION:
+            self.slot_header = json.loads(zlib.decompress(data))
+            name, data = next(self._sections, (None, b""))
+        if name != _KEY_SECTION: raise ValueError("Binary save is missing its key table.")
+        # Encoded reference -> original key.
+        self._key_lookup: Dict[str, str] = {f"{_KEY_REF}{index:x}": key for index, key in enumerate(json.loads(zlib.decompress(data)))}
+
+    @classmethod
+    def open(cls, path: str) -> 'BinarySaveReader':
+        return cls(open(path, 'rb'))
+
+    def close(self) -> None:
+        self._stream.close()
+
+    def __enter__(self) -> 'BinarySaveReader':
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def _pairs_hook(self, pairs: List[Tuple[str, Any]]) -> Dict[str, Any]:
+        lookup = self._key_lookup.get
+        return {lookup(key, key): value for key, value in pairs}
+
+    def _section(self, name: str) -> Dict[str, Any]:
+        if name in self._decoded: return self._decoded[name]
+        while name not in self._raw:
+            entry = next(self._sections, None)
+            if entry is None:
+                self._raw[name] = b""
+                break
+            self._raw[entry[0]] = entry[1]
+        data = self._raw.pop(name)
+        self._decoded[name] = json.loads(zlib.decompress(data), object_pairs_hook=self._pairs_hook) if data else {}
+        return self._decoded[name]
+
+    def _section_for(self, key: str) -> str:
+        for name, keys in SECTION_KEYS.items():
+            if key in keys: return name
+        return "header"
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._section(self._section_for(key)).get(key, default)
+
+    def __getitem__(self, key: str) -> Any:
+        section = self._section(self._section_for(key))
+        return section[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._section(self._section_for(key))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Decodes every section into one plain save document."""
+        doc: Dict[str, Any] = {}
+        for name in SECTION_KEYS: doc.update(self._section(name))
+        return doc
+
+
+def read_binary_save(path: str) -> Dict[str, Any]:
+    with BinarySaveReader.open(path) as reader:
+        return reader.to_dict()
+
+
+def read_binary_slot_header(path: str) -> Optional[Dict[str, Any]]:
+    """Reads only the slot header of a binary save, or None if it was written without one."""
+    with open(path, 'rb') as f:
+        _read_preamble(f)
+        entry = _read_section(f)
+    if not entry or entry[0] != _SLOT_SECTION: return None
+    return json.loads(zlib.decompress(entry[1]))
+
+
+def binary_body_digest(path: str, chunk_size: int = 1 << 16) -> str:
+    """SHA-256 of everything after the slot header, streamed in chunks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        _read_preamble(f)
+        start = f.tell()
+        entry = _read_section(f)
+        if not entry or entry[0] != _SLOT_SECTION: f.seek(start)
+        for chunk in iter(lambda: f.read(chunk_size), b""): digest.update(chunk)
+    return digest.hexdigest()
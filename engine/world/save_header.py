@@ -0,0 +1,128 @@
+# engine/world/save_header.py
+"""
+Small fixed-schema headers written at the front of every save, so the load menu
+can list slots without parsing whole save files.
+
+JSON saves carry the header as their first key, on the second line of the file;
+binary saves carry it as a leading section; SQLite saves keep it as a meta row.
+The header's checksum is the SHA-256 of the rest of the file and is only
+verified for the slot the player picks. SQLite stores have no single byte
+stream to hash, so they are verified with PRAGMA quick_check instead.
+"""
+import hashlib
+import json
+import shutil
+from typing import TYPE_CHECKING, Any, BinaryIO, Dict, Optional, Tuple
+
+from engine.config import SQLITE_SAVE_EXTENSION
+from engine.world.save_codec import binary_body_digest, is_binary_save, read_binary_slot_header
+from engine.world.sqlite_store import check_store_integrity, read_meta_value
+
+if TYPE_CHECKING:
+    from engine.world.world import World
+
+HEADER_KEY = "save_header"
+HEADER_SCHEMA_VERSION = 1
+HEADER_FIELDS = (
+    "header_schema", "save_format_version", "save_name", "timestamp",
+    "player_name", "player_level", "player_class", "region_name", "room_name",
+    "game_time", "checksum",
+)
+_JSON_HEADER_PREFIX = f'  "{HEADER_KEY}": '
+_CHUNK_SIZE = 1 << 16
+
+
+def build_save_header(save_data: Dict[str, Any], world: 'World') -> Dict[str, Any]:
+    """Display metadata for a save document. The checksum is filled in as the file is written."""
+    player = world.player
+    region, room = world.get_current_region(), world.get_current_room()
+    return {
+        "header_schema": HEADER_SCHEMA_VERSION,
+        "save_format_version": save_data.get("save_format_version"),
+        "save_name": save_data.get("save_name"),
+        "timestamp": save_data.get("timestamp"),
+        "player_name": player.name if player else None,
+        "player_level": player.level if player else None,
+        "player_class": player.player_class if player else None,
+        "region_name": region.name if region else None,
+        "room_name": room.name if room else None,
+        "game_time": (save_data.get("time_state") or {}).get("game_time"),
+        "checksum": None,
+    }
+
+
+def describe_save_header(header: Dict[str, Any]) -> str:
+    """One-line summary for the load menu."""
+    parts = []
+    if header.get("player_name"):
+        parts.append(f"{header['player_name']}, Lv {header.get('player_level') or 1} {header.get('player_class') or ''}".rstrip())
+    location = header.get("room_name") or header.get("region_name")
+    if location: parts.append(location)
+    if header.get("game_time") is not None: parts.append(f"Day {int(header['game_time']) // 86400 + 1}")
+    return " - ".join(parts)
+
+
+# --- JSON saves ---
+def write_json_save(out: BinaryIO, doc: Dict[str, Any], header: Optional[Dict[str, Any]] = None) -> None:
+    """
+    Writes an indented JSON save. With a header, it becomes the first key, kept on
+    one line, and its checksum covers the document text that follows it.
+    """
+    body = json.dumps(doc, indent=2, default=str).encode("utf-8")
+    if header is None:
+        out.write(body)
+        return
+    out.write(_json_header_bytes(header, hashlib.sha256(body).hexdigest()))
+    # The body without its opening brace; the header line above stands in for it.
+    out.write(body[2:])
+
+
+def write_json_save_from_body(out: BinaryIO, body: BinaryIO, header: Dict[str, Any], checksum: str) -> None:
+    """Same output as write_json_save, for a document already encoded (and hashed) into `body`."""
+    out.write(_json_header_bytes(header, checksum))
+    body.seek(2)
+    shutil.copyfileobj(body, out, _CHUNK_SIZE)
+
+
+def _json_header_bytes(header: Dict[str, Any], checksum: str) -> bytes:
+    header = dict(header, checksum=checksum)
+    return b"{\n" + _JSON_HEADER_PREFIX.encode("utf-8") + json.dumps(header, default=str).encode("utf-8") + b",\n"
+
+
+def _read_json_header_line(f: BinaryIO) -> Optional[Dict[str, Any]]:
+    if f.readline().strip() != b"{": return None
+    line = f.readline().decode("utf-8").rstrip()
+    if not line.startswith(_JSON_HEADER_PREFIX): return None
+    return json.loads(line[len(_JSON_HEADER_PREFIX):].rstrip(","))
+
+
+def _json_body_digest(f: BinaryIO) -> str:
+    # Hashes the document as it was before the header line was spliced in.
+    digest = hashlib.sha256(b"{\n")
+    for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""): digest.update(chunk)
+    return digest.hexdigest()
+
+
+# --- Any format ---
+def read_save_header(path: str) -> Optional[Dict[str, Any]]:
+    """Reads only the header of a save file; None for saves written before headers existed."""
+    if path.endswith(SQLITE_SAVE_EXTENSION): return read_meta_value(path, HEADER_KEY)
+    if is_binary_save(path): return read_binary_slot_header(path)
+    with open(path, 'rb') as f: return _read_json_header_line(f)
+
+
+def verify_save_file(path: str) -> Tuple[bool, str]:
+    """Checks a save against its header checksum. Returns (ok, reason)."""
+    if path.endswith(SQLITE_SAVE_EXTENSION):
+        ok, result = check_store_integrity(path)
+        return ok, "integrity check passed" if ok else f"integrity check failed: {result}"
+    if is_binary_save(path):
+        header = read_binary_slot_header(path)
+        actual = binary_body_digest(path, _CHUNK_SIZE) if header else None
+    else:
+        with open(path, 'rb') as f:
+            header = _read_json_header_line(f)
+            actual = _json_body_digest(f) if header else None
+    if not header or not header.get("checksum"): return True, "no checksum recorded"
+    if actual != header["checksum"]: return False, "checksum mismatch"
+    return True, "checksum verified"
@@ -0,0 +1,9 @@
+# engine/world/save_migrations/__init__.py
+"""
+Save Format Migration Package.
+Ordered upgrade steps that bring an older save document up to the current
+format once, at load time, so object from_dict methods only ever see
+current-format data.
+"""
+from .pipeline import (CURRENT_SAVE_VERSION, LEGACY_SAVE_VERSION, MIGRATIONS,
+                       get_save_version, migrate_save, needs_migration)
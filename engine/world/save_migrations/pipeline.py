@@ -0,0 +1,44 @@
+# engine/world/save_migrations/pipeline.py
+"""
+Runs the upgrade steps in order. Each step is a pure function taking a save
+document at version N and returning a new document at version N + 1.
+"""
+from typing import Any, Callable, Dict, List, Tuple
+
+from . import v2_to_v3, v3_to_v4
+
+CURRENT_SAVE_VERSION = 4
+# Saves written before save_format_version existed.
+LEGACY_SAVE_VERSION = 2
+
+# Source version -> step producing the next version.
+MIGRATIONS: Dict[int, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+    2: v2_to_v3.migrate,
+    3: v3_to_v4.migrate,
+}
+
+
+def get_save_version(save_data: Any) -> int:
+    return save_data.get("save_format_version", LEGACY_SAVE_VERSION)
+
+
+def needs_migration(save_data: Any) -> bool:
+    return get_save_version(save_data) != CURRENT_SAVE_VERSION
+
+
+def migrate_save(save_data: Dict[str, Any]) -> Tuple[Dict[str, Any], List[int]]:
+    """
+    Upgrades a save document to CURRENT_SAVE_VERSION. Returns the new document
+    and the versions it was migrated from, in order. The input is not modified.
+    """
+    version = get_save_version(save_data)
+    if version > CURRENT_SAVE_VERSION:
+        raise ValueError(f"Save format {version} is newer than this game supports ({CURRENT_SAVE_VERSION}).")
+    applied = []
+    while version < CURRENT_SAVE_VERSION:
+        step = MIGRATIONS.get(version)
+        if step is None: raise ValueError(f"No migration from save format {version}.")
+        save_data = step(save_data)
+        applied.append(version)
+        version = get_save_version(save_data)
+    return save_data, applied
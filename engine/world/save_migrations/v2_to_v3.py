@@ -0,0 +1,26 @@
+# engine/world/save_migrations/v2_to_v3.py
+"""
+Unversioned saves -> format 3.
+- Player skills stored as bare levels become {"level", "xp"} records.
+- Conversation "global_known_topics" is folded into the vocabulary.
+"""
+from typing import Any, Dict
+
+
+def migrate(save_data: Dict[str, Any]) -> Dict[str, Any]:
+    save_data = dict(save_data)
+    if save_data.get("player"):
+        player = dict(save_data["player"])
+        player["skills"] = {
+            name: {"level": skill, "xp": 0} if isinstance(skill, int) else skill
+            for name, skill in player.get("skills", {}).items()
+        }
+        if "conversation_history" in player:
+            history = dict(player["conversation_history"])
+            topics = history.pop("global_known_topics", [])
+            vocabulary = list(history.get("vocabulary", ["job", "rumors"]))
+            history["vocabulary"] = vocabulary + [topic for topic in topics if topic not in vocabulary]
+            player["conversation_history"] = history
+        save_data["player"] = player
+    save_data["save_format_version"] = 3
+    return save_data
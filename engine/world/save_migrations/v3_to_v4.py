@@ -0,0 +1,16 @@
+# engine/world/save_migrations/v3_to_v4.py
+"""
+Format 3 -> 4.
+- Adds the "generated_regions" list; format 3 saved every procedural region in full.
+- Format 3 predates lazy region population, so "populated_region_ids" is null,
+  meaning every region counts as populated.
+"""
+from typing import Any, Dict
+
+
+def migrate(save_data: Dict[str, Any]) -> Dict[str, Any]:
+    save_data = dict(save_data)
+    save_data.setdefault("generated_regions", [])
+    save_data.setdefault("populated_region_ids", None)
+    save_data["save_format_version"] = 4
+    return save_data
@@ -1,18 +1,21 @@
 # engine/world/spawner.py
 """
 Handles the logic for dynamically spawning monsters in the game world.
-Optimized to only process the active region.
+The player's region is always processed; a fixed budget of background
+regions is visited round-robin each tick so they stay populated at a
+constant cost per tick.
 """
 import random
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
-from engine.config import (SPAWN_CHANCE_PER_TICK, SPAWN_DEBUG,
+from engine.config import (SPAWN_BACKGROUND_REGIONS_PER_TICK, SPAWN_CHANCE_PER_TICK, SPAWN_DEBUG,
                          SPAWN_INTERVAL_SECONDS, SPAWN_MAX_MONSTERS_PER_REGION_CAP,
                          SPAWN_MIN_MONSTERS_PER_REGION,
                          SPAWN_NO_SPAWN_ROOM_KEYWORDS, SPAWN_ROOMS_PER_MONSTER)
 from engine.npcs.npc_factory import NPCFactory
 from engine.utils.utils import weighted_choice
 from engine.world.region import Region
+from engine.world.room import Room
 
 if TYPE_CHECKING:
     from engine.world.world import World
@@ -22,6 +25,11 @@ class Spawner:
     def __init__(self, world: 'World'):
         self.world = world
         self.last_spawn_time = 0
+        # region_id -> (region, its rooms dict, room stamp when built, spawn-eligible room ids)
+        self._eligible_rooms: Dict[str, Tuple[Region, Dict[str, Room], Tuple[int, int, int], Tuple[str, ...]]] = {}
+        # Round-robin queue of regions that can spawn monsters.
+        self._background_region_ids: List[str] = []
+        self._background_cursor = 0
 
     def update(self, current_time: float):
         """Main update tick for the spawner."""
@@ -32,17 +40,78 @@ class Spawner:
         if random.random() > SPAWN_CHANCE_PER_TICK:
             return
 
-        # OPTIMIZATION: Only spawn in the region the player is currently in.
-        # Spawning monsters in distant regions uses CPU for no gameplay benefit.
         current_region = self.world.get_current_region()
         if current_region:
             self._spawn_monsters_in_region(current_region)
 
+        self._spawn_in_background_regions(current_region.obj_id if current_region else None)
+
+    # --- Region Tables ---
+
+    def register_region(self, region: Region):
+        """Builds the spawn-eligible room table for a newly loaded or generated region."""
+        self._eligible_rooms[region.obj_id] = (region, region.rooms, self._rooms_stamp(region), self._compute_eligible_rooms(region))
+        if region.spawner_config and region.obj_id not in self._background_region_ids:
+            self._background_region_ids.append(region.obj_id)
+
+    def unregister_region(self, region_id: str):
+        """Drops the tables of a region that was unloaded or torn down."""
+        self._eligible_rooms.pop(region_id, None)
+        if region_id in self._background_region_ids:
+            index = self._background_region_ids.index(region_id)
+            self._background_region_ids.pop(index)
+            if index < self._background_cursor: self._background_cursor -= 1
+
+    def get_eligible_rooms(self, region: Region) -> Tuple[str, ...]:
+        """Returns the region's spawn-eligible room ids, rebuilding if its rooms changed."""
+        entry = self._eligible_rooms.get(region.obj_id)
+        if not entry or entry[0] is not region or entry[1] is not region.rooms or entry[2] != self._rooms_stamp(region):
+            self.register_region(region)
+            entry = self._eligible_rooms[region.obj_id]
+        return entry[3]
+
+    @staticmethod
+    def _rooms_stamp(region: Region) -> Tuple[int, int, int]:
+        # Size catches rooms assigned into the dict directly; the versions catch add_room and room edits.
+        return (len(region.rooms), region.rooms_version, Room.spawn_epoch)
+
+    @staticmethod
+    def _compute_eligible_rooms(region: Region) -> Tuple[str, ...]:
+        eligible = []
+        for room_id, room in region.rooms.items():
+            if not room: continue
+            if room.get_property('no_monster_spawn', False): continue
+
+            room_name_lower = room.name.lower()
+            room_id_lower = room_id.lower()
+            if any(keyword in room_id_lower or keyword in room_name_lower for keyword in SPAWN_NO_SPAWN_ROOM_KEYWORDS): continue
+            eligible.append(room_id)
+        return tuple(eligible)
+
     def _count_monsters_in_region(self, region_id: str) -> int:
         """Counts active hostile monsters currently in a region."""
-        return sum(1 for npc in self.world.npcs.values() if
-                   npc and npc.current_region_id == region_id and
-                   npc.faction == "hostile" and npc.is_alive)
+        return self.world.npcs.count_hostiles_in_region(region_id)
+
+    # --- Spawning ---
+
+    def _spawn_in_background_regions(self, skip_region_id: Optional[str]):
+        """Attempts one spawn in each of the next few regions in the round-robin queue."""
+        budget = SPAWN_BACKGROUND_REGIONS_PER_TICK
+        attempts = len(self._background_region_ids)
+        while budget > 0 and attempts > 0 and self._background_region_ids:
+            attempts -= 1
+            self._background_cursor %= len(self._background_region_ids)
+            region_id = self._background_region_ids[self._background_cursor]
+            if not self.world.regions.is_loaded(region_id):
+                # Region was torn down or unloaded; it re-registers if it is loaded again.
+                self._background_region_ids.pop(self._background_cursor)
+                self._eligible_rooms.pop(region_id, None)
+                continue
+            region = self.world.regions[region_id]
+            self._background_cursor += 1
+            if region_id == skip_region_id: continue
+            self._spawn_monsters_in_region(region)
+            budget -= 1
 
     def _spawn_monsters_in_region(self, region: Region):
         """Attempts to spawn a monster in a suitable room within a given region."""
@@ -63,23 +132,14 @@ class Spawner:
         if current_monster_count >= dynamic_max_for_region:
             return
 
-        # Find a suitable room to spawn in (not player's room, not a no-spawn zone)
-        suitable_rooms = []
-        player_location = (self.world.current_region_id, self.world.current_room_id)
-        for room_id, room in region.rooms.items():
-            if not room: continue
-            if room.get_property('no_monster_spawn', False): continue
-            
-            room_name_lower = room.name.lower()
-            room_id_lower = room_id.lower()
-            if any(keyword in room_id_lower or keyword in room_name_lower for keyword in SPAWN_NO_SPAWN_ROOM_KEYWORDS): continue
-            
-            # Don't spawn in the player's current room
-            if player_location == (region.obj_id, room_id): continue
-            suitable_rooms.append(room_id)
-
+        # Pick a suitable room (not a no-spawn zone, not the player's current room)
+        suitable_rooms = self.get_eligible_rooms(region)
         if not suitable_rooms: return
-        room_id_to_spawn = random.choice(suitable_rooms)
+        pick = random.randrange(len(suitable_rooms))
+        if self.world.current_region_id == region.obj_id and suitable_rooms[pick] == self.world.current_room_id:
+            if len(suitable_rooms) == 1: return
+            pick = (pick + 1 + random.randrange(len(suitable_rooms) - 1)) % len(suitable_rooms)
+        room_id_to_spawn = suitable_rooms[pick]
 
         # Choose a monster from the region's weighted list
         region_monster_weights = region.spawner_config.get("monster_types", {})
@@ -89,7 +149,7 @@ class Spawner:
 
         level_range = region.spawner_config.get("level_range", [1, 1])
         level = random.randint(level_range[0], level_range[1])
-        
+
         overrides = {
             "level": level,
             "current_region_id": region.obj_id,
@@ -102,4 +162,4 @@ class Spawner:
         if monster:
             self.world.add_npc(monster)
             if SPAWN_DEBUG and self.world.game:
-                 self.world.game.renderer.add_message(f"[SpawnerDebug] Spawned {monster.name} in {region.obj_id}:{room_id_to_spawn}")
\ No newline at end of file
+                 self.world.game.renderer.add_message(f"[SpawnerDebug] Spawned {monster.name} in {region.obj_id}:{room_id_to_spawn}")
@@ -0,0 +1,289 @@
+# engine/world/sqlite_store.py
+"""
+SQLite storage backend for save games.
+
+Stores the same save document SaveManager builds for JSON saves, split into
+per-region and per-entity rows. A save can be written whole, or as the core
+document plus only the rows that changed, in one transaction; rows that
+already hold the written values are left alone. A loaded game reads the core
+document at once and each region's items, NPCs and definition through the
+region indexes when that region is needed (see store_session.py).
+"""
+import json
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+STORE_SCHEMA_VERSION = 1
+
+# Player quest logs are kept in the quests table rather than the player row.
+_PLAYER_QUEST_SCOPES = ("quest_log", "completed_quest_log", "archived_quest_log")
+# Save document keys with their own tables; every other top-level key is kept in meta.
+_TABLED_KEYS = {"player", "npc_states", "room_items_state", "dynamic_regions", "generated_regions", "quest_board"}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, data TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS player (slot INTEGER PRIMARY KEY, data TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS regions (region_id TEXT PRIMARY KEY, kind TEXT NOT NULL, data TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS rooms (region_id TEXT NOT NULL, room_id TEXT NOT NULL, data TEXT NOT NULL, PRIMARY KEY (region_id, room_id));
+CREATE TABLE IF NOT EXISTS room_items (region_id TEXT NOT NULL, room_id TEXT NOT NULL, data TEXT NOT NULL, PRIMARY KEY (region_id, room_id));
+CREATE TABLE IF NOT EXISTS npcs (npc_id TEXT PRIMARY KEY, region_id TEXT, data TEXT NOT NULL);
+CREATE INDEX IF NOT EXISTS npcs_by_region ON npcs (region_id);
+CREATE TABLE IF NOT EXISTS quests (scope TEXT NOT NULL, quest_id TEXT NOT NULL, position INTEGER NOT NULL, data TEXT NOT NULL, PRIMARY KEY (scope, quest_id));
+"""
+
+# table -> key columns, in primary key order
+_TABLE_KEYS: Dict[str, Tuple[str, ...]] = {
+    "meta": ("key",), "player": ("slot",), "regions": ("region_id",),
+    "rooms": ("region_id", "room_id"), "room_items": ("region_id", "room_id"),
+    "npcs": ("npc_id",), "quests": ("scope", "quest_id"),
+}
+# table -> all columns in schema order; key columns always come first.
+_TABLE_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "meta": ("key", "data"), "player": ("slot", "data"), "regions": ("region_id", "kind", "data"),
+    "rooms": ("region_id", "room_id", "data"), "room_items": ("region_id", "room_id", "data"),
+    "npcs": ("npc_id", "region_id", "data"), "quests": ("scope", "quest_id", "position", "data"),
+}
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, separators=(",", ":"), default=str)
+
+
+def _npc_row(state: Dict[str, Any]) -> Tuple:
+    return state.get("current_region_id"), _dumps(state)
+
+
+def _region_rows(region_id: str, kind: str, data: Dict[str, Any]) -> Tuple[Tuple, Dict[Tuple, Tuple]]:
+    """The regions row and rooms rows for a saved region. Generated recipes are kept whole."""
+    if kind == "generated": return (kind, _dumps(data)), {}
+    header = dict(data)
+    rooms = {(region_id, room_id): (_dumps(room_data),) for room_id, room_data in (header.pop("rooms", None) or {}).items()}
+    return (kind, _dumps(header)), rooms
+
+
+class SQLiteWorldStore:
+    def __init__(self, path: str):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(_SCHEMA)
+        self.last_write_stats: Dict[str, int] = {}
+
+    def close(self) -> None:
+        self.conn.close()
+
+    # --- Document <-> Rows ---
+    def _rows_from_document(self, doc: Dict[str, Any]) -> Dict[str, Dict[Tuple, Tuple]]:
+        rows: Dict[str, Dict[Tuple, Tuple]] = {table: {} for table in _TABLE_KEYS}
+        for key, value in doc.items():
+            if key not in _TABLED_KEYS: rows["meta"][(key,)] = (_dumps(value),)
+        rows["meta"][("store_schema_version",)] = (_dumps(STORE_SCHEMA_VERSION),)
+
+        player = dict(doc.get("player") or {})
+        for scope in _PLAYER_QUEST_SCOPES:
+            for index, (quest_id, quest) in enumerate((player.pop(scope, None) or {}).items()):
+                rows["quests"][(scope, quest_id)] = (index, _dumps(quest))
+        if doc.get("player") is not None: rows["player"][(1,)] = (_dumps(player),)
+        for index, quest in enumerate(doc.get("quest_board", [])):
+            rows["quests"][("board", str(index))] = (index, _dumps(quest))
+
+        for npc_id, state in doc.get("npc_states", {}).items():
+            rows["npcs"][(npc_id,)] = _npc_row(state)
+        for location_key, item_refs in doc.get("room_items_state", {}).items():
+            region_id, _, room_id = location_key.partition(":")
+            rows["room_items"][(region_id, room_id)] = (_dumps(item_refs),)
+
+        for entry in doc.get("generated_regions", []):
+            region_id = entry.get("id") or f"generated_{len(rows['regions'])}"
+            rows["regions"][(region_id,)] = _region_rows(region_id, "generated", entry)[0]
+        for region_data in doc.get("dynamic_regions", []):
+            region_id = region_data.get("id") or region_data.get("obj_id")
+            rows["regions"][(region_id,)], room_rows = _region_rows(region_id, "dynamic", region_data)
+            rows["rooms"].update(room_rows)
+        return rows
+
+    def _read_core(self, cur: sqlite3.Cursor) -> Dict[str, Any]:
+        doc: Dict[str, Any] = {}
+        for key, data in cur.execute("SELECT key, data FROM meta ORDER BY rowid"):
+            if key != "store_schema_version": doc[key] = json.loads(data)
+
+        row = cur.execute("SELECT data FROM player WHERE slot = 1").fetchone()
+        player = json.loads(row[0]) if row else None
+        quests: Dict[str, Dict[str, Any]] = {}
+        for scope, quest_id, data in cur.execute("SELECT scope, quest_id, data FROM quests ORDER BY scope, position"):
+            quests.setdefault(scope, {})[quest_id] = json.loads(data)
+        if player is not None:
+            for scope in _PLAYER_QUEST_SCOPES: player[scope] = quests.get(scope, {})
+            doc["player"] = player
+        doc["quest_board"] = list(quests.get("board", {}).values())
+        return doc
+
+    def _document_from_rows(self) -> Dict[str, Any]:
+        cur = self.conn.cursor()
+        doc = self._read_core(cur)
+        doc["npc_states"] = {npc_id: json.loads(data) for npc_id, data in cur.execute("SELECT npc_id, data FROM npcs ORDER BY rowid")}
+        doc["room_items_state"] = {
+            f"{region_id}:{room_id}": json.loads(data)
+            for region_id, room_id, data in cur.execute("SELECT region_id, room_id, data FROM room_items ORDER BY rowid")
+        }
+
+        rooms: Dict[str, Dict[str, Any]] = {}
+        for region_id, room_id, data in cur.execute("SELECT region_id, room_id, data FROM rooms ORDER BY rowid"):
+            rooms.setdefault(region_id, {})[room_id] = json.loads(data)
+        doc["generated_regions"], doc["dynamic_regions"] = [], []
+        for region_id, kind, data in cur.execute("SELECT region_id, kind, data FROM regions ORDER BY rowid"):
+            region_data = json.loads(data)
+            if kind == "generated":
+                doc["generated_regions"].append(region_data)
+            else:
+                region_data["rooms"] = rooms.get(region_id, {})
+                doc["dynamic_regions"].append(region_data)
+        return doc
+
+    # --- Row Writes ---
+    def _keys(self, table: str, scope: Tuple = ()) -> List[Tuple]:
+        """Keys of the stored rows in a table, or of those whose keys start with `scope`."""
+        key_cols = _TABLE_KEYS[table]
+        where = " AND ".join(f"{col} = ?" for col in key_cols[:len(scope)])
+        return [tuple(row) for row in self.conn.execute(
+            f"SELECT {', '.join(key_cols)} FROM {table}" + (f" WHERE {where}" if where else ""), scope)]
+
+    def _upsert(self, table: str, rows: Dict[Tuple, Tuple], stats: Dict[str, int]) -> None:
+        if not rows: return
+        key_cols = _TABLE_KEYS[table]
+        value_cols = _TABLE_COLUMNS[table][len(key_cols):]
+        placeholders = ", ".join("?" for _ in _TABLE_COLUMNS[table])
+        updates = ", ".join(f"{col} = excluded.{col}" for col in value_cols)
+        differs = " OR ".join(f"{col} IS NOT excluded.{col}" for col in value_cols)
+        # Upsert rather than REPLACE so existing rows keep their rowid, and with it their order.
+        # Rows that already hold these values are left alone and cost no page writes.
+        written = self.conn.executemany(
+            f"INSERT INTO {table} VALUES ({placeholders}) ON CONFLICT ({', '.join(key_cols)}) DO UPDATE SET {updates} WHERE {differs}",
+            [key + value for key, value in rows.items()]).rowcount
+        stats["written"] += written
+        stats["unchanged"] += len(rows) - written
+
+    def _delete(self, table: str, keys: List[Tuple], stats: Dict[str, int]) -> None:
+        if not keys: return
+        where = " AND ".join(f"{col} = ?" for col in _TABLE_KEYS[table])
+        stats["deleted"] += self.conn.executemany(f"DELETE FROM {table} WHERE {where}", keys).rowcount
+
+    def _replace(self, table: str, rows: Dict[Tuple, Tuple], stats: Dict[str, int], scope: Tuple = ()) -> None:
+        """Makes the table's rows, or those whose keys start with `scope`, exactly `rows`."""
+        self._delete(table, [key for key in self._keys(table, scope) if key not in rows], stats)
+        self._upsert(table, rows, stats)
+
+    # --- Public API ---
+    def write_document(self, doc: Dict[str, Any]) -> Dict[str, int]:
+        """
+        Stores a whole save document, writing only rows that differ from what is
+        already stored. Everything happens in one transaction. Returns row counts.
+        """
+        desired = self._rows_from_document(doc)
+        stats = {"written": 0, "deleted": 0, "unchanged": 0}
+        with self.conn:
+            for table in _TABLE_KEYS: self._replace(table, desired[table], stats)
+        self.last_write_stats = stats
+        return stats
+
+    def write_changes(self, core: Dict[str, Any], npcs: Dict[str, Optional[Dict[str, Any]]],
+                      room_items: Dict[Tuple[str, str], List[Dict[str, Any]]],
+                      region_items: Dict[str, Dict[str, List[Dict[str, Any]]]],
+                      regions: Dict[str, Optional[Tuple[str, Dict[str, Any]]]]) -> Dict[str, int]:
+        """
+        Stores part of a save in one transaction. `core` is the save document without
+        NPCs, room items or dynamic regions and is stored in full. NPCs and regions
+        mapped to None are deleted, as are rooms with no items; `region_items`
+        replaces every room item row of its regions. Rows not mentioned stay as they are.
+        """
+        core_rows = self._rows_from_document(core)
+        stats = {"written": 0, "deleted": 0, "unchanged": 0}
+        with self.conn:
+            for table in ("meta", "player", "quests"): self._replace(table, core_rows[table], stats)
+            self._upsert("npcs", {(npc_id,): _npc_row(state) for npc_id, state in npcs.items() if state}, stats)
+            self._delete("npcs", [(npc_id,) for npc_id, state in npcs.items() if not state], stats)
+            self._upsert("room_items", {key: (_dumps(refs),) for key, refs in room_items.items() if refs}, stats)
+            self._delete("room_items", [key for key, refs in room_items.items() if not refs], stats)
+            for region_id, rooms in region_items.items():
+                self._replace("room_items", {(region_id, room_id): (_dumps(refs),) for room_id, refs in rooms.items() if refs},
+                              stats, (region_id,))
+            for region_id, saved in regions.items():
+                if saved is None:
+                    self._delete("regions", [(region_id,)], stats)
+                    self._replace("rooms", {}, stats, (region_id,))
+                    continue
+                region_row, room_rows = _region_rows(region_id, *saved)
+                self._upsert("regions", {(region_id,): region_row}, stats)
+                self._replace("rooms", room_rows, stats, (region_id,))
+        self.last_write_stats = stats
+        return stats
+
+    def read_document(self) -> Dict[str, Any]:
+        """Rebuilds the full save document."""
+        return self._document_from_rows()
+
+    def read_core(self) -> Dict[str, Any]:
+        """The save document without NPCs, room items and dynamic regions, which are read per region."""
+        return self._read_core(self.conn.cursor())
+
+    def saved_regions(self) -> List[Tuple[str, str]]:
+        """(region id, kind) of every saved dynamic region, in save order."""
+        return [(region_id, kind) for region_id, kind in self.conn.execute("SELECT region_id, kind FROM regions ORDER BY rowid")]
+
+    def read_saved_region(self, region_id: str) -> Optional[Dict[str, Any]]:
+        """One saved dynamic region: a generated region's recipe entry, or a region's full definition."""
+        row = self.conn.execute("SELECT kind, data FROM regions WHERE region_id = ?", (region_id,)).fetchone()
+        if not row: return None
+        region_data = json.loads(row[1])
+        if row[0] != "generated":
+            region_data["rooms"] = {room_id: json.loads(data) for room_id, data in self.conn.execute(
+                "SELECT room_id, data FROM rooms WHERE region_id = ? ORDER BY rowid", (region_id,))}
+        return region_data
+
+    def read_region_npcs(self, region_id: Optional[str]) -> Dict[str, Dict[str, Any]]:
+        """States of the NPCs saved in one region (None for NPCs without one), via the region index."""
+        return {npc_id: json.loads(data) for npc_id, data in
+                self.conn.execute("SELECT npc_id, data FROM npcs WHERE region_id IS ? ORDER BY rowid", (region_id,))}
+
+    def read_room_items(self, region_id: str) -> Dict[str, List[Dict[str, Any]]]:
+        """room id -> item references for one region."""
+        return {room_id: json.loads(data) for room_id, data in
+                self.conn.execute("SELECT room_id, data FROM room_items WHERE region_id = ? ORDER BY rowid", (region_id,))}
+
+    def read_region(self, region_id: str) -> Dict[str, Any]:
+        """Room items and NPC states for one region, via the region indexes."""
+        return {"room_items": self.read_room_items(region_id), "npc_states": self.read_region_npcs(region_id)}
+
+    def npc_region_ids(self) -> Set[Optional[str]]:
+        """Regions with saved NPCs, None among them if any NPC has no region."""
+        return {row[0] for row in self.conn.execute("SELECT DISTINCT region_id FROM npcs")}
+
+    def region_ids(self) -> List[str]:
+        """Regions with saved room items."""
+        return [row[0] for row in self.conn.execute("SELECT DISTINCT region_id FROM room_items ORDER BY region_id")]
+
+
+def _connect_read_only(path: str) -> sqlite3.Connection:
+    return sqlite3.connect(f"{Path(path).absolute().as_uri()}?mode=ro", uri=True)
+
+
+def read_meta_value(path: str, key: str) -> Any:
+    """Reads one meta row without building a store (or creating the file)."""
+    conn = _connect_read_only(path)
+    try:
+        row = conn.execute("SELECT data FROM meta WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else None
+    finally:
+        conn.close()
+
+
+def check_store_integrity(path: str) -> Tuple[bool, str]:
+    """Runs SQLite's quick_check over a save store."""
+    conn = _connect_read_only(path)
+    try:
+        result = conn.execute("PRAGMA quick_check").fetchone()[0]
+    finally:
+        conn.close()
+    return result == "ok", result
@@ -0,0 +1,234 @@
+# engine/world/store_session.py
+"""
+The loaded world's link to SQLite saves.
+
+A game loaded from a .db save is read lazily: the player, quests and world
+state at once, each region's NPCs and room items when the hydrator or the
+region loader materializes that region, and saved dynamic regions when they
+are first needed. Rows not read yet stay as they are when the game saves
+back to the same store; full saves elsewhere copy them across.
+
+After every save to a .db store the session keeps a ledger of the objects
+behind the rows that store holds, with cheap version stamps: NPC save
+fingerprints, room save versions with the time the player last visited the
+region (items change in place, e.g. in containers, only where the player
+is), and the blob or saved state of every unloaded region. The next save to
+the store compares the world against the ledger and serializes and writes
+only what changed, appeared or vanished since.
+"""
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional, Set, Tuple
+
+from engine.world.sqlite_store import SQLiteWorldStore
+
+if TYPE_CHECKING:
+    from engine.npcs.npc import NPC
+    from engine.world.save_manager import SaveManager
+    from engine.world.world import World
+
+# Saved region kind -> key of the deferred state RegionStore hands to the region loader.
+_STATE_KEYS = {"generated": "generated", "dynamic": "region"}
+_DYNAMIC_PREFIXES = ("dynamic_", "instance_")
+
+
+class StoredRegionState(Mapping):
+    """A saved dynamic region's deferred state, read from the store the first time it is looked at."""
+    def __init__(self, session: 'StoreSession', region_id: str, kind: str):
+        self.session = session
+        self.region_id = region_id
+        self.key = _STATE_KEYS.get(kind, "region")
+        self._data: Optional[Dict[str, Any]] = None
+
+    def __getitem__(self, key: str) -> Any:
+        # Deferred saved regions hold nothing else (no "items"), so other keys miss without a read.
+        if key != self.key: raise KeyError(key)
+        if self._data is None: self._data = self.session.store.read_saved_region(self.region_id)
+        return self._data
+
+    def __contains__(self, key: Any) -> bool:
+        return key == self.key
+
+    def __iter__(self) -> Iterator[str]:
+        return iter((self.key,))
+
+    def __len__(self) -> int:
+        return 1
+
+
+class StoreLedger:
+    def __init__(self):
+        # npc id -> (NPC, save fingerprint), or (saved state, None) for NPCs read but not rebuilt yet
+        self.npcs: Dict[str, Tuple[Any, Any]] = {}
+        # region id -> {room id: (room, save version, last visit)} for loaded regions,
+        #              or (blob or None, pending items or None, pending room count) for unloaded ones
+        self.items: Dict[str, Any] = {}
+        # dynamic region id -> loaded Region or deferred state
+        self.regions: Dict[str, Any] = {}
+
+
+class StoreChanges:
+    """What a save to a store with a ledger has to write. None marks something that is gone."""
+    def __init__(self):
+        # npc id -> NPC, saved state, or None
+        self.npcs: Dict[str, Any] = {}
+        # (region id, room id) -> room whose items row is rewritten
+        self.rooms: Dict[Tuple[str, str], Any] = {}
+        # Regions whose room item rows are all rewritten; False once a region has no items left.
+        self.item_regions: Dict[str, bool] = {}
+        # region id -> Region, deferred state, or None
+        self.regions: Dict[str, Any] = {}
+
+
+class StoreSession:
+    def __init__(self, save_manager: 'SaveManager', source: Optional[str] = None):
+        self.save_manager = save_manager
+        # Path of the SQLite save the world was loaded from, read region by region.
+        self.source = source
+        self.unread_npcs: Set[Optional[str]] = set()
+        self.unread_items: Set[str] = set()
+        # Path of the store the ledger describes.
+        self.target: Optional[str] = None
+        self.ledger: Optional[StoreLedger] = None
+        # (path, ledger) a save running in a forked child will leave behind if it succeeds.
+        self.expected: Optional[Tuple[str, StoreLedger]] = None
+        if source:
+            self.unread_npcs = self.store.npc_region_ids()
+            self.unread_items = set(self.store.region_ids())
+            self.target, self.ledger = source, StoreLedger()
+
+    @property
+    def store(self) -> SQLiteWorldStore:
+        return self.save_manager._get_sqlite_store(self.source)
+
+    # --- Reading ---
+    def stored_regions(self) -> Iterator[Tuple[str, StoredRegionState]]:
+        """Deferred states for the source's saved dynamic regions, entered in the ledger as stored."""
+        for region_id, kind in self.store.saved_regions():
+            state = StoredRegionState(self, region_id, kind)
+            if self.ledger is not None: self.ledger.regions[region_id] = state
+            yield region_id, state
+
+    def read_npcs(self, region_id: Optional[str]) -> Dict[str, Dict[str, Any]]:
+        """Saved NPC states of a region the first time it is asked for; empty after that."""
+        if region_id not in self.unread_npcs: return {}
+        self.unread_npcs.discard(region_id)
+        states = self.store.read_region_npcs(region_id)
+        for ledger in self._ledgers():
+            for npc_id, state in states.items(): ledger.npcs[npc_id] = (state, None)
+        return states
+
+    def read_room_items(self, region_id: str) -> Dict[str, Any]:
+        """Saved room items of a region the first time it is asked for; empty after that."""
+        if region_id not in self.unread_items: return {}
+        self.unread_items.discard(region_id)
+        return self.store.read_room_items(region_id)
+
+    def peek_npc_states(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """States of the NPCs not read yet, for full saves."""
+        for region_id in list(self.unread_npcs):
+            yield from self.store.read_region_npcs(region_id).items()
+
+    def peek_room_items(self) -> Iterator[Tuple[str, str, Any]]:
+        """(region id, room id, item references) for room items not read yet, for full saves."""
+        for region_id in list(self.unread_items):
+            for room_id, item_refs in self.store.read_room_items(region_id).items():
+                yield region_id, room_id, item_refs
+
+    def adopt_npc(self, instance_id: str, state: Dict[str, Any], npc: 'NPC'):
+        """Records that an NPC was rebuilt from the state its row holds, so it is not written back unchanged."""
+        for ledger in self._ledgers():
+            entry = ledger.npcs.get(instance_id)
+            if entry and entry[0] is state: ledger.npcs[instance_id] = (npc, npc.save_fingerprint())
+
+    def _ledgers(self) -> Iterator[StoreLedger]:
+        if self.ledger is not None: yield self.ledger
+        if self.expected: yield self.expected[1]
+
+    # --- Tracking ---
+    def ledger_for(self, path: str) -> Optional[StoreLedger]:
+        """The ledger a save to `path` can write only changes against, if there is one."""
+        return self.ledger if path == self.target else None
+
+    def track(self, path: Optional[str], ledger: Optional[StoreLedger]):
+        self.target, self.ledger = path, ledger
+
+    def expect(self, path: str, ledger: StoreLedger):
+        self.expected = (path, ledger)
+
+    def settle(self, success: bool):
+        """Adopts the expected ledger once a forked save has written it, or drops it if the save failed."""
+        if success and self.expected: self.track(*self.expected)
+        self.expected = None
+
+    # --- Capture ---
+    def capture(self, world: 'World', old: Optional[StoreLedger]) -> Tuple[StoreLedger, StoreChanges]:
+        """
+        Stamps the world as it stands into a new ledger and lists what changed against
+        `old`; against None, everything has. Nothing is serialized here.
+        """
+        ledger, changes = StoreLedger(), StoreChanges()
+        old = old or StoreLedger()
+        self._capture_npcs(world, old, ledger, changes)
+        self._capture_items(world, old, ledger, changes)
+        self._capture_regions(world, old, ledger, changes)
+        return ledger, changes
+
+    def _capture_npcs(self, world: 'World', old: StoreLedger, ledger: StoreLedger, changes: StoreChanges):
+        for npc_id, npc in world.npcs.items():
+            entry = ledger.npcs[npc_id] = (npc, npc.save_fingerprint())
+            prev = old.npcs.get(npc_id)
+            if not prev or prev[0] is not npc or prev[1] != entry[1]: changes.npcs[npc_id] = npc
+        for states in world.hydrator.pending_npcs.values():
+            for npc_id, state in states.items():
+                if npc_id in ledger.npcs: continue
+                ledger.npcs[npc_id] = (state, None)
+                prev = old.npcs.get(npc_id)
+                if not prev or prev[0] is not state: changes.npcs[npc_id] = state
+        for npc_id in old.npcs:
+            if npc_id not in ledger.npcs: changes.npcs[npc_id] = None
+
+    def _capture_items(self, world: 'World', old: StoreLedger, ledger: StoreLedger, changes: StoreChanges):
+        regions, pending_items = world.regions, world.pending_room_items
+        for region_id, region in regions.items():
+            if region_id in self.unread_items: continue
+            pending, visit = pending_items.get(region_id, {}), regions.last_visit(region_id)
+            prev = old.items.get(region_id)
+            if not isinstance(prev, dict): changes.item_regions[region_id] = True
+            stamps = ledger.items[region_id] = {}
+            for room_id, room in region.rooms.items():
+                if room_id in pending:
+                    # Still waiting for its saved items, so its row is as it was.
+                    if isinstance(prev, dict) and room_id in prev: stamps[room_id] = prev[room_id]
+                    continue
+                stamp = stamps[room_id] = (room, room.save_version, visit)
+                previous = prev.get(room_id) if isinstance(prev, dict) else None
+                if region_id not in changes.item_regions and (not previous or previous[0] is not room or previous[1:] != stamp[1:]):
+                    changes.rooms[(region_id, room_id)] = room
+
+        unloaded: Dict[str, Optional[bytes]] = {
+            region_id: state for region_id, state in regions.unloaded_states() if isinstance(state, bytes)}
+        for region_id in pending_items:
+            if not regions.is_loaded(region_id): unloaded.setdefault(region_id, None)
+        for region_id, blob in unloaded.items():
+            if region_id in self.unread_items: continue
+            pending = pending_items.get(region_id)
+            token = ledger.items[region_id] = (blob, pending, len(pending) if pending else 0)
+            prev = old.items.get(region_id)
+            if not isinstance(prev, tuple) or prev[0] is not blob or prev[1] is not pending or prev[2] != token[2]:
+                changes.item_regions[region_id] = True
+
+        for region_id in old.items:
+            if region_id not in ledger.items and region_id not in self.unread_items: changes.item_regions[region_id] = False
+
+    def _capture_regions(self, world: 'World', old: StoreLedger, ledger: StoreLedger, changes: StoreChanges):
+        regions = world.regions
+        # Loaded dynamic regions have no stamp of their own; they are few, and rows that
+        # come out unchanged are not written.
+        for region_id, region in regions.items():
+            if region_id.startswith(_DYNAMIC_PREFIXES): ledger.regions[region_id] = changes.regions[region_id] = region
+        for region_id, state in regions.unloaded_states():
+            if isinstance(state, bytes) or regions.manifest_entry(region_id): continue
+            ledger.regions[region_id] = state
+            if old.regions.get(region_id) is not state: changes.regions[region_id] = state
+        for region_id in old.regions:
+            if region_id not in ledger.regions: changes.regions[region_id] = None
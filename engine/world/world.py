@@ -4,9 +4,11 @@ import time
 from typing import Dict, List, Optional, Any, Tuple, TYPE_CHECKING
 
 from engine.campaign.campaign_manager import CampaignManager
+from engine.campaign.transition_table import EVENT_LOCATION_ENTERED
 from engine.config import (
     FORMAT_ERROR, FORMAT_HIGHLIGHT, FORMAT_RESET, DEFAULT_SAVE_FILE, WORLD_UPDATE_INTERVAL,
-    REP_KILL_PENALTY_SAME_FACTION, REP_KILL_REWARD_HOSTILE, FORMAT_SUCCESS
+    REP_KILL_PENALTY_SAME_FACTION, REP_KILL_REWARD_HOSTILE, FORMAT_SUCCESS,
+    REGION_EVICT_IDLE_SECONDS, REGION_EVICTION_CHECK_INTERVAL
 )
 # UPDATED IMPORT
 from engine.core.quests import QuestManager
@@ -20,11 +22,20 @@ from engine.items.item import Item
 from engine.items.lockpick import Lockpick
 from engine.npcs.npc import NPC
 from engine.world.spawner import Spawner
+from engine.world.npc_registry import NPCRegistry
+from engine.world.exit_index import ExitLinkIndex
 from engine.world.save_manager import SaveManager
-from engine.world.definition_loader import load_all_definitions, initialize_new_world
+from engine.world.definition_loader import load_all_definitions, initialize_new_world, load_region
 from engine.world.respawn_manager import RespawnManager
 from engine.world.instance_manager import InstanceManager
+from engine.world.region_pool import RegionPregenPool
+from engine.world.region_generator import RegionGenerator
+from engine.world.region_store import RegionStore
+from engine.world.entity_registry import EntityRegistry
+from engine.world.hydrator import WorldHydrator
+from engine.utils.logger import Logger
 from engine.utils.pathfinding import find_path
+from engine.utils.utils import _serialize_item_reference
 from engine.core.skill_system import SkillSystem
 
 from engine.world.description_generator import generate_room_description
@@ -34,11 +45,16 @@ if TYPE_CHECKING:
 
 class World:
     def __init__(self):
-        self.regions: Dict[str, Region] = {}
+        self.regions = RegionStore()
+        # Saved room items not placed yet (region not loaded, or still hydrating): region_id -> room_id -> item refs.
+        self.pending_room_items: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+        self.hydrator = WorldHydrator(self)
+        self.exit_links = ExitLinkIndex()
         self.item_templates: Dict[str, Dict[str, Any]] = {}
         self.npc_templates: Dict[str, Dict[str, Any]] = {}
-        self.player: Optional['Player'] = None
-        self.npcs: Dict[str, NPC] = {}
+        self.entities = EntityRegistry()
+        self.player = None
+        self.npcs = NPCRegistry()
         self.current_region_id: Optional[str] = None
         self.current_room_id: Optional[str] = None
         self.quest_board: List[Dict[str, Any]] = []
@@ -49,23 +65,86 @@ class World:
         self.save_manager = SaveManager(self)
         self.respawn_manager = RespawnManager(self)
         self.instance_manager = InstanceManager(self)
+        self.region_pool = RegionPregenPool(self)
+        self._region_generator: Optional[RegionGenerator] = None
 
         self.last_update_time = 0.0
+        self._last_eviction_check = 0.0
         if TYPE_CHECKING:
             self.game: Optional['GameManager'] = None
 
         load_all_definitions(self)
 
+    @property
+    def player(self) -> Optional['Player']:
+        return self._player
+
+    @player.setter
+    def player(self, value: Optional['Player']) -> None:
+        # A replaced player (new game, load) must not stay reachable through old handles.
+        old = self.__dict__.get("_player")
+        if old is not None and old is not value: self.entities.release(getattr(old, "handle", None))
+        self._player = value
+        # Registered up front so NPCs can hold the player by handle (combat targets).
+        if value is not None: self.entities.handle_of(value)
+
+    @property
+    def region_generator(self) -> RegionGenerator:
+        """One generator per world, so the theme file is read once rather than per save or load."""
+        if self._region_generator is None: self._region_generator = RegionGenerator(self)
+        return self._region_generator
+
+    @property
+    def npcs(self) -> NPCRegistry:
+        return self._npcs
+
+    @npcs.setter
+    def npcs(self, value: Dict[str, NPC]) -> None:
+        # Wrap plain dicts so the per-region NPC indexes stay in sync.
+        new_npcs = value if isinstance(value, NPCRegistry) else NPCRegistry(value or {})
+        old_npcs = self.__dict__.get("_npcs")
+        # NPCs dropped with the old table are gone; their handles must stop resolving.
+        if old_npcs is not None and old_npcs is not new_npcs:
+            kept = {id(npc) for npc in new_npcs.values()}
+            for npc in old_npcs.values():
+                if id(npc) not in kept: self.entities.release(npc.handle)
+            old_npcs.entities = None
+        self._npcs = new_npcs
+        new_npcs.bind_entities(self.entities)
+
+    @property
+    def current_region_id(self) -> Optional[str]:
+        return self._current_region_id
+
+    @current_region_id.setter
+    def current_region_id(self, value: Optional[str]) -> None:
+        self._current_region_id = value
+        # Entering a region still hydrating after a load builds it in full first.
+        if self.hydrator.active: self.hydrator.materialize_region(value)
+
+    @property
+    def regions(self) -> RegionStore:
+        return self._regions
+
+    @regions.setter
+    def regions(self, value: Dict[str, Region]) -> None:
+        # Wrap plain dicts so unloaded regions still materialize on lookup.
+        self._regions = value if isinstance(value, RegionStore) else RegionStore(value or {})
+        self._regions.loader = lambda region_id: load_region(self, region_id)
+
     def initialize_new_world(self, start_region="town", start_room="town_square"):
         initialize_new_world(self, start_region, start_room)
 
-    def load_save_game(self, filename: str = DEFAULT_SAVE_FILE) -> Tuple[bool, Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
-        return self.save_manager.load(filename)
+    def load_save_game(self, filename: str = DEFAULT_SAVE_FILE, phased: bool = False) -> Tuple[bool, Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        return self.save_manager.load(filename, phased)
 
     def save_game(self, filename: str = DEFAULT_SAVE_FILE) -> bool:
         return self.save_manager.save(filename)
 
     def update(self) -> List[str]:
+        # Runs every frame, ahead of the world tick: finishes off a phased load a slice at a time.
+        if self.hydrator.active: self.hydrator.step()
+
         current_time_abs = time.time()
         messages = []
         
@@ -83,10 +162,17 @@ class World:
                     room_msgs = room.update(dt)
                     messages.extend(room_msgs)
 
+        self.regions.touch(self.current_region_id, current_time_abs)
+        if current_time_abs - self._last_eviction_check >= REGION_EVICTION_CHECK_INTERVAL:
+            self._last_eviction_check = current_time_abs
+            self.evict_cold_regions(current_time_abs)
+
         messages.extend(self.respawn_manager.update(current_time_abs))
         self.spawner.update(current_time_abs)
 
-        npcs_to_update = [npc for npc in self.npcs.values() if npc.is_alive]
+        # NPCs in unloaded regions stay registered but dormant until their region is loaded again.
+        is_loaded = self.regions.is_loaded
+        npcs_to_update = [npc for npc in self.npcs.values() if npc.is_alive and (npc.current_region_id is None or is_loaded(npc.current_region_id))]
         for npc in npcs_to_update:
             npc_message = npc.update(self, current_time_abs)
             if npc_message: messages.append(npc_message)
@@ -97,7 +183,7 @@ class World:
         npcs_to_remove = [npc_id for npc_id, npc in self.npcs.items() if not npc.is_alive]
         for npc_id in npcs_to_remove: self.npcs.pop(npc_id, None)
 
-        self.instance_manager.check_and_cleanup_completed_instances()
+        self.instance_manager.update()
         
         return messages
 
@@ -173,6 +259,9 @@ class World:
         quest_updates = []
         if self.quest_manager:
             quest_updates = self.quest_manager.handle_room_entry(self.player)
+        if self.campaign_manager and self.player.active_campaigns:
+            campaign_update = self.campaign_manager.handle_event(EVENT_LOCATION_ENTERED, f"{new_region_id}:{new_room_id}", self.player)
+            if campaign_update: quest_updates.append(campaign_update)
 
         if new_region_id.startswith("instance_"):
             for quest in self.player.quest_log.values():
@@ -274,20 +363,6 @@ class World:
 
         return "There is nothing locked in that direction."
 
-    def _load_room_items_from_save(self, room_items_data: Dict[str, Any]):
-        for location_key, item_refs in room_items_data.items():
-            try:
-                region_id, room_id = location_key.split(":")
-                region = self.get_region(region_id)
-                room = region.get_room(room_id) if region else None
-                if room:
-                    for item_ref in item_refs:
-                        if item_ref and "item_id" in item_ref:
-                            item = ItemFactory.create_item_from_template(item_ref["item_id"], self, **item_ref.get("properties_override", {}))
-                            if item: room.add_item(item)
-            except ValueError:
-                print(f"Warning: Could not parse room location key '{location_key}' from save file.")
-
     def get_region(self, region_id: str) -> Optional[Region]: return self.regions.get(region_id)
     
     def get_current_region(self) -> Optional[Region]: 
@@ -299,8 +374,39 @@ class World:
             return region.get_room(self.current_room_id)
         return None
 
-    def add_region(self, region_id: str, region: Region) -> None: self.regions[region_id] = region
+    def add_region(self, region_id: str, region: Region) -> None:
+        old = self.regions.get(region_id)
+        if old is not None and old is not region: self.exit_links.detach_region(old)
+        self.regions[region_id] = region
+        self.exit_links.attach_region(region)
+        self.spawner.register_region(region)
+
+    def remove_region(self, region_id: str) -> Optional[Region]:
+        """Unloads a region. Exits elsewhere that lead into it are left to the caller."""
+        region = self.regions.pop(region_id, None)
+        if region: self.exit_links.detach_region(region)
+        return region
     
+    def evict_cold_regions(self, now: float, max_idle: float = REGION_EVICT_IDLE_SECONDS) -> List[str]:
+        """
+        Unloads static regions the player left more than `max_idle` seconds ago into
+        compact blobs. Generated and instance regions always stay resident.
+        """
+        evicted = []
+        for region_id in self.regions.cold_region_ids(now, max_idle):
+            if region_id == self.current_region_id or not self.regions.manifest_entry(region_id): continue
+            region = self.regions.get(region_id)
+            items = {room_id: [_serialize_item_reference(item, 1, self) for item in room.items]
+                     for room_id, room in region.rooms.items() if room.items}
+            self.exit_links.release_region(region)
+            # Keep the manifest's safe-zone flag current, so retreats still find the region while it is out.
+            self.regions.manifest_entry(region_id)["safe_zone"] = bool(region.get_property("safe_zone", False))
+            self.regions.store_blob(region_id, {"region": region.to_dict(), "items": items})
+            self.spawner.unregister_region(region_id)
+            evicted.append(region_id)
+        if evicted: Logger.debug("World", f"Evicted cold regions: {', '.join(evicted)}")
+        return evicted
+
     def add_npc(self, npc: NPC) -> None:
         npc.last_moved = time.time()
         npc.world = self
@@ -393,6 +499,7 @@ class World:
         if not room or not hasattr(room, 'items'): return False
         try:
             room.items.remove(item_instance)
+            room.save_version += 1
             return True
         except ValueError:
             return False
@@ -401,12 +508,13 @@ class World:
         if self.is_location_safe(source_region_id, source_room_id):
             return (source_region_id, source_room_id)
         candidate_paths = []
-        for region_id, region in self.regions.items():
-            if region.get_property("safe_zone", False):
-                for room_id in region.rooms.keys():
-                    path = self.find_path(source_region_id, source_room_id, region_id, room_id)
-                    if path is not None:
-                        heapq.heappush(candidate_paths, (len(path), (region_id, room_id)))
+        # Candidates include unloaded and evicted safe zones. Path searches can load
+        # regions, so iterate over a snapshot.
+        for region_id, room_ids in list(self.regions.safe_zone_rooms()):
+            for room_id in room_ids:
+                path = self.find_path(source_region_id, source_room_id, region_id, room_id)
+                if path is not None:
+                    heapq.heappush(candidate_paths, (len(path), (region_id, room_id)))
         if candidate_paths:
             return heapq.heappop(candidate_paths)[1]
         return None
@@ -0,0 +1,45 @@
+# tests/singles/test_affix_tables.py
+import random
+import unittest
+from collections import Counter
+from engine.items.affix_data import PREFIXES, SUFFIXES
+from engine.items.loot_generator import LootGenerator
+
+SAMPLES = 20000
+
+def _eligible(pool, item_type, level):
+    # The filter _pick_affix used to run on every roll.
+    return [name for name, data in pool.items()
+            if ("All" in data["allowed_types"] or item_type in data["allowed_types"]) and level >= data.get("level_min", 1)]
+
+class TestAffixTables(unittest.TestCase):
+
+    def test_distribution_matches_filtered_pool(self):
+        """Verify table rolls cover exactly the eligible affixes, each about equally often."""
+        random.seed(44)
+        for pool in (PREFIXES, SUFFIXES):
+            for item_type in ("Weapon", "Armor", "Jewelry", "Junk"):
+                for level in (1, 3, 5, 10):
+                    eligible = _eligible(pool, item_type, level)
+                    counts = Counter(LootGenerator._pick_affix(pool, item_type, level)[0] for _ in range(SAMPLES))
+                    if not eligible:
+                        self.assertEqual(counts, Counter({"": SAMPLES}))
+                        continue
+                    self.assertEqual(set(counts), set(eligible), f"{item_type} level {level}")
+                    expected = SAMPLES / len(eligible)
+                    # Chi-square against the uniform choice the old filter made; the bound is far past p = 0.001.
+                    chi_square = sum((counts[name] - expected) ** 2 / expected for name in eligible)
+                    self.assertLess(chi_square, 3 * len(eligible) + 30, f"{item_type} level {level}: {counts}")
+
+    def test_weights_are_honoured(self):
+        """Verify an affix's optional weight scales how often it is rolled."""
+        random.seed(7)
+        pool = {
+            "Common": {"allowed_types": ["All"], "level_min": 1, "weight": 3},
+            "Rare": {"allowed_types": ["All"], "level_min": 1},
+            "Late": {"allowed_types": ["Weapon"], "level_min": 5, "weight": 100},
+        }
+        counts = Counter(LootGenerator._pick_affix(pool, "Armor", 9)[0] for _ in range(SAMPLES))
+        self.assertNotIn("Late", counts)
+        self.assertAlmostEqual(counts["Common"] / SAMPLES, 0.75, delta=0.02)
+        self.assertEqual(LootGenerator._pick_affix(pool, "Weapon", 0), ("", {}))
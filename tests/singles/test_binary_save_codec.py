@@ -0,0 +1,63 @@
+# tests/singles/test_binary_save_codec.py
+import os
+import shutil
+from tests.fixtures import GameTestBase
+from engine.config import SAVE_GAME_DIR
+from engine.items.item_factory import ItemFactory
+from engine.world.save_codec import SAVE_MAGIC, BinarySaveReader, read_binary_save
+
+class TestBinarySaveCodec(GameTestBase):
+
+    TEST_SAV = "test_binary_codec.sav"
+    TEST_JSON = "test_binary_codec.json"
+
+    def tearDown(self):
+        for name in (self.TEST_SAV, self.TEST_JSON):
+            path = os.path.join(SAVE_GAME_DIR, name)
+            if os.path.exists(path):
+                try: os.remove(path)
+                except: pass
+        super().tearDown()
+
+    def _path(self, name):
+        return os.path.join(SAVE_GAME_DIR, name)
+
+    def _stock_room(self):
+        for _ in range(10):
+            item = ItemFactory.create_item_from_template("item_healing_potion_small", self.world)
+            if not item: self.fail("Item template missing")
+            self.world.add_item_to_room("town", "town_square", item)
+
+    def test_binary_round_trip_matches_json(self):
+        """Verify a .sav file decodes to the same document as the JSON save, in fewer bytes."""
+        self._stock_room()
+        self.assertTrue(self.world.save_game(self.TEST_JSON))
+        self.assertTrue(self.world.save_game(self.TEST_SAV))
+        with open(self._path(self.TEST_SAV), 'rb') as f: self.assertEqual(f.read(len(SAVE_MAGIC)), SAVE_MAGIC)
+
+        json_doc = self.world.save_manager.read_document(self._path(self.TEST_JSON))
+        binary_doc = read_binary_save(self._path(self.TEST_SAV))
+        json_doc.pop("timestamp"); binary_doc.pop("timestamp")
+        self.assertEqual(binary_doc, json_doc)
+        self.assertLess(os.path.getsize(self._path(self.TEST_SAV)) * 4, os.path.getsize(self._path(self.TEST_JSON)))
+
+        success, _, _ = self.world.load_save_game(self.TEST_SAV)
+        self.assertTrue(success)
+        self.assertEqual(len(self.world.get_items_in_room("town", "town_square")), len(json_doc["room_items_state"]["town:town_square"]))
+
+    def test_reader_decodes_sections_on_demand(self):
+        """Verify reading the player does not parse the NPC or item sections."""
+        self.assertTrue(self.world.save_game(self.TEST_SAV))
+        with BinarySaveReader.open(self._path(self.TEST_SAV)) as reader:
+            self.assertEqual(reader["player"]["name"], self.player.name)
+            self.assertNotIn("npcs", reader._decoded)
+            self.assertNotIn("items", reader._decoded)
+            self.assertEqual(len(reader.get("npc_states", {})), len(self.world.npcs))
+
+    def test_json_content_is_detected(self):
+        """Verify an old JSON save loads even under a binary save's extension."""
+        self.assertTrue(self.world.save_game(self.TEST_JSON))
+        shutil.copy(self._path(self.TEST_JSON), self._path(self.TEST_SAV))
+        success, _, _ = self.world.load_save_game(self.TEST_SAV)
+        self.assertTrue(success)
+        self.assertEqual(self.world.current_room_id, "town_square")
@@ -0,0 +1,120 @@
+# tests/singles/test_campaign_transitions.py
+from unittest.mock import patch
+from tests.fixtures import GameTestBase
+from engine.campaign.campaign_models import CampaignDefinition
+from engine.campaign.transition_table import TransitionTable, EVENT_ITEM_ACQUIRED, EVENT_QUEST_COMPLETED
+from engine.items.item_factory import ItemFactory
+
+def _chain(campaign_id, size):
+    """A linear campaign where every node advances on the same relic pickup, a quest success or its own flag."""
+    nodes = {}
+    for i in range(size):
+        target = f"node_{i + 1}" if i + 1 < size else "end"
+        nodes[f"node_{i}"] = {"type": "DIALOGUE", "transitions": [
+            {"trigger": "SUCCESS", "target_node_id": target},
+            {"event": "item_acquired", "trigger": "test_relic", "target_node_id": target, "narrative_text": f"Relic {i}."},
+            {"event": "flag_set", "trigger": f"flag_{i}", "target_node_id": target, "conditions": {"flag": "allowed"}},
+        ]}
+    nodes["end"] = {"type": "END", "outcome": "DONE"}
+    return CampaignDefinition.from_dict({
+        "campaign_id": campaign_id, "name": campaign_id, "description": "", "start_node_id": "node_0", "nodes": nodes
+    })
+
+class TestCampaignTransitions(GameTestBase):
+
+    def setUp(self):
+        super().setUp()
+        self.cm = self.world.campaign_manager
+        self.world.item_templates["test_relic"] = {"type": "Item", "name": "Odd Relic", "value": 1}
+
+    def _activate(self, definition, node_id):
+        self.cm.definitions[definition.campaign_id] = definition
+        self.player.active_campaigns[definition.campaign_id] = {"current_node": node_id, "history": [], "variables": {}}
+
+    def _examined(self, event_type, key):
+        """Number of transitions handle_event looked at for one event."""
+        examined = []
+        original = TransitionTable.candidates
+        def counting(table, node_id, event, k):
+            found = original(table, node_id, event, k)
+            examined.append(len(found))
+            return found
+        with patch.object(TransitionTable, "candidates", counting):
+            self.cm.handle_event(event_type, key, self.player)
+        return sum(examined)
+
+    def test_event_cost_does_not_grow_with_the_graph(self):
+        """Verify an event on a 500-node campaign examines as many transitions as on a 5-node one."""
+        self._activate(_chain("test_small", 5), "node_2")
+        small = self._examined(EVENT_ITEM_ACQUIRED, "test_relic")
+        self.player.active_campaigns.clear()
+
+        self._activate(_chain("test_large", 500), "node_250")
+        large = self._examined(EVENT_ITEM_ACQUIRED, "test_relic")
+        self.assertEqual(small, large)
+        self.assertEqual(large, 1)
+        # Only the current node fired, although every node listens for the relic.
+        self.assertEqual(self.player.active_campaigns["test_large"]["current_node"], "node_251")
+        self.assertEqual(self._examined(EVENT_ITEM_ACQUIRED, "some_other_item"), 0)
+
+    def test_quest_resolutions_match_generic_triggers(self):
+        """Verify specific resolutions still fall back to SUCCESS transitions, in declaration order."""
+        table = TransitionTable(_chain("test_quest", 3))
+        self.assertEqual([c.order for c in table.candidates("node_1", EVENT_QUEST_COMPLETED, "VIOLENT_SUCCESS")], [0])
+        self.assertEqual(table.candidates("node_1", EVENT_QUEST_COMPLETED, "FAILURE"), [])
+
+    def test_pickup_and_flags_drive_transitions(self):
+        """Verify picking up an item and setting a flag fire their transitions, with conditions checked."""
+        self._activate(_chain("test_events", 5), "node_0")
+        relic = ItemFactory.create_item_from_template("test_relic", self.world)
+        if not relic: self.fail("Failed to create relic.")
+        self.world.add_item_to_room(self.world.current_region_id, self.world.current_room_id, relic)
+        result = self.game.process_command("take odd relic")
+        self.assertIn("Relic 0.", result or "")
+        state = self.player.active_campaigns["test_events"]
+        self.assertEqual(state["current_node"], "node_1")
+
+        # The flag transition is gated on the "allowed" variable.
+        self.cm.set_flag("test_events", "flag_1", self.player)
+        self.assertEqual(state["current_node"], "node_1")
+        self.cm.set_flag("test_events", "allowed", self.player)
+        self.cm.set_flag("test_events", "flag_1", self.player)
+        self.assertEqual(state["current_node"], "node_2")
+
+    def test_every_acquisition_fires_item_acquired(self):
+        """Verify items gained outside the take command (buying, crafting, rewards) advance campaigns too."""
+        self._activate(_chain("test_sources", 5), "node_0")
+        state = self.player.active_campaigns["test_sources"]
+        for node in range(1, 4):
+            relic = ItemFactory.create_item_from_template("test_relic", self.world)
+            if not relic: self.fail("Failed to create relic.")
+            success, _ = self.player.inventory.add_item(relic)
+            self.assertTrue(success)
+            self.assertEqual(state["current_node"], f"node_{node}")
+        self.assertEqual(self.player.update(0.0, 0.0)[-3:], ["Relic 0.", "Relic 1.", "Relic 2."])
+        self.assertEqual(self.player.event_messages, [])
+
+        # Taking an item off is not acquiring it.
+        self.player.equipment["main_hand"] = relic
+        self.assertTrue(self.player.unequip_item("main_hand")[0])
+        self.assertEqual(state["current_node"], "node_3")
+
+    def test_location_entered(self):
+        """Verify entering a room fires a location transition keyed by region and room."""
+        room = self.world.get_current_room()
+        if not room or not room.exits: self.fail("Start room has no exits.")
+        direction, destination = next(iter(room.exits.items()))
+        location = destination if ":" in destination else f"{self.world.current_region_id}:{destination}"
+        definition = CampaignDefinition.from_dict({
+            "campaign_id": "test_travel", "name": "Travel", "description": "", "start_node_id": "start",
+            "nodes": {
+                "start": {"type": "DIALOGUE", "transitions": [
+                    {"event": "location_entered", "trigger": location, "target_node_id": "end", "narrative_text": "You arrive."}
+                ]},
+                "end": {"type": "END", "outcome": "ARRIVED"}
+            }
+        })
+        self._activate(definition, "start")
+        result = self.world.change_room(direction)
+        self.assertIn("You arrive.", result)
+        self.assertEqual(self.player.completed_campaigns["test_travel"]["outcome"], "ARRIVED")
@@ -0,0 +1,81 @@
+# tests/singles/test_collection_counters.py
+import os
+from tests.fixtures import GameTestBase
+from engine.items.item_factory import ItemFactory
+from engine.npcs.npc_factory import NPCFactory
+
+class TestCollectionCounters(GameTestBase):
+
+    TEST_SAVE = "test_collection_counters.json"
+
+    def setUp(self):
+        super().setUp()
+        self.manager = self.game.collection_manager
+        self.manager.collections["test_shells"] = {
+            "name": "Sea Shells", "items": ["test_conch", "test_cowrie"], "rewards": {"gold": 40}
+        }
+        for item_id, name in (("test_conch", "Conch Shell"), ("test_cowrie", "Cowrie Shell")):
+            self.world.item_templates[item_id] = {"type": "Junk", "name": name, "value": 1, "properties": {"collection_id": "test_shells"}}
+        collector = NPCFactory.create_npc_from_template("wandering_villager", self.world)
+        if not collector: self.fail("Failed to create collector.")
+        collector.properties["is_collector"] = True
+        self.collector = collector
+        self.player.gold = 0
+
+    def tearDown(self):
+        path = os.path.join("data", "saves", self.TEST_SAVE)
+        if os.path.exists(path): os.remove(path)
+        super().tearDown()
+
+    def _pick_up(self, item_id):
+        item = ItemFactory.create_item_from_template(item_id, self.world)
+        if not item: self.fail(f"Failed to create {item_id}.")
+        self.world.add_item_to_room(self.world.current_region_id, self.world.current_room_id, item)
+        return self.game.process_command(f"take {item.name}")
+
+    def test_membership_index(self):
+        """Verify items map to the collections that list them."""
+        self.assertEqual(self.manager.collections.members["test_conch"], {"test_shells"})
+        del self.manager.collections["test_shells"]
+        self.assertNotIn("test_conch", self.manager.collections.members)
+
+    def test_duplicate_pickups_count_once(self):
+        """Verify duplicate pickups and turn-ins leave the counter at one and completion fires once."""
+        self.assertIn("Sea Shells", self._pick_up("test_conch") or "")
+        self._pick_up("test_conch")
+        self.assertEqual(self.manager.get_progress(self.player, "test_shells"), (0, 2))
+
+        self.manager.turn_in_items(self.player, self.collector)
+        self.assertEqual(self.manager.get_progress(self.player, "test_shells"), (1, 2))
+        self.assertEqual(self.player.inventory.count_item("test_conch"), 1)
+        self.manager.turn_in_items(self.player, self.collector)
+        self.assertEqual(self.manager.get_progress(self.player, "test_shells"), (1, 2))
+
+        self._pick_up("test_cowrie")
+        result = self.manager.turn_in_items(self.player, self.collector)
+        self.assertIn("COLLECTION COMPLETE", result)
+        self.assertEqual(self.manager.get_progress(self.player, "test_shells"), (2, 2))
+        self.assertEqual(self.player.gold, 40)
+
+        self._pick_up("test_cowrie")
+        self.assertNotIn("COLLECTION COMPLETE", self.manager.turn_in_items(self.player, self.collector))
+        self.assertEqual(self.player.gold, 40)
+
+    def test_counters_survive_save_and_load(self):
+        """Verify counters read the same after a save/load round trip."""
+        self._pick_up("test_conch")
+        self.manager.turn_in_items(self.player, self.collector)
+        self.assertTrue(self.world.save_game(self.TEST_SAVE))
+
+        self.player.collections_progress = {}
+        self.assertEqual(self.manager.get_progress(self.player, "test_shells"), (0, 2))
+
+        success, _, _ = self.world.load_save_game(self.TEST_SAVE)
+        self.assertTrue(success)
+        loaded = self.world.player
+        if not loaded: self.fail("No player after load.")
+        self.assertEqual(self.manager.get_progress(loaded, "test_shells"), (1, 2))
+
+        loaded.inventory.add_item(ItemFactory.create_item_from_template("test_cowrie", self.world))
+        self.assertIn("COLLECTION COMPLETE", self.manager.turn_in_items(loaded, self.collector))
+        self.assertEqual(self.manager.get_progress(loaded, "test_shells"), (2, 2))
@@ -0,0 +1,47 @@
+# tests/singles/test_combat_tables.py
+from tests.fixtures import GameTestBase
+from engine.config import config_combat, LEVEL_DIFF_COMBAT_MODIFIERS, DAMAGE_TYPE_FLAVOR_TEXT
+from engine.core.combat_tables import (
+    get_level_diff_entry, get_element_id, get_resistance_multiplier, get_resistance_flavor, rebuild_combat_tables
+)
+from engine.utils.text_formatter import get_level_diff_category
+
+class TestCombatTables(GameTestBase):
+
+    def test_level_table_matches_direct_calculation(self):
+        """Verify table lookups agree with the category function, including clamped deltas."""
+        for viewer_level in range(1, config_combat.COMBAT_TABLE_MAX_LEVEL + 20):
+            for target_level in range(max(1, viewer_level - 150), viewer_level + 150, 7):
+                category = get_level_diff_category(viewer_level, target_level)
+                expected = (category, *LEVEL_DIFF_COMBAT_MODIFIERS[category])
+                self.assertEqual(get_level_diff_entry(viewer_level, target_level), expected,
+                                 f"Mismatch at viewer {viewer_level}, target {target_level}")
+
+    def test_resistance_multiplier(self):
+        """Verify resistance multipliers clamp to the -100..100 range."""
+        self.assertEqual(get_resistance_multiplier(0), 1.0)
+        self.assertEqual(get_resistance_multiplier(25), 0.75)
+        self.assertEqual(get_resistance_multiplier(-50), 1.5)
+        self.assertEqual(get_resistance_multiplier(500), 0.0)
+        self.assertEqual(get_resistance_multiplier(-500), 2.0)
+        self.assertAlmostEqual(get_resistance_multiplier(12.5), 0.875)
+
+    def test_element_flavor_matrix(self):
+        """Verify flavor lookups pick the element row and fall back to the default row."""
+        self.assertNotEqual(get_element_id("fire"), get_element_id("ice"))
+        self.assertEqual(get_resistance_flavor("fire", -10), DAMAGE_TYPE_FLAVOR_TEXT["fire"]["weakness"])
+        self.assertEqual(get_resistance_flavor("fire", 60), DAMAGE_TYPE_FLAVOR_TEXT["fire"]["strong_resistance"])
+        self.assertEqual(get_resistance_flavor("not_an_element", 10), DAMAGE_TYPE_FLAVOR_TEXT["default"]["resistance"])
+        self.assertIsNone(get_resistance_flavor("fire", 0))
+
+    def test_rebuild_picks_up_config_changes(self):
+        """Verify rebuilding the tables reflects modified modifiers."""
+        original = LEVEL_DIFF_COMBAT_MODIFIERS["yellow"]
+        try:
+            LEVEL_DIFF_COMBAT_MODIFIERS["yellow"] = (0.5, 0.5, 0.5)
+            rebuild_combat_tables()
+            self.assertEqual(get_level_diff_entry(10, 10), ("yellow", 0.5, 0.5, 0.5))
+        finally:
+            LEVEL_DIFF_COMBAT_MODIFIERS["yellow"] = original
+            rebuild_combat_tables()
+        self.assertEqual(get_level_diff_entry(10, 10), ("yellow", *original))
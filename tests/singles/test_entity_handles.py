@@ -0,0 +1,95 @@
+# tests/singles/test_entity_handles.py
+from tests.fixtures import GameTestBase
+from engine.npcs.npc_factory import NPCFactory
+from engine.world.entity_registry import EntityRegistry
+
+class _Thing:
+    handle = None
+
+class TestEntityHandles(GameTestBase):
+
+    def _spawn(self, template_id):
+        npc = NPCFactory.create_npc_from_template(template_id, self.world, current_region_id="town", current_room_id="town_square")
+        if not npc: self.fail(f"NPC template {template_id} missing")
+        self.world.add_npc(npc)
+        return npc
+
+    def test_released_slots_are_reused_with_a_new_generation(self):
+        """Verify a released handle stays stale even after its slot is handed out again."""
+        registry = EntityRegistry()
+        first = _Thing()
+        handle = registry.register(first)
+        self.assertIs(registry.resolve(handle), first)
+
+        self.assertIs(registry.release(handle), first)
+        self.assertIsNone(registry.resolve(handle))
+        self.assertIsNone(first.handle)
+
+        second = _Thing()
+        reused = registry.register(second)
+        self.assertEqual(reused.index, handle.index)
+        self.assertNotEqual(reused.generation, handle.generation)
+        self.assertIsNone(registry.resolve(handle))
+        self.assertIs(registry.resolve(reused), second)
+        self.assertEqual(len(registry), 1)
+
+    def test_handles_go_stale_after_death_and_purge(self):
+        """Verify references to an NPC resolve to None once it has died and the world purged it."""
+        rat, guard = self._spawn("giant_rat"), self._spawn("giant_rat")
+        handle = rat.handle
+        if handle is None: self.fail("Registered NPC has no handle")
+        guard.follow_target = handle
+        guard.combat_target = rat
+        self.assertIs(self.world.entities.resolve(handle), rat)
+        self.assertIs(guard.combat_target, rat)
+
+        rat.health = 0
+        rat.die(self.world)
+        self.world.last_update_time = 0
+        self.world.update()
+
+        self.assertNotIn(rat.obj_id, self.world.npcs)
+        self.assertIsNone(self.world.entities.resolve(handle))
+        self.assertIsNone(self.world.entities.resolve(guard.follow_target))
+        self.assertIsNone(guard.combat_target)
+
+    def test_purged_entities_are_not_revived(self):
+        """Verify a purged NPC assigned as a target reads as None and drops out of combat target sets."""
+        rat, guard = self._spawn("giant_rat"), self._spawn("giant_rat")
+        guard.enter_combat(rat)
+        self.assertIn(rat, guard.combat_targets)
+        self.assertIn(guard, rat.combat_targets)
+
+        # Remove it behind combat's back, as a purge of a corpse left in a fight would.
+        rat.health = 0
+        rat.is_alive = False
+        self.world.last_update_time = 0
+        self.world.update()
+        self.assertNotIn(rat.obj_id, self.world.npcs)
+
+        self.assertNotIn(rat, guard.combat_targets)
+        self.assertNotIn(rat, list(guard.combat_targets))
+        guard.combat_target = rat
+        self.assertIsNone(guard.combat_target)
+        self.assertIsNone(rat.handle)
+
+    def test_minion_owner_is_a_handle(self):
+        """Verify a minion finds its owner through a handle, which a replaced player invalidates."""
+        minion = self._spawn("skeleton_minion")
+        minion.owner_handle = self.world.entities.handle_of(self.player)
+        self.assertIs(minion.resolve_owner(self.world), self.player)
+
+        old_player = self.player
+        self.world.player = None
+        self.assertIsNone(self.world.entities.resolve(minion.owner_handle))
+        self.world.player = old_player
+
+    def test_saves_keep_string_ids(self):
+        """Verify handles never reach saved state and replacing the NPC table releases them."""
+        npc = self._spawn("giant_rat")
+        handle = npc.handle
+        self.assertNotIn("handle", npc.to_dict())
+        self.assertEqual(npc.to_dict()["obj_id"], npc.obj_id)
+
+        self.world.npcs = {}
+        self.assertIsNone(self.world.entities.resolve(handle))
@@ -0,0 +1,55 @@
+# tests/singles/test_faction_relations.py
+from tests.fixtures import GameTestBase
+from engine.config import FACTIONS, FACTION_RELATIONSHIP_MATRIX
+from engine.core.factions import get_faction_id, get_base_relation, ReputationMap
+from engine.npcs.combat import get_relation_to
+from engine.npcs.npc_factory import NPCFactory
+from engine.player import Player
+
+class TestFactionRelations(GameTestBase):
+
+    def test_matrix_matches_config(self):
+        """Verify the interned matrix reproduces the string-keyed config matrix."""
+        for viewer in FACTIONS:
+            for target in FACTIONS:
+                expected = FACTION_RELATIONSHIP_MATRIX.get(viewer, {}).get(target, 0)
+                self.assertEqual(get_base_relation(get_faction_id(viewer), get_faction_id(target)), expected)
+
+    def test_faction_id_tracks_reassignment(self):
+        """Verify changing an NPC's faction string updates its interned ID."""
+        npc = NPCFactory.create_npc_from_template("wandering_villager", self.world)
+        self.assertIsNotNone(npc)
+        if not npc: return
+        npc.faction = "hostile"
+        self.assertEqual(npc.faction_id, get_faction_id("hostile"))
+        self.assertFalse(npc.is_player_like)
+        self.assertTrue(self.player.is_player_like)
+
+    def test_reputation_offsets_follow_changes(self):
+        """Verify reputation writes, adjustments and reloads all reach the offset vector."""
+        villager = NPCFactory.create_npc_from_template("wandering_villager", self.world)
+        if not villager: return
+        villager.faction = "friendly"
+
+        self.assertEqual(get_relation_to(villager, self.player), 100)
+        self.player.reputation["friendly"] = -150
+        self.assertEqual(get_relation_to(villager, self.player), -50)
+        self.player.adjust_reputation("friendly", 20)
+        self.assertEqual(get_relation_to(villager, self.player), 100 + self.player.reputation["friendly"])
+
+        # Persistence round trip rewraps the plain dict
+        loaded = Player.from_dict(self.player.to_dict(self.world), self.world)
+        self.assertIsInstance(loaded.reputation, ReputationMap)
+        self.assertEqual(get_relation_to(villager, loaded), get_relation_to(villager, self.player))
+
+        del self.player.reputation["friendly"]
+        self.assertEqual(get_relation_to(villager, self.player), 100)
+
+    def test_unknown_faction_is_neutral(self):
+        """Verify factions missing from config are interned with zero relations."""
+        npc = NPCFactory.create_npc_from_template("wandering_villager", self.world)
+        if not npc: return
+        npc.faction = "cultists_of_test"
+        self.assertEqual(get_relation_to(npc, self.player), 0)
+        self.player.reputation["cultists_of_test"] = -60
+        self.assertEqual(get_relation_to(npc, self.player), -60)
@@ -0,0 +1,59 @@
+# tests/singles/test_fork_autosave.py
+import os
+import unittest
+from unittest.mock import patch
+from tests.fixtures import GameTestBase
+from engine.config import SAVE_GAME_DIR
+from engine.core.autosave_manager import AutosaveManager
+
+class TestForkAutosave(GameTestBase):
+
+    TEST_SAVE = "test_fork_autosave.json"
+
+    def tearDown(self):
+        self.game.autosave_manager.wait()
+        path = os.path.join(SAVE_GAME_DIR, self.TEST_SAVE)
+        if os.path.exists(path):
+            try: os.remove(path)
+            except: pass
+        super().tearDown()
+
+    def _saved_player(self):
+        return self.world.save_manager.read_document(os.path.join(SAVE_GAME_DIR, self.TEST_SAVE))["player"]
+
+    @unittest.skipUnless(hasattr(os, "fork"), "os.fork is not available on this platform")
+    def test_save_reflects_world_at_fork(self):
+        """Verify changes made right after the fork do not reach the autosave."""
+        self.player.gold = 100
+        autosaves = self.game.autosave_manager
+        self.assertTrue(autosaves.save(self.TEST_SAVE))
+        self.assertIsNotNone(autosaves.child_pid)
+        self.assertFalse(autosaves.save(self.TEST_SAVE))
+
+        self.player.gold = 5
+        self.player.level = 9
+        self.assertTrue(autosaves.wait())
+        self.assertIsNone(autosaves.child_pid)
+
+        saved = self._saved_player()
+        self.assertEqual(saved["gold"], 100)
+        self.assertEqual(saved["level"], 1)
+        self.assertTrue(any("autosaved" in msg for msg in self.game.renderer.message_buffer))
+
+    def test_falls_back_without_fork(self):
+        """Verify autosaves still happen, without a child process, where fork is unavailable."""
+        self.player.gold = 42
+        with patch.object(AutosaveManager, "fork_available", return_value=False):
+            self.assertTrue(self.game.autosave_manager.save(self.TEST_SAVE))
+        self.assertIsNone(self.game.autosave_manager.child_pid)
+        self.assertTrue(self.game.autosave_manager.wait())
+        self.assertEqual(self._saved_player()["gold"], 42)
+
+    def test_interval_triggers_autosave(self):
+        """Verify the tick loop starts an autosave once the interval has elapsed."""
+        with patch("engine.core.autosave_manager.AUTOSAVE_INTERVAL_SECONDS", 1.0), \
+             patch.object(AutosaveManager, "save") as save:
+            self.game.autosave_manager.update(0.6)
+            save.assert_not_called()
+            self.game.autosave_manager.update(0.6)
+            save.assert_called_once()
@@ -0,0 +1,106 @@
+# tests/singles/test_generated_region_saves.py
+import json
+import os
+from unittest.mock import patch
+from tests.fixtures import GameTestBase
+from engine.config import SAVE_GAME_DIR
+from engine.world.region import Region
+from engine.world.region_delta import apply_dict_delta, dict_delta
+from engine.world.region_generator import RegionGenerator
+
+class TestGeneratedRegionSaves(GameTestBase):
+
+    TEST_SAVE = "test_generated_regions.json"
+
+    def tearDown(self):
+        path = os.path.join(SAVE_GAME_DIR, self.TEST_SAVE)
+        if os.path.exists(path):
+            try: os.remove(path)
+            except: pass
+        super().tearDown()
+
+    def _read_save(self):
+        with open(os.path.join(SAVE_GAME_DIR, self.TEST_SAVE)) as f: return json.load(f)
+
+    def test_dict_delta_round_trip(self):
+        """Verify deltas capture additions, changes, removals and nested edits."""
+        base = {"a": 1, "b": {"x": 1, "y": 2}, "c": [1, 2], "gone": True}
+        current = {"a": 1, "b": {"x": 5, "z": 3}, "c": [1, 2, 3], "new": "v"}
+        delta = dict_delta(base, current)
+        self.assertEqual(apply_dict_delta(json.loads(json.dumps(base)), delta), current)
+        self.assertEqual(dict_delta(current, current), {})
+
+    def test_player_changes_survive_regeneration(self):
+        """Verify a generated region reloads from its recipe with player changes replayed."""
+        region, entry_id = RegionGenerator(self.world).generate_region("caves", 12) or (None, None)
+        if not region: self.fail("Generation failed")
+        self.world.add_region(region.obj_id, region)
+
+        entry = region.get_room(entry_id)
+        entry.exits["portal"] = "town:town_square"
+        first_dir = next(d for d in entry.exits if d != "portal")
+        removed_dest = entry.exits.pop(first_dir)
+        region.get_room(removed_dest).visited = True
+        entry.update_property("exit_requirements", {})
+        region.name = "Renamed Caves"
+        # A full dump reloaded through from_dict is what the old save path produced.
+        expected = Region.from_dict(json.loads(json.dumps(region.to_dict()))).to_dict()
+
+        self.world.save_game(self.TEST_SAVE)
+        save_data = self._read_save()
+        self.assertNotIn(region.obj_id, [r["id"] for r in save_data["dynamic_regions"]])
+        self.assertEqual(len(save_data["generated_regions"]), 1)
+        self.assertEqual(set(save_data["generated_regions"][0]["recipe"]), {"version", "theme", "num_rooms", "seed"})
+
+        self.world.remove_region(region.obj_id)
+        success, _, _ = self.world.load_save_game(self.TEST_SAVE)
+        self.assertTrue(success)
+
+        loaded = self.world.get_region(region.obj_id)
+        if not loaded: self.fail("Generated region missing after load")
+        self.assertEqual(json.dumps(loaded.to_dict(), sort_keys=True), json.dumps(expected, sort_keys=True))
+        self.assertIn((loaded.obj_id, entry_id, "portal"), self.world.exit_links.links_to("town"))
+
+    def test_save_size_with_fifty_dungeons(self):
+        """Verify recipe-plus-delta saves are far smaller than full dumps for 50 dungeons."""
+        gen = RegionGenerator(self.world)
+        full_dump_size = 0
+        for i in range(50):
+            region, entry_id = gen.generate_region("caves", 20, seed=1000 + i) or (None, None)
+            if not region: self.fail("Generation failed")
+            region.get_room(entry_id).exits["exit_quest"] = "town:town_square"
+            self.world.add_region(region.obj_id, region)
+            full_dump_size += len(json.dumps(region.to_dict(), indent=2, default=str))
+
+        self.world.save_game(self.TEST_SAVE)
+        save_data = self._read_save()
+        self.assertEqual(len(save_data["generated_regions"]), 50)
+        compact_size = len(json.dumps(save_data["generated_regions"], indent=2, default=str))
+        self.assertLess(compact_size * 10, full_dump_size, f"recipe+delta {compact_size}B vs full {full_dump_size}B")
+
+    def test_saves_reuse_cached_baseline(self):
+        """Verify saving never regenerates a region, before or after a reload, and the delta stays exact."""
+        region, entry_id = self.world.region_generator.generate_region("caves", 12) or (None, None)
+        if not region: self.fail("Generation failed")
+        self.world.add_region(region.obj_id, region)
+        region.get_room(entry_id).exits["portal"] = "town:town_square"
+
+        with patch.object(RegionGenerator, "regenerate", side_effect=AssertionError("regenerated on save")), \
+             patch.object(RegionGenerator, "load_themes", side_effect=AssertionError("themes reloaded on save")):
+            self.world.save_game(self.TEST_SAVE)
+        room_deltas = self._read_save()["generated_regions"][0]["delta"]["sub"]["rooms"]["sub"]
+        self.assertEqual(list(room_deltas), [entry_id])
+        self.assertEqual(room_deltas[entry_id]["sub"]["exits"], {"set": {"portal": "town:town_square"}})
+
+        self.world.remove_region(region.obj_id)
+        success, _, _ = self.world.load_save_game(self.TEST_SAVE)
+        self.assertTrue(success)
+        loaded = self.world.get_region(region.obj_id)
+        if not loaded: self.fail("Generated region missing after load")
+        loaded.name = "Renamed Caves"
+
+        with patch.object(RegionGenerator, "regenerate", side_effect=AssertionError("regenerated on save")):
+            self.world.save_game(self.TEST_SAVE)
+        delta = self._read_save()["generated_regions"][0]["delta"]
+        self.assertEqual(delta["set"], {"name": "Renamed Caves"})
+        self.assertIn(entry_id, delta["sub"]["rooms"]["sub"])
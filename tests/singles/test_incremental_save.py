@@ -0,0 +1,89 @@
+# tests/singles/test_incremental_save.py
+import os
+from unittest.mock import patch
+from tests.fixtures import GameTestBase
+from engine.config import SAVE_GAME_DIR
+from engine.items.item_factory import ItemFactory
+from engine.world.incremental_save import IncrementalSave
+
+class TestIncrementalSave(GameTestBase):
+
+    TEST_SAVES = ("test_incremental_save.json", "test_incremental_reference.json")
+
+    def tearDown(self):
+        for name in self.TEST_SAVES:
+            path = os.path.join(SAVE_GAME_DIR, name)
+            if os.path.exists(path):
+                try: os.remove(path)
+                except: pass
+        super().tearDown()
+
+    def _read(self, name):
+        doc = self.world.save_manager.read_document(os.path.join(SAVE_GAME_DIR, name))
+        for key in ("timestamp", "save_name"): doc.pop(key)
+        return doc
+
+    def _other_town_room(self):
+        region = self.world.get_region("town")
+        if not region: self.fail("Town region missing")
+        return next(room for room_id, room in region.rooms.items() if room_id != self.world.current_room_id)
+
+    def test_matches_synchronous_save(self):
+        """Verify a save spread over many frames writes the same document, with a valid checksum."""
+        save = IncrementalSave(self.world.save_manager, self.TEST_SAVES[0], budget_ms=0)
+        while not save.step(): pass
+        self.assertTrue(save.success)
+        self.assertGreater(save.frames, len(self.world.npcs))
+        self.assertTrue(self.world.save_game(self.TEST_SAVES[1]))
+
+        self.assertEqual(self._read(self.TEST_SAVES[0]), self._read(self.TEST_SAVES[1]))
+        self.assertEqual(self.world.save_manager.verify_save(self.TEST_SAVES[0]), (True, "checksum verified"))
+
+    def test_objects_changed_after_writing_are_saved_again(self):
+        """Verify NPCs and rooms mutated after being serialized end up in the save as they are at the end."""
+        npc_id, npc = next(iter(self.world.npcs.items()))
+        room = self._other_town_room()
+        save = IncrementalSave(self.world.save_manager, self.TEST_SAVES[0], budget_ms=0)
+        for _ in range(len(self.world.npcs) + len(self.world.get_region("town").rooms)): save.step() # type: ignore
+        self.assertIn(npc_id, save._npcs)
+
+        npc.health = 1
+        potion = ItemFactory.create_item_from_template("item_healing_potion_small", self.world)
+        if not potion: self.fail("Item template missing")
+        room.add_item(potion)
+        self.assertTrue(save.run_to_completion())
+        self.assertGreaterEqual(save.reserialized, 2)
+
+        doc = self._read(self.TEST_SAVES[0])
+        self.assertEqual(doc["npc_states"][npc_id]["health"], 1)
+        self.assertEqual(len(doc["room_items_state"][f"town:{room.obj_id}"]), len(room.items))
+
+    def test_autosave_runs_across_ticks(self):
+        """Verify the game loop advances an incremental autosave and reports progress until it finishes."""
+        autosaves = self.game.autosave_manager
+        with patch("engine.core.autosave_manager.AUTOSAVE_MODE", "incremental"):
+            self.assertTrue(autosaves.save(self.TEST_SAVES[0]))
+        if not autosaves.incremental: self.fail("Incremental save not started")
+        autosaves.incremental.budget = 0
+
+        seen = []
+        while autosaves.is_saving:
+            seen.append(autosaves.progress)
+            autosaves.update(0.0)
+        self.assertGreater(len(seen), 2)
+        self.assertEqual(seen, sorted(seen))
+        self.assertTrue(os.path.exists(os.path.join(SAVE_GAME_DIR, self.TEST_SAVES[0])))
+        self.assertTrue(any("autosaved" in msg for msg in self.game.renderer.message_buffer))
+
+    def test_npc_fingerprint_tracks_saved_state(self):
+        """Verify the save fingerprint changes with saved fields and in-place edits, and not with runtime ones."""
+        npc = next(iter(self.world.npcs.values()))
+        stamp = npc.save_fingerprint()
+        npc.last_moved = 123.0
+        self.assertEqual(npc.save_fingerprint(), stamp)
+
+        npc.health = max(1, npc.health - 1)
+        self.assertNotEqual(npc.save_fingerprint(), stamp)
+        stamp = npc.save_fingerprint()
+        npc.level_up()
+        self.assertNotEqual(npc.save_fingerprint(), stamp)
@@ -0,0 +1,96 @@
+# tests/singles/test_instance_link_index.py
+from unittest.mock import patch
+from tests.fixtures import GameTestBase
+from engine.world.region import Region
+from engine.world.room import Room
+from engine.npcs.npc_factory import NPCFactory
+
+class TestInstanceLinkIndex(GameTestBase):
+
+    def _make_region(self, region_id: str) -> Region:
+        region = Region("Linked", "Test", obj_id=region_id)
+        region.add_room("entry", Room("Entry", "Room", {"north": "hall"}, obj_id="entry"))
+        region.add_room("hall", Room("Hall", "Room", {"south": "entry"}, obj_id="hall"))
+        self.world.add_region(region_id, region)
+        return region
+
+    def test_index_follows_exit_edits(self):
+        """Verify links appear and disappear as exits are assigned, replaced and deleted."""
+        self._make_region("dyn_a")
+        square = self.world.get_region("town").get_room("town_square")
+        links = self.world.exit_links
+
+        square.exits["portal"] = "dyn_a:entry"
+        self.assertIn(("town", "town_square", "portal"), links.links_to("dyn_a"))
+        self.assertEqual(links.links_to("hall"), [], "Intra-region exits are not indexed.")
+
+        square.exits["portal"] = "dyn_b:entry"
+        self.assertEqual(links.links_to("dyn_a"), [])
+        self.assertEqual(links.links_to("dyn_b"), [("town", "town_square", "portal")])
+
+        square.exits = {"north": "dyn_a:hall"}
+        self.assertEqual(links.links_to("dyn_b"), [])
+        self.assertEqual(links.links_to("dyn_a"), [("town", "town_square", "north")])
+        self.assertIs(square.get_property("exits"), square.exits)
+
+        del square.exits["north"]
+        self.assertEqual(links.links_to("dyn_a"), [])
+
+    def test_rooms_added_after_registration_are_indexed(self):
+        """Verify rooms added to an already-loaded region contribute their links."""
+        region = self._make_region("dyn_a")
+        region.add_room("annex", Room("Annex", "Room", {"out": "town:town_square"}, obj_id="annex"))
+        self.assertIn(("dyn_a", "annex", "out"), self.world.exit_links.links_to("town"))
+
+    def test_region_npc_membership(self):
+        """Verify per-region membership follows NPC moves and removal."""
+        self._make_region("dyn_a")
+        npc = NPCFactory.create_npc_from_template("goblin", self.world, current_region_id="dyn_a", current_room_id="entry")
+        if not npc: self.fail("Goblin template failed")
+        self.world.add_npc(npc)
+        self.assertIn(npc, self.world.npcs.npcs_in_region("dyn_a"))
+
+        npc.current_region_id = "town"
+        self.assertNotIn(npc, self.world.npcs.npcs_in_region("dyn_a"))
+        self.assertIn(npc, self.world.npcs.npcs_in_region("town"))
+
+        del self.world.npcs[npc.obj_id]
+        self.assertNotIn(npc, self.world.npcs.npcs_in_region("town"))
+
+    def test_teardown_removes_only_indexed_links(self):
+        """Verify cleanup removes inbound exits and occupants without touching other exits."""
+        self._make_region("gen_a")
+        square = self.world.get_region("town").get_room("town_square")
+        square.exits["enter_quest"] = "gen_a:entry"
+        self.world.get_region("gen_a").get_room("entry").exits["exit_quest"] = "town:town_square"
+        other_exits = {k: v for k, v in square.exits.items() if k != "enter_quest"}
+
+        npc = NPCFactory.create_npc_from_template("goblin", self.world, current_region_id="gen_a", current_room_id="hall")
+        if not npc: self.fail("Goblin template failed")
+        self.world.add_npc(npc)
+
+        self.player.completed_quest_log["saga"] = {"generated_region_ids": ["gen_a"]}
+        self.world.cleanup_quest_region("saga")
+
+        self.assertNotIn("gen_a", self.world.regions)
+        self.assertNotIn("enter_quest", square.exits)
+        self.assertEqual(dict(square.exits), other_exits)
+        self.assertNotIn(npc.obj_id, self.world.npcs)
+        self.assertNotIn(("gen_a", "entry", "exit_quest"), self.world.exit_links.links_to("town"), "Removed region's own links are dropped.")
+
+    def test_cleanup_check_runs_on_region_change(self):
+        """Verify the completed-instance check runs after the player leaves a region, not every tick."""
+        manager = self.world.instance_manager
+        with patch.object(manager, 'check_and_cleanup_completed_instances') as check:
+            manager.update()
+            manager.update()
+            self.assertEqual(check.call_count, 1)
+
+            self.player.current_region_id = "instance_elsewhere"
+            manager.update()
+            manager.update()
+            self.assertEqual(check.call_count, 2)
+
+            manager.request_cleanup_check()
+            manager.update()
+            self.assertEqual(check.call_count, 3)
@@ -0,0 +1,85 @@
+# tests/singles/test_item_templates.py
+import copy
+import json
+import pickle
+from tests.fixtures import GameTestBase
+from engine.items.container import Container
+from engine.items.item_factory import ItemFactory
+from engine.utils.utils import _serialize_item_reference
+
+class TestItemTemplates(GameTestBase):
+
+    def _make(self, template_id, **overrides):
+        item = ItemFactory.create_item_from_template(template_id, self.world, **overrides)
+        if not item: self.fail(f"Item template {template_id} missing")
+        return item
+
+    def test_items_share_one_template_record(self):
+        """Verify copies of a template share its record and hold no properties of their own."""
+        first, second = self._make("item_iron_sword"), self._make("item_iron_sword")
+        self.assertIsNotNone(first.template)
+        self.assertIs(first.template, second.template)
+        self.assertEqual(first.properties.overrides(), {})
+        self.assertEqual(first.get_property("durability"), 50)
+        self.assertEqual(first.name, self.world.item_templates["item_iron_sword"]["name"])
+        self.assertNotIn("name", first.__dict__)
+
+    def test_writes_stay_on_the_instance(self):
+        """Verify changing one item leaves its template and its siblings alone."""
+        worn, fresh = self._make("item_iron_sword"), self._make("item_iron_sword")
+        worn.update_property("durability", 7)
+        worn.name = "Notched Sword"
+        self.assertEqual(fresh.get_property("durability"), 50)
+        self.assertNotEqual(fresh.name, "Notched Sword")
+        self.assertEqual(worn.properties.overrides(), {"durability": 7})
+        self.assertEqual(worn.to_dict()["properties"]["durability"], 7)
+        self.assertIn("value", worn.to_dict()["properties"])
+
+    def test_reference_holds_only_overrides(self):
+        """Verify a saved item reference is just the override mapping and restores the same item."""
+        sword = self._make("item_iron_sword")
+        self.assertEqual(_serialize_item_reference(sword, 1, self.world), {"item_id": "item_iron_sword"})
+
+        sword.update_property("durability", 12)
+        sword.name = "Notched Sword"
+        ref = _serialize_item_reference(sword, 1, self.world)
+        if not ref: self.fail("Reference not created")
+        self.assertEqual(ref["properties_override"], {"name": "Notched Sword", "durability": 12})
+
+        restored = self._make(ref["item_id"], **ref["properties_override"])
+        self.assertEqual(restored.name, "Notched Sword")
+        self.assertEqual(restored.get_property("durability"), 12)
+
+    def test_copies_and_containers_do_not_share_state(self):
+        """Verify deep copies keep the shared record and mutable per-item state stays per item."""
+        sword = self._make("item_iron_sword")
+        clone = copy.deepcopy(sword)
+        clone.update_property("durability", 1)
+        self.assertIs(clone.template, sword.template)
+        self.assertEqual(sword.get_property("durability"), 50)
+
+        self.world.item_templates["item_test_crate"] = {
+            "type": "Container", "name": "Crate", "value": 1, "weight": 5.0, "properties": {"capacity": 10.0, "is_open": True}
+        }
+        first, second = self._make("item_test_crate"), self._make("item_test_crate")
+        if not isinstance(first, Container) or not isinstance(second, Container): self.fail("Crate is not a container")
+        first.properties["contains"].append(self._make("item_iron_sword"))
+        self.assertEqual(second.properties["contains"], [])
+
+    def test_properties_serialize_in_full(self):
+        """Verify json and pickle see an item's full properties, template values included."""
+        fresh, worn = self._make("item_iron_sword"), self._make("item_iron_sword")
+        worn.update_property("durability", 7)
+        del worn.properties["value"]
+        for item in (fresh, worn):
+            as_dict = dict(item.properties)
+            self.assertIn("durability", as_dict)
+            self.assertEqual(json.loads(json.dumps(dict(item.properties))), as_dict)
+            self.assertEqual(pickle.loads(pickle.dumps(item.properties)), as_dict)
+        self.assertRaises(TypeError, json.dumps, fresh.properties)
+
+        restored = pickle.loads(pickle.dumps(worn))
+        self.assertIs(restored.template, worn.template)
+        self.assertEqual(restored.get_property("durability"), 7)
+        self.assertNotIn("value", restored.properties)
+        self.assertEqual(restored.properties.overrides(), {"durability": 7})
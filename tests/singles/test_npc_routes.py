@@ -0,0 +1,81 @@
+# tests/singles/test_npc_routes.py
+from unittest.mock import patch
+from tests.fixtures import GameTestBase
+from engine.npcs.ai.movement import perform_patrol, perform_schedule
+from engine.npcs.npc_factory import NPCFactory
+from engine.world.room import Room
+from engine.world.region import Region
+from engine.world.world import World
+
+class TestNPCRoutes(GameTestBase):
+
+    def setUp(self):
+        super().setUp()
+        # A ring of six rooms: r0 - r1 - ... - r5 - r0.
+        region = Region("Route Town", "Testing", obj_id="route_town")
+        for i in range(6):
+            region.add_room(f"r{i}", Room(f"Room {i}", "", {"east": f"r{(i + 1) % 6}", "west": f"r{(i - 1) % 6}"}, obj_id=f"r{i}"))
+        self.world.add_region("route_town", region)
+        self.region = region
+
+        npc = NPCFactory.create_npc_from_template("wandering_villager", self.world)
+        if not npc: self.fail("Failed to create NPC.")
+        npc.current_region_id = npc.home_region_id = "route_town"
+        npc.current_room_id = "r0"
+        self.world.add_npc(npc)
+        self.npc = npc
+
+        self.find_path_calls = 0
+        original = World.find_path
+        def counting(world, *args):
+            self.find_path_calls += 1
+            return original(world, *args)
+        patcher = patch.object(World, "find_path", counting)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _patrol(self, moves):
+        for _ in range(moves): perform_patrol(self.npc, self.world, self.player)
+
+    def test_patrol_loop_is_planned_once(self):
+        """Verify a patrol plans each leg of its loop once, however many times it walks it."""
+        self.npc.patrol_points = ["r2", "r0"]
+        self._patrol(3)
+        self.assertEqual(self.npc.current_room_id, "r2")
+        self.assertEqual(self.find_path_calls, 2)
+
+        visited = []
+        for _ in range(30):
+            perform_patrol(self.npc, self.world, self.player)
+            visited.append(self.npc.current_room_id)
+        self.assertEqual(self.find_path_calls, 2)
+        self.assertEqual(visited[:6], ["r1", "r0", "r0", "r1", "r2", "r2"])
+
+    def test_blocked_step_is_replanned(self):
+        """Verify removing an exit on the route makes the NPC re-plan around it, once."""
+        self.npc.patrol_points = ["r2", "r0"]
+        self._patrol(1)
+        self.assertEqual(self.npc.current_room_id, "r1")
+        calls = self.find_path_calls
+
+        # Tear out r1 -> r2; the way round is r1 -> r0 -> r5 -> r4 -> r3 -> r2.
+        r1 = self.region.get_room("r1")
+        if not r1: self.fail("Missing room.")
+        del r1.exits["east"]
+        self._patrol(5)
+        self.assertEqual(self.npc.current_room_id, "r2")
+        self.assertEqual(self.find_path_calls, calls + 1)
+
+    def test_schedule_legs_are_reused(self):
+        """Verify a schedule's legs are planned on the first day and walked from the cache after."""
+        self.game.time_manager.minute = 0
+        self.npc.schedule = {
+            "8": {"region_id": "route_town", "room_id": "r3", "activity": "working"},
+            "18": {"region_id": "route_town", "room_id": "r0", "activity": "sleeping"}
+        }
+        for day in range(3):
+            for hour in (8, 9, 10, 11, 18, 19, 20, 21):
+                self.game.time_manager.hour = hour
+                perform_schedule(self.npc, self.world, self.player)
+            self.assertEqual(self.npc.current_room_id, "r0")
+        self.assertEqual(self.find_path_calls, 2)
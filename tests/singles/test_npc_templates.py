@@ -0,0 +1,48 @@
+# tests/singles/test_npc_templates.py
+from tests.fixtures import GameTestBase
+from engine.npcs.npc_factory import NPCFactory
+
+class TestNPCTemplates(GameTestBase):
+
+    def _spawn(self, template_id="goblin", instance_id=None, **overrides):
+        npc = NPCFactory.create_npc_from_template(template_id, self.world, instance_id, **overrides)
+        if not npc: self.fail(f"NPC template {template_id} missing")
+        return npc
+
+    def test_spawns_share_one_record(self):
+        """Verify NPCs of one template read template data from a single shared record."""
+        first, second = self._spawn(), self._spawn()
+        self.assertIsNotNone(first.template)
+        self.assertIs(first.template, second.template)
+        self.assertIs(first.loot_table.base, second.loot_table.base)
+        self.assertEqual(first.loot_table.overrides(), {})
+        self.assertEqual(dict(first.loot_table), self.world.npc_templates["goblin"]["loot_table"])
+        self.assertEqual(first.aggression, self.world.npc_templates["goblin"]["properties"]["aggression"])
+
+    def test_instance_changes_stay_on_the_instance(self):
+        """Verify changing one NPC's template-owned data does not reach the template or other NPCs."""
+        first, second = self._spawn("bandit"), self._spawn("bandit")
+        first.dialog["taunt"] = "You'll pay for that!"
+        first.properties["is_summoned"] = True
+        self.assertEqual(first.dialog["taunt"], "You'll pay for that!")
+        self.assertNotIn("taunt", second.dialog)
+        self.assertNotIn("is_summoned", second.properties)
+        self.assertNotIn("taunt", self.world.npc_templates["bandit"].get("dialog", {}))
+        self.assertEqual(first.dialog["threat"], second.dialog["threat"])
+
+        marked = self._spawn(properties_override={"owner_id": "player"})
+        self.assertEqual(marked.properties.overrides(), {"owner_id": "player"})
+
+    def test_to_dict_is_runtime_state_only(self):
+        """Verify saved NPC state leaves template data out and restores onto the shared record."""
+        goblin = self._spawn(instance_id="goblin_saved", current_region_id="town", current_room_id="town_square")
+        goblin.health = 3
+        state = goblin.to_dict()
+        for template_field in ("dialog", "loot_table", "schedule", "properties", "description"):
+            self.assertNotIn(template_field, state)
+
+        overrides = dict(state)
+        restored = self._spawn(overrides.pop("template_id"), "goblin_saved", **overrides)
+        self.assertEqual(restored.health, 3)
+        self.assertIs(restored.template, goblin.template)
+        self.assertEqual(restored.to_dict(), state)
@@ -0,0 +1,60 @@
+# tests/singles/test_phased_load.py
+import os
+from tests.fixtures import GameTestBase
+from engine.config import SAVE_GAME_DIR
+
+class TestPhasedLoad(GameTestBase):
+
+    TEST_SAVES = ("test_phased_load.json", "test_phased_resave.json")
+
+    def setUp(self):
+        super().setUp()
+        self.casino_ids = {npc_id for npc_id, npc in self.world.npcs.items() if npc.current_region_id == "casino"}
+        self.town_ids = {npc_id for npc_id, npc in self.world.npcs.items() if npc.current_region_id == "town"}
+        if not self.casino_ids or not self.town_ids: self.fail("Expected NPCs in both town and casino")
+        self.assertTrue(self.world.save_game(self.TEST_SAVES[0]))
+        success, _, _ = self.world.load_save_game(self.TEST_SAVES[0], phased=True)
+        self.assertTrue(success)
+
+    def tearDown(self):
+        for name in self.TEST_SAVES:
+            path = os.path.join(SAVE_GAME_DIR, name)
+            if os.path.exists(path):
+                try: os.remove(path)
+                except: pass
+        super().tearDown()
+
+    def test_player_region_is_ready_first(self):
+        """Verify the player and their region's NPCs are restored at once, with the rest left pending."""
+        hydrator = self.world.hydrator
+        self.assertTrue(hydrator.active)
+        self.assertIsNotNone(self.world.player)
+        self.assertIsNotNone(self.world.get_current_room())
+        self.assertTrue(self.town_ids <= set(self.world.npcs))
+        self.assertFalse(self.casino_ids & set(self.world.npcs))
+        self.assertEqual(set(hydrator.pending_npcs.get("casino", {})), self.casino_ids)
+        for phase in ("read", "regions", "player", "current_region"): self.assertIn(phase, hydrator.timings)
+
+    def test_hydrates_over_frames(self):
+        """Verify stepping with a tiny budget finishes hydration across several frames."""
+        hydrator = self.world.hydrator
+        frames = 1
+        while not hydrator.step(0): frames += 1
+        self.assertGreater(frames, 1)
+        self.assertFalse(hydrator.active)
+        self.assertTrue(self.casino_ids <= set(self.world.npcs))
+        self.assertEqual(hydrator.timings["hydrate_frames"], frames)
+        self.assertIn("finalize", hydrator.timings)
+
+    def test_entering_region_materializes_it(self):
+        """Verify moving into a region still waiting for hydration builds its NPCs immediately."""
+        self.world.current_region_id = "casino"
+        self.assertTrue(self.casino_ids <= set(self.world.npcs))
+        self.assertNotIn("casino", self.world.hydrator.pending_npcs)
+
+    def test_save_during_hydration_keeps_pending_npcs(self):
+        """Verify a save taken before hydration finishes still includes NPCs not built yet."""
+        self.assertTrue(self.world.save_game(self.TEST_SAVES[1]))
+        doc = self.world.save_manager.read_document(os.path.join(SAVE_GAME_DIR, self.TEST_SAVES[1]))
+        self.assertTrue(self.casino_ids <= set(doc["npc_states"]))
+        self.assertTrue(self.world.hydrator.active)
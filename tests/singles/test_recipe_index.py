@@ -0,0 +1,75 @@
+# tests/singles/test_recipe_index.py
+from tests.fixtures import GameTestBase
+from engine.crafting.recipe import Recipe
+from engine.items.item_factory import ItemFactory
+
+class TestRecipeIndex(GameTestBase):
+
+    def setUp(self):
+        super().setUp()
+        self.manager = self.game.crafting_manager
+        self.world.item_templates["test_twig"] = {"type": "Item", "name": "Twig", "value": 1, "stackable": True}
+        self.world.item_templates["test_bundle"] = {"type": "Item", "name": "Twig Bundle", "value": 3}
+        self.world.item_templates["test_bench"] = {
+            "type": "Item", "name": "Workbench", "properties": {"crafting_station_type": "test_workbench"}
+        }
+        self.manager.recipes["test_bind_twigs"] = Recipe("test_bind_twigs", {
+            "result_item_id": "test_bundle", "ingredients": [{"item_id": "test_twig", "quantity": 3}]
+        })
+        self.manager.recipes["test_bench_bundle"] = Recipe("test_bench_bundle", {
+            "result_item_id": "test_bundle", "station_required": "test_workbench",
+            "ingredients": [{"item_id": "test_twig", "quantity": 1}]
+        })
+
+    def _give_twigs(self, count):
+        twig = ItemFactory.create_item_from_template("test_twig", self.world)
+        if not twig: self.fail("Failed to create twig.")
+        self.player.inventory.add_item(twig, count)
+
+    def _brute_force(self):
+        return {r_id for r_id, recipe in self.manager.recipes.items() if self.manager.can_craft(self.player, recipe)[0]}
+
+    def test_indexes_follow_the_recipe_table(self):
+        """Verify ingredient and station indexes track recipes as they are added, replaced and removed."""
+        recipes = self.manager.recipes
+        self.assertEqual(set(recipes.by_ingredient["test_twig"]), {"test_bind_twigs", "test_bench_bundle"})
+        self.assertIn("test_bench_bundle", recipes.by_station["test_workbench"])
+
+        recipes["test_bench_bundle"] = Recipe("test_bench_bundle", {"result_item_id": "test_bundle"})
+        self.assertNotIn("test_workbench", recipes.by_station)
+        self.assertIn("test_bench_bundle", recipes.no_ingredients)
+        del recipes["test_bind_twigs"]
+        del recipes["test_bench_bundle"]
+        self.assertNotIn("test_twig", recipes.by_ingredient)
+
+    def test_craftable_set_tracks_inventory_and_room(self):
+        """Verify the cached craftable set matches per-recipe checks as inventory and stations change."""
+        self.assertEqual(self.manager.craftable_recipes(self.player), self._brute_force())
+        self.assertNotIn("test_bind_twigs", self.manager.craftable_recipes(self.player))
+
+        self._give_twigs(3)
+        craftable = self.manager.craftable_recipes(self.player)
+        self.assertIn("test_bind_twigs", craftable)
+        self.assertNotIn("test_bench_bundle", craftable)
+        self.assertIs(self.manager.craftable_recipes(self.player), craftable)
+
+        bench = ItemFactory.create_item_from_template("test_bench", self.world)
+        if not bench: self.fail("Failed to create workbench.")
+        self.world.add_item_to_room(self.world.current_region_id, self.world.current_room_id, bench)
+        self.assertIn("test_bench_bundle", self.manager.craftable_recipes(self.player))
+        self.assertEqual(self.manager.craftable_recipes(self.player), self._brute_force())
+
+        self.player.inventory.remove_item("test_twig", 3)
+        self.assertEqual(self.manager.craftable_recipes(self.player) & {"test_bind_twigs", "test_bench_bundle"}, set())
+
+    def test_salvage_yields_come_from_the_table(self):
+        """Verify salvage yields are precomputed per template and renamed items are judged by their own name."""
+        self.world.item_templates["test_old_helm"] = {"type": "Armor", "name": "Dented Helm", "weight": 6.0}
+        helm = ItemFactory.create_item_from_template("test_old_helm", self.world)
+        if not helm: self.fail("Failed to create helm.")
+        self.assertEqual(self.manager.get_salvage_yield(helm), ("item_iron_ingot", 3))
+        self.assertEqual(self.manager.salvage_yields["test_old_helm"], ("item_iron_ingot", 3))
+        self.assertEqual(self.manager.salvage_yields["test_twig"], ("item_scrap", 1))
+
+        helm.name = "Leather-Lined Cap"
+        self.assertEqual(self.manager.get_salvage_yield(helm), ("item_leather_scraps", 6))
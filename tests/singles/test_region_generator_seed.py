@@ -0,0 +1,40 @@
+# tests/singles/test_region_generator_seed.py
+import json
+from tests.fixtures import GameTestBase
+from engine.world.region_generator import RegionGenerator
+
+class TestRegionGeneratorSeed(GameTestBase):
+
+    def _dump(self, result) -> str:
+        region, entry = result
+        return json.dumps({"entry": entry, "region": region.to_dict()}, sort_keys=True)
+
+    def test_same_seed_is_byte_identical(self):
+        """Verify a fixed seed reproduces the region exactly, including its ID."""
+        gen = RegionGenerator(self.world)
+        first = gen.generate_region("caves", 150, seed=42)
+        second = gen.generate_region("caves", 150, seed=42)
+        other = gen.generate_region("caves", 150, seed=43)
+        if not (first and second and other): self.fail("Generation failed")
+        self.assertEqual(self._dump(first), self._dump(second))
+        self.assertNotEqual(self._dump(first), self._dump(other))
+
+    def test_large_region_connected_and_symmetric(self):
+        """Verify every room is reachable from the entrance and every exit has a return path."""
+        result = RegionGenerator(self.world).generate_region("caves", 500, seed=7)
+        if not result: self.fail("Generation failed")
+        region, entry = result
+        self.assertEqual(len(region.rooms), 500)
+
+        opposite = {"north": "south", "south": "north", "east": "west", "west": "east",
+                    "northeast": "southwest", "southwest": "northeast", "northwest": "southeast",
+                    "southeast": "northwest", "up": "down", "down": "up"}
+        seen, stack = {entry}, [entry]
+        while stack:
+            room = region.rooms[stack.pop()]
+            for direction, dest in room.exits.items():
+                self.assertEqual(region.rooms[dest].exits.get(opposite[direction]), room.obj_id)
+                if dest not in seen:
+                    seen.add(dest)
+                    stack.append(dest)
+        self.assertEqual(len(seen), 500)
@@ -0,0 +1,57 @@
+# tests/singles/test_region_pool.py
+from concurrent.futures import wait
+from unittest.mock import MagicMock, patch
+from tests.fixtures import GameTestBase
+from engine.world.region import Region
+from engine.world.region_pool import RegionPregenPool
+
+class TestRegionPool(GameTestBase):
+
+    def test_empty_pool_falls_back_to_generator(self):
+        """Verify a miss generates synchronously with the supplied generator and refills the pool."""
+        pool = RegionPregenPool(self.world)
+        generator = MagicMock()
+        region = Region("Fallback", "x", obj_id="fallback_region")
+        generator.generate_region.return_value = (region, "room_entry")
+
+        with patch.object(pool, 'prime') as prime:
+            result = pool.acquire("caves", 5, generator)
+
+        self.assertEqual(result, (region, "room_entry"))
+        generator.generate_region.assert_called_once_with("caves", 5)
+        prime.assert_called_once_with("caves", 5)
+        metrics = pool.get_metrics()
+        self.assertEqual((metrics["pool_hits"], metrics["pool_misses"]), (0, 1))
+        self.assertEqual(metrics["handoff_count"], 1)
+
+    def test_disabled_pool_never_submits(self):
+        """Verify a disabled pool generates in place without touching the worker pool."""
+        pool = RegionPregenPool(self.world)
+        pool.enabled = False
+        with patch("engine.world.region_pool._get_executor") as get_executor:
+            result = pool.acquire("caves", 4)
+        get_executor.assert_not_called()
+        self.assertIsNotNone(result)
+        if result: self.assertEqual(len(result[0].rooms), 4)
+
+    def test_pregenerated_region_handed_over(self):
+        """Verify a region built in a worker process is handed over ready to add to the world."""
+        pool = RegionPregenPool(self.world)
+        pool.enabled = True
+        pool.prime("caves", 6)
+        wait(list(pool._pending[("caves", 6)]), timeout=60)
+        self.assertGreaterEqual(pool.ready_count("caves", 6), 1)
+
+        generator = MagicMock()
+        result = pool.acquire("caves", 6, generator)
+        generator.generate_region.assert_not_called()
+        if not result: self.fail("Pool returned nothing")
+        region, entry_id = result
+        self.assertEqual(len(region.rooms), 6)
+        self.assertIn(entry_id, region.rooms)
+        self.world.add_region(region.obj_id, region)
+        self.assertIn(region.obj_id, self.world.regions)
+
+        metrics = pool.get_metrics()
+        self.assertEqual(metrics["pool_hits"], 1)
+        self.assertGreater(metrics["generation_time_total"], 0.0)
@@ -0,0 +1,102 @@
+# tests/singles/test_region_streaming.py
+import os
+from tests.fixtures import GameTestBase
+from engine.config import SAVE_GAME_DIR
+from engine.items.item_factory import ItemFactory
+from engine.world.region import Region
+from engine.world.room import Room
+
+class TestRegionStreaming(GameTestBase):
+
+    TEST_SAVE = "test_region_streaming.json"
+
+    def tearDown(self):
+        path = os.path.join(SAVE_GAME_DIR, self.TEST_SAVE)
+        if os.path.exists(path):
+            try: os.remove(path)
+            except: pass
+        super().tearDown()
+
+    def _drop_item(self, region_id, room_id):
+        item = ItemFactory.create_item_from_template("item_healing_potion_small", self.world)
+        if not item: self.fail("Item template missing")
+        self.world.add_item_to_room(region_id, room_id, item)
+        return item
+
+    def test_new_game_loads_only_start_region(self):
+        """Verify a new game keeps unvisited static regions out of memory but knows their rooms."""
+        regions = self.world.regions
+        self.assertTrue(regions.is_loaded("town"))
+        self.assertFalse(regions.is_loaded("forest"))
+        self.assertIn("forest", regions)
+        self.assertIn("forest", regions.known_ids())
+        self.assertIn(("forest", "forest_edge"), {(r, room) for r, room, _, _ in regions.room_catalog()})
+
+    def test_lookup_materializes_region(self):
+        """Verify looking a region up loads it once and places its initial items."""
+        forest = self.world.get_region("forest")
+        if not forest: self.fail("Forest failed to load")
+        self.assertTrue(self.world.regions.is_loaded("forest"))
+        self.assertIs(self.world.get_region("forest"), forest)
+        self.assertIn("forest", self.world.regions.populated)
+
+    def test_evicted_region_restores_state(self):
+        """Verify a cold region is unloaded to a blob and comes back with its items and exits."""
+        forest = self.world.get_region("forest")
+        if not forest: self.fail("Forest failed to load")
+        item = self._drop_item("forest", "forest_edge")
+        forest.get_room("forest_edge").visited = True
+        links_before = self.world.exit_links.links_to("town")
+
+        evicted = self.world.evict_cold_regions(float("inf"), max_idle=0)
+        self.assertIn("forest", evicted)
+        self.assertNotIn("town", evicted)
+        self.assertFalse(self.world.regions.is_loaded("forest"))
+        self.assertEqual(self.world.exit_links.links_to("town"), links_before)
+
+        restored = self.world.get_region("forest")
+        if not restored: self.fail("Forest failed to reload")
+        room = restored.get_room("forest_edge")
+        self.assertTrue(room.visited)
+        self.assertIn(item.name, [i.name for i in room.items])
+        self.assertEqual(self.world.exit_links.links_to("town"), links_before)
+
+    def test_save_load_keeps_unloaded_room_items(self):
+        """Verify items in evicted regions are saved and reappear when the region loads after a load."""
+        self.world.get_region("forest")
+        item = self._drop_item("forest", "forest_edge")
+        self.world.evict_cold_regions(float("inf"), max_idle=0)
+
+        self.assertTrue(self.world.save_game(self.TEST_SAVE))
+        success, _, _ = self.world.load_save_game(self.TEST_SAVE)
+        self.assertTrue(success)
+        self.assertFalse(self.world.regions.is_loaded("forest"))
+        self.assertIn("forest", self.world.pending_room_items)
+
+        names = [i.name for i in self.world.get_items_in_room("forest", "forest_edge")]
+        self.assertEqual(names.count(item.name), 1)
+        self.assertNotIn("forest", self.world.pending_room_items)
+
+    def test_unloaded_safe_zones_are_retreat_candidates(self):
+        """Verify safe zones are found for retreats whether never loaded or evicted, without loading them to check."""
+        regions = self.world.regions
+        self.assertFalse(regions.is_loaded("farmland"))
+        self.assertIn("farmland", dict(regions.safe_zone_rooms()))
+        self.assertFalse(regions.is_loaded("farmland"))
+
+        danger = Region("Danger", "Heck", obj_id="danger")
+        danger.add_room("danger_start", Room("Start", "Scary", {"east": "farmland:farm_bridge"}, obj_id="danger_start"))
+        self.world.add_region("danger", danger)
+        self.assertEqual(self.world.find_nearest_safe_room("danger", "danger_start"), ("farmland", "farm_bridge"))
+
+        self.assertIn("farmland", self.world.evict_cold_regions(float("inf"), max_idle=0))
+        self.assertFalse(regions.is_loaded("farmland"))
+        self.assertEqual(self.world.find_nearest_safe_room("danger", "danger_start"), ("farmland", "farm_bridge"))
+
+        # A saved dynamic safe zone not rebuilt since the load counts too.
+        camp = Region("Camp", "Quiet", obj_id="dynamic_camp")
+        camp.add_room("camp_fire", Room("Fire", "Warm", obj_id="camp_fire"))
+        camp.update_property("safe_zone", True)
+        regions.defer("dynamic_camp", {"region": camp.to_dict()})
+        self.assertEqual(dict(regions.safe_zone_rooms())["dynamic_camp"], ["camp_fire"])
+        self.assertFalse(regions.is_loaded("dynamic_camp"))
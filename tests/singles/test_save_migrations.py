@@ -0,0 +1,61 @@
+# tests/singles/test_save_migrations.py
+import copy
+import json
+import os
+import shutil
+from unittest.mock import patch
+from tests.fixtures import GameTestBase
+from engine.config import SAVE_GAME_DIR
+from engine.world.save_migrations import CURRENT_SAVE_VERSION, migrate_save, needs_migration
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "saves")
+
+class TestSaveMigrations(GameTestBase):
+
+    TEST_SAVE = "test_migrated_save.json"
+
+    def tearDown(self):
+        path = os.path.join(SAVE_GAME_DIR, self.TEST_SAVE)
+        if os.path.exists(path):
+            try: os.remove(path)
+            except: pass
+        super().tearDown()
+
+    def _fixture(self, name):
+        with open(os.path.join(FIXTURE_DIR, f"{name}.json")) as f: return json.load(f)
+
+    def _load_fixture(self, name):
+        shutil.copy(os.path.join(FIXTURE_DIR, f"{name}.json"), os.path.join(SAVE_GAME_DIR, self.TEST_SAVE))
+        success, _, _ = self.world.load_save_game(self.TEST_SAVE)
+        self.assertTrue(success)
+
+    def test_each_version_upgrades_to_current(self):
+        """Verify every historical fixture migrates to the current format without touching its input."""
+        current = self._fixture("save_v4")
+        self.assertFalse(needs_migration(current))
+        for name, expected_steps in (("save_v2", [2, 3]), ("save_v3", [3])):
+            original = self._fixture(name)
+            untouched = copy.deepcopy(original)
+            migrated, applied = migrate_save(original)
+            self.assertEqual(original, untouched)
+            self.assertEqual(applied, expected_steps)
+            self.assertEqual(migrated["save_format_version"], CURRENT_SAVE_VERSION)
+            self.assertEqual(migrated["player"], current["player"])
+            self.assertEqual(migrated["generated_regions"], [])
+            self.assertIsNone(migrated["populated_region_ids"])
+
+    def test_legacy_save_loads(self):
+        """Verify an unversioned save loads with integer skills and global topics upgraded."""
+        self._load_fixture("save_v2")
+        player = self.world.player
+        if not player: self.fail("Player missing after load")
+        self.assertEqual(player.skills["lockpicking"], {"level": 3, "xp": 0})
+        self.assertIn("weather", player.conversation.vocabulary)
+        self.assertEqual(player.inventory.count_item("item_healing_potion_small"), 2)
+
+    def test_rewrite_after_migration(self):
+        """Verify migrated saves are written back in the current format when enabled."""
+        with patch("engine.world.save_manager.SAVE_REWRITE_AFTER_MIGRATION", True):
+            self._load_fixture("save_v3")
+        with open(os.path.join(SAVE_GAME_DIR, self.TEST_SAVE)) as f:
+            self.assertEqual(json.load(f)["save_format_version"], CURRENT_SAVE_VERSION)
@@ -0,0 +1,67 @@
+# tests/singles/test_save_slot_headers.py
+import os
+from unittest.mock import patch
+from tests.fixtures import GameTestBase
+from engine.config import SAVE_GAME_DIR
+from engine.world.save_header import HEADER_FIELDS
+from engine.world.save_manager import SaveManager
+
+class TestSaveSlotHeaders(GameTestBase):
+
+    TEST_SAVES = ("test_slot_header.json", "test_slot_header.sav", "test_slot_header.db")
+
+    def tearDown(self):
+        self.world.save_manager.close_stores()
+        for name in self.TEST_SAVES + ("test_slot_header.db-wal", "test_slot_header.db-shm"):
+            path = os.path.join(SAVE_GAME_DIR, name)
+            if os.path.exists(path):
+                try: os.remove(path)
+                except: pass
+        super().tearDown()
+
+    def _corrupt(self, name):
+        # Flips a byte near the end of the file, well past the header.
+        path = os.path.join(SAVE_GAME_DIR, name)
+        with open(path, 'r+b') as f:
+            f.seek(-20, os.SEEK_END)
+            byte = f.read(1)
+            f.seek(-20, os.SEEK_END)
+            f.write(bytes([byte[0] ^ 0xFF]))
+
+    def test_every_format_writes_a_header(self):
+        """Verify each save format carries a fixed-schema header the menu can read."""
+        self.player.level = 4
+        for name in self.TEST_SAVES: self.assertTrue(self.world.save_game(name))
+        slots = dict(SaveManager.list_save_slots(SAVE_GAME_DIR))
+        for name in self.TEST_SAVES:
+            header = slots[name]
+            if not header: self.fail(f"No header for {name}")
+            self.assertEqual(tuple(header), HEADER_FIELDS)
+            self.assertEqual(header["player_name"], self.player.name)
+            self.assertEqual(header["player_level"], 4)
+            self.assertEqual(header["room_name"], self.world.get_current_room().name) # type: ignore
+        self.assertIsNone(slots["test_slot_header.db"]["checksum"]) # type: ignore
+
+    def test_listing_reads_only_headers(self):
+        """Verify listing slots never loads a save document, even a damaged one."""
+        self.assertTrue(self.world.save_game("test_slot_header.json"))
+        self._corrupt("test_slot_header.json")
+        with patch.object(SaveManager, "read_document", side_effect=AssertionError("full save parsed")):
+            self.game._update_available_saves()
+        self.assertIn("test_slot_header.json", self.game.available_saves)
+        self.assertEqual(self.game.save_slot_headers["test_slot_header.json"]["player_name"], self.player.name) # type: ignore
+
+    def test_checksum_catches_tampering(self):
+        """Verify the chosen slot is checked before loading and a damaged save is refused."""
+        for name in self.TEST_SAVES[:2]:
+            self.assertTrue(self.world.save_game(name))
+            self.assertEqual(self.world.save_manager.verify_save(name), (True, "checksum verified"))
+            self._corrupt(name)
+            self.assertEqual(self.world.save_manager.verify_save(name), (False, "checksum mismatch"))
+
+        self.game._update_available_saves()
+        self.game.selected_load_option = self.game.available_saves.index("test_slot_header.json")
+        with patch.object(SaveManager, "load") as load:
+            self.game.load_selected_game()
+        load.assert_not_called()
+        self.assertIn("checksum mismatch", self.game.load_error_message or "")
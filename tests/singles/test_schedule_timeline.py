@@ -0,0 +1,100 @@
+# tests/singles/test_schedule_timeline.py
+import time
+from unittest.mock import patch
+from tests.fixtures import GameTestBase
+from engine.npcs.ai.schedule_timeline import ScheduleTimeline
+from engine.npcs.ai.schedules import _index_rooms_by_space
+from engine.npcs.npc_factory import NPCFactory
+from engine.world.room import Room
+from engine.world.region import Region
+
+def _sorted_lookup(schedule, hour):
+    """The active entry the way perform_schedule used to find it, by sorting the hours."""
+    if str(hour) in schedule: return schedule[str(hour)]
+    hours = sorted((int(h) for h in schedule), reverse=True)
+    for h in hours:
+        if hour >= h: return schedule[str(h)]
+    return schedule[str(hours[0])] if hours else None
+
+class TestScheduleTimeline(GameTestBase):
+
+    def setUp(self):
+        super().setUp()
+        region = Region("Timeline Town", "Testing", obj_id="timeline_town")
+        for room_id, exits in (("room_home", {"north": "room_work"}), ("room_work", {"south": "room_home"})):
+            room = Room(room_id, room_id, obj_id=room_id)
+            room.exits.update(exits)
+            region.add_room(room_id, room)
+        self.world.add_region("timeline_town", region)
+
+        npc = NPCFactory.create_npc_from_template("wandering_villager", self.world)
+        if not npc: self.fail("Failed to create NPC.")
+        npc.current_region_id = "timeline_town"
+        npc.current_room_id = "room_home"
+        npc.behavior_type = "scheduled"
+        npc.schedule = {
+            "8": {"region_id": "timeline_town", "room_id": "room_work", "activity": "working"},
+            "18": {"region_id": "timeline_town", "room_id": "room_home", "activity": "sleeping"}
+        }
+        self.world.add_npc(npc)
+        self.npc = npc
+
+    def _tick(self, hour, minute=0):
+        self.game.time_manager.hour = hour
+        self.game.time_manager.minute = minute
+        self.npc.last_moved = 0
+        self.npc.update(self.world, time.time())
+
+    def test_lookup_matches_sorted_hours(self):
+        """Verify the bisect lookup picks the same entry as sorting the hours, including past midnight."""
+        schedule = {str(h): {"activity": f"act_{h}"} for h in (1, 7, 13, 22)}
+        timeline = ScheduleTimeline(schedule)
+        for hour in range(24):
+            window = timeline.window_at(hour * 60 + 30)
+            if not window: self.fail("Expected an active entry.")
+            self.assertIs(window[2], _sorted_lookup(schedule, hour))
+        self.assertEqual(timeline.window_at(0)[:2], (22 * 60, 3 * 60))
+        self.assertIsNone(ScheduleTimeline({}).window_at(600))
+
+    def test_no_lookups_between_transitions(self):
+        """Verify an NPC that has arrived does no lookup until the clock reaches its next entry."""
+        calls = []
+        original = ScheduleTimeline.window_at
+        def counting(timeline, minute_of_day):
+            calls.append(minute_of_day)
+            return original(timeline, minute_of_day)
+
+        with patch.object(ScheduleTimeline, "window_at", counting):
+            self._tick(9)
+            self.assertEqual(self.npc.current_room_id, "room_work")
+            for hour in range(10, 18):
+                self._tick(hour, 45)
+            self.assertEqual(len(calls), 1)
+
+            self._tick(18, 5)
+            self.assertEqual(len(calls), 2)
+            self.assertEqual(self.npc.current_room_id, "room_home")
+            self.assertEqual(self.npc.ai_state.get("current_activity"), "sleeping")
+            # Overnight still falls in the 18:00 window.
+            self._tick(3)
+            self.assertEqual(len(calls), 2)
+
+    def test_reassigned_schedule_is_recompiled(self):
+        """Verify assigning a new schedule takes effect on the next tick."""
+        self._tick(9)
+        self.assertEqual(self.npc.current_room_id, "room_work")
+        self.npc.schedule = {"0": {"region_id": "timeline_town", "room_id": "room_home", "activity": "resting"}}
+        self._tick(10)
+        self.assertEqual(self.npc.current_room_id, "room_home")
+        self.assertEqual(self.npc.ai_state.get("current_activity"), "resting")
+
+    def test_room_keyword_index(self):
+        """Verify rooms are filed under every space type their name matches."""
+        rooms = [
+            {"region_id": "r", "room_id": str(i), "room_name": name, "properties": {}}
+            for i, name in enumerate(["Cottage", "Mill House", "Cottage", "Quiet Road"])
+        ]
+        index = _index_rooms_by_space(rooms)
+        self.assertEqual([r["room_id"] for r in index["homes"]], ["0", "1", "2"])
+        self.assertEqual([r["room_id"] for r in index["work_areas"]], ["1"])
+        self.assertFalse(any(rooms[3] in found for found in index.values()))
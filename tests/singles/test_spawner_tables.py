@@ -0,0 +1,107 @@
+# tests/singles/test_spawner_tables.py
+import time
+from unittest.mock import patch
+from tests.fixtures import GameTestBase
+from engine.world.region import Region
+from engine.world.room import Room
+from engine.npcs.npc_factory import NPCFactory
+
+class TestSpawnerTables(GameTestBase):
+
+    def setUp(self):
+        super().setUp()
+        self.world.npc_templates["table_goblin"] = {
+            "name": "Goblin", "description": "Ugly.", "faction": "hostile", "health": 10
+        }
+
+    def _make_region(self, region_id: str, room_ids) -> Region:
+        region = Region("Table Zone", "Testing", obj_id=region_id)
+        for rid in room_ids:
+            region.add_room(rid, Room(rid.title(), "Room", obj_id=rid))
+        region.spawner_config = {"monster_types": {"table_goblin": 1}, "level_range": [1, 1]}
+        region.properties["safe_zone"] = False
+        self.world.add_region(region_id, region)
+        return region
+
+    def test_eligible_rooms_filter_keywords(self):
+        """Verify the precomputed room table excludes no-spawn rooms."""
+        region = self._make_region("zone_a", ["cave_1", "village_tavern", "cave_2"])
+        region.rooms["cave_2"].update_property("no_monster_spawn", True)
+        region.add_room("cave_3", Room("Cave", "Room", obj_id="cave_3"))
+        self.assertEqual(set(self.world.spawner.get_eligible_rooms(region)), {"cave_1", "cave_3"})
+
+    def test_eligible_rooms_follow_room_changes(self):
+        """Verify the room table is rebuilt when rooms are flagged, renamed or swapped without changing count."""
+        spawner = self.world.spawner
+        region = self._make_region("zone_a", ["cave_1", "cave_2"])
+        self.assertEqual(set(spawner.get_eligible_rooms(region)), {"cave_1", "cave_2"})
+
+        region.rooms["cave_2"].update_property("no_monster_spawn", True)
+        self.assertEqual(spawner.get_eligible_rooms(region), ("cave_1",))
+
+        region.rooms["cave_1"].name = "Village Tavern"
+        self.assertEqual(spawner.get_eligible_rooms(region), ())
+
+        region.rooms = {rid: Room("Cave", "Room", obj_id=rid) for rid in ("cave_3", "cave_4")}
+        self.assertEqual(set(spawner.get_eligible_rooms(region)), {"cave_3", "cave_4"})
+
+    def test_hostile_counter_tracks_lifecycle(self):
+        """Verify the live counter follows spawns, moves, faction changes, deaths and removal."""
+        self._make_region("zone_a", ["cave_1"])
+        self._make_region("zone_b", ["cave_1"])
+        npcs = self.world.npcs
+
+        goblin = NPCFactory.create_npc_from_template("table_goblin", self.world, current_region_id="zone_a", current_room_id="cave_1")
+        if not goblin: self.fail("Goblin template failed")
+        self.world.add_npc(goblin)
+        self.assertEqual(npcs.count_hostiles_in_region("zone_a"), 1)
+
+        goblin.current_region_id = "zone_b"
+        self.assertEqual(npcs.count_hostiles_in_region("zone_a"), 0)
+        self.assertEqual(npcs.count_hostiles_in_region("zone_b"), 1)
+
+        goblin.faction = "neutral"
+        self.assertEqual(npcs.count_hostiles_in_region("zone_b"), 0)
+        goblin.faction = "hostile"
+        self.assertEqual(npcs.count_hostiles_in_region("zone_b"), 1)
+
+        goblin.die(self.world)
+        self.assertEqual(npcs.count_hostiles_in_region("zone_b"), 0)
+
+        goblin.is_alive = True
+        self.assertEqual(npcs.count_hostiles_in_region("zone_b"), 1)
+        del self.world.npcs[goblin.obj_id]
+        self.assertEqual(npcs.count_hostiles_in_region("zone_b"), 0)
+
+    def test_plain_dict_assignment_is_indexed(self):
+        """Verify replacing world.npcs with a plain dict keeps counting."""
+        self._make_region("zone_a", ["cave_1"])
+        goblin = NPCFactory.create_npc_from_template("table_goblin", self.world, current_region_id="zone_a", current_room_id="cave_1")
+        if not goblin: self.fail("Goblin template failed")
+        self.world.npcs = {goblin.obj_id: goblin}
+        self.assertEqual(self.world.npcs.count_hostiles_in_region("zone_a"), 1)
+
+    def test_background_regions_spawn_within_budget(self):
+        """Verify background regions are populated round-robin while the player is elsewhere."""
+        self.world.npcs = {}
+        spawner = self.world.spawner
+        spawner._background_region_ids = []
+        for i in range(4):
+            self._make_region(f"bg_zone_{i}", [f"cave_{n}" for n in range(10)])
+
+        with patch('engine.world.spawner.SPAWN_BACKGROUND_REGIONS_PER_TICK', 2), patch('random.random', return_value=0.0):
+            spawner.update(time.time() + 1000.0)
+            populated = [f"bg_zone_{i}" for i in range(4) if self.world.npcs.count_hostiles_in_region(f"bg_zone_{i}")]
+            self.assertEqual(len(populated), 2, "Only the tick budget of regions should spawn.")
+
+            spawner.update(time.time() + 2000.0)
+            for i in range(4):
+                self.assertEqual(self.world.npcs.count_hostiles_in_region(f"bg_zone_{i}"), 1)
+
+    def test_removed_region_leaves_queue(self):
+        """Verify torn-down regions are dropped from the background queue."""
+        self._make_region("doomed_zone", ["cave_1"])
+        del self.world.regions["doomed_zone"]
+        with patch('engine.world.spawner.SPAWN_BACKGROUND_REGIONS_PER_TICK', 100):
+            self.world.spawner._spawn_in_background_regions(None)
+        self.assertNotIn("doomed_zone", self.world.spawner._background_region_ids)
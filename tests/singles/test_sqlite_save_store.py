@@ -0,0 +1,135 @@
+# tests/singles/test_sqlite_save_store.py
+import json
+import os
+import time
+from unittest.mock import patch
+from tests.fixtures import GameTestBase
+from engine.config import SAVE_GAME_DIR
+from engine.items.item_factory import ItemFactory
+from engine.world.save_manager import SaveManager
+from engine.world.sqlite_store import SQLiteWorldStore
+
+class TestSQLiteSaveStore(GameTestBase):
+
+    TEST_DB = "test_sqlite_store.db"
+    TEST_JSON = "test_sqlite_store.json"
+
+    def tearDown(self):
+        self.world.save_manager.close_stores()
+        for name in (self.TEST_DB, self.TEST_DB + "-wal", self.TEST_DB + "-shm", self.TEST_JSON):
+            path = os.path.join(SAVE_GAME_DIR, name)
+            if os.path.exists(path):
+                try: os.remove(path)
+                except: pass
+        super().tearDown()
+
+    def _drop_item(self, room_id="town_square", region_id="town"):
+        item = ItemFactory.create_item_from_template("item_healing_potion_small", self.world)
+        if not item: self.fail("Item template missing")
+        self.world.add_item_to_room(region_id, room_id, item)
+
+    def _store(self) -> SQLiteWorldStore:
+        return self.world.save_manager._get_sqlite_store(os.path.join(SAVE_GAME_DIR, self.TEST_DB))
+
+    def test_round_trip_through_sqlite(self):
+        """Verify a .db save loads back the player, room items and NPCs."""
+        sword = ItemFactory.create_item_from_template("item_iron_sword", self.world)
+        if sword: self.player.inventory.add_item(sword)
+        self._drop_item()
+        npc_ids = set(self.world.npcs)
+
+        self.assertTrue(self.world.save_game(self.TEST_DB))
+        self.player.inventory.slots = []
+        success, _, _ = self.world.load_save_game(self.TEST_DB)
+        self.assertTrue(success)
+
+        if not self.world.player: self.fail("Player missing after load")
+        self.assertEqual(self.world.player.inventory.count_item("item_iron_sword"), 1)
+        item_ids = [i.obj_id for i in self.world.get_items_in_room("town", "town_square")]
+        self.assertIn("item_healing_potion_small", item_ids)
+        self.assertEqual(set(self.world.npcs), npc_ids)
+
+    def test_autosave_rewrites_only_changed_rows(self):
+        """Verify a second save touching one room writes only a handful of rows."""
+        self.assertTrue(self.world.save_game(self.TEST_DB))
+        path = os.path.join(SAVE_GAME_DIR, self.TEST_DB)
+        store = self.world.save_manager._get_sqlite_store(path)
+        first = store.last_write_stats
+
+        self._drop_item()
+        self.assertTrue(self.world.save_game(self.TEST_DB))
+        second = store.last_write_stats
+        self.assertGreater(second["unchanged"], 0)
+        self.assertLess(second["written"], first["written"])
+        self.assertIn("town_square", store.read_region("town")["room_items"])
+
+    def test_json_export_import_round_trip(self):
+        """Verify exportsave and importsave convert between formats without losing data."""
+        self._drop_item()
+        self.assertTrue(self.world.save_game(self.TEST_DB))
+        self.world.save_manager.close_stores()
+
+        self.assertIn("Exported", self.game.process_command(f"exportsave {self.TEST_DB} {self.TEST_JSON}"))
+        with open(os.path.join(SAVE_GAME_DIR, self.TEST_JSON)) as f: exported = json.load(f)
+        self.assertIn("town:town_square", exported["room_items_state"])
+
+        os.remove(os.path.join(SAVE_GAME_DIR, self.TEST_DB))
+        self.assertIn("Imported", self.game.process_command(f"importsave {self.TEST_JSON} {self.TEST_DB}"))
+        store = SQLiteWorldStore(os.path.join(SAVE_GAME_DIR, self.TEST_DB))
+        try:
+            self.assertEqual(store.read_document(), exported)
+        finally:
+            store.close()
+
+    def test_load_reads_regions_when_materialized(self):
+        """Verify a .db load leaves a region's rows unread until the region loads, and saves leave them alone."""
+        forest = self.world.get_region("forest")
+        if not forest: self.fail("forest region missing")
+        self._drop_item("forest_edge", "forest")
+        self.world.evict_cold_regions(time.time() + 10**6)
+        self.assertFalse(self.world.regions.is_loaded("forest"))
+        self.assertTrue(self.world.save_game(self.TEST_DB))
+
+        reads = []
+        original = SQLiteWorldStore.read_room_items
+        def counting(store, region_id):
+            reads.append(region_id)
+            return original(store, region_id)
+        with patch.object(SQLiteWorldStore, "read_room_items", counting):
+            success, _, _ = self.world.load_save_game(self.TEST_DB)
+            self.assertTrue(success)
+            self.assertNotIn("forest", reads)
+            self.assertIn("forest", self.world.save_manager.session.unread_items)
+
+            # Saving back writes nothing for the unread region and keeps its rows.
+            self.assertTrue(self.world.save_game(self.TEST_DB))
+            self.assertIn("forest:forest_edge", self._store().read_document()["room_items_state"])
+
+            self.assertIsNotNone(self.world.get_region("forest"))
+            self.assertEqual(reads.count("forest"), 1)
+        item_ids = [i.obj_id for i in self.world.get_items_in_room("forest", "forest_edge")]
+        self.assertEqual(item_ids.count("item_healing_potion_small"), 1)
+
+    def test_autosave_serializes_only_changed_objects(self):
+        """Verify a save after one NPC changes serializes that NPC alone and writes a few rows."""
+        self.assertTrue(self.world.save_game(self.TEST_DB))
+        npc_id, npc = next(iter(self.world.npcs.items()))
+        gone_id = next(other for other in self.world.npcs if other != npc_id)
+        npc.health -= 1
+        self.world.npcs.pop(gone_id)
+
+        serialized = []
+        original = SaveManager.serialize_npc
+        def counting(manager, target):
+            serialized.append(target.obj_id)
+            return original(manager, target)
+        with patch.object(SaveManager, "serialize_npc", counting):
+            self.assertTrue(self.world.save_game(self.TEST_DB))
+        self.assertEqual(serialized, [npc_id])
+        stats = self._store().last_write_stats
+        self.assertLess(stats["written"], 5)
+        self.assertEqual(stats["deleted"], 1)
+
+        saved = self._store().read_document()["npc_states"]
+        self.assertEqual(saved[npc_id]["health"], npc.health)
+        self.assertNotIn(gone_id, saved)
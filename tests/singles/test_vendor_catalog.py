@@ -0,0 +1,69 @@
+# tests/singles/test_vendor_catalog.py
+from tests.fixtures import GameTestBase
+from engine.items.item_factory import ItemFactory
+from engine.npcs.npc_factory import NPCFactory
+from engine.npcs.vendor_catalog import VendorCatalog
+
+class TestVendorCatalog(GameTestBase):
+
+    def setUp(self):
+        super().setUp()
+        self.world.item_templates["test_lantern"] = {"type": "Item", "name": "Brass Lantern", "value": 10}
+        self.world.item_templates["test_rope"] = {"type": "Item", "name": "Rope", "value": 4, "stackable": True}
+        self.world.npc_templates["test_outfitter"] = {
+            "name": "Outfitter", "faction": "friendly",
+            "properties": {
+                "is_vendor": True, "buys_item_types": ["Item"],
+                "sells_items": [{"item_id": "test_lantern", "price_multiplier": 3.0}, {"item_id": "test_rope"}]
+            }
+        }
+        vendor = NPCFactory.create_npc_from_template("test_outfitter", self.world)
+        if not vendor: self.fail("Failed to create vendor.")
+        self.world.add_npc(vendor)
+        vendor.current_region_id = self.player.current_region_id
+        vendor.current_room_id = self.player.current_room_id
+        self.vendor = vendor
+        self.player.trading_with = vendor.obj_id
+        self.player.gold = 1000
+
+    def test_prices_are_cached_until_the_discount_changes(self):
+        """Verify wares are priced once and repriced when an economy discount starts."""
+        catalog = VendorCatalog.for_vendor(self.vendor, self.world)
+        wares = catalog.wares
+        self.assertEqual([(w.item_id, w.price) for w in wares], [("test_lantern", 30), ("test_rope", 8)])
+        self.assertIs(VendorCatalog.for_vendor(self.vendor, self.world).wares, wares)
+
+        self.vendor.properties["economy_impact"] = {"discount": 1.0, "expiry": 1e12}
+        self.assertEqual([w.price for w in VendorCatalog.for_vendor(self.vendor, self.world).wares], [15, 4])
+        result = self.game.process_command("list")
+        self.assertIn("Special Discount Active", result or "")
+        self.assertIn("15 gold", result or "")
+
+    def test_lookups_by_id_and_name(self):
+        """Verify buying finds wares by ID, exact name and partial name."""
+        catalog = VendorCatalog.for_vendor(self.vendor, self.world)
+        for query in ("test_lantern", "brass lantern", "LANTERN"):
+            ware = catalog.find_ware(query)
+            self.assertEqual(ware.item_id if ware else None, "test_lantern", query)
+        self.assertIsNone(catalog.find_ware("sword"))
+
+        result = self.game.process_command("buy lantern")
+        self.assertIn("30 gold", result or "")
+        self.assertEqual(self.player.gold, 970)
+
+    def test_stock_index_follows_the_vendor_inventory(self):
+        """Verify items sold to the vendor are indexed, priced and counted, then drop out once bought back."""
+        rope = ItemFactory.create_item_from_template("test_rope", self.world)
+        if not rope: self.fail("Failed to create rope.")
+        self.player.inventory.add_item(rope, 3)
+        self.game.process_command("sell rope 3")
+
+        catalog = VendorCatalog.for_vendor(self.vendor, self.world)
+        entry = catalog.find_stock("rope")
+        self.assertIsNotNone(entry)
+        self.assertEqual(catalog.stock_count("test_rope"), 3)
+        self.assertEqual(entry.price if entry else None, 8)
+
+        self.game.process_command("buy rope 3")
+        self.assertEqual(self.player.inventory.count_item("test_rope"), 3)
+        self.assertIsNone(VendorCatalog.for_vendor(self.vendor, self.world).find_stock("rope"))